@@ -9,7 +9,7 @@ from curl_cffi import requests
 from llm4free import exceptions
 from llm4free.AIbase import AISearch, SearchResponse
 from llm4free.litagent import LitAgent
-from llm4free.sanitize import sanitize_stream
+from llm4free.sanitize import compile_sanitizer
 
 
 class Perplexity(AISearch):
@@ -243,35 +243,32 @@ class Perplexity(AISearch):
                     )
 
                 def stream_response():
-                    full_text = ""
-
-                    def extract_perplexity_content(data):
-                        nonlocal full_text
-                        current_answer = self._extract_answer(data)
-                        if current_answer and len(current_answer) > len(full_text):
-                            delta = current_answer[len(full_text) :]
-                            full_text = current_answer
-                            return delta
-                        return None
+                    chunks = resp.iter_content(chunk_size=1024)
+                    if raw:
+                        yield from compile_sanitizer(
+                            raw=True, encoding="utf-8", encoding_errors="replace"
+                        )(chunks)
+                        return
 
-                    processed_chunks = sanitize_stream(
-                        data=resp.iter_content(chunk_size=1024),
+                    sanitizer = compile_sanitizer(
                         to_json=True,
-                        # We already parse the raw data and extract the relevant answer text in
-                        # `extract_perplexity_content`, so we do not need additional regex extraction.
-                        extract_regexes=None,
-                        content_extractor=lambda chunk: extract_perplexity_content(chunk),
                         yield_raw_on_error=False,
                         encoding="utf-8",
                         encoding_errors="replace",
                         line_delimiter="\r\n\r\n",
-                        raw=raw,
-                        output_formatter=None
-                        if raw
-                        else lambda x: SearchResponse(x) if isinstance(x, str) else x,
+                        fragments=True,
                     )
-
-                    yield from processed_chunks
+                    # Each event carries the whole answer so far; yield only the new text.
+                    full_text = ""
+                    for data in sanitizer(chunks):
+                        try:
+                            current_answer = self._extract_answer(data)
+                        except Exception:
+                            continue
+                        if current_answer and len(current_answer) > len(full_text):
+                            delta = current_answer[len(full_text) :]
+                            full_text = current_answer
+                            yield SearchResponse(delta)
 
                 if stream:
                     return stream_response()
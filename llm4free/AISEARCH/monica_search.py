@@ -6,7 +6,18 @@ from curl_cffi.requests.exceptions import RequestException
 from llm4free import exceptions
 from llm4free.AIbase import AISearch, SearchResponse
 from llm4free.litagent import LitAgent
-from llm4free.sanitize import sanitize_stream
+from llm4free.sanitize import compile_sanitizer
+
+
+def _extract_text(chunk: Union[str, Dict[str, Any]]) -> Optional[str]:
+    """Pull the text delta out of a Monica stream event."""
+    if isinstance(chunk, dict) and chunk.get("text") is not None:
+        return chunk.get("text")
+    return None
+
+
+def _to_search_response(content: Any) -> Any:
+    return SearchResponse(content) if isinstance(content, str) else content
 
 
 class Monica(AISearch):
@@ -131,22 +142,17 @@ class Monica(AISearch):
                         f"Failed to generate response - ({response.status_code}, {response.reason}) - {response.text}"
                     )
 
-                processed_chunks = sanitize_stream(
-                    data=response.iter_content(chunk_size=None),
+                sanitizer = compile_sanitizer(
                     to_json=True,
-                    content_extractor=lambda chunk: (
-                        chunk.get("text")
-                        if isinstance(chunk, dict) and chunk.get("text") is not None
-                        else None
-                    ),
+                    content_extractor=_extract_text,
                     yield_raw_on_error=False,
                     encoding="utf-8",
                     encoding_errors="replace",
+                    fragments=True,
                     raw=raw,
-                    output_formatter=None
-                    if raw
-                    else lambda x: SearchResponse(x) if isinstance(x, str) else x,
+                    output_formatter=None if raw else _to_search_response,
                 )
+                processed_chunks = sanitizer(response.iter_content(chunk_size=None))
 
                 yield from processed_chunks
 
@@ -175,24 +181,15 @@ class Monica(AISearch):
                     return response.text
                 else:
                     # Process response similar to streaming when raw=False
-                    processed_chunks = sanitize_stream(
-                        data=response.content,
+                    sanitizer = compile_sanitizer(
                         intro_value="",
                         to_json=True,
-                        skip_markers=[],
-                        strip_chars=None,
-                        start_marker=None,
-                        end_marker=None,
-                        content_extractor=lambda chunk: (
-                            chunk.get("text")
-                            if isinstance(chunk, dict) and chunk.get("text") is not None
-                            else None
-                        ),
+                        content_extractor=_extract_text,
                         yield_raw_on_error=False,
                         encoding="utf-8",
                         encoding_errors="replace",
-                        buffer_size=8192,
                     )
+                    processed_chunks = sanitizer(response.content)
 
                     full_response = ""
                     for content_chunk in processed_chunks:
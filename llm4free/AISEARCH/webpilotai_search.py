@@ -7,7 +7,19 @@ from curl_cffi.requests.exceptions import RequestException, Timeout
 from llm4free import exceptions
 from llm4free.AIbase import AISearch, SearchResponse
 from llm4free.litagent import LitAgent
-from llm4free.sanitize import sanitize_stream
+from llm4free.sanitize import compile_sanitizer
+
+
+def _extract_content(chunk: Union[str, Dict[str, Any]]) -> Optional[str]:
+    """Pull the text delta out of a webpilotai stream event."""
+    if not isinstance(chunk, dict):
+        return None
+    data = chunk.get("data") or {}
+    return data.get("content") or data.get("text") or data.get("delta", {}).get("content")
+
+
+def _to_search_response(content: Any) -> Any:
+    return SearchResponse(content) if isinstance(content, str) else content
 
 
 class webpilotai(AISearch):
@@ -129,37 +141,19 @@ class webpilotai(AISearch):
                         f"Failed to generate response - ({response.status_code}, {response.reason}) - {response.text}"
                     )
 
-                processed_chunks = sanitize_stream(
-                    data=response.iter_content(chunk_size=1024),
+                sanitizer = compile_sanitizer(
                     to_json=True,
-                    # Extract content from parsed JSON payload similar to Monica
-                    content_extractor=lambda chunk: (
-                        (
-                            (chunk.get("data") or {}).get("content")
-                            if isinstance(chunk, dict)
-                            else None
-                        )
-                        or (
-                            (chunk.get("data") or {}).get("text")
-                            if isinstance(chunk, dict)
-                            else None
-                        )
-                        or (
-                            (chunk.get("data") or {}).get("delta", {}).get("content")
-                            if isinstance(chunk, dict)
-                            else None
-                        )
-                    ),
+                    content_extractor=_extract_content,
                     skip_markers=["event:message"],
                     yield_raw_on_error=False,
                     encoding="utf-8",
                     encoding_errors="replace",
                     line_delimiter="\n",
+                    fragments=True,
                     raw=raw,
-                    output_formatter=None
-                    if raw
-                    else lambda x: SearchResponse(x) if isinstance(x, str) else x,
+                    output_formatter=None if raw else _to_search_response,
                 )
+                processed_chunks = sanitizer(response.iter_content(chunk_size=1024))
 
                 for chunk in processed_chunks:
                     yield chunk
@@ -187,37 +181,17 @@ class webpilotai(AISearch):
                     return response.text
 
                 # Process full response payload using sanitize_stream similar to streaming path
-                processed_chunks = sanitize_stream(
-                    data=response.content,
+                sanitizer = compile_sanitizer(
                     intro_value="",
                     to_json=True,
-                    strip_chars=None,
-                    start_marker=None,
-                    end_marker=None,
-                    content_extractor=lambda chunk: (
-                        (
-                            (chunk.get("data") or {}).get("content")
-                            if isinstance(chunk, dict)
-                            else None
-                        )
-                        or (
-                            (chunk.get("data") or {}).get("text")
-                            if isinstance(chunk, dict)
-                            else None
-                        )
-                        or (
-                            (chunk.get("data") or {}).get("delta", {}).get("content")
-                            if isinstance(chunk, dict)
-                            else None
-                        )
-                    ),
+                    content_extractor=_extract_content,
                     skip_markers=["event:message"],
                     yield_raw_on_error=False,
                     encoding="utf-8",
                     encoding_errors="replace",
-                    buffer_size=8192,
-                    output_formatter=lambda x: SearchResponse(x) if isinstance(x, str) else x,
+                    output_formatter=_to_search_response,
                 )
+                processed_chunks = sanitizer(response.content)
 
                 full_response = ""
                 for content_chunk in processed_chunks:
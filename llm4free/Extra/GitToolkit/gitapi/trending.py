@@ -1,6 +1,7 @@
 import re
 from typing import Any, Dict, List
-from urllib.request import Request, urlopen
+
+from llm4free.http_session import shared_session
 
 try:
     from llm4free.litagent.agent import LitAgent
@@ -66,9 +67,9 @@ class Trending:
             else "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         }
-        req = Request(url, headers=headers)
-        response = urlopen(req, timeout=30)
-        return response.read().decode("utf-8")
+        response = shared_session().get(url, headers=headers, timeout=30)
+        response.raise_for_status()
+        return response.content.decode("utf-8")
 
     def _parse_repos(self, html: str) -> List[Dict[str, Any]]:
         """Parse trending repositories from HTML."""
@@ -1,8 +1,8 @@
 import json
 import time
 from typing import Any
-from urllib.error import HTTPError
-from urllib.request import Request, urlopen
+
+from llm4free.http_session import shared_session
 
 try:
     from llm4free.litagent.agent import LitAgent
@@ -61,33 +61,35 @@ def request(url: str, retry_attempts: int = 3) -> Any:
 
     for attempt in range(retry_attempts):
         try:
-            req = Request(url, headers=headers)
-            response = urlopen(req, timeout=30)
-            data = response.read().decode("utf-8")
+            response = shared_session().get(url, headers=headers, timeout=30)
+            status = response.status_code
+            if status < 400:
+                data = response.content.decode("utf-8")
+        except Exception as e:
+            if attempt == retry_attempts - 1:
+                raise RequestError(f"Request failed: {str(e)}")
+            time.sleep(1)
+            continue
+
+        if status < 400:
             try:
                 return json.loads(data)
             except json.JSONDecodeError as json_err:
                 raise RequestError(f"Invalid JSON response from {url}: {str(json_err)}")
 
-        except HTTPError as e:
-            if e.code == 404:
-                raise NotFoundError(f"Resource not found: {url}")
-            if e.code == 429:
-                if attempt < retry_attempts - 1:
-                    # Wait before retrying on rate limit
-                    time.sleep(2**attempt)  # Exponential backoff
-                    continue
-                raise RateLimitError(f"Rate limited after {retry_attempts} attempts")
-            if e.code == 403:
-                raise RequestError("Forbidden: Check your authentication token")
-            if attempt == retry_attempts - 1:
-                raise RequestError(f"HTTP Error {e.code}: {e.reason}")
-            # Wait before retrying on other HTTP errors
-            time.sleep(1)
-
-        except Exception as e:
-            if attempt == retry_attempts - 1:
-                raise RequestError(f"Request failed: {str(e)}")
-            time.sleep(1)
+        if status == 404:
+            raise NotFoundError(f"Resource not found: {url}")
+        if status == 429:
+            if attempt < retry_attempts - 1:
+                # Wait before retrying on rate limit
+                time.sleep(2**attempt)  # Exponential backoff
+                continue
+            raise RateLimitError(f"Rate limited after {retry_attempts} attempts")
+        if status == 403:
+            raise RequestError("Forbidden: Check your authentication token")
+        if attempt == retry_attempts - 1:
+            raise RequestError(f"HTTP Error {status}: {response.reason}")
+        # Wait before retrying on other HTTP errors
+        time.sleep(1)
 
     raise RequestError(f"Request to {url} failed after {retry_attempts} attempts")
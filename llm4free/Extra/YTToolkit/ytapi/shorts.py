@@ -2,8 +2,8 @@
 
 import re
 from typing import List, Optional
-from urllib.error import HTTPError
-from urllib.request import Request, urlopen
+
+from llm4free.http_session import shared_session
 
 from .patterns import _ExtraPatterns as Patterns
 from .utils import dup_filter, request
@@ -45,16 +45,12 @@ class Shorts:
 
         try:
             headers = {"User-Agent": _USER_AGENT, "Accept": "text/html"}
-            req = Request(url, headers=headers, method="HEAD")
-            response = urlopen(req, timeout=10)
-            # If we get a 200 and URL contains /shorts/, it's a Short
-            final_url = response.geturl()
-            return "/shorts/" in final_url
-        except HTTPError as e:
-            if e.code == 303 or e.code == 302:
-                # Redirect means it's not a Short (redirects to /watch)
+            response = shared_session().head(url, headers=headers, timeout=10)
+            if response.status_code >= 400:
                 return False
-            return False
+            # If we get a 200 and URL contains /shorts/, it's a Short; other
+            # videos redirect to /watch
+            return "/shorts/" in response.url
         except Exception:
             return False
 
@@ -3,7 +3,8 @@
 import json
 from typing import List, Optional
 from urllib.parse import quote
-from urllib.request import Request, urlopen
+
+from llm4free.http_session import shared_session
 
 try:
     from llm4free.litagent.agent import LitAgent
@@ -38,9 +39,9 @@ class Suggestions:
         headers = {"User-Agent": _USER_AGENT, "Accept": "application/json"}
 
         try:
-            req = Request(url, headers=headers)
-            response = urlopen(req, timeout=10)
-            data = response.read().decode("utf-8")
+            response = shared_session().get(url, headers=headers, timeout=10)
+            response.raise_for_status()
+            data = response.content.decode("utf-8")
 
             # Response is JSONP, extract JSON part
             # Format: window.google.ac.h(["query",[["suggestion1"],["suggestion2"],...]])
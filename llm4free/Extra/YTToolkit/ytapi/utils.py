@@ -1,8 +1,7 @@
 from collections import OrderedDict
 from typing import Optional
-from urllib.error import HTTPError
-from urllib.request import Request, urlopen
 
+from llm4free.http_session import shared_session
 from llm4free.litagent import LitAgent
 
 from .errors import InvalidURL, RequestError, TooManyRequests
@@ -32,23 +31,21 @@ def request(url: str, retry_attempts: int = 3) -> str:
     for attempt in range(retry_attempts):
         try:
             headers = {"User-Agent": _USER_AGENT_GENERATOR.random()}
-
-            req = Request(url, headers=headers)
-            response = urlopen(req)
-            return response.read().decode("utf-8")
-
-        except HTTPError as e:
-            if e.code == 404:
-                raise InvalidURL(f"Cannot find anything with the requested URL: {url}")
-            if e.code == 429:
-                raise TooManyRequests(f"Rate-limited on attempt {attempt + 1}")
-
-            if attempt == retry_attempts - 1:
-                raise RequestError(f"HTTP Error {e.code}: {e.reason}") from e
-
+            response = shared_session().get(url, headers=headers)
+            status = response.status_code
+            if status < 400:
+                return response.content.decode("utf-8")
         except Exception as e:
             if attempt == retry_attempts - 1:
                 raise RequestError(f"Request failed: {e!r}") from None
+            continue
+
+        if status == 404:
+            raise InvalidURL(f"Cannot find anything with the requested URL: {url}")
+        if status == 429:
+            raise TooManyRequests(f"Rate-limited on attempt {attempt + 1}")
+        if attempt == retry_attempts - 1:
+            raise RequestError(f"HTTP Error {status}: {response.reason}")
 
     raise RequestError(f"Request to {url} failed after {retry_attempts} attempts")
 
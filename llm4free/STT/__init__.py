@@ -1,19 +1,25 @@
 # This file marks the directory as a Python package.
-# Static imports for all STT (Speech-to-Text) provider modules
+# Lazy exports for all STT (Speech-to-Text) provider modules (see llm4free/lazy.py)
 
-# Base classes
-from llm4free.STT.base import (
-    BaseSTTAudio,
-    BaseSTTChat,
-    BaseSTTTranscriptions,
-    STTCompatibleProvider,
-    STTModels,
-    TranscriptionResponse,
-)
+from typing import TYPE_CHECKING
 
-# Provider implementations
-from llm4free.STT.cohere import CohereSTT
-from llm4free.STT.elevenlabs import ElevenLabsSTT
+from llm4free._exports import EXPORTS
+from llm4free.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    # Base classes
+    from llm4free.STT.base import (
+        BaseSTTAudio,
+        BaseSTTChat,
+        BaseSTTTranscriptions,
+        STTCompatibleProvider,
+        STTModels,
+        TranscriptionResponse,
+    )
+
+    # Provider implementations
+    from llm4free.STT.cohere import CohereSTT
+    from llm4free.STT.elevenlabs import ElevenLabsSTT
 
 # List of all exported names
 __all__ = [
@@ -28,3 +34,5 @@ __all__ = [
     "CohereSTT",
     "ElevenLabsSTT",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, EXPORTS.get(__name__, {}))
@@ -1,30 +1,36 @@
 # This file marks the directory as a Python package.
-# Static imports for all TTI (Text-to-Image) provider modules
+# Lazy exports for all TTI (Text-to-Image) provider modules (see llm4free/lazy.py)
 
-# Base classes
-from llm4free.TTI.base import (
-    BaseImages,
-    TTICompatibleProvider,
-)
+from typing import TYPE_CHECKING
 
-# Provider implementations
-from llm4free.TTI.bingimage import BingImageAI
-from llm4free.TTI.magichour import MagicHourAI
-from llm4free.TTI.magicstudio import MagicStudioAI
-from llm4free.TTI.miragic import MiragicAI
-from llm4free.TTI.nologintool import NoLoginTool
-from llm4free.TTI.onefreeai import OneFreeAI
-from llm4free.TTI.perchance import PerchanceAI
-from llm4free.TTI.pollinations import PollinationsAI
-from llm4free.TTI.raphael import RaphaelAI
-from llm4free.TTI.together import TogetherImage
+from llm4free._exports import EXPORTS
+from llm4free.lazy import lazy_exports
 
-# Utility classes
-from llm4free.TTI.utils import (
-    ImageData,
-    ImageResponse,
-)
-from llm4free.TTI.visualgpt import VisualGPT
+if TYPE_CHECKING:
+    # Base classes
+    from llm4free.TTI.base import (
+        BaseImages,
+        TTICompatibleProvider,
+    )
+
+    # Provider implementations
+    from llm4free.TTI.bingimage import BingImageAI
+    from llm4free.TTI.magichour import MagicHourAI
+    from llm4free.TTI.magicstudio import MagicStudioAI
+    from llm4free.TTI.miragic import MiragicAI
+    from llm4free.TTI.nologintool import NoLoginTool
+    from llm4free.TTI.onefreeai import OneFreeAI
+    from llm4free.TTI.perchance import PerchanceAI
+    from llm4free.TTI.pollinations import PollinationsAI
+    from llm4free.TTI.raphael import RaphaelAI
+    from llm4free.TTI.together import TogetherImage
+
+    # Utility classes
+    from llm4free.TTI.utils import (
+        ImageData,
+        ImageResponse,
+    )
+    from llm4free.TTI.visualgpt import VisualGPT
 
 # List of all exported names
 __all__ = [
@@ -47,3 +53,5 @@ __all__ = [
     "PerchanceAI",
     "VisualGPT",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, EXPORTS.get(__name__, {}))
@@ -1,30 +1,36 @@
 # This file marks the directory as a Python package.
-# Static imports for all TTS (Text-to-Speech) provider modules
+# Lazy exports for all TTS (Text-to-Speech) provider modules (see llm4free/lazy.py)
 
-# Base classes
-from llm4free.TTS.base import (
-    AsyncBaseTTSProvider,
-    BaseTTSProvider,
-)
+from typing import TYPE_CHECKING
 
-# Provider implementations
-from llm4free.TTS.deepgram import DeepgramTTS
-from llm4free.TTS.elevenlabs import ElevenlabsTTS
-from llm4free.TTS.faster_qwen3 import FasterQwen3TTS
-from llm4free.TTS.kittentts import KittenTTS
-from llm4free.TTS.luxtts import LuxTTS
-from llm4free.TTS.murfai import MurfAITTS
-from llm4free.TTS.openai_fm import OpenAIFMTTS
-from llm4free.TTS.parler import ParlerTTS
-from llm4free.TTS.pockettts import PocketTTS
-from llm4free.TTS.qwen import QwenTTS
-from llm4free.TTS.sherpa import SherpaTTS
-from llm4free.TTS.stream_elements import StreamElements
-from llm4free.TTS.ttsai import TTSAI
+from llm4free._exports import EXPORTS
+from llm4free.lazy import lazy_exports
 
-# Utility classes
-from llm4free.TTS.utils import SentenceTokenizer
-from llm4free.TTS.xlnk import XLNKTTS
+if TYPE_CHECKING:
+    # Base classes
+    from llm4free.TTS.base import (
+        AsyncBaseTTSProvider,
+        BaseTTSProvider,
+    )
+
+    # Provider implementations
+    from llm4free.TTS.deepgram import DeepgramTTS
+    from llm4free.TTS.elevenlabs import ElevenlabsTTS
+    from llm4free.TTS.faster_qwen3 import FasterQwen3TTS
+    from llm4free.TTS.kittentts import KittenTTS
+    from llm4free.TTS.luxtts import LuxTTS
+    from llm4free.TTS.murfai import MurfAITTS
+    from llm4free.TTS.openai_fm import OpenAIFMTTS
+    from llm4free.TTS.parler import ParlerTTS
+    from llm4free.TTS.pockettts import PocketTTS
+    from llm4free.TTS.qwen import QwenTTS
+    from llm4free.TTS.sherpa import SherpaTTS
+    from llm4free.TTS.stream_elements import StreamElements
+    from llm4free.TTS.ttsai import TTSAI
+
+    # Utility classes
+    from llm4free.TTS.utils import SentenceTokenizer
+    from llm4free.TTS.xlnk import XLNKTTS
 
 # List of all exported names
 __all__ = [
@@ -49,3 +55,5 @@ __all__ = [
     "TTSAI",
     "XLNKTTS",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, EXPORTS.get(__name__, {}))
@@ -1,35 +1,70 @@
 # llm4free/__init__.py
+#
+# Public names are resolved lazily (PEP 562) through the generated manifest in
+# llm4free/_exports.py, so `import llm4free` does not import every provider.
+# Regenerate it with `python -m llm4free.lazy_manifest` after changing exports.
 
 import logging
+import os
+import threading
+from typing import TYPE_CHECKING, Any
 
-from llm4free.litagent import LitAgent
-
-from .AISEARCH import *
-from .AIutel import *  # noqa: F403
-from .client import Client
-from .Extra import *  # noqa: F403
-from .llm import *
-from .models import model
-from .scout import *
-from .search import *
-from .STT import *  # noqa: F403
-from .swiftcli import *
-from .TTI import *
-from .TTS import *
-from .update_checker import check_for_updates
+from ._exports import EXPORTS
+from .lazy import lazy_exports
 from .version import __version__
 
-# x0gpt.py and X0GPT removed; no import here
-from .zeroart import *
+if TYPE_CHECKING:
+    from llm4free.litagent import LitAgent
 
-useragent = LitAgent()
+    from .AISEARCH import *  # noqa: F403
+    from .AIutel import *  # noqa: F403
+    from .async_client import AsyncClient
+    from .client import Client
+    from .Extra import *  # noqa: F403
+    from .llm import *  # noqa: F403
+    from .models import model
+    from .scout import *  # noqa: F403
+    from .search import *  # noqa: F403
+    from .STT import *  # noqa: F403
+    from .swiftcli import *  # noqa: F403
+    from .TTI import *  # noqa: F403
+    from .TTS import *  # noqa: F403
+    from .update_checker import check_for_updates
+    from .zeroart import *  # noqa: F403
+
+    useragent: LitAgent
 
 logger = logging.getLogger(__name__)
 
-# Check for updates on import to notify users of new versions
-try:
-    update_message = check_for_updates(force=True)
-    if update_message:
-        logger.info(update_message)
-except Exception:
-    pass
+_lazy_getattr, __dir__ = lazy_exports(__name__, EXPORTS.get(__name__, {}))
+__all__ = sorted(EXPORTS.get(__name__, {}))
+
+
+def __getattr__(name: str) -> Any:
+    if name == "useragent":
+        from llm4free.litagent import LitAgent
+
+        globals()["useragent"] = agent = LitAgent()
+        return agent
+    return _lazy_getattr(name)
+
+
+def _check_for_updates_in_background() -> None:
+    """Run the PyPI update check in a daemon thread so it never delays imports."""
+
+    def run() -> None:
+        try:
+            from .update_checker import check_for_updates
+
+            update_message = check_for_updates()
+            if update_message:
+                logger.info(update_message)
+        except Exception:
+            pass
+
+    threading.Thread(target=run, name="llm4free-update-check", daemon=True).start()
+
+
+# Update checks are opt-in: set LLM4FREE_UPDATE_CHECK=1 to be notified of new versions.
+if os.environ.get("LLM4FREE_UPDATE_CHECK", "").lower() in ("1", "true", "yes"):
+    _check_for_updates_in_background()
@@ -0,0 +1,441 @@
+# Generated by `python -m llm4free.lazy_manifest`; do not edit by hand.
+"""Lazy export manifest: package -> public name -> defining module."""
+
+from typing import Dict
+
+EXPORTS: Dict[str, Dict[str, str]] = {
+    "llm4free": {
+        "AI4Chat": "llm4free.llm.ai4chat",
+        "AgentBrowserNotFound": "llm4free.Extra",
+        "AkashGPT": "llm4free.llm.akashgpt",
+        "Any": "llm4free.Extra",
+        "Apriel": "llm4free.llm.apriel",
+        "ArtingAI": "llm4free.llm.artingai",
+        "AsyncBaseTTSProvider": "llm4free.TTS.base",
+        "AsyncClient": "llm4free.async_client",
+        "AsyncTempMailProvider": "llm4free.Extra",
+        "AwesomePrompts": "llm4free.AIutel",
+        "BadParameter": "llm4free.swiftcli",
+        "BaseChat": "llm4free.llm.base",
+        "BaseCompletions": "llm4free.llm.base",
+        "BaseImages": "llm4free.TTI.base",
+        "BaseSTTAudio": "llm4free.STT.base",
+        "BaseSTTChat": "llm4free.STT.base",
+        "BaseSTTTranscriptions": "llm4free.STT.base",
+        "BaseSearch": "llm4free.search",
+        "BaseSearchEngine": "llm4free.search",
+        "BaseTTSProvider": "llm4free.TTS.base",
+        "BingImageAI": "llm4free.TTI.bingimage",
+        "BingSearch": "llm4free.search",
+        "BlockFont": "llm4free.zeroart",
+        "BooksResult": "llm4free.search",
+        "BraveSearch": "llm4free.search",
+        "CLI": "llm4free.swiftcli",
+        "Callable": "llm4free.AIutel",
+        "Captions": "llm4free.Extra",
+        "Cerebras": "llm4free.llm.Auth.cerebras",
+        "Channel": "llm4free.Extra",
+        "ChatCompletion": "llm4free.llm.utils",
+        "ChatCompletionChunk": "llm4free.llm.utils",
+        "ChatCompletionMessage": "llm4free.llm.utils",
+        "ChatGPT": "llm4free.llm.chatgpt",
+        "ChatGPTReversed": "llm4free.llm.chatgpt",
+        "Choice": "llm4free.llm.utils",
+        "ChoiceDelta": "llm4free.llm.utils",
+        "Client": "llm4free.client",
+        "CohereSTT": "llm4free.STT.cohere",
+        "CompletionUsage": "llm4free.llm.utils",
+        "ConfigError": "llm4free.swiftcli",
+        "Console": "llm4free.Extra",
+        "Context": "llm4free.swiftcli",
+        "ConversionError": "llm4free.Extra",
+        "Cookie": "llm4free.Extra",
+        "CookieHarvester": "llm4free.Extra",
+        "CookiePathInvalidError": "llm4free.Extra",
+        "CurrentCondition": "llm4free.Extra",
+        "CyberFont": "llm4free.zeroart",
+        "DayForecast": "llm4free.Extra",
+        "DeepAI": "llm4free.llm.Auth.deep_ai",
+        "DeepInfra": "llm4free.llm.Auth.deepinfra",
+        "DeepgramTTS": "llm4free.TTS.deepgram",
+        "Dict": "llm4free.Extra",
+        "DottedFont": "llm4free.zeroart",
+        "DuckDuckGoSearch": "llm4free.search",
+        "E2B": "llm4free.llm.e2b",
+        "ElectronicFont": "llm4free.zeroart",
+        "ElevenLabsSTT": "llm4free.STT.elevenlabs",
+        "ElevenlabsTTS": "llm4free.TTS.elevenlabs",
+        "EmailnatorProvider": "llm4free.Extra",
+        "EncodingType": "llm4free.AIutel",
+        "EssentialAI": "llm4free.llm.essentialai",
+        "ExaAI": "llm4free.llm.exaai",
+        "Extras": "llm4free.Extra",
+        "FailedToCreateConsentCookieError": "llm4free.Extra",
+        "FasterQwen3TTS": "llm4free.TTS.faster_qwen3",
+        "FontType": "llm4free.zeroart",
+        "Fore": "llm4free.Extra",
+        "FreeAI": "llm4free.llm.freeai",
+        "FreeAIOnline": "llm4free.llm.freeaionline",
+        "FreeAssist": "llm4free.llm.freeassist",
+        "FuckICoding": "llm4free.llm.fuckicoding",
+        "FunctionCall": "llm4free.llm.utils",
+        "FunctionDefinition": "llm4free.llm.base",
+        "FunctionParameters": "llm4free.llm.base",
+        "GitError": "llm4free.Extra",
+        "GptFree": "llm4free.llm.gptfree",
+        "Groq": "llm4free.llm.Auth.groq",
+        "Group": "llm4free.swiftcli",
+        "Handler": "llm4free.Extra",
+        "HarvestError": "llm4free.Extra",
+        "HarvestResult": "llm4free.Extra",
+        "Hashtag": "llm4free.Extra",
+        "HeckAI": "llm4free.llm.heckai",
+        "HfApi": "llm4free.Extra",
+        "HourlyForecast": "llm4free.Extra",
+        "HuggingFace": "llm4free.llm.Auth.huggingface",
+        "IAsk": "llm4free.AISEARCH",
+        "IBM": "llm4free.llm.ibm",
+        "INNERTUBE_API_URL": "llm4free.Extra",
+        "INNERTUBE_CONTEXT": "llm4free.Extra",
+        "ImageData": "llm4free.TTI.utils",
+        "ImageResponse": "llm4free.TTI.utils",
+        "ImagesResult": "llm4free.search",
+        "InvalidVideoIdError": "llm4free.Extra",
+        "IsometricFont": "llm4free.zeroart",
+        "K2Think": "llm4free.llm.k2think",
+        "KittenTTS": "llm4free.TTS.kittentts",
+        "LITSTREAM": "llm4free.AIutel",
+        "LLMChat": "llm4free.llm.llmchat",
+        "List": "llm4free.Extra",
+        "LitAgent": "llm4free.Extra",
+        "Location": "llm4free.Extra",
+        "LuxTTS": "llm4free.TTS.luxtts",
+        "MAX_WORKERS": "llm4free.Extra",
+        "MagicHourAI": "llm4free.TTI.magichour",
+        "MagicStudioAI": "llm4free.TTI.magicstudio",
+        "MailTM": "llm4free.Extra",
+        "MailTMAsync": "llm4free.Extra",
+        "MetaSearch": "llm4free.search",
+        "MiragicAI": "llm4free.TTI.miragic",
+        "ModelConverter": "llm4free.Extra",
+        "ModelData": "llm4free.llm.utils",
+        "ModelList": "llm4free.llm.utils",
+        "Mojeek": "llm4free.search",
+        "Monica": "llm4free.AISEARCH",
+        "MurfAITTS": "llm4free.TTS.murfai",
+        "NavigableString": "llm4free.scout",
+        "NeonFont": "llm4free.zeroart",
+        "Netwrck": "llm4free.llm.netwrck",
+        "NewsResult": "llm4free.search",
+        "NoLoginTool": "llm4free.TTI.nologintool",
+        "NoTranscriptFoundError": "llm4free.Extra",
+        "NotFoundError": "llm4free.Extra",
+        "NotTranslatableError": "llm4free.Extra",
+        "Nvidia": "llm4free.llm.Auth.nvidia",
+        "OllamaSwarm": "llm4free.llm.ollama_swarm",
+        "OneFreeAI": "llm4free.TTI.onefreeai",
+        "OpenAICompatibleProvider": "llm4free.llm.base",
+        "OpenAIFMTTS": "llm4free.TTS.openai_fm",
+        "OpenRouter": "llm4free.llm.Auth.openrouter",
+        "OperaAria": "llm4free.llm.opera_aria",
+        "Optional": "llm4free.Extra",
+        "Panel": "llm4free.Extra",
+        "ParlerTTS": "llm4free.TTS.parler",
+        "Path": "llm4free.Extra",
+        "PerchanceAI": "llm4free.TTI.perchance",
+        "Perplexity": "llm4free.AISEARCH",
+        "PiAI": "llm4free.llm.pi",
+        "Playlist": "llm4free.Extra",
+        "Plugin": "llm4free.swiftcli",
+        "PluginError": "llm4free.swiftcli",
+        "PocketTTS": "llm4free.TTS.pockettts",
+        "PollinationsAI": "llm4free.TTI.pollinations",
+        "ProxyManager": "llm4free.Extra",
+        "QuantizationMethod": "llm4free.Extra",
+        "QwenTTS": "llm4free.TTS.qwen",
+        "RaphaelAI": "llm4free.TTI.raphael",
+        "RateLimitError": "llm4free.Extra",
+        "Repository": "llm4free.Extra",
+        "RequestError": "llm4free.Extra",
+        "STTCompatibleProvider": "llm4free.STT.base",
+        "STTModels": "llm4free.STT.base",
+        "Sambanova": "llm4free.llm.Auth.sambanova",
+        "SanitizerPipeline": "llm4free.AIutel",
+        "Scout": "llm4free.scout",
+        "ScoutCrawler": "llm4free.scout",
+        "ScoutSearchResult": "llm4free.scout",
+        "ScoutTextAnalyzer": "llm4free.scout",
+        "ScoutWebAnalyzer": "llm4free.scout",
+        "Search": "llm4free.Extra",
+        "SearchCache": "llm4free.search",
+        "SentenceTokenizer": "llm4free.TTS.utils",
+        "Session": "llm4free.Extra",
+        "Set": "llm4free.Extra",
+        "ShadowFont": "llm4free.zeroart",
+        "SherpaTTS": "llm4free.TTS.sherpa",
+        "Shorts": "llm4free.Extra",
+        "SimpleModelList": "llm4free.llm.base",
+        "SlantFont": "llm4free.zeroart",
+        "StreamElements": "llm4free.TTS.stream_elements",
+        "Suggestions": "llm4free.Extra",
+        "SwiftCLIException": "llm4free.swiftcli",
+        "TTICompatibleProvider": "llm4free.TTI.base",
+        "TTSAI": "llm4free.TTS.ttsai",
+        "Table": "llm4free.Extra",
+        "Tag": "llm4free.scout",
+        "TempMailIO": "llm4free.Extra",
+        "TempMailIOAsync": "llm4free.Extra",
+        "TempMailProvider": "llm4free.Extra",
+        "TextPollinations": "llm4free.llm.Auth.textpollinations",
+        "TextResult": "llm4free.search",
+        "Thread": "llm4free.Extra",
+        "ThreadPoolExecutor": "llm4free.Extra",
+        "ThreeDFont": "llm4free.zeroart",
+        "TogetherAI": "llm4free.llm.Auth.together_ai",
+        "TogetherImage": "llm4free.TTI.together",
+        "TooManyRequestsError": "llm4free.Extra",
+        "Tool": "llm4free.llm.base",
+        "ToolCall": "llm4free.llm.utils",
+        "ToolCallType": "llm4free.llm.utils",
+        "ToolDefinition": "llm4free.llm.base",
+        "ToolFunction": "llm4free.llm.utils",
+        "Toolbaz": "llm4free.llm.toolbaz",
+        "Transcript": "llm4free.Extra",
+        "TranscriptList": "llm4free.Extra",
+        "TranscriptListFetcher": "llm4free.Extra",
+        "TranscriptParser": "llm4free.Extra",
+        "TranscriptRetrievalError": "llm4free.Extra",
+        "TranscriptionResponse": "llm4free.STT.base",
+        "TranscriptsDisabledError": "llm4free.Extra",
+        "TranslationLanguageNotAvailableError": "llm4free.Extra",
+        "Tuple": "llm4free.Extra",
+        "TurboSeek": "llm4free.llm.turboseek",
+        "TwoAI": "llm4free.llm.Auth.two_ai",
+        "TypedDict": "llm4free.Extra",
+        "TypliAI": "llm4free.llm.typliai",
+        "UncensoredChat": "llm4free.llm.Auth.uncensoredchat",
+        "Union": "llm4free.Extra",
+        "Upstage": "llm4free.llm.Auth.upstage",
+        "UsageError": "llm4free.swiftcli",
+        "User": "llm4free.Extra",
+        "Video": "llm4free.Extra",
+        "VideoUnavailableError": "llm4free.Extra",
+        "VideosResult": "llm4free.search",
+        "VisualGPT": "llm4free.TTI.visualgpt",
+        "WATCH_URL": "llm4free.Extra",
+        "Weather": "llm4free.Extra",
+        "WeatherAscii": "llm4free.Extra",
+        "WeatherAsciiClient": "llm4free.Extra",
+        "WeatherClient": "llm4free.Extra",
+        "Wikipedia": "llm4free.search",
+        "WiseCat": "llm4free.llm.wisecat",
+        "Writecream": "llm4free.llm.writecream",
+        "XLNKTTS": "llm4free.TTS.xlnk",
+        "YTTranscriber": "llm4free.Extra",
+        "YahooSearch": "llm4free.search",
+        "YouTubeRequestFailedError": "llm4free.Extra",
+        "Zenmux": "llm4free.llm.Auth.zenmux",
+        "ZeroArtFont": "llm4free.zeroart",
+        "app": "llm4free.Extra",
+        "appdir": "llm4free.Extra",
+        "argument": "llm4free.swiftcli",
+        "bounce": "llm4free.zeroart",
+        "check_for_updates": "llm4free.update_checker",
+        "command": "llm4free.swiftcli",
+        "compile_sanitizer": "llm4free.AIutel",
+        "config_file": "llm4free.swiftcli",
+        "confirm_from_user": "llm4free.Extra",
+        "console": "llm4free.Extra",
+        "convert_command": "llm4free.Extra",
+        "count_tokens": "llm4free.llm.utils",
+        "datetime": "llm4free.Extra",
+        "download": "llm4free.Extra",
+        "envvar": "llm4free.swiftcli",
+        "figlet_format": "llm4free.zeroart",
+        "first_query": "llm4free.Extra",
+        "flag": "llm4free.swiftcli",
+        "format_output": "llm4free.swiftcli",
+        "format_prompt": "llm4free.llm.utils",
+        "get": "llm4free.Extra",
+        "get_disposable_email": "llm4free.Extra",
+        "get_excep": "llm4free.Extra",
+        "get_last_user_message": "llm4free.llm.utils",
+        "get_provider": "llm4free.Extra",
+        "get_random_email": "llm4free.Extra",
+        "get_search_cache": "llm4free.search",
+        "get_system_prompt": "llm4free.llm.utils",
+        "getcwd": "llm4free.Extra",
+        "glitch": "llm4free.zeroart",
+        "gradient": "llm4free.zeroart",
+        "group": "llm4free.swiftcli",
+        "harvest_cookies": "llm4free.Extra",
+        "headers": "llm4free.Extra",
+        "help_option": "llm4free.swiftcli",
+        "history_path": "llm4free.Extra",
+        "json_output": "llm4free.swiftcli",
+        "launch_media": "llm4free.Extra",
+        "lit_streamer": "llm4free.AIutel",
+        "logger": "llm4free.AIutel",
+        "lru_cache": "llm4free.Extra",
+        "main": "llm4free.Extra",
+        "makedirs": "llm4free.Extra",
+        "media_qualities": "llm4free.Extra",
+        "model": "llm4free.models",
+        "mp3_qualities": "llm4free.Extra",
+        "mp4_qualities": "llm4free.Extra",
+        "option": "llm4free.swiftcli",
+        "outline": "llm4free.zeroart",
+        "pager_output": "llm4free.swiftcli",
+        "panel_output": "llm4free.swiftcli",
+        "pass_context": "llm4free.swiftcli",
+        "print_figlet": "llm4free.zeroart",
+        "progress": "llm4free.swiftcli",
+        "rainbow": "llm4free.zeroart",
+        "resolvers": "llm4free.Extra",
+        "retry": "llm4free.AIutel",
+        "sanitize_stream": "llm4free.AIutel",
+        "sanitize_stream_decorator": "llm4free.AIutel",
+        "second_query": "llm4free.Extra",
+        "serialize_results": "llm4free.search",
+        "session": "llm4free.Extra",
+        "set_search_cache": "llm4free.search",
+        "sleep": "llm4free.Extra",
+        "table_output": "llm4free.swiftcli",
+        "third_query": "llm4free.Extra",
+        "timeIt": "llm4free.AIutel",
+        "tqdm": "llm4free.Extra",
+        "user_cache_dir": "llm4free.Extra",
+        "version_option": "llm4free.swiftcli",
+        "webpilotai": "llm4free.AISEARCH",
+        "wrap_text": "llm4free.zeroart",
+        "yaml_output": "llm4free.swiftcli",
+    },
+    "llm4free.STT": {
+        "BaseSTTAudio": "llm4free.STT.base",
+        "BaseSTTChat": "llm4free.STT.base",
+        "BaseSTTTranscriptions": "llm4free.STT.base",
+        "CohereSTT": "llm4free.STT.cohere",
+        "ElevenLabsSTT": "llm4free.STT.elevenlabs",
+        "STTCompatibleProvider": "llm4free.STT.base",
+        "STTModels": "llm4free.STT.base",
+        "TranscriptionResponse": "llm4free.STT.base",
+    },
+    "llm4free.TTI": {
+        "BaseImages": "llm4free.TTI.base",
+        "BingImageAI": "llm4free.TTI.bingimage",
+        "ImageData": "llm4free.TTI.utils",
+        "ImageResponse": "llm4free.TTI.utils",
+        "MagicHourAI": "llm4free.TTI.magichour",
+        "MagicStudioAI": "llm4free.TTI.magicstudio",
+        "MiragicAI": "llm4free.TTI.miragic",
+        "NoLoginTool": "llm4free.TTI.nologintool",
+        "OneFreeAI": "llm4free.TTI.onefreeai",
+        "PerchanceAI": "llm4free.TTI.perchance",
+        "PollinationsAI": "llm4free.TTI.pollinations",
+        "RaphaelAI": "llm4free.TTI.raphael",
+        "TTICompatibleProvider": "llm4free.TTI.base",
+        "TogetherImage": "llm4free.TTI.together",
+        "VisualGPT": "llm4free.TTI.visualgpt",
+    },
+    "llm4free.TTS": {
+        "AsyncBaseTTSProvider": "llm4free.TTS.base",
+        "BaseTTSProvider": "llm4free.TTS.base",
+        "DeepgramTTS": "llm4free.TTS.deepgram",
+        "ElevenlabsTTS": "llm4free.TTS.elevenlabs",
+        "FasterQwen3TTS": "llm4free.TTS.faster_qwen3",
+        "KittenTTS": "llm4free.TTS.kittentts",
+        "LuxTTS": "llm4free.TTS.luxtts",
+        "MurfAITTS": "llm4free.TTS.murfai",
+        "OpenAIFMTTS": "llm4free.TTS.openai_fm",
+        "ParlerTTS": "llm4free.TTS.parler",
+        "PocketTTS": "llm4free.TTS.pockettts",
+        "QwenTTS": "llm4free.TTS.qwen",
+        "SentenceTokenizer": "llm4free.TTS.utils",
+        "SherpaTTS": "llm4free.TTS.sherpa",
+        "StreamElements": "llm4free.TTS.stream_elements",
+        "TTSAI": "llm4free.TTS.ttsai",
+        "XLNKTTS": "llm4free.TTS.xlnk",
+    },
+    "llm4free.llm": {
+        "AI4Chat": "llm4free.llm.ai4chat",
+        "AkashGPT": "llm4free.llm.akashgpt",
+        "Apriel": "llm4free.llm.apriel",
+        "ArtingAI": "llm4free.llm.artingai",
+        "BaseChat": "llm4free.llm.base",
+        "BaseCompletions": "llm4free.llm.base",
+        "Cerebras": "llm4free.llm.Auth.cerebras",
+        "ChatCompletion": "llm4free.llm.utils",
+        "ChatCompletionChunk": "llm4free.llm.utils",
+        "ChatCompletionMessage": "llm4free.llm.utils",
+        "ChatGPT": "llm4free.llm.chatgpt",
+        "ChatGPTReversed": "llm4free.llm.chatgpt",
+        "Choice": "llm4free.llm.utils",
+        "ChoiceDelta": "llm4free.llm.utils",
+        "CompletionUsage": "llm4free.llm.utils",
+        "DeepAI": "llm4free.llm.Auth.deep_ai",
+        "DeepInfra": "llm4free.llm.Auth.deepinfra",
+        "E2B": "llm4free.llm.e2b",
+        "EssentialAI": "llm4free.llm.essentialai",
+        "ExaAI": "llm4free.llm.exaai",
+        "FreeAI": "llm4free.llm.freeai",
+        "FreeAIOnline": "llm4free.llm.freeaionline",
+        "FreeAssist": "llm4free.llm.freeassist",
+        "FuckICoding": "llm4free.llm.fuckicoding",
+        "FunctionCall": "llm4free.llm.utils",
+        "FunctionDefinition": "llm4free.llm.base",
+        "FunctionParameters": "llm4free.llm.base",
+        "GptFree": "llm4free.llm.gptfree",
+        "Groq": "llm4free.llm.Auth.groq",
+        "HeckAI": "llm4free.llm.heckai",
+        "HuggingFace": "llm4free.llm.Auth.huggingface",
+        "IBM": "llm4free.llm.ibm",
+        "K2Think": "llm4free.llm.k2think",
+        "LLMChat": "llm4free.llm.llmchat",
+        "ModelData": "llm4free.llm.utils",
+        "ModelList": "llm4free.llm.utils",
+        "Netwrck": "llm4free.llm.netwrck",
+        "Nvidia": "llm4free.llm.Auth.nvidia",
+        "OllamaSwarm": "llm4free.llm.ollama_swarm",
+        "OpenAICompatibleProvider": "llm4free.llm.base",
+        "OpenRouter": "llm4free.llm.Auth.openrouter",
+        "OperaAria": "llm4free.llm.opera_aria",
+        "PiAI": "llm4free.llm.pi",
+        "Sambanova": "llm4free.llm.Auth.sambanova",
+        "SimpleModelList": "llm4free.llm.base",
+        "TextPollinations": "llm4free.llm.Auth.textpollinations",
+        "TogetherAI": "llm4free.llm.Auth.together_ai",
+        "Tool": "llm4free.llm.base",
+        "ToolCall": "llm4free.llm.utils",
+        "ToolCallType": "llm4free.llm.utils",
+        "ToolDefinition": "llm4free.llm.base",
+        "ToolFunction": "llm4free.llm.utils",
+        "Toolbaz": "llm4free.llm.toolbaz",
+        "TurboSeek": "llm4free.llm.turboseek",
+        "TwoAI": "llm4free.llm.Auth.two_ai",
+        "TypliAI": "llm4free.llm.typliai",
+        "UncensoredChat": "llm4free.llm.Auth.uncensoredchat",
+        "Upstage": "llm4free.llm.Auth.upstage",
+        "WiseCat": "llm4free.llm.wisecat",
+        "Writecream": "llm4free.llm.writecream",
+        "Zenmux": "llm4free.llm.Auth.zenmux",
+        "count_tokens": "llm4free.llm.utils",
+        "format_prompt": "llm4free.llm.utils",
+        "get_last_user_message": "llm4free.llm.utils",
+        "get_system_prompt": "llm4free.llm.utils",
+    },
+    "llm4free.llm.Auth": {
+        "Cerebras": "llm4free.llm.Auth.cerebras",
+        "DeepAI": "llm4free.llm.Auth.deep_ai",
+        "DeepInfra": "llm4free.llm.Auth.deepinfra",
+        "Groq": "llm4free.llm.Auth.groq",
+        "HuggingFace": "llm4free.llm.Auth.huggingface",
+        "Nvidia": "llm4free.llm.Auth.nvidia",
+        "OpenRouter": "llm4free.llm.Auth.openrouter",
+        "Sambanova": "llm4free.llm.Auth.sambanova",
+        "TextPollinations": "llm4free.llm.Auth.textpollinations",
+        "TogetherAI": "llm4free.llm.Auth.together_ai",
+        "TwoAI": "llm4free.llm.Auth.two_ai",
+        "Upstage": "llm4free.llm.Auth.upstage",
+        "Zenmux": "llm4free.llm.Auth.zenmux",
+    },
+}
@@ -0,0 +1,1611 @@
+# Generated by `python -m llm4free.provider_manifest`; do not edit by hand.
+"""Provider manifest: kind -> provider class name -> metadata."""
+
+from typing import Any, Dict
+
+MANIFEST_VERSION = 1
+
+PROVIDERS: Dict[str, Dict[str, Dict[str, Any]]] = {
+    "aisearch": {
+        "BraveSearch": {
+            "module": "llm4free.AISEARCH.BraveSearch",
+            "required_auth": False,
+            "models": [],
+            "capabilities": [],
+            "description": "A class to interact with the Brave Search Ask AI API.",
+        },
+        "IAsk": {
+            "module": "llm4free.AISEARCH.iask_search",
+            "required_auth": False,
+            "models": [],
+            "capabilities": [],
+            "description": "A class to interact with the IAsk AI search API.",
+        },
+        "Monica": {
+            "module": "llm4free.AISEARCH.monica_search",
+            "required_auth": False,
+            "models": [],
+            "capabilities": [],
+            "description": "A class to interact with the Monica stream search API.",
+        },
+        "Perplexity": {
+            "module": "llm4free.AISEARCH.Perplexity",
+            "required_auth": False,
+            "models": [],
+            "capabilities": [],
+            "description": "A class to interact with the Perplexity AI search API.",
+        },
+        "webpilotai": {
+            "module": "llm4free.AISEARCH.webpilotai_search",
+            "required_auth": False,
+            "models": [],
+            "capabilities": [],
+            "description": "A class to interact with the webpilotai (WebPilot) AI search API.",
+        },
+    },
+    "chat": {
+        "AI4Chat": {
+            "module": "llm4free.llm.ai4chat",
+            "required_auth": False,
+            "models": [
+                "gpt-5.2",
+                "claude-haiku-4.5",
+                "gemini-3-flash",
+                "grok-4.1-fast",
+                "kimi-k2.5",
+                "gpt-3.5",
+                "gpt-4o",
+                "gpt-4.5",
+                "gpt-4o-mini",
+                "gpt-4o-search-preview",
+                "gpt-4o-mini-search-preview",
+                "gpt-4.1",
+                "gpt-4.1-mini",
+                "gpt-4.1-nano",
+                "codex-mini",
+                "o1",
+                "o1-pro",
+                "o3-mini",
+                "o3-mini-high",
+                "o4-mini",
+                "o4-mini-high",
+                "gpt-oss-20b",
+                "gpt-oss-120b",
+                "gpt-5-mini",
+                "gpt-5-nano",
+                "gpt-5",
+                "gpt-5.1",
+                "gpt-5.1-codex",
+                "gpt-5.1-codex-mini",
+                "gpt-5.2-codex",
+                "gpt-5.3-codex",
+                "gpt-5.3",
+                "gpt-5.4",
+                "gpt-5.4-pro",
+                "claude-3-haiku",
+                "claude-3.5-haiku",
+                "claude-3.7-sonnet",
+                "claude-sonnet-4",
+                "claude-opus-4",
+                "claude-opus-4.1",
+                "claude-sonnet-4.5",
+                "claude-opus-4.6",
+                "claude-sonnet-4.6",
+                "deepseek-v3",
+                "deepseek-v3.1",
+                "deepseek-v3.2",
+                "r1-distill-qwen-1.5b",
+                "r1-distill-qwen-14b",
+                "r1-distill-qwen-32b",
+                "r1-distill-llama-70b",
+                "r1",
+                "gemini-flash-2.0",
+                "gemini-flash-lite-2.0",
+                "gemini-2.5-flash-lite",
+                "gemini-2.5-flash-preview",
+                "gemini-2.5-pro",
+                "gemma-2-9b",
+                "gemma-2-27b",
+                "gemma-3-27b",
+                "gemini-3-pro",
+                "gemini-3.1-flash-lite",
+                "gemini-3.1-pro",
+                "llama-v3-8b",
+                "llama-v3-70b",
+                "llama-v3.1-8b",
+                "llama-v3.1-70b",
+                "llama-v3.1-405b",
+                "llama-v3.2-1b",
+                "llama-v3.2-3b",
+                "llama-v3.2-11b",
+                "llama-v3.2-90b",
+                "llama-v3.3-70b",
+                "llama-4-scout",
+                "llama-4-maverick",
+                "mistral-7b-instruct",
+                "mistral-7b-instruct-v0.1",
+                "mistral-7b-instruct-v0.3",
+                "mixtral-8x7b-instruct",
+                "mixtral-8x22b-instruct",
+                "mistral-nemo",
+                "mistral-large-2",
+                "mistral-large-3",
+                "ministral-3b",
+                "ministral-8b",
+                "ministral-3-3b",
+                "ministral-3-8b",
+                "ministral-3-14b",
+                "pixtral-12b",
+                "mistral-small-3",
+                "mistral-small-3.1-24b",
+                "mistral-small-3.2-24b",
+                "mistral-medium-3",
+                "codestral",
+                "saba",
+                "devstral-small-1.1",
+                "devstral-medium",
+                "devstral-2",
+                "grok-2",
+                "grok-3-mini-beta",
+                "grok-3-beta",
+                "grok-4",
+                "grok-4-fast",
+                "grok-code-fast-1",
+                "glm-4-32b",
+                "glm-4.5-air",
+                "glm-4.5",
+                "glm-4.6",
+                "glm-4.7-flash",
+                "glm-5",
+                "jamba-mini-1.7",
+                "jamba-large-1.7",
+                "nova-lite-1.0",
+                "nova-micro-1.0",
+                "nova-pro-1.0",
+                "nova-premier-1.0",
+                "nova-2-lite",
+                "qwen-2.5-7b",
+                "qwen-2.5-32b",
+                "qwen-2.5-72b",
+                "qwen-2.5-coder-32b",
+                "qwen-3-14b",
+                "qwen-3-32b",
+                "qwen-3-30b-a3b",
+                "qwen-3-235b-a22b",
+                "qwen-3-coder",
+                "qwen3-coder-plus",
+                "qwen3-max",
+                "qwen-plus",
+                "qwen-max",
+                "qwen-turbo",
+                "qwq-32b",
+                "qwen-3-max-thinking",
+                "qwen-3-coder-next",
+                "qwen-3.5-397b-a17b",
+                "qwen-3.5-plus",
+                "command",
+                "command-a",
+                "command-r",
+                "command-r7b",
+                "command-r-plus",
+                "dolphin-2.9.2-mixtral-8x22b",
+                "inception-mercury",
+                "mercury-2",
+                "inflection-3-pi",
+                "inflection-3-productivity",
+                "lfm-3b",
+                "lfm-7b",
+                "lfm2-2.6b",
+                "lfm2-8b",
+                "magnum-v4-72b",
+                "phi-3-mini-instruct",
+                "phi-3.5-mini-128k-instruct",
+                "phi-3-medium-instruct",
+                "phi-4",
+                "phi-4-reasoning-plus",
+                "wizardlm-2-8x22b",
+                "midnight-rose-70b",
+                "minimax-01",
+                "minimax-m1",
+                "minimax-m2",
+                "minimax-m2.1",
+                "minimax-m2.5",
+                "kimi-k2",
+                "kimi-k2-thinking",
+                "mythomax-13b",
+                "noromaid-20b",
+                "hermes-2-pro-llama-3-8b",
+                "hermes-2-mixtral-8x7b-dpo",
+                "hermes-3-70b-instruct",
+                "hermes-3-405b-instruct",
+                "nvidia-llama-3.1-nemotron-70b",
+                "sonar",
+                "sonar-reasoning",
+                "sonar-pro",
+                "sonar-reasoning-pro",
+                "sonar-deep-research",
+                "rocinante-12b",
+                "unslopnemo-v4.1",
+                "capybara-34b",
+                "capybara-7b",
+                "chronos-hermes-13b-v2",
+                "claude-3-opus",
+                "claude-3-sonnet",
+                "claude-3.5-sonnet",
+                "claude-instant-v1",
+                "claude-opus-4.7",
+                "claude-v2.0",
+                "claude-v2.1",
+                "codellama-34b",
+                "codellama-70b-instruct",
+                "codestral-mamba",
+                "dbrx-132b-instruct",
+                "deepseek-v3-0324",
+                "deepseek-v4-flash",
+                "deepseek-v4-pro",
+                "deepseek-v2-chat",
+                "deepseek-coder",
+                "devstral-small",
+                "dolphin-2.6-mixtral-8x7b",
+                "dolphin-llama-3-70b",
+                "firellava-13b",
+                "glm-5-turbo",
+                "glm-5.1",
+                "gpt-5.4-mini",
+                "gpt-5.4-nano",
+                "gpt-5.5",
+                "gemini-1.0-pro",
+                "gemini-1.5-flash",
+                "gemini-1.5-flash-8b",
+                "gemini-1.5-pro",
+                "gemini-2.0-flash",
+                "gemini-2.0-flash-thinking-experimental",
+                "gemini-pro-2.0-experimental",
+                "gemma-4-31b",
+                "gemma-7b",
+                "grok-4.2",
+                "grok-4.2-multi-agent",
+                "grok-beta",
+                "hermes-13b",
+                "hermes-2-mistral-7b-dpo",
+                "hermes-2-mixtral-8x7b-sft",
+                "hermes-2-theta-8b",
+                "hermes-4-70b",
+                "inferor-12b",
+                "jamba-1.5-large",
+                "jamba-1.5-mini",
+                "jamba-instruct",
+                "jamba-large-1.6",
+                "jamba-mini-1.6",
+                "kimi-k2.6",
+                "llava-v1.6-34b",
+                "llama-3-lumimaid-70b",
+                "llama-3-lumimaid-8b",
+                "llama-3-soliloquy-8b-v2",
+                "llama-3.1-sonar-405b-online",
+                "llama-3.1-sonar-70b-online",
+                "llama-3.1-sonar-8b-online",
+                "llama-v2-13b",
+                "llama-v2-70b",
+                "llama3-sonar-70b-online",
+                "llama3-sonar-8b-online",
+                "lumimaid-v0.2-70b",
+                "lzlv-70b",
+                "magnum-72b",
+                "magnum-v2-72b",
+                "mimo-v2-pro",
+                "minimax-m2.7",
+                "mistral-7b-instruct-v0.2",
+                "mistral-openorca-7b",
+                "mistral-small-4",
+                "mythomist-7b",
+                "nvidia-nemotron-4-340b-instruct",
+                "nemotron-3-super",
+                "noromaid-mixtral-8x7b-instruct",
+                "olmo-7b-instruct",
+                "olmo-2-32b-instruct",
+                "openchat-3.5-8b",
+                "openchat-3.6-8b",
+                "openhermes-2.5-mistral-7b",
+                "phind-codellama-34b-v2",
+                "qwq-32b-preview",
+                "qwen-1.5-110b-chat",
+                "qwen-1.5-4b-chat",
+                "qwen-1.5-72b",
+                "qwen-1.5-7b-chat",
+                "qwen-2-72b",
+                "qwen-2-7b",
+                "qwen3.5-9b",
+                "stripedhyena-nous-7b",
+                "wizardlm-2-7b",
+                "yi-1.5-34b",
+                "yi-34b",
+                "yi-6b",
+                "yi-large",
+                "yi-large-turbo",
+                "o1-mini",
+                "o1-preview",
+            ],
+            "capabilities": [],
+            "description": "OpenAI-compatible client for AI4Chat API with support for multiple AI models.",
+        },
+        "AkashGPT": {
+            "module": "llm4free.llm.akashgpt",
+            "required_auth": False,
+            "models": [
+                "Qwen/Qwen3-30B-A3B",
+                "DeepSeek-V3.1",
+                "Meta-Llama-3-3-70B-Instruct",
+                "DeepSeek-V3.2",
+            ],
+            "capabilities": [],
+            "description": "OpenAI-compatible client for AkashGPT API.",
+        },
+        "Apriel": {
+            "module": "llm4free.llm.apriel",
+            "required_auth": False,
+            "models": [
+                "Apriel-1.6-15B-Thinker",
+            ],
+            "capabilities": [],
+            "description": "",
+        },
+        "ArtingAI": {
+            "module": "llm4free.llm.artingai",
+            "required_auth": False,
+            "models": [
+                "gpt-5",
+                "gpt-5.1",
+                "gpt-5.2",
+                "gpt-4o-mini",
+                "o4-mini",
+                "gemini-2.5-pro",
+                "gemini-3-pro-preview",
+                "deepseek-chat",
+                "deepseek-reasoner",
+            ],
+            "capabilities": [],
+            "description": "",
+        },
+        "Cerebras": {
+            "module": "llm4free.llm.Auth.cerebras",
+            "required_auth": True,
+            "models": [],
+            "capabilities": [
+                "async",
+            ],
+            "description": "",
+        },
+        "ChatGPT": {
+            "module": "llm4free.llm.chatgpt",
+            "required_auth": False,
+            "models": [
+                "auto",
+                "gpt-5-1",
+                "gpt-5-1-instant",
+                "gpt-5-1-thinking",
+                "gpt-5",
+                "gpt-5-instant",
+                "gpt-5-thinking",
+                "gpt-4",
+                "gpt-4.1",
+                "gpt-4-1",
+                "gpt-4.1-mini",
+                "gpt-4-1-mini",
+                "gpt-4.5",
+                "gpt-4-5",
+                "gpt-4o",
+                "gpt-4o-mini",
+                "o1",
+                "o1-mini",
+                "o3-mini",
+                "o3-mini-high",
+                "o4-mini",
+                "o4-mini-high",
+            ],
+            "capabilities": [],
+            "description": "OpenAI-compatible client for ChatGPT API.",
+        },
+        "DeepAI": {
+            "module": "llm4free.llm.Auth.deep_ai",
+            "required_auth": True,
+            "models": [
+                "standard",
+                "genius",
+                "super-genius",
+                "deepseek-v3.2",
+                "gemini-2.5-flash-lite",
+                "gpt-4.1-nano",
+                "gpt-oss-120b",
+                "gemma-3-12b",
+                "qwen3-30b",
+                "gpt-5-nano",
+                "llama-3.3-70b-instruct",
+                "llama-3.1-8b-instant",
+                "llama-4-scout",
+                "gemma2-9b",
+                "gpt-4o-mini",
+                "gpt-4.1",
+                "o4-mini",
+                "o3",
+                "gemini-3-pro",
+                "claude-4.5-opus",
+                "grok-4",
+                "gpt-5-chat-latest",
+                "gpt-5.2",
+                "chatgpt-4o-latest",
+            ],
+            "capabilities": [],
+            "description": "OpenAI-compatible client for DeepAI API.",
+        },
+        "DeepInfra": {
+            "module": "llm4free.llm.Auth.deepinfra",
+            "required_auth": True,
+            "models": [
+                "meta-llama/Llama-3.3-70B-Instruct-Turbo",
+                "meta-llama/Meta-Llama-3-8B-Instruct",
+                "nvidia/NVIDIA-Nemotron-3-Super-120B-A12B",
+                "deepseek-ai/DeepSeek-V3.1",
+                "Qwen/Qwen2.5-72B-Instruct",
+            ],
+            "capabilities": [
+                "async",
+            ],
+            "description": "DeepInfra OpenAI-compatible provider.",
+        },
+        "E2B": {
+            "module": "llm4free.llm.e2b",
+            "required_auth": False,
+            "models": [
+                "claude-3.7-sonnet",
+                "claude-3.5-haiku",
+                "claude-opus-4-1-20250805",
+                "claude-opus-4-5-20251101",
+                "claude-sonnet-4-5-20250929",
+                "claude-haiku-4-5-20251001",
+                "o1-mini",
+                "o3-mini",
+                "o4-mini",
+                "o1",
+                "o3",
+                "gpt-4.5-preview",
+                "gpt-4o",
+                "gpt-4o-mini",
+                "gpt-4-turbo",
+                "gpt-4.1",
+                "gpt-4.1-mini",
+                "gpt-4.1-nano",
+                "gemini-1.5-pro-002",
+                "gemini-2.5-pro-exp-03-25",
+                "gemini-2.0-flash",
+                "gemini-2.0-flash-lite",
+                "gemini-2.0-flash-thinking-exp-01-21",
+                "qwen-qwq-32b-preview",
+                "deepseek-chat",
+                "codestral-2501",
+                "mistral-large-latest",
+                "llama4-maverick-instruct-basic",
+                "llama4-scout-instruct-basic",
+                "llama-v3p1-405b-instruct",
+                "qwen2p5-coder-32b-instruct",
+                "deepseek-r1",
+                "claude-opus-4-20250514",
+                "claude-sonnet-4",
+                "gpt-5",
+                "gpt-5-mini",
+                "gpt-5-nano",
+                "openai/gpt-oss-120b",
+                "moonshotai/kimi-k2-instruct",
+                "qwen/qwen3-32b",
+                "llama-3.3-70b-versatile",
+                "accounts/fireworks/models/qwen3-coder-480b-a35b-instruct",
+                "accounts/fireworks/models/qwen3-235b-a22b-thinking-2507",
+                "accounts/fireworks/models/qwen3-235b-a22b-instruct-2507",
+                "accounts/fireworks/models/zai-org/glm-4p5",
+                "accounts/fireworks/models/kimi-k2-instruct",
+                "grok-4",
+                "grok-3",
+                "grok-3-mini",
+                "grok-3-fast",
+                "grok-3-mini-fast",
+                "grok-code-fast-1",
+                "meta-llama/Meta-Llama-3.1-70B-Instruct-Turbo",
+            ],
+            "capabilities": [],
+            "description": "OpenAI-compatible client for the E2B API (fragments.e2b.dev).",
+        },
+        "EssentialAI": {
+            "module": "llm4free.llm.essentialai",
+            "required_auth": False,
+            "models": [
+                "rnj-1-instruct",
+            ],
+            "capabilities": [],
+            "description": "",
+        },
+        "ExaAI": {
+            "module": "llm4free.llm.exaai",
+            "required_auth": False,
+            "models": [
+                "O3-Mini",
+            ],
+            "capabilities": [],
+            "description": "OpenAI-compatible client for ExaAI API.",
+        },
+        "FreeAI": {
+            "module": "llm4free.llm.freeai",
+            "required_auth": False,
+            "models": [
+                "qwen7b",
+                "qwen3-8b",
+                "deepseek-r1",
+                "deepseek-r1-7b",
+                "mistral",
+                "qwen/qwen3-8b",
+                "deepseek/deepseek-chat-v3-0324",
+                "deepseek/deepseek-r1",
+                "openai/gpt-4o-mini",
+                "openai/gpt-4.1-nano",
+                "openai/gpt-4.1-mini",
+                "openai/gpt-4.1",
+                "openai/gpt-5",
+                "openai/gpt-5-mini",
+                "openai/gpt-5-nano",
+                "openai/o4-mini",
+                "anthropic/claude-haiku-4.5",
+                "anthropic/claude-sonnet-4.6",
+                "anthropic/claude-opus-4.6",
+                "google/gemini-2.5-flash",
+                "google/gemini-2.5-pro",
+                "google/gemini-3.1-flash-lite",
+                "google/gemini-3-flash-preview",
+                "meta-llama/llama-4-scout",
+                "meta-llama/llama-4-maverick",
+                "meta-llama/llama-3.3-70b-instruct",
+                "mistralai/mistral-small-3.2-24b-instruct",
+                "mistralai/mistral-large-2411",
+                "qwen/qwen2.5-72b-instruct",
+                "qwen/qwen3-32b",
+                "qwen/qwen3-235b-a22b",
+                "deepseek/deepseek-v3-0324",
+                "deepseek/deepseek-v3.1",
+                "nvidia/llama-3.3-nemotron-super-49b-v1.5",
+                "cohere/command-a",
+                "x-ai/grok-4.3",
+                "z-ai/glm-5",
+                "minimax/minimax-m3",
+                "qwen/qwen3.7-plus",
+                "stepfun/step-3.7-flash",
+            ],
+            "capabilities": [],
+            "description": "",
+        },
+        "FreeAIOnline": {
+            "module": "llm4free.llm.freeaionline",
+            "required_auth": False,
+            "models": [
+                "gpt-4o",
+            ],
+            "capabilities": [],
+            "description": "Free AI - No Login & Unlimited via free-ai-online.com",
+        },
+        "FreeAssist": {
+            "module": "llm4free.llm.freeassist",
+            "required_auth": False,
+            "models": [
+                "google/gemini-2.5-flash-lite",
+                "google/gemini-2.5-flash",
+                "google/gemini-2.5-pro",
+                "openai/gpt-5-nano",
+                "openai/gpt-5-mini",
+                "openai/gpt-5",
+                "anthropic/claude-sonnet-4-5",
+                "anthropic/claude-opus-4-1-20250805",
+            ],
+            "capabilities": [],
+            "description": "FreeAssist - A free OpenAI-compatible provider using FreeAssist.ai",
+        },
+        "FuckICoding": {
+            "module": "llm4free.llm.fuckicoding",
+            "required_auth": False,
+            "models": [
+                "mimo-v2.5-pro",
+                "gpt-4o",
+                "gpt-4-turbo",
+                "deepseek-chat",
+                "claude-3.5",
+                "gpt-5",
+                "gpt-5-mini",
+                "gpt-5-nano",
+                "claude-4.5-haiku",
+                "gemini-2.5-lite",
+                "gpt-5.4-mini",
+            ],
+            "capabilities": [],
+            "description": "Free ChatGPT Mirror via link.fuckicoding.com (Lite-GPT)",
+        },
+        "GptFree": {
+            "module": "llm4free.llm.gptfree",
+            "required_auth": False,
+            "models": [
+                "gpt-4o",
+            ],
+            "capabilities": [],
+            "description": "GptFree - A free OpenAI-compatible provider via gptfree.com",
+        },
+        "Groq": {
+            "module": "llm4free.llm.Auth.groq",
+            "required_auth": True,
+            "models": [
+                "distil-whisper-large-v3-en",
+                "gemma2-9b-it",
+                "llama-3.3-70b-versatile",
+                "llama-3.1-8b-instant",
+                "llama-guard-3-8b",
+                "llama3-70b-8192",
+                "llama3-8b-8192",
+                "whisper-large-v3",
+                "whisper-large-v3-turbo",
+                "meta-llama/llama-4-scout-17b-16e-instruct",
+                "meta-llama/llama-4-maverick-17b-128e-instruct",
+                "playai-tts",
+                "playai-tts-arabic",
+                "qwen-qwq-32b",
+                "mistral-saba-24b",
+                "qwen-2.5-coder-32b",
+                "qwen-2.5-32b",
+                "deepseek-r1-distill-qwen-32b",
+                "deepseek-r1-distill-llama-70b",
+                "llama-3.3-70b-specdec",
+                "llama-3.2-1b-preview",
+                "llama-3.2-3b-preview",
+                "llama-3.2-11b-vision-preview",
+                "llama-3.2-90b-vision-preview",
+                "mixtral-8x7b-32768",
+            ],
+            "capabilities": [
+                "async",
+            ],
+            "description": "",
+        },
+        "HeckAI": {
+            "module": "llm4free.llm.heckai",
+            "required_auth": False,
+            "models": [
+                "deepseek/deepseek-v4-flash",
+                "deepseek/deepseek-v4-pro",
+                "tencent/hy3-preview",
+                "qwen/qwen3.7-plus",
+                "stepfun/step-3.7-flash",
+                "google/gemini-3.1-flash-lite",
+                "google/gemini-3-flash-preview",
+                "openai/gpt-5.4-mini",
+                "minimax/minimax-m3",
+            ],
+            "capabilities": [],
+            "description": "",
+        },
+        "HuggingFace": {
+            "module": "llm4free.llm.Auth.huggingface",
+            "required_auth": True,
+            "models": [],
+            "capabilities": [],
+            "description": "OpenAI-compatible client for Hugging Face Inference API.",
+        },
+        "IBM": {
+            "module": "llm4free.llm.ibm",
+            "required_auth": False,
+            "models": [
+                "granite-chat",
+                "granite-thinking",
+                "granite-search",
+                "granite-research",
+            ],
+            "capabilities": [],
+            "description": "OpenAI-compatible client for IBM Granite Playground API.",
+        },
+        "K2Think": {
+            "module": "llm4free.llm.k2think",
+            "required_auth": False,
+            "models": [
+                "MBZUAI-IFM/K2-Think-v2",
+            ],
+            "capabilities": [],
+            "description": "OpenAI-compatible client for K2Think AI API.",
+        },
+        "LLMChat": {
+            "module": "llm4free.llm.llmchat",
+            "required_auth": False,
+            "models": [
+                "@cf/aisingapore/gemma-sea-lion-v4-27b-it",
+                "@cf/deepseek-ai/deepseek-math-7b-instruct",
+                "@cf/deepseek-ai/deepseek-r1-distill-qwen-32b",
+                "@cf/defog/sqlcoder-7b-2",
+                "@cf/fblgit/una-cybertron-7b-v2-bf16",
+                "@cf/google/gemma-2b-it-lora",
+                "@cf/google/gemma-3-12b-it",
+                "@cf/ibm-granite/granite-4.0-h-micro",
+                "@cf/meta-llama/llama-2-7b-chat-hf-lora",
+                "@cf/meta/llama-2-7b-chat-fp16",
+                "@cf/meta/llama-2-7b-chat-int8",
+                "@cf/meta/llama-3-8b-instruct",
+                "@cf/meta/llama-3-8b-instruct-awq",
+                "@cf/meta/llama-3.1-70b-instruct",
+                "@cf/meta/llama-3.1-8b-instruct",
+                "@cf/meta/llama-3.2-1b-instruct",
+                "@cf/meta/llama-3.2-3b-instruct",
+                "@cf/meta/llama-3.3-70b-instruct-fp8-fast",
+                "@cf/meta/llama-4-scout-17b-16e-instruct",
+                "@cf/meta/llama/llama-2-7b-chat-hf-lora",
+                "@cf/meta/meta-llama-3-8b-instruct",
+                "@cf/microsoft/phi-2",
+                "@cf/mistral/mistral-7b-instruct-v0.1-vllm",
+                "@cf/mistral/mistral-7b-instruct-v0.2-lora",
+                "@cf/mistralai/mistral-small-3.1-24b-instruct",
+                "@cf/moonshotai/kimi-k2.5",
+                "@cf/moonshotai/kimi-k2.7-code",
+                "@cf/nvidia/nemotron-3-120b-a12b",
+                "@cf/openchat/openchat-3.5-0106",
+                "@cf/qwen/qwen1.5-0.5b-chat",
+                "@cf/qwen/qwen1.5-1.8b-chat",
+                "@cf/qwen/qwen1.5-14b-chat-awq",
+                "@cf/qwen/qwen1.5-7b-chat-awq",
+                "@cf/qwen/qwen2.5-coder-32b-instruct",
+                "@cf/qwen/qwen3-30b-a3b-fp8",
+                "@cf/qwen/qwq-32b",
+                "@cf/tiiuae/falcon-7b-instruct",
+                "@cf/tinyllama/tinyllama-1.1b-chat-v1.0",
+                "@cf/zai-org/glm-4.7-flash",
+                "@cf/zai-org/glm-5.2",
+                "@hf/google/gemma-7b-it",
+                "@hf/meta-llama/meta-llama-3-8b-instruct",
+                "@hf/mistral/mistral-7b-instruct-v0.2",
+                "@hf/nexusflow/starling-lm-7b-beta",
+                "@hf/thebloke/deepseek-coder-6.7b-base-awq",
+                "@hf/thebloke/deepseek-coder-6.7b-instruct-awq",
+                "@hf/thebloke/llama-2-13b-chat-awq",
+                "@hf/thebloke/llamaguard-7b-awq",
+                "@hf/thebloke/mistral-7b-instruct-v0.1-awq",
+                "@hf/thebloke/neural-chat-7b-v3-1-awq",
+                "@hf/thebloke/openhermes-2.5-mistral-7b-awq",
+                "@hf/thebloke/zephyr-7b-beta-awq",
+            ],
+            "capabilities": [],
+            "description": "",
+        },
+        "Netwrck": {
+            "module": "llm4free.llm.netwrck",
+            "required_auth": False,
+            "models": [
+                "thedrummer/skyfall-36b-v2",
+                "thedrummer/valkyrie-49b-v1",
+                "sao10k/l3-euryale-70b",
+                "deepseek/deepseek-chat",
+                "deepseek/deepseek-r1",
+                "minimax/minimax-m2.5",
+                "gryphe/mythomax-l2-13b",
+                "neversleep/llama-3.1-lumimaid-8b",
+                "neversleep/llama-3.1-lumimaid-70b",
+                "nvidia/llama-3.1-nemotron-70b-instruct",
+            ],
+            "capabilities": [],
+            "description": "OpenAI-compatible client for Netwrck API.",
+        },
+        "Nvidia": {
+            "module": "llm4free.llm.Auth.nvidia",
+            "required_auth": True,
+            "models": [],
+            "capabilities": [
+                "async",
+            ],
+            "description": "OpenAI-compatible client for Nvidia NIM API.",
+        },
+        "OllamaSwarm": {
+            "module": "llm4free.llm.ollama_swarm",
+            "required_auth": False,
+            "models": [],
+            "capabilities": [],
+            "description": "",
+        },
+        "OpenRouter": {
+            "module": "llm4free.llm.Auth.openrouter",
+            "required_auth": True,
+            "models": [],
+            "capabilities": [
+                "tools",
+                "tool_choice",
+                "async",
+            ],
+            "description": "OpenAI-compatible client for OpenRouter API.",
+        },
+        "OperaAria": {
+            "module": "llm4free.llm.opera_aria",
+            "required_auth": False,
+            "models": [
+                "aria",
+                "aria-legacy",
+            ],
+            "capabilities": [],
+            "description": "OpenAI-compatible client for Opera Aria.",
+        },
+        "PiAI": {
+            "module": "llm4free.llm.pi",
+            "required_auth": False,
+            "models": [
+                "inflection_3_pi",
+            ],
+            "capabilities": [],
+            "description": "PiAI provider following OpenAI-compatible interface.",
+        },
+        "Sambanova": {
+            "module": "llm4free.llm.Auth.sambanova",
+            "required_auth": True,
+            "models": [],
+            "capabilities": [],
+            "description": "OpenAI-compatible client for Sambanova API.",
+        },
+        "TextPollinations": {
+            "module": "llm4free.llm.Auth.textpollinations",
+            "required_auth": True,
+            "models": [
+                "openai",
+                "openai-large",
+                "openai-fast",
+                "gemini",
+                "deepseek",
+                "mistral",
+            ],
+            "capabilities": [],
+            "description": "OpenAI-compatible client for TextPollinations API.",
+        },
+        "TogetherAI": {
+            "module": "llm4free.llm.Auth.together_ai",
+            "required_auth": True,
+            "models": [],
+            "capabilities": [
+                "async",
+            ],
+            "description": "OpenAI-compatible client for TogetherAI API.",
+        },
+        "Toolbaz": {
+            "module": "llm4free.llm.toolbaz",
+            "required_auth": False,
+            "models": [
+                "gemini-3-flash",
+                "gemini-3.1-flash-lite",
+                "gemini-2.5-flash",
+                "gemini-2.5-pro",
+                "gemini-2.0-flash-thinking",
+                "gemini-2.0-flash",
+                "claude-sonnet-4",
+                "gpt-5",
+                "gpt-5.2",
+                "gpt-oss-120b",
+                "o3-mini",
+                "gpt-4o",
+                "gpt-4o-latest",
+                "grok-4-fast",
+                "toolbaz-v4.5-fast",
+                "toolbaz_v4",
+                "deepseek-v3.1",
+                "deepseek-v3",
+                "deepseek-r1",
+                "Llama-4-Maverick",
+                "midnight-rose",
+                "unfiltered_x",
+                "L3-70B-Euryale-v2.1",
+            ],
+            "capabilities": [],
+            "description": "OpenAI-compatible client for Toolbaz API.",
+        },
+        "TurboSeek": {
+            "module": "llm4free.llm.turboseek",
+            "required_auth": False,
+            "models": [
+                "gpt-oss",
+            ],
+            "capabilities": [],
+            "description": "",
+        },
+        "TwoAI": {
+            "module": "llm4free.llm.Auth.two_ai",
+            "required_auth": True,
+            "models": [
+                "sutra-v2",
+                "sutra-r0",
+            ],
+            "capabilities": [],
+            "description": "OpenAI-compatible client for the TwoAI API.",
+        },
+        "TypliAI": {
+            "module": "llm4free.llm.typliai",
+            "required_auth": False,
+            "models": [
+                "openai/gpt-4o-mini",
+                "openai/gpt-4.1-mini",
+                "openai/gpt-4.1",
+                "openai/gpt-5-nano",
+                "openai/gpt-5-mini",
+                "openai/gpt-5.2",
+                "openai/gpt-5.2-pro",
+                "google/gemini-2.5-flash",
+                "anthropic/claude-haiku-4-5",
+                "xai/grok-4-fast-reasoning",
+                "xai/grok-4-fast",
+                "moonshotai/kimi-k2.5",
+                "alibaba/qwen-3-235b",
+            ],
+            "capabilities": [],
+            "description": "OpenAI-compatible client for TypliAI.",
+        },
+        "UncensoredChat": {
+            "module": "llm4free.llm.Auth.uncensoredchat",
+            "required_auth": True,
+            "models": [
+                "assistant",
+                "gigachad",
+                "donald-trump",
+                "mental-health",
+                "jeffrey-epstein",
+                "sydney-sweeney",
+                "steve-jobs",
+                "ana-de-amars",
+                "mahatma-gandhi",
+                "marie-curie",
+                "cleopatra",
+            ],
+            "capabilities": [],
+            "description": "Free AI Chat via uncensored.chat (OpenAI-compatible API)",
+        },
+        "Upstage": {
+            "module": "llm4free.llm.Auth.upstage",
+            "required_auth": True,
+            "models": [
+                "solar-1-pro",
+                "solar-pro-2",
+                "solar-pro-3",
+            ],
+            "capabilities": [],
+            "description": "Upstage Solar API Provider - OpenAI Compatible.",
+        },
+        "WiseCat": {
+            "module": "llm4free.llm.wisecat",
+            "required_auth": False,
+            "models": [
+                "WiseCat/chat-model-small",
+            ],
+            "capabilities": [],
+            "description": "OpenAI-compatible client for WiseCat API.",
+        },
+        "Writecream": {
+            "module": "llm4free.llm.writecream",
+            "required_auth": False,
+            "models": [
+                "writecream",
+            ],
+            "capabilities": [],
+            "description": "OpenAI-compatible client for Writecream API.",
+        },
+        "Zenmux": {
+            "module": "llm4free.llm.Auth.zenmux",
+            "required_auth": True,
+            "models": [
+                "z-ai/glm-4.6v-flash",
+            ],
+            "capabilities": [],
+            "description": "",
+        },
+    },
+    "stt": {
+        "CohereSTT": {
+            "module": "llm4free.STT.cohere",
+            "required_auth": False,
+            "models": [
+                "cohere-multilingual-asr",
+            ],
+            "capabilities": [],
+            "description": "OpenAI-compatible client for Cohere Multilingual ASR API.",
+        },
+        "ElevenLabsSTT": {
+            "module": "llm4free.STT.elevenlabs",
+            "required_auth": False,
+            "models": [
+                "scribe_v1",
+            ],
+            "capabilities": [],
+            "description": "OpenAI-compatible client for ElevenLabs STT API.",
+        },
+    },
+    "tti": {
+        "BingImageAI": {
+            "module": "llm4free.TTI.bingimage",
+            "required_auth": True,
+            "models": [
+                "dalle3",
+                "mai-image-1",
+                "gpt4o",
+            ],
+            "capabilities": [],
+            "description": "Bing Image Creator TTI Provider.",
+        },
+        "MagicHourAI": {
+            "module": "llm4free.TTI.magichour",
+            "required_auth": False,
+            "models": [
+                "general",
+                "photorealistic",
+                "cinematic",
+                "anime",
+                "cartoon",
+                "watercolor",
+                "digital-art",
+                "fantasy",
+                "vector",
+                "minimalist",
+                "illustration",
+                "3d-render",
+                "oil-painting",
+                "sketch",
+                "retro",
+                "surreal",
+            ],
+            "capabilities": [],
+            "description": "MagicHour AI Free TTI Provider for LLM4Free.",
+        },
+        "MagicStudioAI": {
+            "module": "llm4free.TTI.magicstudio",
+            "required_auth": False,
+            "models": [
+                "magicstudio",
+            ],
+            "capabilities": [],
+            "description": "MagicStudio AI TTI Provider - Generates images through MagicStudio's public endpoint.",
+        },
+        "MiragicAI": {
+            "module": "llm4free.TTI.miragic",
+            "required_auth": False,
+            "models": [
+                "flux",
+                "turbo",
+                "gptimage",
+            ],
+            "capabilities": [],
+            "description": "Miragic AI TTI Provider implementation.",
+        },
+        "NoLoginTool": {
+            "module": "llm4free.TTI.nologintool",
+            "required_auth": False,
+            "models": [
+                "flux",
+                "@cf/black-forest-labs/flux-1-schnell",
+                "@cf/bytedance/stable-diffusion-xl-lightning",
+                "@cf/stabilityai/stable-diffusion-xl-base-1.0",
+                "stable_diffusion",
+                "Albedobase XL (SDXL)",
+                "Anything Diffusion",
+            ],
+            "capabilities": [],
+            "description": "",
+        },
+        "OneFreeAI": {
+            "module": "llm4free.TTI.onefreeai",
+            "required_auth": False,
+            "models": [
+                "qwen_image_plus",
+                "flux_1_1_pro",
+                "flux_1_1_pro_ultra",
+                "nano_banana",
+                "nano_banana_pro",
+            ],
+            "capabilities": [],
+            "description": "",
+        },
+        "PerchanceAI": {
+            "module": "llm4free.TTI.perchance",
+            "required_auth": False,
+            "models": [
+                "2d-disney-character",
+                "3d-disney-character",
+                "anime",
+                "anime-screencap",
+                "cartoon",
+                "casual-photo",
+                "cinematic",
+                "claymation",
+                "concept-art",
+                "concept-sketch",
+                "crayon-drawing",
+                "cute-anime",
+                "cute-illustration",
+                "digital-painting",
+                "disney-sketch",
+                "drawn-anime",
+                "fantasy-landscape",
+                "fantasy-painting",
+                "fantasy-portrait",
+                "flat-illustration",
+                "illustration",
+                "manga",
+                "medieval",
+                "no-style",
+                "oil-painting",
+                "oil-painting-old",
+                "oil-painting-realism",
+                "painted-anime",
+                "painterly",
+                "pencil",
+                "pixel-art",
+                "professional-photo",
+                "soft-anime",
+                "studio-ghibli",
+                "tattoo-design",
+                "vintage-comic",
+                "waifu",
+                "watercolor",
+            ],
+            "capabilities": [],
+            "description": "",
+        },
+        "PollinationsAI": {
+            "module": "llm4free.TTI.pollinations",
+            "required_auth": False,
+            "models": [
+                "flux",
+                "flux-pro",
+                "flux-realism",
+                "flux-anime",
+                "flux-3d",
+                "any-dark",
+                "turbo",
+                "gptimage",
+                "gptimage-large",
+                "kontext",
+                "nanobanana",
+                "nanobanana-pro",
+                "seedream",
+                "seedream-pro",
+                "qwen-image",
+                "grok-imagine",
+            ],
+            "capabilities": [],
+            "description": "PollinationsAI TTI Provider - Allows setting a custom seed for reproducible results.",
+        },
+        "RaphaelAI": {
+            "module": "llm4free.TTI.raphael",
+            "required_auth": True,
+            "models": [
+                "raphael-basic",
+                "raphael-2",
+                "gpt-image-2",
+                "nano-banana-2",
+                "nano-banana-pro",
+                "seedream-5",
+            ],
+            "capabilities": [],
+            "description": "",
+        },
+        "TogetherImage": {
+            "module": "llm4free.TTI.together",
+            "required_auth": True,
+            "models": [],
+            "capabilities": [],
+            "description": "Together.xyz Text-to-Image provider",
+        },
+        "VisualGPT": {
+            "module": "llm4free.TTI.visualgpt",
+            "required_auth": True,
+            "models": [
+                "nano-banana",
+            ],
+            "capabilities": [],
+            "description": "VisualGPT AI Image Generator Provider.",
+        },
+    },
+    "tts": {
+        "DeepgramTTS": {
+            "module": "llm4free.TTS.deepgram",
+            "required_auth": False,
+            "models": [
+                "aura-2",
+            ],
+            "capabilities": [],
+            "description": "Text-to-speech provider using the Deepgram Aura-2 API.",
+        },
+        "ElevenlabsTTS": {
+            "module": "llm4free.TTS.elevenlabs",
+            "required_auth": True,
+            "models": [
+                "eleven_multilingual_v2",
+                "eleven_flash_v2_5",
+                "eleven_flash_v2",
+                "eleven_turbo_v2_5",
+                "eleven_turbo_v2",
+                "eleven_monolingual_v1",
+            ],
+            "capabilities": [],
+            "description": "Text-to-speech provider using the ElevenLabs API.",
+        },
+        "FasterQwen3TTS": {
+            "module": "llm4free.TTS.faster_qwen3",
+            "required_auth": False,
+            "models": [
+                "Qwen/Qwen3-TTS-12Hz-0.6B-Base",
+                "Qwen/Qwen3-TTS-12Hz-1.7B-Base",
+                "Qwen/Qwen3-TTS-12Hz-0.6B-CustomVoice",
+                "Qwen/Qwen3-TTS-12Hz-1.7B-CustomVoice",
+                "Qwen/Qwen3-TTS-12Hz-1.7B-VoiceDesign",
+            ],
+            "capabilities": [],
+            "description": "Text-to-speech provider using the Faster Qwen3-TTS API (Hugging Face Spaces).",
+        },
+        "KittenTTS": {
+            "module": "llm4free.TTS.kittentts",
+            "required_auth": False,
+            "models": [
+                "nano",
+                "micro",
+                "mini",
+            ],
+            "capabilities": [],
+            "description": "KittenTTS provider.",
+        },
+        "LuxTTS": {
+            "module": "llm4free.TTS.luxtts",
+            "required_auth": False,
+            "models": [
+                "luxtts",
+            ],
+            "capabilities": [],
+            "description": "LuxTTS voice cloning provider.",
+        },
+        "MurfAITTS": {
+            "module": "llm4free.TTS.murfai",
+            "required_auth": False,
+            "models": [],
+            "capabilities": [],
+            "description": "Text-to-speech provider using the MurfAITTS API with OpenAI-compatible interface.",
+        },
+        "OpenAIFMTTS": {
+            "module": "llm4free.TTS.openai_fm",
+            "required_auth": False,
+            "models": [
+                "gpt-4o-mini-tts",
+                "tts-1",
+                "tts-1-hd",
+            ],
+            "capabilities": [],
+            "description": "Text-to-speech provider using the OpenAI.fm API with OpenAI-compatible interface.",
+        },
+        "ParlerTTS": {
+            "module": "llm4free.TTS.parler",
+            "required_auth": False,
+            "models": [
+                "parler-mini-v1",
+                "parler-large-v1",
+            ],
+            "capabilities": [],
+            "description": "Text-to-speech provider using the Parler-TTS API (Hugging Face Spaces).",
+        },
+        "PocketTTS": {
+            "module": "llm4free.TTS.pockettts",
+            "required_auth": False,
+            "models": [
+                "pocket-tts",
+                "tts-1.6b",
+            ],
+            "capabilities": [],
+            "description": "Backward compatibility alias for KyutaiTTS.",
+        },
+        "QwenTTS": {
+            "module": "llm4free.TTS.qwen",
+            "required_auth": False,
+            "models": [
+                "qwen3-tts",
+            ],
+            "capabilities": [],
+            "description": "Text-to-speech provider using the Qwen3-TTS API (Hugging Face Spaces).",
+        },
+        "SherpaTTS": {
+            "module": "llm4free.TTS.sherpa",
+            "required_auth": False,
+            "models": [
+                "csukuangfj/kokoro-en-v0_19|11 speakers",
+                "csukuangfj/kitten-kitten-en-v0_1-fp16|8 speakers",
+                "csukuangfj/kitten-nano-en-v0_2-fp16|8 speakers",
+                "csukuangfj/kitten-nano-en-v0_1-fp16|8 speakers",
+                "csukuangfj/vits-piper-en_US-glados-high|1 speaker",
+                "csukuangfj/vits-piper-en_US-glados|1 speaker",
+                "csukuangfj/vits-piper-en_GB-southern_english_male-medium|8 speakers",
+                "csukuangfj/vits-piper-en_GB-southern_english_female-medium|6 speakers",
+                "csukuangfj/vits-piper-en_US-bryce-medium|1 speaker",
+                "csukuangfj/vits-piper-en_US-john-medium|1 speaker",
+                "csukuangfj/vits-piper-en_US-norman-medium|1 speaker",
+                "csukuangfj/vits-piper-en_US-miro-high|1 speaker",
+                "csukuangfj/vits-coqui-en-ljspeech|1 speaker",
+                "csukuangfj/vits-coqui-en-ljspeech-neon|1 speaker",
+                "csukuangfj/vits-coqui-en-vctk|109 speakers",
+                "csukuangfj/vits-piper-en_GB-miro-high|1 speaker",
+                "csukuangfj/vits-piper-en_GB-dii-high|1 speaker",
+                "csukuangfj/vits-piper-en_GB-sweetbbak-amy|1 speaker",
+                "csukuangfj/vits-piper-en_US-amy-low|1 speaker",
+                "csukuangfj/vits-piper-en_US-amy-medium|1 speaker",
+                "csukuangfj/vits-piper-en_US-arctic-medium|18 speakers",
+                "csukuangfj/vits-piper-en_US-danny-low|1 speaker",
+                "csukuangfj/vits-piper-en_US-hfc_male-medium|1 speaker",
+                "csukuangfj/vits-piper-en_US-hfc_female-medium|1 speaker",
+                "csukuangfj/vits-piper-en_US-joe-medium|1 speaker",
+                "csukuangfj/vits-piper-en_US-kathleen-low|1 speaker",
+                "csukuangfj/vits-piper-en_US-kusal-medium|1 speaker",
+                "csukuangfj/vits-piper-en_US-l2arctic-medium|24 speakers",
+                "csukuangfj/vits-piper-en_US-lessac-high|1 speaker",
+                "csukuangfj/vits-piper-en_US-lessac-low|1 speaker",
+                "csukuangfj/vits-piper-en_US-lessac-medium|1 speaker",
+                "csukuangfj/vits-piper-en_US-libritts-high|904 speakers",
+                "csukuangfj/vits-piper-en_US-libritts_r-medium|904 speakers",
+                "csukuangfj/vits-piper-en_US-ljspeech-high|1 speaker",
+                "csukuangfj/vits-piper-en_US-ljspeech-medium|1 speaker",
+                "csukuangfj/vits-piper-en_US-ryan-high|1 speaker",
+                "csukuangfj/vits-piper-en_US-ryan-low|1 speaker",
+                "csukuangfj/vits-piper-en_US-ryan-medium|1 speaker",
+                "csukuangfj/vits-piper-en_GB-alan-low|1 speaker",
+                "csukuangfj/vits-piper-en_GB-alan-medium|1 speaker",
+                "csukuangfj/vits-piper-en_GB-alan-medium",
+                "csukuangfj/vits-piper-en_GB-cori-high|1 speaker",
+                "csukuangfj/vits-piper-en_GB-cori-medium|1 speaker",
+                "csukuangfj/vits-piper-en_GB-jenny_dioco-medium|1 speaker",
+                "csukuangfj/vits-piper-en_GB-northern_english_male-medium|1 speaker",
+                "csukuangfj/vits-piper-en_GB-semaine-medium|4 speakers",
+                "csukuangfj/vits-piper-en_GB-southern_english_female-low|1 speaker",
+                "csukuangfj/vits-piper-en_GB-vctk-medium|109 speakers",
+                "csukuangfj/vits-vctk|109 speakers",
+                "csukuangfj/vits-ljs|1 speaker",
+            ],
+            "capabilities": [],
+            "description": "Text-to-speech provider using the Next-gen Kaldi (Sherpa-ONNX) API.",
+        },
+        "StreamElements": {
+            "module": "llm4free.TTS.stream_elements",
+            "required_auth": False,
+            "models": [
+                "gpt-4o-mini-tts",
+                "tts-1",
+                "tts-1-hd",
+            ],
+            "capabilities": [],
+            "description": "Text-to-speech provider using the StreamElements API.",
+            "voices": [
+                "Filiz",
+                "Astrid",
+                "Tatyana",
+                "Maxim",
+                "Carmen",
+                "Ines",
+                "Cristiano",
+                "Vitoria",
+                "Ricardo",
+                "Maja",
+                "Jan",
+                "Jacek",
+                "Ewa",
+                "Ruben",
+                "Lotte",
+                "Liv",
+                "Seoyeon",
+                "Takumi",
+                "Mizuki",
+                "Giorgio",
+                "Carla",
+                "Bianca",
+                "Karl",
+                "Dora",
+                "Mathieu",
+                "Celine",
+                "Chantal",
+                "Penelope",
+                "Miguel",
+                "Mia",
+                "Enrique",
+                "Conchita",
+                "Geraint",
+                "Salli",
+                "Matthew",
+                "Kimberly",
+                "Kendra",
+                "Justin",
+                "Joey",
+                "Joanna",
+                "Ivy",
+                "Raveena",
+                "Aditi",
+                "Emma",
+                "Brian",
+                "Amy",
+                "Russell",
+                "Nicole",
+                "Vicki",
+                "Marlene",
+                "Hans",
+                "Naja",
+                "Mads",
+                "Gwyneth",
+                "Zhiyu",
+                "es-ES-Standard-A",
+                "it-IT-Standard-A",
+                "it-IT-Wavenet-A",
+                "ja-JP-Standard-A",
+                "ja-JP-Wavenet-A",
+                "ko-KR-Standard-A",
+                "ko-KR-Wavenet-A",
+                "pt-BR-Standard-A",
+                "tr-TR-Standard-A",
+                "sv-SE-Standard-A",
+                "nl-NL-Standard-A",
+                "nl-NL-Wavenet-A",
+                "en-US-Wavenet-A",
+                "en-US-Wavenet-B",
+                "en-US-Wavenet-C",
+                "en-US-Wavenet-D",
+                "en-US-Wavenet-E",
+                "en-US-Wavenet-F",
+                "en-GB-Standard-A",
+                "en-GB-Standard-B",
+                "en-GB-Standard-C",
+                "en-GB-Standard-D",
+                "en-GB-Wavenet-A",
+                "en-GB-Wavenet-B",
+                "en-GB-Wavenet-C",
+                "en-GB-Wavenet-D",
+                "en-US-Standard-B",
+                "en-US-Standard-C",
+                "en-US-Standard-D",
+                "en-US-Standard-E",
+                "de-DE-Standard-A",
+                "de-DE-Standard-B",
+                "de-DE-Wavenet-A",
+                "de-DE-Wavenet-B",
+                "de-DE-Wavenet-C",
+                "de-DE-Wavenet-D",
+                "en-AU-Standard-A",
+                "en-AU-Standard-B",
+                "en-AU-Wavenet-A",
+                "en-AU-Wavenet-B",
+                "en-AU-Wavenet-C",
+                "en-AU-Wavenet-D",
+                "en-AU-Standard-C",
+                "en-AU-Standard-D",
+                "fr-CA-Standard-A",
+                "fr-CA-Standard-B",
+                "fr-CA-Standard-C",
+                "fr-CA-Standard-D",
+                "fr-FR-Standard-C",
+                "fr-FR-Standard-D",
+                "fr-FR-Wavenet-A",
+                "fr-FR-Wavenet-B",
+                "fr-FR-Wavenet-C",
+                "fr-FR-Wavenet-D",
+                "da-DK-Wavenet-A",
+                "pl-PL-Wavenet-A",
+                "pl-PL-Wavenet-B",
+                "pl-PL-Wavenet-C",
+                "pl-PL-Wavenet-D",
+                "pt-PT-Wavenet-A",
+                "pt-PT-Wavenet-B",
+                "pt-PT-Wavenet-C",
+                "pt-PT-Wavenet-D",
+                "ru-RU-Wavenet-A",
+                "ru-RU-Wavenet-B",
+                "ru-RU-Wavenet-C",
+                "ru-RU-Wavenet-D",
+                "sk-SK-Wavenet-A",
+                "tr-TR-Wavenet-A",
+                "tr-TR-Wavenet-B",
+                "tr-TR-Wavenet-C",
+                "tr-TR-Wavenet-D",
+                "tr-TR-Wavenet-E",
+                "uk-UA-Wavenet-A",
+                "ar-XA-Wavenet-A",
+                "ar-XA-Wavenet-B",
+                "ar-XA-Wavenet-C",
+                "cs-CZ-Wavenet-A",
+                "nl-NL-Wavenet-B",
+                "nl-NL-Wavenet-C",
+                "nl-NL-Wavenet-D",
+                "nl-NL-Wavenet-E",
+                "en-IN-Wavenet-A",
+                "en-IN-Wavenet-B",
+                "en-IN-Wavenet-C",
+                "fil-PH-Wavenet-A",
+                "fi-FI-Wavenet-A",
+                "el-GR-Wavenet-A",
+                "hi-IN-Wavenet-A",
+                "hi-IN-Wavenet-B",
+                "hi-IN-Wavenet-C",
+                "hu-HU-Wavenet-A",
+                "id-ID-Wavenet-A",
+                "id-ID-Wavenet-B",
+                "id-ID-Wavenet-C",
+                "it-IT-Wavenet-B",
+                "it-IT-Wavenet-C",
+                "it-IT-Wavenet-D",
+                "ja-JP-Wavenet-B",
+                "ja-JP-Wavenet-C",
+                "ja-JP-Wavenet-D",
+                "cmn-CN-Wavenet-A",
+                "cmn-CN-Wavenet-B",
+                "cmn-CN-Wavenet-C",
+                "cmn-CN-Wavenet-D",
+                "nb-no-Wavenet-E",
+                "nb-no-Wavenet-A",
+                "nb-no-Wavenet-B",
+                "nb-no-Wavenet-C",
+                "nb-no-Wavenet-D",
+                "vi-VN-Wavenet-A",
+                "vi-VN-Wavenet-B",
+                "vi-VN-Wavenet-C",
+                "vi-VN-Wavenet-D",
+                "sr-rs-Standard-A",
+                "lv-lv-Standard-A",
+                "is-is-Standard-A",
+                "bg-bg-Standard-A",
+                "af-ZA-Standard-A",
+                "Tracy",
+                "Danny",
+                "Huihui",
+                "Yaoyao",
+                "Kangkang",
+                "HanHan",
+                "Zhiwei",
+                "Asaf",
+                "An",
+                "Stefanos",
+                "Filip",
+                "Ivan",
+                "Heidi",
+                "Herena",
+                "Kalpana",
+                "Hemant",
+                "Matej",
+                "Andika",
+                "Rizwan",
+                "Lado",
+                "Valluvar",
+                "Linda",
+                "Heather",
+                "Sean",
+                "Michael",
+                "Karsten",
+                "Guillaume",
+                "Pattara",
+                "Jakub",
+                "Szabolcs",
+                "Hoda",
+                "Naayf",
+            ],
+        },
+        "TTSAI": {
+            "module": "llm4free.TTS.ttsai",
+            "required_auth": False,
+            "models": [
+                "piper",
+                "vits",
+                "melotts",
+                "kitten-tts",
+                "kokoro",
+                "outetts",
+                "pocket-tts",
+                "ming-omni-tts",
+            ],
+            "capabilities": [],
+            "description": "TTS.ai provider.",
+        },
+        "XLNKTTS": {
+            "module": "llm4free.TTS.xlnk",
+            "required_auth": False,
+            "models": [
+                "xlnk-tts",
+            ],
+            "capabilities": [],
+            "description": "XLNK TTS provider.",
+        },
+    },
+}
@@ -0,0 +1,565 @@
+"""
+LLM4Free Async Client
+
+``AsyncClient`` mirrors ``llm4free.client.Client`` for asyncio code: the same
+provider resolution, router-ordered failover and provider pool, with
+``chat.completions.create``, ``images.generate`` and ``audio.speech.create`` as
+coroutines and streams as async iterators. Providers with a native async
+interface (``provider.aio``) are awaited directly; sync-only providers run in a
+thread pool owned by the client.
+
+For offline evaluation jobs, ``gather_completions`` and ``map_prompts`` run
+many requests with bounded concurrency, each with its own failover.
+"""
+
+import asyncio
+import functools
+import inspect
+import itertools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from llm4free.client import (
+    Client,
+    _chat_call_kwargs,
+    _is_valid_chat_completion,
+    _print_provider_selection,
+)
+from llm4free.llm.base import OpenAICompatibleProvider, Tool
+from llm4free.llm.utils import ChatCompletion, ChatCompletionChunk
+from llm4free.provider_pool import ProviderLease, close_instance
+from llm4free.response_cache import CACHE_USE, replay_chunks
+from llm4free.router import ProviderRouter
+from llm4free.TTI.base import TTICompatibleProvider
+from llm4free.TTI.utils import ImageResponse
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Worker threads for sync-only providers when AsyncClient(max_workers=...) is not given.
+DEFAULT_MAX_WORKERS = 32
+
+_DONE = object()
+
+
+async def _chain_async_stream(
+    first_chunk: ChatCompletionChunk,
+    stream: AsyncIterator[ChatCompletionChunk],
+    *,
+    provider_name: str,
+    model_name: str,
+    print_provider_info: bool,
+    fallback: bool,
+    router: ProviderRouter,
+) -> AsyncGenerator[ChatCompletionChunk, None]:
+    if print_provider_info:
+        _print_provider_selection(provider_name, model_name, fallback=fallback)
+
+    loop = asyncio.get_running_loop()
+    chunks = 0
+    try:
+        yield first_chunk
+        start = loop.time()
+        async for chunk in stream:
+            chunks += 1
+            yield chunk
+    except Exception as exc:
+        router.record_failure(provider_name, model_name, exc)
+        raise
+    finally:
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    elapsed = loop.time() - start
+    if chunks and elapsed > 0:
+        router.record_throughput(provider_name, model_name, chunks / elapsed)
+
+
+async def _release_after_async_stream(
+    stream: AsyncIterator[ChatCompletionChunk], lease: ProviderLease
+) -> AsyncGenerator[ChatCompletionChunk, None]:
+    """Yield a provider stream, returning its instance to the pool when it ends."""
+    try:
+        async for chunk in stream:
+            yield chunk
+    except Exception:
+        lease.release(failed=True)
+        raise
+    finally:
+        lease.release()
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+async def _replay_async(
+    chunks: Iterable[ChatCompletionChunk],
+) -> AsyncGenerator[ChatCompletionChunk, None]:
+    for chunk in chunks:
+        yield chunk
+
+
+class AsyncClientCompletions:
+    """
+    Async chat completions with provider resolution and failover.
+
+    Resolution, candidate ordering and provider instances are shared with the
+    wrapped sync ``Client``; only the provider calls differ.
+    """
+
+    def __init__(self, client: "AsyncClient"):
+        self._client = client
+        self._last_provider: Optional[str] = None
+
+    @property
+    def last_provider(self) -> Optional[str]:
+        """Name of the last provider that produced a completion, or None."""
+        return self._last_provider
+
+    async def _start_provider(
+        self,
+        provider_class: Type[OpenAICompatibleProvider],
+        provider_name: str,
+        model_name: str,
+        call_kwargs: Dict[str, Any],
+    ) -> Tuple[Optional[ChatCompletionChunk], Any]:
+        """
+        Call one provider and wait for its first output.
+
+        Returns ``(first_chunk, stream)`` for streams (``stream`` is an async
+        iterator) and ``(None, completion)`` otherwise. Outcomes are reported to
+        the router; errors, empty responses and unexpected streams are raised.
+        """
+        client = self._client
+        router = client.router
+        stream = call_kwargs.get("stream", False)
+        loop = asyncio.get_running_loop()
+        lease = await client.run(client._sync.chat.completions._lease_provider, provider_class)
+        start = loop.time()
+        first_chunk = None
+        try:
+            instance = lease.instance
+            async_provider = getattr(instance, "aio", None)
+            if async_provider is not None:
+                response = await async_provider.chat.completions.create(**call_kwargs)
+            else:
+                response = await client.run(instance.chat.completions.create, **call_kwargs)
+
+            if inspect.isgenerator(response):
+                response = client.iterate(response)
+            if hasattr(response, "__aiter__"):
+                if not stream:
+                    await response.aclose()
+                    raise ValueError(f"Provider {provider_name} returned an unexpected stream")
+                response = _release_after_async_stream(response, lease)
+                try:
+                    first_chunk = await response.__anext__()
+                except StopAsyncIteration:
+                    raise ValueError(f"Provider {provider_name} returned an empty stream")
+            elif not _is_valid_chat_completion(response):
+                raise ValueError(f"Provider {provider_name} returned empty content")
+        except Exception as exc:
+            lease.release(failed=True)
+            router.record_failure(provider_name, model_name, exc)
+            raise
+
+        if first_chunk is None:
+            lease.release()
+        router.record_success(provider_name, model_name, ttft=loop.time() - start)
+        return first_chunk, response
+
+    async def create(
+        self,
+        *,
+        model: str = "auto",
+        messages: List[Dict[str, Any]],
+        max_tokens: Optional[int] = None,
+        stream: bool = False,
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+        tools: Optional[List[Union[Tool, Dict[str, Any]]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        timeout: Optional[int] = None,
+        proxies: Optional[dict] = None,
+        provider: Optional[Type[OpenAICompatibleProvider]] = None,
+        cache_mode: str = CACHE_USE,
+        **kwargs: Any,
+    ) -> Union[ChatCompletion, AsyncGenerator[ChatCompletionChunk, None]]:
+        """
+        Creates a chat completion with automatic provider selection and failover.
+
+        Takes the same arguments as ``Client.chat.completions.create`` (except
+        hedging), tries providers in the same order and uses the same response
+        cache.
+
+        Returns:
+            ChatCompletion for non-streaming requests, or an async generator of
+            ChatCompletionChunk objects that already produced its first chunk.
+
+        Raises:
+            RuntimeError: If all chat providers fail or no providers are available.
+
+        Examples:
+            >>> async with AsyncClient() as client:
+            ...     stream = await client.chat.completions.create(
+            ...         model="auto",
+            ...         messages=[{"role": "user", "content": "Hello!"}],
+            ...         stream=True,
+            ...     )
+            ...     async for chunk in stream:
+            ...         print(chunk.choices[0].delta.content or "", end="")
+        """
+        client = self._client
+        completions = client._sync.chat.completions
+        call_kwargs = _chat_call_kwargs(
+            model,
+            messages,
+            stream=stream,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            tools=tools,
+            tool_choice=tool_choice,
+            timeout=timeout,
+            proxies=proxies,
+            **kwargs,
+        )
+        cache = client.response_cache
+        cache_key = None
+        if cache is not None:
+            lookup = functools.partial(
+                cache.lookup,
+                call_kwargs,
+                namespace=provider.__name__ if provider is not None else "",
+                mode=cache_mode,
+            )
+            cache_key, cached = await client.run(lookup) if cache.persistent else lookup()
+            if cached is not None:
+                if stream:
+                    return _replay_async(replay_chunks(cached))
+                return ChatCompletion(**cached)
+
+        try:
+            resolved_provider, resolved_model = await client.run(
+                completions._resolve_provider_and_model, model, provider
+            )
+        except (RuntimeError, ValueError):
+            resolved_provider, resolved_model = None, model
+        call_kwargs["model"] = resolved_model
+
+        # Fallback tiers are built lazily (and may list provider models), so the
+        # candidate generator is advanced in the pool.
+        candidates = completions._candidates(model, provider, resolved_provider, resolved_model)
+
+        errors: List[str] = []
+        while True:
+            candidate = await client.run(next, candidates, None)
+            if candidate is None:
+                break
+            p_name, p_cls, p_model, tier = candidate
+            try:
+                first_chunk, response = await self._start_provider(
+                    p_cls, p_name, p_model, dict(call_kwargs, model=p_model)
+                )
+            except Exception as exc:
+                if tier == 0:
+                    logger.debug("Provider %s failed: %s", p_name, exc)
+                else:
+                    errors.append(f"{p_name}: {str(exc)}")
+                continue
+
+            self._last_provider = p_name
+            if first_chunk is not None or hasattr(response, "__aiter__"):
+                chained = _chain_async_stream(
+                    first_chunk,
+                    response,
+                    provider_name=p_name,
+                    model_name=p_model,
+                    print_provider_info=client.print_provider_info,
+                    fallback=tier > 0,
+                    router=client.router,
+                )
+                if cache_key is None:
+                    return chained
+                return cache.wrap_async_stream(cache_key, chained)
+            if client.print_provider_info:
+                _print_provider_selection(p_name, p_model, fallback=tier > 0)
+            if cache_key is not None:
+                if cache.persistent:
+                    await client.run(cache.set, cache_key, response)
+                else:
+                    cache.set(cache_key, response)
+            return response
+
+        raise RuntimeError(f"All chat providers failed. Errors: {'; '.join(errors[:3])}")
+
+
+class AsyncClientChat:
+    """Async chat namespace: ``client.chat.completions``."""
+
+    def __init__(self, client: "AsyncClient"):
+        self.completions = AsyncClientCompletions(client)
+
+
+class AsyncClientImages:
+    """Async image generation through the wrapped sync ``Client.images``."""
+
+    def __init__(self, client: "AsyncClient"):
+        self._client = client
+
+    @property
+    def last_provider(self) -> Optional[str]:
+        """Name of the last provider that generated images, or None."""
+        return self._client._sync.images.last_provider
+
+    async def generate(self, **kwargs: Any) -> ImageResponse:
+        """Generates images; takes the arguments of ``Client.images.generate``."""
+        return await self._client.run(self._client._sync.images.generate, **kwargs)
+
+    async def create(self, **kwargs: Any) -> ImageResponse:
+        """Alias of ``generate``."""
+        return await self.generate(**kwargs)
+
+
+class AsyncClientAudioSpeech:
+    """Async text-to-speech through the wrapped sync ``Client.audio.speech``."""
+
+    def __init__(self, client: "AsyncClient"):
+        self._client = client
+
+    @property
+    def last_provider(self) -> Optional[str]:
+        """Name of the last provider that generated speech, or None."""
+        return self._client._sync.audio.speech.last_provider
+
+    async def create(self, **kwargs: Any) -> Union[str, AsyncIterator[bytes]]:
+        """
+        Generates speech; takes the arguments of ``Client.audio.speech.create``.
+
+        Returns the audio file path, or an async iterator of audio bytes when
+        ``stream`` is True.
+        """
+        result = await self._client.run(self._client._sync.audio.speech.create, **kwargs)
+        if inspect.isgenerator(result):
+            return self._client.iterate(result)
+        return result
+
+
+class AsyncClientAudio:
+    """Async audio namespace: ``client.audio.speech``."""
+
+    def __init__(self, client: "AsyncClient"):
+        self.speech = AsyncClientAudioSpeech(client)
+
+
+class AsyncClient:
+    """
+    Asyncio counterpart of ``llm4free.client.Client``.
+
+    Accepts the same arguments as ``Client`` plus ``max_workers``, the size of
+    the thread pool used for sync-only providers. Use it as an async context
+    manager, or call ``aclose()`` when done, to release the pool and any native
+    async provider sessions.
+
+    Examples:
+        >>> async with AsyncClient() as client:
+        ...     response = await client.chat.completions.create(
+        ...         model="auto", messages=[{"role": "user", "content": "Hello!"}]
+        ...     )
+        ...     async for index, result in client.map_prompts(prompts, concurrency=16):
+        ...         ...
+    """
+
+    def __init__(
+        self,
+        provider: Optional[Type[OpenAICompatibleProvider]] = None,
+        image_provider: Optional[Type[TTICompatibleProvider]] = None,
+        api_key: Optional[str] = None,
+        proxies: Optional[dict] = None,
+        exclude: Optional[List[str]] = None,
+        exclude_images: Optional[List[str]] = None,
+        exclude_tts: Optional[List[str]] = None,
+        print_provider_info: bool = False,
+        router: Optional[ProviderRouter] = None,
+        max_workers: Optional[int] = None,
+        **kwargs: Any,
+    ):
+        self._sync = Client(
+            provider=provider,
+            image_provider=image_provider,
+            api_key=api_key,
+            proxies=proxies,
+            exclude=exclude,
+            exclude_images=exclude_images,
+            exclude_tts=exclude_tts,
+            print_provider_info=print_provider_info,
+            router=router,
+            **kwargs,
+        )
+        self.router = self._sync.router
+        self.provider_pool = self._sync.provider_pool
+        self.response_cache = self._sync.response_cache
+        self.print_provider_info = print_provider_info
+        self.max_workers = max_workers or DEFAULT_MAX_WORKERS
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+        self.chat = AsyncClientChat(self)
+        self.images = AsyncClientImages(self)
+        self.audio = AsyncClientAudio(self)
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        """Thread pool for sync-only providers, created on first use."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="llm4free-async"
+            )
+        return self._pool
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking callable in the client's thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.pool, functools.partial(func, *args, **kwargs))
+
+    async def iterate(self, iterator: Iterator[T]) -> AsyncGenerator[T, None]:
+        """Drain a blocking iterator in the thread pool, one item per hop."""
+        try:
+            while True:
+                item = await self.run(next, iterator, _DONE)
+                if item is _DONE:
+                    return
+                yield item
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                await self.run(close)
+
+    async def _completions_as_completed(
+        self, requests: Iterable[Dict[str, Any]], concurrency: int
+    ) -> AsyncIterator[Tuple[int, Union[ChatCompletion, Exception]]]:
+        """Run non-streaming requests, at most ``concurrency`` at once, as they finish."""
+
+        async def complete(index: int, request: Dict[str, Any]) -> Tuple[int, Any]:
+            try:
+                return index, await self.chat.completions.create(**dict(request, stream=False))
+            except Exception as exc:
+                return index, exc
+
+        pending_requests = enumerate(requests)
+        running: Set[asyncio.Future] = set()
+        try:
+            while True:
+                for index, request in itertools.islice(
+                    pending_requests, max(1, concurrency) - len(running)
+                ):
+                    running.add(asyncio.ensure_future(complete(index, request)))
+                if not running:
+                    return
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in running:
+                task.cancel()
+
+    async def gather_completions(
+        self,
+        requests: Iterable[Dict[str, Any]],
+        *,
+        concurrency: int = 8,
+        return_exceptions: bool = True,
+    ) -> List[Union[ChatCompletion, Exception]]:
+        """
+        Run many chat completions concurrently and return them in request order.
+
+        Each request is a dict of ``chat.completions.create`` arguments and gets
+        its own provider failover. Requests are always non-streaming.
+
+        Args:
+            requests: Iterable of request dicts; consumed lazily.
+            concurrency: Maximum number of requests in flight.
+            return_exceptions: If True (default), a request whose providers all
+                failed yields its exception in place of a completion. If False, the
+                first failure is raised and outstanding requests are cancelled.
+        """
+        results: Dict[int, Union[ChatCompletion, Exception]] = {}
+        stream = self._completions_as_completed(requests, concurrency)
+        try:
+            async for index, result in stream:
+                if isinstance(result, Exception) and not return_exceptions:
+                    raise result
+                results[index] = result
+        finally:
+            await stream.aclose()
+        return [results[index] for index in sorted(results)]
+
+    async def map_prompts(
+        self,
+        prompts: Iterable[str],
+        *,
+        model: str = "auto",
+        system: Optional[str] = None,
+        concurrency: int = 8,
+        **kwargs: Any,
+    ) -> AsyncIterator[Tuple[int, Union[ChatCompletion, Exception]]]:
+        """
+        Complete each prompt and yield ``(index, result)`` as results arrive.
+
+        ``result`` is a ChatCompletion, or the exception raised when every
+        provider failed for that prompt. Extra keyword arguments are passed to
+        ``chat.completions.create``.
+
+        Args:
+            prompts: User messages; consumed lazily, so it may be a generator.
+            model: Model for every prompt. Default "auto".
+            system: Optional system message prepended to every prompt.
+            concurrency: Maximum number of requests in flight.
+        """
+        prefix = [{"role": "system", "content": system}] if system else []
+        requests = (
+            dict(kwargs, model=model, messages=prefix + [{"role": "user", "content": prompt}])
+            for prompt in prompts
+        )
+        stream = self._completions_as_completed(requests, concurrency)
+        try:
+            async for item in stream:
+                yield item
+        finally:
+            await stream.aclose()
+
+    async def aclose(self) -> None:
+        """Close idle provider instances and shut down the thread pool."""
+        for instance in self.provider_pool.drain():
+            async_provider = vars(instance).get("_aio") if hasattr(instance, "__dict__") else None
+            if async_provider is not None:
+                try:
+                    await async_provider.aclose()
+                except Exception as exc:
+                    logger.debug("Failed to close %s: %s", type(instance).__name__, exc)
+            close_instance(instance)
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
@@ -1,44 +1,40 @@
 import sys
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union
 
 from rich import print as rprint
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from .search import (
-    BaseSearch,
-    BaseSearchEngine,
-    BingSearch,
-    BraveSearch,
-    DuckDuckGoSearch,
-    Mojeek,
-    Wikipedia,
-    YahooSearch,
-)
 from .swiftcli import CLI, option
 from .version import __version__
 
+if TYPE_CHECKING:
+    from .search import BaseSearch, BaseSearchEngine
+
 console = Console()
 
-# Engine mapping
-ENGINES: Dict[str, Union[Type[BaseSearch], Type[BaseSearchEngine]]] = {
-    "ddg": DuckDuckGoSearch,
-    "duckduckgo": DuckDuckGoSearch,
-    "bing": BingSearch,
-    "yahoo": YahooSearch,
-    "brave": BraveSearch,
-    "mojeek": Mojeek,
-    "wikipedia": Wikipedia,
+# Engine mapping (class names in llm4free.search, imported when a command runs)
+ENGINES: Dict[str, str] = {
+    "ddg": "DuckDuckGoSearch",
+    "duckduckgo": "DuckDuckGoSearch",
+    "bing": "BingSearch",
+    "yahoo": "YahooSearch",
+    "brave": "BraveSearch",
+    "mojeek": "Mojeek",
+    "wikipedia": "Wikipedia",
 }
 
 
-def _get_engine(name: str) -> Union[BaseSearch, BaseSearchEngine]:
-    cls: type[BaseSearch | BaseSearchEngine] | None = ENGINES.get(name.lower())
-    if not cls:
+def _get_engine(name: str) -> Union["BaseSearch", "BaseSearchEngine"]:
+    class_name = ENGINES.get(name.lower())
+    if not class_name:
         rprint(f"[bold red]Error: Engine '{name}' not supported.[/bold red]")
         rprint(f"Available engines: {', '.join(sorted(set(e for e in ENGINES.keys())))}")
         sys.exit(1)
+    from . import search
+
+    cls: Optional[Type[Any]] = getattr(search, class_name, None)
     if not callable(cls):
         rprint(f"[bold red]Error: Engine '{name}' is not callable.[/bold red]")
         sys.exit(1)
@@ -6,20 +6,24 @@ to interact with multiple AI providers for chat completions, image generation,
 and TTS-based audio generation.
 """
 
-import difflib
 import functools
-import importlib
 import inspect
+import itertools
 import logging
-import pkgutil
+import queue
 import random
+import threading
+import time
 from pathlib import Path
 from typing import (
     Any,
     Callable,
     Dict,
     Generator,
+    Iterable,
+    Iterator,
     List,
+    Mapping,
     Optional,
     Set,
     Tuple,
@@ -30,6 +34,7 @@ from typing import (
     cast,
 )
 
+from llm4free import provider_manifest
 from llm4free.llm.base import (
     BaseChat,
     BaseCompletions,
@@ -40,6 +45,10 @@ from llm4free.llm.utils import (
     ChatCompletion,
     ChatCompletionChunk,
 )
+from llm4free.model_index import ModelIndex, ModelIndexCache
+from llm4free.provider_pool import ProviderLease, ProviderPool
+from llm4free.response_cache import CACHE_USE, ResponseCache, replay_chunks
+from llm4free.router import ProviderRouter, get_default_router
 from llm4free.TTI.base import BaseImages, TTICompatibleProvider
 from llm4free.TTI.utils import ImageResponse
 from llm4free.TTS.base import BaseTTSProvider
@@ -47,73 +56,58 @@ from llm4free.TTS.base import BaseTTSProvider
 logger = logging.getLogger(__name__)
 
 
-def load_openai_providers() -> Tuple[Dict[str, Type[OpenAICompatibleProvider]], Set[str]]:
+def load_openai_providers() -> Tuple[Mapping[str, Type[OpenAICompatibleProvider]], Set[str]]:
     """
-    Dynamically loads all OpenAI-compatible provider classes from the llm module.
+    Returns all OpenAI-compatible provider classes from the provider manifest.
 
-    Scans the llm4free.llm package and imports all subclasses of
-    OpenAICompatibleProvider. Excludes base classes, utility modules, and private classes.
+    Reads the generated manifest (see llm4free.provider_manifest) instead of
+    scanning the llm4free.llm package. Each provider's module is imported the
+    first time its class is looked up in the returned registry.
 
     Returns:
         A tuple containing:
-        - A dictionary mapping provider class names to their class objects.
+        - A mapping of provider class names to their (lazily imported) classes.
         - A set of provider names that require API authentication.
 
-    Raises:
-        No exceptions are raised; failures are silently handled to ensure robust loading.
-
     Examples:
         >>> providers, auth_required = load_openai_providers()
         >>> print(list(providers.keys())[:3])
-        ['Claude', 'GPT4Free', 'OpenRouter']
-        >>> print('Claude' in auth_required)
+        ['AI4Chat', 'AkashGPT', 'Apriel']
+        >>> print('Groq' in auth_required)
         True
     """
-    return _load_providers_cached(
-        "llm4free.llm",
-        OpenAICompatibleProvider,
-        ("base", "utils", "pydantic", "__"),
-    )
+    return _load_providers_cached("chat")
 
 
-def load_tti_providers() -> Tuple[Dict[str, Type[TTICompatibleProvider]], Set[str]]:
+def load_tti_providers() -> Tuple[Mapping[str, Type[TTICompatibleProvider]], Set[str]]:
     """
-    Dynamically loads all TTI (Text-to-Image) provider classes from the TTI module.
-
-    Scans the llm4free.TTI package and imports all subclasses of
-    TTICompatibleProvider. Excludes base classes, utility modules, and private classes.
+    Returns all TTI (Text-to-Image) provider classes from the provider manifest.
 
     Returns:
         A tuple containing:
-        - A dictionary mapping TTI provider class names to their class objects.
+        - A mapping of TTI provider class names to their (lazily imported) classes.
         - A set of TTI provider names that require API authentication.
 
-    Raises:
-        No exceptions are raised; failures are silently handled to ensure robust loading.
-
     Examples:
         >>> providers, auth_required = load_tti_providers()
-        >>> print('DALL-E' in providers)
+        >>> print('PollinationsAI' in providers)
         True
-        >>> print('Stable Diffusion' in auth_required)
+        >>> print('PollinationsAI' in auth_required)
         False
     """
-    return _load_providers_cached("llm4free.TTI", TTICompatibleProvider, ("base", "utils", "__"))
+    return _load_providers_cached("tti")
 
 
-def load_tts_providers() -> Tuple[Dict[str, Type[BaseTTSProvider]], Set[str]]:
+def load_tts_providers() -> Tuple[Mapping[str, Type[BaseTTSProvider]], Set[str]]:
     """
-    Dynamically loads all TTS provider classes from the TTS module.
-
-    Scans the llm4free.TTS package and imports all subclasses of
-    BaseTTSProvider. Excludes base classes, utility modules, and private classes.
+    Returns all TTS provider classes from the provider manifest.
 
     Returns:
         A tuple containing:
-        - A dictionary mapping TTS provider class names to their class objects.
+        - A mapping of TTS provider class names to their (lazily imported) classes.
         - A set of TTS provider names that require API authentication.
     """
-    return _load_providers_cached("llm4free.TTS", BaseTTSProvider, ("base", "utils", "__"))
+    return _load_providers_cached("tts")
 
 
 def _get_models_safely(provider_cls: type, client: Optional["Client"] = None) -> List[str]:
@@ -121,13 +115,13 @@ def _get_models_safely(provider_cls: type, client: Optional["Client"] = None) ->
     Safely retrieves the list of available models from a provider.
 
     Attempts to instantiate the provider class and call its models.list() method.
-    If a Client instance is provided, uses the client's provider cache to avoid
-    redundant instantiations. Handles all exceptions gracefully and returns an
-    empty list if model retrieval fails.
+    If a Client instance is provided, borrows an instance from the client's
+    provider pool to avoid redundant instantiations. Handles all exceptions
+    gracefully and returns an empty list if model retrieval fails.
 
     Args:
         provider_cls: The provider class to retrieve models from.
-        client: Optional Client instance to use for caching and configuration.
+        client: Optional Client instance to use for pooling and configuration.
                 If provided, uses client's proxies and api_key for initialization.
 
     Returns:
@@ -148,35 +142,23 @@ def _get_models_safely(provider_cls: type, client: Optional["Client"] = None) ->
     """
     models = []
 
+    lease: Optional[ProviderLease] = None
     try:
-        instance = None
         if client:
-            p_name = provider_cls.__name__
-            if p_name in client._provider_cache:
-                instance = client._provider_cache[p_name]
-            else:
-                try:
-                    init_kwargs = {}
-                    if client.proxies:
-                        init_kwargs["proxies"] = client.proxies
-                    if client.api_key:
-                        init_kwargs["api_key"] = client.api_key
-                    instance = provider_cls(**init_kwargs)
-                except (TypeError, RuntimeError):
-                    try:
-                        instance = provider_cls()
-                    except (TypeError, RuntimeError):
-                        pass
-
-                if instance:
-                    client._provider_cache[p_name] = instance
+            init_kwargs = {}
+            if client.proxies:
+                init_kwargs["proxies"] = client.proxies
+            if client.api_key:
+                init_kwargs["api_key"] = client.api_key
+            lease = client._lease_provider(provider_cls, [init_kwargs])
+            instance = lease.instance
         else:
-            try:
-                instance = provider_cls()
-            except (TypeError, RuntimeError):
-                pass
+            instance = provider_cls()
+    except (TypeError, RuntimeError):
+        return models
 
-        if instance and hasattr(instance, "models") and hasattr(instance.models, "list"):
+    try:
+        if hasattr(instance, "models") and hasattr(instance.models, "list"):
             res = instance.models.list()
             if isinstance(res, list):
                 for m in res:
@@ -186,6 +168,9 @@ def _get_models_safely(provider_cls: type, client: Optional["Client"] = None) ->
                         models.append(m["id"])
     except (AttributeError, TypeError):
         pass
+    finally:
+        if lease is not None:
+            lease.release()
 
     return models
 
@@ -216,47 +201,12 @@ ProviderT = TypeVar("ProviderT")
 
 
 @functools.lru_cache(maxsize=None)
-def _load_providers_cached(
-    module_path: str,
-    base_class: type,
-    exclude_prefixes: Tuple[str, ...],
-) -> Tuple[Dict[str, Any], Set[str]]:
-    """Cached wrapper around _load_providers to avoid redundant scans."""
-    return _load_providers(module_path, base_class, exclude_prefixes)
-
-
-def _load_providers(
-    module_path: str,
-    base_class: Type[ProviderT],
-    exclude_prefixes: Tuple[str, ...],
-) -> Tuple[Dict[str, Type[ProviderT]], Set[str]]:
-    provider_map: Dict[str, Type[ProviderT]] = {}
-    auth_required_providers: Set[str] = set()
-
-    try:
-        provider_package = importlib.import_module(module_path)
-        for _, module_name, _ in pkgutil.iter_modules(provider_package.__path__):
-            if module_name.startswith(exclude_prefixes):
-                continue
-            try:
-                module = importlib.import_module(f"{module_path}.{module_name}")
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if (
-                        isinstance(attr, type)
-                        and issubclass(attr, base_class)
-                        and attr != base_class
-                        and not attr_name.startswith(("Base", "_"))
-                    ):
-                        provider_map[attr_name] = attr
-                        if getattr(attr, "required_auth", False):
-                            auth_required_providers.add(attr_name)
-            except (ImportError, AttributeError):
-                pass
-    except (ImportError, ValueError):
-        pass
-
-    return provider_map, auth_required_providers
+def _load_providers_cached(kind: str) -> Tuple[provider_manifest.ProviderRegistry, Set[str]]:
+    """Build the lazy registry for one provider kind from the provider manifest."""
+    return (
+        provider_manifest.ProviderRegistry(provider_manifest.provider_entries(kind)),
+        provider_manifest.auth_required_providers(kind),
+    )
 
 
 def _print_provider_selection(
@@ -271,51 +221,52 @@ def _print_model_match(match_type: str, model: str, matched_model: str) -> None:
 
 
 def _get_available_provider_items(
-    provider_registry: Dict[str, Type[ProviderT]],
+    provider_registry: Mapping[str, Type[ProviderT]],
     auth_required_providers: Set[str],
     excluded: Optional[List[str]],
     api_key: Optional[str],
 ) -> List[Tuple[str, Type[ProviderT]]]:
     exclude = _normalized_name_set(excluded)
-    if api_key:
-        return [
-            (name, cls) for name, cls in provider_registry.items() if name.casefold() not in exclude
-        ]
+    # Filter on names first so excluded providers are never imported.
     return [
-        (name, cls)
-        for name, cls in provider_registry.items()
-        if name not in auth_required_providers and name.casefold() not in exclude
+        (name, provider_registry[name])
+        for name in provider_registry
+        if name.casefold() not in exclude and (api_key or name not in auth_required_providers)
     ]
 
 
-def _get_provider_instance_cached(
-    cache: Dict[str, Any],
+def _new_provider_instance(
     provider_class: Type[ProviderT],
     init_kwargs_candidates: List[Dict[str, Any]],
     *,
     provider_kind: Optional[str] = None,
 ) -> ProviderT:
-    provider_name = provider_class.__name__
-    if provider_name in cache:
-        return cache[provider_name]
-
     for init_kwargs in init_kwargs_candidates:
         try:
-            instance = provider_class(**init_kwargs)
-            cache[provider_name] = instance
-            return instance
+            return provider_class(**init_kwargs)
         except (TypeError, RuntimeError):
             continue
 
     try:
-        instance = provider_class()
-        cache[provider_name] = instance
-        return instance
+        return provider_class()
     except (TypeError, RuntimeError) as exc:
         label = f"{provider_kind} " if provider_kind else ""
         raise RuntimeError(f"Failed to initialize {label}provider {provider_class.__name__}: {exc}")
 
 
+def _release_after_stream(
+    response: Generator[ChatCompletionChunk, None, None], lease: ProviderLease
+) -> Generator[ChatCompletionChunk, None, None]:
+    """Yield a provider stream, returning its instance to the pool when it ends."""
+    try:
+        yield from response
+    except Exception:
+        lease.release(failed=True)
+        raise
+    finally:
+        lease.release()
+
+
 def _build_search_models(model: str, resolved_model: Optional[str]) -> Tuple[str, Set[str]]:
     base_model = model.split("/")[-1] if "/" in model else model
     search_models = {base_model, resolved_model} if resolved_model else {base_model}
@@ -324,50 +275,26 @@ def _build_search_models(model: str, resolved_model: Optional[str]) -> Tuple[str
 
 def _fuzzy_resolve_provider_and_model(
     model: str,
-    available: List[Tuple[str, Type[ProviderT]]],
-    get_models_fn: Callable[[Type[ProviderT]], List[str]],
+    index: ModelIndex[ProviderT],
     *,
     print_provider_info: bool = False,
     match_suffix: str = "",
 ) -> Optional[Tuple[Type[ProviderT], str]]:
-    model_to_provider: Dict[str, Type[ProviderT]] = {}
-
-    for _, provider_class in available:
-        for provider_model in get_models_fn(provider_class):
-            if provider_model not in model_to_provider:
-                model_to_provider[provider_model] = provider_class
-
-    if not model_to_provider:
+    match = index.resolve(model)
+    if match is None:
         return None
-
-    model_lower = model.lower()
-
-    for model_name in model_to_provider:
-        if model_name.lower() == model_lower:
-            return model_to_provider[model_name], model_name
-
-    for model_name in model_to_provider:
-        candidate = model_name.lower()
-        if model_lower in candidate or candidate in model_lower:
-            if print_provider_info:
-                _print_model_match(f"Substring match{match_suffix}", model, model_name)
-            return model_to_provider[model_name], model_name
-
-    matches = difflib.get_close_matches(model, model_to_provider.keys(), n=1, cutoff=0.5)
-    if matches:
-        matched_model = matches[0]
-        if print_provider_info:
-            _print_model_match(f"Fuzzy match{match_suffix}", model, matched_model)
-        return model_to_provider[matched_model], matched_model
-
-    return None
+    if print_provider_info and match.match_type != "exact":
+        _print_model_match(
+            f"{match.match_type.capitalize()} match{match_suffix}", model, match.model
+        )
+    return match.provider, match.model
 
 
 def _resolve_provider_and_model(
     model: str,
     provider: Optional[Type[ProviderT]],
-    provider_registry: Dict[str, Type[ProviderT]],
-    available_provider_fn: Callable[[], List[Tuple[str, Type[ProviderT]]]],
+    provider_registry: Mapping[str, Type[ProviderT]],
+    model_index_fn: Callable[[], ModelIndex[ProviderT]],
     get_models_fn: Callable[[Type[ProviderT]], List[str]],
     *,
     print_provider_info: bool = False,
@@ -377,19 +304,16 @@ def _resolve_provider_and_model(
     no_providers_for_model_message: str,
     provider_empty_model_fallback: Optional[str] = None,
     match_suffix: str = "",
+    router: Optional[ProviderRouter] = None,
 ) -> Tuple[Type[ProviderT], str]:
     if "/" in model:
         provider_name, model_name = model.split("/", 1)
-        found_provider = next(
-            (
-                cls
-                for name, cls in provider_registry.items()
-                if name.lower() == provider_name.lower()
-            ),
+        found_name = next(
+            (name for name in provider_registry if name.lower() == provider_name.lower()),
             None,
         )
-        if found_provider:
-            return found_provider, model_name
+        if found_name:
+            return provider_registry[found_name], model_name
 
     if provider:
         resolved_model = model
@@ -403,91 +327,151 @@ def _resolve_provider_and_model(
                 raise RuntimeError(provider_no_models_message.format(provider=provider.__name__))
         return provider, resolved_model
 
+    index = model_index_fn()
     if model == "auto":
-        available = available_provider_fn()
-        if not available:
+        if not index.providers:
             raise RuntimeError(no_available_message)
 
-        providers_with_models = []
-        for _, provider_class in available:
-            provider_models = get_models_fn(provider_class)
-            if provider_models:
-                providers_with_models.append((provider_class, provider_models))
+        providers_with_models = [
+            (provider_class, provider_models)
+            for _, provider_class, provider_models in index.providers
+            if provider_models
+        ]
 
         if providers_with_models:
-            provider_class, provider_models = random.choice(providers_with_models)
+            if router is not None:
+                provider_class, provider_models = router.choose(
+                    providers_with_models, key=lambda item: item[0].__name__
+                )
+            else:
+                provider_class, provider_models = random.choice(providers_with_models)
             return provider_class, random.choice(provider_models)
 
         raise RuntimeError(no_available_with_models_message)
 
-    available = available_provider_fn()
-    for _, provider_class in available:
-        provider_models = get_models_fn(provider_class)
-        if provider_models and model in provider_models:
-            return provider_class, model
+    exact_provider = index.provider_for(model)
+    if exact_provider is not None:
+        return exact_provider, model
 
     fuzzy_result = _fuzzy_resolve_provider_and_model(
         model,
-        available,
-        get_models_fn,
+        index,
         print_provider_info=print_provider_info,
         match_suffix=match_suffix,
     )
     if fuzzy_result:
         return fuzzy_result
 
+    available = [(name, provider_class) for name, provider_class, _ in index.providers]
     if available:
+        if router is not None:
+            return router.choose(available, key=lambda item: item[0])[1], model
         random.shuffle(available)
         return available[0][1], model
 
     raise RuntimeError(no_providers_for_model_message.format(model=model))
 
 
-def _build_fallback_queue(
-    available: List[Tuple[str, Type[ProviderT]]],
+def _build_fallback_tiers(
+    index: ModelIndex[ProviderT],
     resolved_provider: Optional[Type[ProviderT]],
     model: str,
     resolved_model: Optional[str],
-    get_models_fn: Callable[[Type[ProviderT]], List[str]],
     *,
     empty_model_fallback: str,
-) -> List[Tuple[str, Type[ProviderT], str]]:
+    router: Optional[ProviderRouter] = None,
+) -> Tuple[List[Tuple[str, Type[ProviderT], str]], ...]:
+    """Split fallback candidates into exact-match, fuzzy-match and any-model tiers."""
     tier1: List[Tuple[str, Type[ProviderT], str]] = []
     tier2: List[Tuple[str, Type[ProviderT], str]] = []
     tier3: List[Tuple[str, Type[ProviderT], str]] = []
     base_model, search_models = _build_search_models(model, resolved_model)
 
-    for provider_name, provider_class in available:
+    closest = index.closest(base_model) if base_model != "auto" else {}
+
+    for provider_name, provider_class, provider_models in index.providers:
         if provider_class == resolved_provider:
             continue
 
-        provider_models = get_models_fn(provider_class)
         if not provider_models:
             fallback_model = base_model if base_model != "auto" else empty_model_fallback
             tier3.append((provider_name, provider_class, fallback_model))
             continue
 
-        found_exact = False
-        for search_model in search_models:
-            if search_model != "auto" and search_model in provider_models:
-                tier1.append((provider_name, provider_class, search_model))
-                found_exact = True
-                break
-        if found_exact:
+        model_set = index.models_of(provider_name)
+        exact_model = next(
+            (m for m in search_models if m != "auto" and m in model_set),
+            None,
+        )
+        if exact_model is not None:
+            tier1.append((provider_name, provider_class, exact_model))
             continue
 
-        if base_model != "auto":
-            matches = difflib.get_close_matches(base_model, provider_models, n=1, cutoff=0.5)
-            if matches:
-                tier2.append((provider_name, provider_class, matches[0]))
-                continue
+        if provider_name in closest:
+            tier2.append((provider_name, provider_class, closest[provider_name]))
+            continue
 
         tier3.append((provider_name, provider_class, random.choice(provider_models)))
 
+    if router is not None:
+        # Healthiest providers first within each tier; open circuits go last.
+        return tuple(
+            router.order(tier, key=lambda item: (item[0], item[2]))
+            for tier in (tier1, tier2, tier3)
+        )
     random.shuffle(tier1)
     random.shuffle(tier2)
     random.shuffle(tier3)
-    return tier1 + tier2 + tier3
+    return tier1, tier2, tier3
+
+
+def _build_fallback_queue(
+    index: ModelIndex[ProviderT],
+    resolved_provider: Optional[Type[ProviderT]],
+    model: str,
+    resolved_model: Optional[str],
+    *,
+    empty_model_fallback: str,
+    router: Optional[ProviderRouter] = None,
+) -> List[Tuple[str, Type[ProviderT], str]]:
+    tiers = _build_fallback_tiers(
+        index,
+        resolved_provider,
+        model,
+        resolved_model,
+        empty_model_fallback=empty_model_fallback,
+        router=router,
+    )
+    return [item for tier in tiers for item in tier]
+
+
+def _chat_call_kwargs(
+    model: str,
+    messages: List[Dict[str, Any]],
+    *,
+    stream: bool = False,
+    max_tokens: Optional[int] = None,
+    temperature: Optional[float] = None,
+    top_p: Optional[float] = None,
+    tools: Optional[List[Union[Tool, Dict[str, Any]]]] = None,
+    tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+    timeout: Optional[int] = None,
+    proxies: Optional[dict] = None,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    call_kwargs: Dict[str, Any] = {"model": model, "messages": messages, "stream": stream}
+    optional = {
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+        "top_p": top_p,
+        "tools": tools,
+        "tool_choice": tool_choice,
+        "timeout": timeout,
+        "proxies": proxies,
+    }
+    call_kwargs.update((key, value) for key, value in optional.items() if value is not None)
+    call_kwargs.update(kwargs)
+    return call_kwargs
 
 
 def _is_valid_chat_completion(response: Any) -> TypeGuard[ChatCompletion]:
@@ -516,17 +500,47 @@ def _chain_stream_response(
     model_name: str,
     print_provider_info: bool,
     fallback: bool = False,
+    router: Optional[ProviderRouter] = None,
 ) -> Generator[ChatCompletionChunk, None, None]:
     if print_provider_info:
         _print_provider_selection(provider_name, model_name, fallback=fallback)
 
     yield first_chunk
-    yield from response
+    if router is None:
+        yield from response
+        return
 
-
-OPENAI_PROVIDERS, OPENAI_AUTH_REQUIRED = load_openai_providers()
-TTI_PROVIDERS, TTI_AUTH_REQUIRED = load_tti_providers()
-TTS_PROVIDERS, TTS_AUTH_REQUIRED = load_tts_providers()
+    chunks = 0
+    start = time.perf_counter()
+    try:
+        for chunk in response:
+            chunks += 1
+            yield chunk
+    except Exception as exc:
+        router.record_failure(provider_name, model_name, exc)
+        raise
+    elapsed = time.perf_counter() - start
+    if chunks and elapsed > 0:
+        router.record_throughput(provider_name, model_name, chunks / elapsed)
+
+
+_PROVIDER_REGISTRIES: Dict[str, Tuple[Callable[[], Tuple[Mapping[str, Any], Set[str]]], int]] = {
+    "OPENAI_PROVIDERS": (load_openai_providers, 0),
+    "OPENAI_AUTH_REQUIRED": (load_openai_providers, 1),
+    "TTI_PROVIDERS": (load_tti_providers, 0),
+    "TTI_AUTH_REQUIRED": (load_tti_providers, 1),
+    "TTS_PROVIDERS": (load_tts_providers, 0),
+    "TTS_AUTH_REQUIRED": (load_tts_providers, 1),
+}
+
+
+def __getattr__(name: str) -> Any:
+    # Provider registries are built on first use, not when the module is imported.
+    registry = _PROVIDER_REGISTRIES.get(name)
+    if registry is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    loader, index = registry
+    return loader()[index]
 
 
 class ClientCompletions(BaseCompletions):
@@ -557,6 +571,7 @@ class ClientCompletions(BaseCompletions):
     def __init__(self, client: "Client"):
         self._client = client
         self._last_provider: Optional[str] = None
+        self._model_indexes: ModelIndexCache = ModelIndexCache()
 
     @property
     def last_provider(self) -> Optional[str]:
@@ -579,9 +594,9 @@ class ClientCompletions(BaseCompletions):
         """
         return self._last_provider
 
-    def _get_provider_instance(
+    def _lease_provider(
         self, provider_class: Type[OpenAICompatibleProvider], **kwargs
-    ) -> OpenAICompatibleProvider:
+    ) -> "ProviderLease[OpenAICompatibleProvider]":
         init_kwargs = {}
         if self._client.proxies:
             init_kwargs["proxies"] = self._client.proxies
@@ -589,19 +604,14 @@ class ClientCompletions(BaseCompletions):
             init_kwargs["api_key"] = self._client.api_key
         init_kwargs.update(kwargs)
 
-        return _get_provider_instance_cached(
-            self._client._provider_cache,
-            provider_class,
-            [init_kwargs],
-        )
+        return self._client._lease_provider(provider_class, [init_kwargs])
 
     def _fuzzy_resolve_provider_and_model(
         self, model: str
     ) -> Optional[Tuple[Type[OpenAICompatibleProvider], str]]:
         return _fuzzy_resolve_provider_and_model(
             model,
-            self._get_available_providers(),
-            lambda provider_cls: _get_models_safely(provider_cls, self._client),
+            self._model_index(),
             print_provider_info=self._client.print_provider_info,
         )
 
@@ -611,24 +621,257 @@ class ClientCompletions(BaseCompletions):
         return _resolve_provider_and_model(
             model,
             provider,
-            OPENAI_PROVIDERS,
-            self._get_available_providers,
+            load_openai_providers()[0],
+            self._model_index,
             lambda provider_cls: _get_models_safely(provider_cls, self._client),
             print_provider_info=self._client.print_provider_info,
             no_available_message="No available chat providers found.",
             no_available_with_models_message="No available chat providers with models found.",
             provider_no_models_message="Provider {provider} has no available models.",
             no_providers_for_model_message="No providers found for model '{model}'",
+            router=self._client.router,
         )
 
     def _get_available_providers(self) -> List[Tuple[str, Type[OpenAICompatibleProvider]]]:
         return _get_available_provider_items(
-            OPENAI_PROVIDERS,
-            OPENAI_AUTH_REQUIRED,
+            *load_openai_providers(),
             self._client.exclude,
             self._client.api_key,
         )
 
+    def _model_index(self) -> ModelIndex:
+        return self._model_indexes.get(
+            self._get_available_providers(),
+            lambda provider_cls: _get_models_safely(provider_cls, self._client),
+        )
+
+    def _build_fallback_tiers(
+        self,
+        model: str,
+        resolved_provider: Optional[Type[OpenAICompatibleProvider]],
+        resolved_model: Optional[str],
+    ) -> Tuple[List[Tuple[str, Type[OpenAICompatibleProvider], str]], ...]:
+        return _build_fallback_tiers(
+            self._model_index(),
+            resolved_provider,
+            model,
+            resolved_model,
+            empty_model_fallback="auto",
+            router=self._client.router,
+        )
+
+    def _candidates(
+        self,
+        model: str,
+        provider: Optional[Type[OpenAICompatibleProvider]],
+        resolved_provider: Optional[Type[OpenAICompatibleProvider]],
+        resolved_model: str,
+    ) -> Iterator[Tuple[str, Type[OpenAICompatibleProvider], str, int]]:
+        """
+        Yield ``(name, provider_class, model, tier)`` in the order providers are tried.
+
+        Tier 0 is the resolved provider; tiers 1-3 are providers with an exact,
+        fuzzy or any model match, computed only once tier 0 is exhausted. Tier 4
+        holds the providers passed over earlier because their circuit was open.
+        """
+        router = self._client.router
+        # Providers with an open circuit are only tried once everything else failed.
+        deferred: List[Tuple[str, Type[OpenAICompatibleProvider], str]] = []
+
+        # An explicitly requested provider is always tried; an automatically
+        # resolved one is skipped while its circuit is open.
+        if resolved_provider:
+            primary = (resolved_provider.__name__, resolved_provider, resolved_model)
+            if provider is not None or "/" in model or router.acquire(primary[0]):
+                yield (*primary, 0)
+            else:
+                deferred.append(primary)
+
+        tiers = self._build_fallback_tiers(model, resolved_provider, resolved_model)
+        for tier, entries in enumerate(tiers, 1):
+            for entry in entries:
+                if router.acquire(entry[0]):
+                    yield (*entry, tier)
+                else:
+                    deferred.append(entry)
+        for entry in deferred:
+            yield (*entry, 4)
+
+    def _start_provider(
+        self,
+        provider_class: Type[OpenAICompatibleProvider],
+        provider_name: str,
+        model_name: str,
+        call_kwargs: Dict[str, Any],
+    ) -> Tuple[Optional[ChatCompletionChunk], Any]:
+        """
+        Call one provider and wait for its first output.
+
+        Returns ``(first_chunk, stream)`` for streams and ``(None, completion)``
+        otherwise, and reports the time to first token to the client's router.
+        Provider errors, empty responses and unexpected streams are recorded as
+        failures and raised.
+
+        The provider instance is borrowed from the client's pool and returned
+        once the completion is received or the stream is exhausted or closed;
+        it is evicted if the call fails.
+        """
+        router = self._client.router
+        stream = call_kwargs.get("stream", False)
+        lease = self._lease_provider(provider_class)
+        start = time.perf_counter()
+        first_chunk = None
+        try:
+            response = lease.instance.chat.completions.create(**call_kwargs)
+
+            if inspect.isgenerator(response):
+                if not stream:
+                    response.close()
+                    raise ValueError(f"Provider {provider_name} returned an unexpected stream")
+                response = _release_after_stream(response, lease)
+                try:
+                    first_chunk = cast(ChatCompletionChunk, next(response))
+                except StopIteration:
+                    raise ValueError(f"Provider {provider_name} returned an empty stream")
+            elif not _is_valid_chat_completion(response):
+                raise ValueError(f"Provider {provider_name} returned empty content")
+        except Exception as exc:
+            lease.release(failed=True)
+            router.record_failure(provider_name, model_name, exc)
+            raise
+
+        if first_chunk is None:
+            lease.release()
+        router.record_success(provider_name, model_name, ttft=time.perf_counter() - start)
+        return first_chunk, response
+
+    def _finish_provider(
+        self,
+        provider_name: str,
+        model_name: str,
+        first_chunk: Optional[ChatCompletionChunk],
+        response: Any,
+        *,
+        fallback: bool = False,
+    ) -> Union[ChatCompletion, Generator[ChatCompletionChunk, None, None]]:
+        self._last_provider = provider_name
+        if inspect.isgenerator(response):
+            return _chain_stream_response(
+                cast(ChatCompletionChunk, first_chunk),
+                response,
+                provider_name=provider_name,
+                model_name=model_name,
+                print_provider_info=self._client.print_provider_info,
+                fallback=fallback,
+                router=self._client.router,
+            )
+        if self._client.print_provider_info:
+            _print_provider_selection(provider_name, model_name, fallback=fallback)
+        return cast(ChatCompletion, response)
+
+    def _call_provider(
+        self,
+        provider_class: Type[OpenAICompatibleProvider],
+        provider_name: str,
+        model_name: str,
+        call_kwargs: Dict[str, Any],
+        *,
+        fallback: bool = False,
+    ) -> Union[ChatCompletion, Generator[ChatCompletionChunk, None, None]]:
+        """
+        Call one provider and report the outcome to the client's router.
+
+        Returns the completion, or a stream that already produced its first chunk.
+        """
+        first_chunk, response = self._start_provider(
+            provider_class, provider_name, model_name, call_kwargs
+        )
+        return self._finish_provider(
+            provider_name, model_name, first_chunk, response, fallback=fallback
+        )
+
+    def _hedged_call(
+        self,
+        candidates: Iterable[Tuple[str, Type[OpenAICompatibleProvider], str]],
+        call_kwargs: Dict[str, Any],
+        *,
+        hedge: int,
+        hedge_delay: float,
+        errors: List[str],
+    ) -> Optional[Union[ChatCompletion, Generator[ChatCompletionChunk, None, None]]]:
+        """
+        Race up to ``hedge`` providers and return the first one to produce output.
+
+        The first candidate starts at once. Another one starts each time
+        ``hedge_delay`` seconds pass without a first token, and whenever a running
+        attempt fails. Losing streams are closed as soon as their attempt returns.
+        Returns None if every candidate failed; the failures are appended to
+        ``errors``.
+        """
+        pending = iter(candidates)
+        results: "queue.Queue[Tuple[int, Optional[Exception], Any]]" = queue.Queue()
+        lock = threading.Lock()
+        decided = threading.Event()
+        launched: List[Tuple[str, Type[OpenAICompatibleProvider], str]] = []
+
+        def discard(outcome: Any) -> None:
+            if outcome is not None and inspect.isgenerator(outcome[1]):
+                outcome[1].close()
+
+        def run(index: int, p_name: str, p_cls: Type[OpenAICompatibleProvider], p_model: str):
+            try:
+                attempt_kwargs = dict(call_kwargs, model=p_model)
+                result = (index, None, self._start_provider(p_cls, p_name, p_model, attempt_kwargs))
+            except Exception as exc:
+                result = (index, exc, None)
+            with lock:
+                if not decided.is_set():
+                    results.put(result)
+                    return
+            discard(result[2])
+
+        def launch() -> bool:
+            candidate = next(pending, None)
+            if candidate is None:
+                return False
+            launched.append(candidate)
+            threading.Thread(
+                target=run,
+                args=(len(launched) - 1, *candidate),
+                name=f"llm4free-hedge-{candidate[0]}",
+                daemon=True,
+            ).start()
+            return True
+
+        running = int(launch())
+        exhausted = not running
+        while running:
+            can_hedge = running < hedge and not exhausted
+            try:
+                index, error, outcome = results.get(timeout=hedge_delay if can_hedge else None)
+            except queue.Empty:
+                exhausted = not launch()
+                running += not exhausted
+                continue
+            running -= 1
+            if error is None:
+                break
+            errors.append(f"{launched[index][0]}: {error}")
+            if not exhausted:
+                exhausted = not launch()
+                running += not exhausted
+        else:
+            return None
+
+        with lock:
+            decided.set()
+        while not results.empty():
+            discard(results.get_nowait()[2])
+
+        p_name, _, p_model = launched[index]
+        first_chunk, response = outcome
+        return self._finish_provider(p_name, p_model, first_chunk, response, fallback=index > 0)
+
     def create(
         self,
         *,
@@ -643,6 +886,9 @@ class ClientCompletions(BaseCompletions):
         timeout: Optional[int] = None,
         proxies: Optional[dict] = None,
         provider: Optional[Type[OpenAICompatibleProvider]] = None,
+        hedge: int = 1,
+        hedge_delay: float = 1.5,
+        cache_mode: str = CACHE_USE,
         **kwargs: Any,
     ) -> Union[ChatCompletion, Generator[ChatCompletionChunk, None, None]]:
         """
@@ -655,9 +901,24 @@ class ClientCompletions(BaseCompletions):
         2. Providers with fuzzy model matches
         3. Providers with any available model
 
+        Within each tier, providers are ordered by the client's router from their
+        observed time-to-first-token and error rate; providers whose circuit
+        breaker is open are only tried after all others have failed.
+
+        With ``hedge`` > 1 the request is hedged: if the first provider has not
+        produced a first token (or, without streaming, a response) after
+        ``hedge_delay`` seconds, the next exact or fuzzy match is started as well,
+        up to ``hedge`` providers at once. Whichever answers first is returned and
+        reported by ``last_provider``; the other streams are closed.
+
+        If the client has a ``response_cache``, deterministic requests are
+        answered from it when possible (streams replay the cached answer as
+        chunks) and new answers are stored in it.
+
         Args:
-            model: Model identifier. Default "auto" randomly selects available models.
-                   Can be "provider/model" format or model name. Required.
+            model: Model identifier. Default "auto" picks a healthy provider via the
+                   router and a random model from it. Can be "provider/model" format or
+                   model name. Required.
             messages: List of message dicts with 'role' and 'content' keys. Required.
             max_tokens: Maximum tokens in the response. Optional.
             stream: Whether to stream the response. Default is False.
@@ -668,6 +929,11 @@ class ClientCompletions(BaseCompletions):
             timeout: Request timeout in seconds. Optional.
             proxies: HTTP proxy configuration dict. Optional.
             provider: Specific provider class to use. Optional.
+            hedge: Maximum number of providers raced at once. Default 1 (no hedging).
+            hedge_delay: Seconds to wait for a first token before starting the next
+                         provider. Default 1.5.
+            cache_mode: How the response cache is used: "use" (default), "refresh"
+                        to skip the lookup but store the new answer, or "bypass".
             **kwargs: Additional arguments passed to the provider.
 
         Returns:
@@ -697,113 +963,100 @@ class ClientCompletions(BaseCompletions):
             ... ):
             ...     print(chunk.choices[0].delta.content, end="")
         """
+        call_kwargs = _chat_call_kwargs(
+            model,
+            messages,
+            stream=stream,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            tools=tools,
+            tool_choice=tool_choice,
+            timeout=timeout,
+            proxies=proxies,
+            **kwargs,
+        )
+        cache = self._client.response_cache
+        cache_key = None
+        if cache is not None:
+            cache_key, cached = cache.lookup(
+                call_kwargs,
+                namespace=provider.__name__ if provider is not None else "",
+                mode=cache_mode,
+            )
+            if cached is not None:
+                if stream:
+                    return (chunk for chunk in replay_chunks(cached))
+                return ChatCompletion(**cached)
+
         try:
             resolved_provider, resolved_model = self._resolve_provider_and_model(model, provider)
         except (RuntimeError, ValueError):
             resolved_provider, resolved_model = None, model
+        call_kwargs["model"] = resolved_model
 
-        call_kwargs: Dict[str, Any] = {
-            "model": resolved_model,
-            "messages": messages,
-            "stream": stream,
-        }
-        if max_tokens is not None:
-            call_kwargs["max_tokens"] = max_tokens
-        if temperature is not None:
-            call_kwargs["temperature"] = temperature
-        if top_p is not None:
-            call_kwargs["top_p"] = top_p
-        if tools is not None:
-            call_kwargs["tools"] = tools
-        if tool_choice is not None:
-            call_kwargs["tool_choice"] = tool_choice
-        if timeout is not None:
-            call_kwargs["timeout"] = timeout
-        if proxies is not None:
-            call_kwargs["proxies"] = proxies
-        call_kwargs.update(kwargs)
-
-        if resolved_provider:
-            try:
-                provider_instance = self._get_provider_instance(resolved_provider)
-                response = provider_instance.chat.completions.create(**call_kwargs)
-
-                if stream and inspect.isgenerator(response):
-                    try:
-                        first_chunk = cast(ChatCompletionChunk, next(response))
-                        self._last_provider = resolved_provider.__name__
-                        return _chain_stream_response(
-                            first_chunk,
-                            response,
-                            provider_name=resolved_provider.__name__,
-                            model_name=resolved_model,
-                            print_provider_info=self._client.print_provider_info,
-                        )
-                    except StopIteration:
-                        pass
-                    except (RuntimeError, ValueError) as exc:
-                        logger.debug("Stream error from %s: %s", resolved_provider.__name__, exc)
-                else:
-                    if not inspect.isgenerator(response):
-                        completion_response = cast(ChatCompletion, response)
-                        if _is_valid_chat_completion(completion_response):
-                            self._last_provider = resolved_provider.__name__
-                            if self._client.print_provider_info:
-                                _print_provider_selection(
-                                    resolved_provider.__name__, resolved_model
-                                )
-                            return completion_response
-                        raise ValueError(
-                            f"Provider {resolved_provider.__name__} returned empty content"
-                        )
-            except (RuntimeError, ValueError, TypeError) as exc:
-                logger.debug("Provider %s failed: %s", resolved_provider.__name__, exc)
-
-        all_available = self._get_available_providers()
-        fallback_queue = _build_fallback_queue(
-            all_available,
-            resolved_provider,
+        response = self._complete(
             model,
+            provider,
+            resolved_provider,
             resolved_model,
-            lambda provider_cls: _get_models_safely(provider_cls, self._client),
-            empty_model_fallback="auto",
+            call_kwargs,
+            hedge=hedge,
+            hedge_delay=hedge_delay,
         )
+        if cache_key is None:
+            return response
+        return cache.store(cache_key, response)
 
-        errors = []
-        for p_name, p_cls, p_model in fallback_queue:
+    def _complete(
+        self,
+        model: str,
+        provider: Optional[Type[OpenAICompatibleProvider]],
+        resolved_provider: Optional[Type[OpenAICompatibleProvider]],
+        resolved_model: str,
+        call_kwargs: Dict[str, Any],
+        *,
+        hedge: int,
+        hedge_delay: float,
+    ) -> Union[ChatCompletion, Generator[ChatCompletionChunk, None, None]]:
+        """Try the candidate providers for a request, hedged or one by one."""
+        candidates = self._candidates(model, provider, resolved_provider, resolved_model)
+
+        errors: List[str] = []
+        if hedge > 1:
+            # Race the resolved provider and the exact/fuzzy matches; the rest
+            # are tried one by one if they all fail.
+            remaining: List[Tuple[str, Type[OpenAICompatibleProvider], str, int]] = []
+
+            def hedgeable():
+                for candidate in candidates:
+                    if candidate[3] > 2:
+                        remaining.append(candidate)
+                        return
+                    yield candidate[:3]
+
+            response = self._hedged_call(
+                hedgeable(),
+                call_kwargs,
+                hedge=hedge,
+                hedge_delay=hedge_delay,
+                errors=errors,
+            )
+            if response is not None:
+                return response
+            candidates = itertools.chain(remaining, candidates)
+
+        for p_name, p_cls, p_model, tier in candidates:
             try:
-                provider_instance = self._get_provider_instance(p_cls)
-                fallback_kwargs: Dict[str, Any] = dict(call_kwargs)
-                fallback_kwargs["model"] = p_model
-                response = provider_instance.chat.completions.create(**fallback_kwargs)
-
-                if stream and inspect.isgenerator(response):
-                    try:
-                        first_chunk = cast(ChatCompletionChunk, next(response))
-                        self._last_provider = p_name
-                        return _chain_stream_response(
-                            first_chunk,
-                            response,
-                            provider_name=p_name,
-                            model_name=p_model,
-                            print_provider_info=self._client.print_provider_info,
-                            fallback=True,
-                        )
-                    except (StopIteration, RuntimeError, ValueError):
-                        continue
-
-                if not inspect.isgenerator(response):
-                    completion_response = cast(ChatCompletion, response)
-                    if _is_valid_chat_completion(completion_response):
-                        self._last_provider = p_name
-                        if self._client.print_provider_info:
-                            _print_provider_selection(p_name, p_model, fallback=True)
-                        return completion_response
-                    errors.append(f"{p_name}: Returned empty response.")
-                    continue
-            except Exception as e:
-                errors.append(f"{p_name}: {str(e)}")
-                continue
+                attempt_kwargs = dict(call_kwargs, model=p_model)
+                return self._call_provider(
+                    p_cls, p_name, p_model, attempt_kwargs, fallback=tier > 0
+                )
+            except Exception as exc:
+                if tier == 0:
+                    logger.debug("Provider %s failed: %s", p_name, exc)
+                else:
+                    errors.append(f"{p_name}: {str(exc)}")
 
         raise RuntimeError(f"All chat providers failed. Errors: {'; '.join(errors[:3])}")
 
@@ -864,6 +1117,7 @@ class ClientImages(BaseImages):
     def __init__(self, client: "Client"):
         self._client = client
         self._last_provider: Optional[str] = None
+        self._model_indexes: ModelIndexCache = ModelIndexCache()
 
     @property
     def last_provider(self) -> Optional[str]:
@@ -886,28 +1140,22 @@ class ClientImages(BaseImages):
         """
         return self._last_provider
 
-    def _get_provider_instance(
+    def _lease_provider(
         self, provider_class: Type[TTICompatibleProvider], **kwargs
-    ) -> TTICompatibleProvider:
+    ) -> "ProviderLease[TTICompatibleProvider]":
         init_kwargs = {}
         if self._client.proxies:
             init_kwargs["proxies"] = self._client.proxies
         init_kwargs.update(kwargs)
 
-        return _get_provider_instance_cached(
-            self._client._provider_cache,
-            provider_class,
-            [init_kwargs],
-            provider_kind="TTI",
-        )
+        return self._client._lease_provider(provider_class, [init_kwargs], provider_kind="TTI")
 
     def _fuzzy_resolve_provider_and_model(
         self, model: str
     ) -> Optional[Tuple[Type[TTICompatibleProvider], str]]:
         return _fuzzy_resolve_provider_and_model(
             model,
-            self._get_available_providers(),
-            lambda provider_cls: _get_models_safely(provider_cls, self._client),
+            self._model_index(),
             print_provider_info=self._client.print_provider_info,
             match_suffix=" (TTI)",
         )
@@ -918,8 +1166,8 @@ class ClientImages(BaseImages):
         return _resolve_provider_and_model(
             model,
             provider,
-            TTI_PROVIDERS,
-            self._get_available_providers,
+            load_tti_providers()[0],
+            self._model_index,
             lambda provider_cls: _get_models_safely(provider_cls, self._client),
             print_provider_info=self._client.print_provider_info,
             no_available_message="No available image providers found.",
@@ -930,12 +1178,17 @@ class ClientImages(BaseImages):
 
     def _get_available_providers(self) -> List[Tuple[str, Type[TTICompatibleProvider]]]:
         return _get_available_provider_items(
-            TTI_PROVIDERS,
-            TTI_AUTH_REQUIRED,
+            *load_tti_providers(),
             self._client.exclude_images,
             self._client.api_key,
         )
 
+    def _model_index(self) -> ModelIndex:
+        return self._model_indexes.get(
+            self._get_available_providers(),
+            lambda provider_cls: _get_models_safely(provider_cls, self._client),
+        )
+
     def generate(
         self,
         *,
@@ -1011,8 +1264,8 @@ class ClientImages(BaseImages):
         errors: List[str] = []
         if resolved_provider:
             try:
-                provider_instance = self._get_provider_instance(resolved_provider)
-                response = provider_instance.images.create(**call_kwargs)
+                with self._lease_provider(resolved_provider) as provider_instance:
+                    response = provider_instance.images.create(**call_kwargs)
                 self._last_provider = resolved_provider.__name__
                 if self._client.print_provider_info:
                     _print_provider_selection(resolved_provider.__name__, resolved_model)
@@ -1021,22 +1274,20 @@ class ClientImages(BaseImages):
                 logger.debug("TTI provider %s failed: %s", resolved_provider.__name__, exc)
                 errors.append(f"{resolved_provider.__name__}: {exc}")
 
-        all_available = self._get_available_providers()
         fallback_queue = _build_fallback_queue(
-            all_available,
+            self._model_index(),
             resolved_provider,
             model,
             resolved_model,
-            lambda provider_cls: _get_models_safely(provider_cls, self._client),
             empty_model_fallback="auto",
         )
 
         for p_name, p_cls, p_model in fallback_queue:
             try:
-                provider_instance = self._get_provider_instance(p_cls)
                 fallback_kwargs: Dict[str, Any] = dict(call_kwargs)
                 fallback_kwargs["model"] = p_model
-                response = provider_instance.images.create(**fallback_kwargs)
+                with self._lease_provider(p_cls) as provider_instance:
+                    response = provider_instance.images.create(**fallback_kwargs)
                 self._last_provider = p_name
                 if self._client.print_provider_info:
                     _print_provider_selection(p_name, p_model, fallback=True)
@@ -1084,14 +1335,15 @@ class ClientAudioSpeech:
     def __init__(self, client: "Client"):
         self._client = client
         self._last_provider: Optional[str] = None
+        self._model_indexes: ModelIndexCache = ModelIndexCache()
 
     @property
     def last_provider(self) -> Optional[str]:
         return self._last_provider
 
-    def _get_provider_instance(
+    def _lease_provider(
         self, provider_class: Type[BaseTTSProvider], **kwargs: Any
-    ) -> BaseTTSProvider:
+    ) -> "ProviderLease[BaseTTSProvider]":
         init_kwargs: Dict[str, Any] = dict(kwargs)
         if self._client.api_key:
             init_kwargs["api_key"] = self._client.api_key
@@ -1109,20 +1361,14 @@ class ClientAudioSpeech:
             if proxy_value:
                 proxy_candidates.insert(1, {**init_kwargs, "proxy": proxy_value})
 
-        return _get_provider_instance_cached(
-            self._client._provider_cache,
-            provider_class,
-            proxy_candidates,
-            provider_kind="TTS",
-        )
+        return self._client._lease_provider(provider_class, proxy_candidates, provider_kind="TTS")
 
     def _fuzzy_resolve_provider_and_model(
         self, model: str
     ) -> Optional[Tuple[Type[BaseTTSProvider], str]]:
         return _fuzzy_resolve_provider_and_model(
             model,
-            self._get_available_providers(),
-            _get_tts_models_safely,
+            self._model_index(),
             print_provider_info=self._client.print_provider_info,
             match_suffix=" (TTS)",
         )
@@ -1133,8 +1379,8 @@ class ClientAudioSpeech:
         return _resolve_provider_and_model(
             model,
             provider,
-            TTS_PROVIDERS,
-            self._get_available_providers,
+            load_tts_providers()[0],
+            self._model_index,
             _get_tts_models_safely,
             print_provider_info=self._client.print_provider_info,
             no_available_message="No available audio providers found.",
@@ -1147,12 +1393,14 @@ class ClientAudioSpeech:
 
     def _get_available_providers(self) -> List[Tuple[str, Type[BaseTTSProvider]]]:
         return _get_available_provider_items(
-            TTS_PROVIDERS,
-            TTS_AUTH_REQUIRED,
+            *load_tts_providers(),
             self._client.exclude_tts,
             self._client.api_key,
         )
 
+    def _model_index(self) -> ModelIndex:
+        return self._model_indexes.get(self._get_available_providers(), _get_tts_models_safely)
+
     @staticmethod
     def _stream_audio_file(audio_file: str, chunk_size: int) -> Generator[bytes, None, None]:
         with open(audio_file, "rb") as file_handle:
@@ -1195,8 +1443,8 @@ class ClientAudioSpeech:
 
         if resolved_provider:
             try:
-                provider_instance = self._get_provider_instance(resolved_provider)
-                audio_file = provider_instance.tts(input_text, **call_kwargs)
+                with self._lease_provider(resolved_provider) as provider_instance:
+                    audio_file = provider_instance.tts(input_text, **call_kwargs)
                 if audio_file and Path(audio_file).exists():
                     self._last_provider = resolved_provider.__name__
                     if self._client.print_provider_info:
@@ -1208,23 +1456,21 @@ class ClientAudioSpeech:
             except (RuntimeError, ValueError, TypeError, FileNotFoundError) as exc:
                 logger.debug("TTS provider %s failed: %s", resolved_provider.__name__, exc)
 
-        all_available = self._get_available_providers()
         fallback_queue = _build_fallback_queue(
-            all_available,
+            self._model_index(),
             resolved_provider,
             model,
             resolved_model,
-            _get_tts_models_safely,
             empty_model_fallback="gpt-4o-mini-tts",
         )
 
         errors: List[str] = []
         for provider_name, provider_class, provider_model in fallback_queue:
             try:
-                provider_instance = self._get_provider_instance(provider_class)
                 fallback_kwargs: Dict[str, Any] = dict(call_kwargs)
                 fallback_kwargs["model"] = provider_model
-                audio_file = provider_instance.tts(input_text, **fallback_kwargs)
+                with self._lease_provider(provider_class) as provider_instance:
+                    audio_file = provider_instance.tts(input_text, **fallback_kwargs)
                 if audio_file and Path(audio_file).exists():
                     self._last_provider = provider_name
                     if self._client.print_provider_info:
@@ -1259,7 +1505,7 @@ class Client:
 
     This client aims to provide a seamless, provider-agnostic experience by:
     - Supporting automatic provider selection and fallback
-    - Caching provider instances for performance
+    - Pooling provider instances, one per in-flight request
     - Offering intelligent model resolution (auto, provider/model, or model name)
     - Handling authentication across multiple providers
     - Providing detailed provider information when enabled
@@ -1273,6 +1519,9 @@ class Client:
         exclude_images: List of provider names to exclude from image generation.
         exclude_tts: List of provider names to exclude from audio generation.
         print_provider_info: Whether to print selected provider and model info.
+        router: ProviderRouter holding per-provider health stats (see router.stats()).
+        provider_pool: ProviderPool of provider instances (see provider_pool.metrics()).
+        response_cache: Optional ResponseCache of chat completions (see response_cache.stats()).
         chat: ClientChat instance for chat completions.
         images: ClientImages instance for image generation.
         audio: ClientAudio instance for speech generation.
@@ -1315,6 +1564,9 @@ class Client:
         exclude_images: Optional[List[str]] = None,
         exclude_tts: Optional[List[str]] = None,
         print_provider_info: bool = False,
+        router: Optional[ProviderRouter] = None,
+        provider_pool: Optional[ProviderPool] = None,
+        response_cache: Optional[ResponseCache] = None,
         **kwargs: Any,
     ):
         """
@@ -1337,6 +1589,16 @@ class Client:
                          Names are case-insensitive. Optional.
             print_provider_info: If True, prints selected provider name and model to stdout
                                 before each request. Useful for debugging. Default is False.
+            router: ProviderRouter that scores chat providers by latency and errors and
+                    orders selection and fallback. Defaults to the process-wide router
+                    (see llm4free.router.get_default_router). Optional.
+            provider_pool: ProviderPool the client borrows provider instances from,
+                           one per in-flight request. Defaults to a new pool with
+                           llm4free.provider_pool.DEFAULT_POOL_SIZE instances per
+                           provider. Optional.
+            response_cache: ResponseCache that answers repeated deterministic chat
+                            requests without calling a provider. Disabled by
+                            default. Optional.
             **kwargs: Additional keyword arguments stored for future use.
 
         Examples:
@@ -1367,20 +1629,48 @@ class Client:
         self.exclude_images = exclude_images or []
         self.exclude_tts = exclude_tts or []
         self.print_provider_info = print_provider_info
+        self.router = router or get_default_router()
         self.kwargs = kwargs
 
-        self._provider_cache = {}
+        self.provider_pool: ProviderPool = provider_pool or ProviderPool()
+        self.response_cache = response_cache
         self.chat = ClientChat(self)
         self.images = ClientImages(self)
         self.audio = ClientAudio(self)
 
+    def _lease_provider(
+        self,
+        provider_class: Type[ProviderT],
+        init_kwargs_candidates: List[Dict[str, Any]],
+        *,
+        provider_kind: Optional[str] = None,
+    ) -> "ProviderLease[ProviderT]":
+        return self.provider_pool.lease(
+            provider_class.__name__,
+            functools.partial(
+                _new_provider_instance,
+                provider_class,
+                init_kwargs_candidates,
+                provider_kind=provider_kind,
+            ),
+        )
+
+    def refresh_models(self) -> None:
+        """
+        Drops the cached model indexes so the next request re-reads every
+        provider's model list. Indexes are otherwise rebuilt every
+        llm4free.model_index.MODEL_INDEX_TTL seconds.
+        """
+        for namespace in (self.chat.completions, self.images, self.audio.speech):
+            namespace._model_indexes.invalidate()
+
     @staticmethod
     def get_chat_providers() -> List[str]:
         """
         Returns a list of all available chat provider names.
 
-        Queries the global OPENAI_PROVIDERS registry that is populated
-        at module load time. Names are not normalized and appear as
+        Queries the OPENAI_PROVIDERS registry, which is populated on first
+        use. Names are not normalized and appear as
         defined in their respective classes.
 
         Returns:
@@ -1393,15 +1683,15 @@ class Client:
             >>> print(len(providers))
             42
         """
-        return list(OPENAI_PROVIDERS.keys())
+        return list(load_openai_providers()[0].keys())
 
     @staticmethod
     def get_image_providers() -> List[str]:
         """
         Returns a list of all available image provider names.
 
-        Queries the global TTI_PROVIDERS registry that is populated
-        at module load time. Names are not normalized and appear as
+        Queries the TTI_PROVIDERS registry, which is populated on first
+        use. Names are not normalized and appear as
         defined in their respective classes.
 
         Returns:
@@ -1414,14 +1704,14 @@ class Client:
             >>> print(len(providers))
             8
         """
-        return list(TTI_PROVIDERS.keys())
+        return list(load_tti_providers()[0].keys())
 
     @staticmethod
     def get_free_chat_providers() -> List[str]:
         """
         Returns a list of chat providers that don't require authentication.
 
-        Filters the global OPENAI_PROVIDERS registry to include only providers
+        Filters the OPENAI_PROVIDERS registry to include only providers
         where required_auth is False. These providers can be used without
         an API key.
 
@@ -1435,14 +1725,15 @@ class Client:
             >>> print(len(free_providers))
             35
         """
-        return [name for name in OPENAI_PROVIDERS.keys() if name not in OPENAI_AUTH_REQUIRED]
+        providers, auth_required = load_openai_providers()
+        return [name for name in providers if name not in auth_required]
 
     @staticmethod
     def get_free_image_providers() -> List[str]:
         """
         Returns a list of image providers that don't require authentication.
 
-        Filters the global TTI_PROVIDERS registry to include only providers
+        Filters the TTI_PROVIDERS registry to include only providers
         where required_auth is False. These providers can be used without
         an API key.
 
@@ -1456,21 +1747,23 @@ class Client:
             >>> print(len(free_providers))
             6
         """
-        return [name for name in TTI_PROVIDERS.keys() if name not in TTI_AUTH_REQUIRED]
+        providers, auth_required = load_tti_providers()
+        return [name for name in providers if name not in auth_required]
 
     @staticmethod
     def get_tts_providers() -> List[str]:
         """
         Returns a list of all available TTS provider names.
         """
-        return list(TTS_PROVIDERS.keys())
+        return list(load_tts_providers()[0].keys())
 
     @staticmethod
     def get_free_tts_providers() -> List[str]:
         """
         Returns a list of TTS providers that don't require authentication.
         """
-        return [name for name in TTS_PROVIDERS.keys() if name not in TTS_AUTH_REQUIRED]
+        providers, auth_required = load_tts_providers()
+        return [name for name in providers if name not in auth_required]
 
     @staticmethod
     def get_audio_providers() -> List[str]:
@@ -1487,85 +1780,65 @@ class Client:
         return Client.get_free_tts_providers()
 
 
-try:
-    from llm4free.server.server import run_api as _run_api_impl
-    from llm4free.server.server import run_api as _start_server_impl
-
-    def run_api(*args: Any, **kwargs: Any) -> Any:
-        """
-        Runs the FastAPI OpenAI-compatible API server.
-
-        Delegates to llm4free.server.server.run_api to start an OpenAI-compatible
-        HTTP API server that provides chat and image endpoints. Requires the
-        'api' optional dependencies to be installed.
-
-        Args:
-            *args: Positional arguments passed to the underlying run_api implementation.
-            **kwargs: Keyword arguments passed to the underlying run_api implementation.
-                     Common options include host, port, debug, and reload.
-
-        Returns:
-            The return value from the underlying FastAPI run function.
-
-        Raises:
-            ImportError: If llm4free.server.server is not available.
+def _import_server(name: str) -> Any:
+    """Import the API server on demand; it pulls in FastAPI and uvicorn."""
+    try:
+        from llm4free.server import server
+    except ImportError as exc:
+        raise ImportError(f"llm4free.server.server.{name} is not available.") from exc
+    return server
 
-        Examples:
-            >>> from llm4free.client import run_api
-            >>> run_api(host="0.0.0.0", port=8000)
-        """
-        return _run_api_impl(*args, **kwargs)
 
-    def start_server(*args: Any, **kwargs: Any) -> Any:
-        """
-        Starts the FastAPI OpenAI-compatible API server.
+def run_api(*args: Any, **kwargs: Any) -> Any:
+    """
+    Runs the FastAPI OpenAI-compatible API server.
 
-        Delegates to llm4free.server.server.start_server to initialize and run
-        an OpenAI-compatible HTTP API server. This is typically the main entry
-        point for starting the llm4free server in production or development.
+    Delegates to llm4free.server.server.run_api to start an OpenAI-compatible
+    HTTP API server that provides chat and image endpoints. Requires the
+    'api' optional dependencies to be installed.
 
-        Args:
-            *args: Positional arguments passed to the underlying start_server implementation.
-            **kwargs: Keyword arguments passed to the underlying start_server implementation.
-                     Common options include host, port, workers, and config paths.
+    Args:
+        *args: Positional arguments passed to the underlying run_api implementation.
+        **kwargs: Keyword arguments passed to the underlying run_api implementation.
+                 Common options include host, port, debug, and reload.
 
-        Returns:
-            The return value from the underlying server implementation.
+    Returns:
+        The return value from the underlying FastAPI run function.
 
-        Raises:
-            ImportError: If llm4free.server.server is not available.
+    Raises:
+        ImportError: If llm4free.server.server is not available.
 
-        Examples:
-            >>> from llm4free.client import start_server
-            >>> start_server()
-        """
-        return _start_server_impl(*args, **kwargs)
+    Examples:
+        >>> from llm4free.client import run_api
+        >>> run_api(host="0.0.0.0", port=8000)
+    """
+    return _import_server("run_api").run_api(*args, **kwargs)
 
-except ImportError:
 
-    def run_api(*args: Any, **kwargs: Any) -> Any:
-        """
-        Runs the FastAPI OpenAI-compatible API server.
+def start_server(*args: Any, **kwargs: Any) -> Any:
+    """
+    Starts the FastAPI OpenAI-compatible API server.
 
-        Raises ImportError if the server module is not available.
-        Install with: pip install llm4free[api]
+    Delegates to llm4free.server.server.start_server to initialize and run
+    an OpenAI-compatible HTTP API server. This is typically the main entry
+    point for starting the llm4free server in production or development.
 
-        Raises:
-            ImportError: Always raised; server not available in current environment.
-        """
-        raise ImportError("llm4free.server.server.run_api is not available.")
+    Args:
+        *args: Positional arguments passed to the underlying start_server implementation.
+        **kwargs: Keyword arguments passed to the underlying start_server implementation.
+                 Common options include host, port, workers, and config paths.
 
-    def start_server(*args: Any, **kwargs: Any) -> Any:
-        """
-        Starts the FastAPI OpenAI-compatible API server.
+    Returns:
+        The return value from the underlying server implementation.
 
-        Raises ImportError if the server module is not available.
-        Install with: pip install llm4free[api]
+    Raises:
+        ImportError: If llm4free.server.server is not available.
 
-        Raises:
-            ImportError: Always raised; server not available in current environment.
-        """
-        raise ImportError("llm4free.server.server.start_server is not available.")
+    Examples:
+        >>> from llm4free.client import start_server
+        >>> start_server()
+    """
+    return _import_server("start_server").run_api(*args, **kwargs)
 
 
 if __name__ == "__main__":
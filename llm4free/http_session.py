@@ -0,0 +1,231 @@
+"""
+Shared HTTP sessions for stateless request sites.
+
+Search engines, the scout crawler and the YouTube/GitHub toolkits used to open a
+``curl_cffi`` session (or a bare ``urlopen`` connection) per object or per call,
+paying a DNS lookup and a TLS handshake each time. ``SessionManager`` keeps one
+session per ``(impersonation profile, proxy, verify)`` and hands out
+``SharedSession`` views of it. Each view has its own default headers, cookies
+and timeout, while connections, TLS sessions and DNS results are reused.
+
+curl_cffi gives every thread its own curl handle within a session, so each
+handle keeps its own connection cache (``max_connections`` connections) and DNS
+cache (``dns_cache_ttl`` seconds). HTTP/2 is negotiated over TLS when no
+browser profile is impersonated; impersonation profiles pick their own
+protocol. Cookies set by servers are kept in the shared session's jar, so these
+sessions suit clients that do not rely on per-object cookie state. Chat
+providers keep their own sessions for that reason and are reused through
+``llm4free.provider_pool`` instead.
+
+Call ``close_shared_sessions()`` on shutdown; the API server does so in its
+lifespan hook.
+"""
+
+import threading
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+from curl_cffi.const import CurlHttpVersion, CurlOpt
+from curl_cffi.requests import Headers, Response, Session
+
+# Idle connections cached per curl handle (one handle per thread and session).
+DEFAULT_MAX_CONNECTIONS = 16
+# Seconds a resolved host name is cached (curl's own default is 60).
+DEFAULT_DNS_CACHE_TTL = 300
+
+ProxySpec = Union[str, Mapping[str, str], None]
+SessionKey = Tuple[Optional[str], Tuple[Tuple[str, str], ...], bool]
+
+
+def _proxy_items(proxy: ProxySpec) -> Tuple[Tuple[str, str], ...]:
+    if not proxy:
+        return ()
+    if isinstance(proxy, str):
+        return (("http", proxy), ("https", proxy))
+    return tuple(sorted((scheme, url) for scheme, url in proxy.items() if url))
+
+
+class SharedSession:
+    """
+    A caller's view of a shared session.
+
+    Exposes the parts of the ``curl_cffi.requests.Session`` API that request
+    sites use: ``headers``, ``cookies``, ``request``/``get``/``post``/... and
+    ``close``. Default headers and cookies are merged into each request;
+    closing a view leaves the shared session open.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        headers: Optional[Mapping[str, str]] = None,
+        cookies: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        self.session = session
+        self.headers = Headers(dict(headers or {}))
+        self.cookies: Dict[str, str] = dict(cookies or {})
+        self.timeout = timeout
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Response:
+        headers = Headers(self.headers)
+        if kwargs.get("headers"):
+            headers.update(kwargs["headers"])
+        kwargs["headers"] = headers
+        if self.cookies:
+            kwargs["cookies"] = {**self.cookies, **(kwargs.get("cookies") or {})}
+        if kwargs.get("timeout") is None and self.timeout is not None:
+            kwargs["timeout"] = self.timeout
+        return self.session.request(method, url, **kwargs)  # type: ignore[arg-type]
+
+    def get(self, url: str, **kwargs: Any) -> Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> Response:
+        return self.request("POST", url, **kwargs)
+
+    def head(self, url: str, **kwargs: Any) -> Response:
+        return self.request("HEAD", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> Response:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        """No-op: the underlying session is closed by its ``SessionManager``."""
+
+    def __enter__(self) -> "SharedSession":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class SessionManager:
+    """
+    One ``curl_cffi`` session per ``(impersonate, proxy, verify)``.
+
+    Args:
+        max_connections: Idle connections each curl handle keeps for reuse.
+        dns_cache_ttl: Seconds resolved host names are cached.
+        http2: Negotiate HTTP/2 over TLS for sessions without an impersonation
+            profile.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        dns_cache_ttl: int = DEFAULT_DNS_CACHE_TTL,
+        http2: bool = True,
+    ) -> None:
+        self.max_connections = max_connections
+        self.dns_cache_ttl = dns_cache_ttl
+        self.http2 = http2
+        self._sessions: Dict[SessionKey, Session] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(
+        self,
+        impersonate: Optional[str] = None,
+        proxy: ProxySpec = None,
+        verify: bool = True,
+    ) -> Session:
+        """Return the shared session for these settings, creating it on first use."""
+        proxies = _proxy_items(proxy)
+        key: SessionKey = (impersonate, proxies, verify)
+        session = self._sessions.get(key)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(key)
+                if session is None:
+                    session = self._sessions[key] = self._create(impersonate, proxies, verify)
+        return session
+
+    def _create(
+        self, impersonate: Optional[str], proxies: Tuple[Tuple[str, str], ...], verify: bool
+    ) -> Session:
+        curl_options = {
+            CurlOpt.MAXCONNECTS: self.max_connections,
+            CurlOpt.DNS_CACHE_TIMEOUT: self.dns_cache_ttl,
+            CurlOpt.TCP_KEEPALIVE: 1,
+            # Prefer waiting for an HTTP/2 connection to multiplex over opening another.
+            CurlOpt.PIPEWAIT: 1,
+        }
+        kwargs: Dict[str, Any] = {
+            "proxies": dict(proxies) or None,
+            "verify": verify,
+            "curl_options": curl_options,
+        }
+        if impersonate:
+            kwargs["impersonate"] = impersonate
+        elif self.http2:
+            kwargs["http_version"] = CurlHttpVersion.V2TLS
+        return Session(**kwargs)
+
+    def session(
+        self,
+        impersonate: Optional[str] = None,
+        proxy: ProxySpec = None,
+        verify: bool = True,
+        *,
+        headers: Optional[Mapping[str, str]] = None,
+        cookies: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> SharedSession:
+        """A ``SharedSession`` view with its own default headers, cookies and timeout."""
+        return SharedSession(
+            self.get(impersonate, proxy, verify),
+            headers=headers,
+            cookies=cookies,
+            timeout=timeout,
+        )
+
+    def close(self) -> None:
+        """Close every session. Later requests open new ones."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            try:
+                session.close()
+            except Exception:
+                pass
+
+
+_manager: Optional[SessionManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_session_manager() -> SessionManager:
+    """Return the process-wide session manager."""
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = SessionManager()
+    return _manager
+
+
+def shared_session(
+    impersonate: Optional[str] = None,
+    proxy: ProxySpec = None,
+    verify: bool = True,
+    *,
+    headers: Optional[Mapping[str, str]] = None,
+    cookies: Optional[Mapping[str, str]] = None,
+    timeout: Optional[float] = None,
+) -> SharedSession:
+    """A view of the process-wide session for these settings."""
+    return get_session_manager().session(
+        impersonate, proxy, verify, headers=headers, cookies=cookies, timeout=timeout
+    )
+
+
+def close_shared_sessions() -> None:
+    """Close the process-wide sessions, if any were opened."""
+    if _manager is not None:
+        _manager.close()
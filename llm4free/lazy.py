@@ -0,0 +1,54 @@
+"""
+PEP 562 lazy exports for llm4free packages.
+
+``llm4free`` and its provider packages (``llm``, ``llm.Auth``, ``TTI``, ``TTS``,
+``STT``) no longer import every module up front. Each package keeps its imports
+in an ``if TYPE_CHECKING:`` block, so IDEs and type checkers still see them,
+and resolves public names at runtime through the generated manifest in
+``llm4free/_exports.py``, which maps every name to the module that defines it.
+A provider module is imported the first time one of its names is accessed.
+Subpackages and submodules (``llm4free.AISEARCH``, ``llm4free.server``) are
+imported on first attribute access too, as they were when the package
+imported them eagerly.
+
+The manifest is generated by ``llm4free.lazy_manifest``.
+"""
+
+import importlib
+import importlib.util
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` functions for a package.
+
+    Args:
+        package: The package's ``__name__``.
+        exports: Mapping of public name to the module that defines it.
+
+    Returns:
+        ``(__getattr__, __dir__)`` to assign at module level in the package.
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            submodule = f"{package}.{name}"
+            if name.startswith("__") or importlib.util.find_spec(submodule) is None:
+                raise AttributeError(f"module {package!r} has no attribute {name!r}")
+            # Importing a submodule also binds it on the package.
+            return importlib.import_module(submodule)
+        value = getattr(importlib.import_module(module), name)
+        # Cache on the package so later lookups skip __getattr__ entirely.
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,162 @@
+"""
+Generate and verify ``llm4free/_exports.py``, the lazy export manifest.
+
+The manifest maps every public name of ``llm4free`` and of the lazy provider
+packages to the module that defines it (see ``llm4free.lazy``). Lazy packages
+are read statically from their ``if TYPE_CHECKING:`` imports; the top-level
+names are resolved by importing the packages ``llm4free`` used to star-import.
+
+Usage::
+
+    python -m llm4free.lazy_manifest           # rewrite llm4free/_exports.py
+    python -m llm4free.lazy_manifest --check   # exit with status 1 if it is out of date
+"""
+
+import argparse
+import ast
+import importlib
+import importlib.util
+import json
+import pkgutil
+import sys
+import types
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple, Union
+
+# Packages whose ``__init__`` resolves names lazily. Listed innermost first so
+# that outer packages can resolve re-exports through the inner manifests.
+LAZY_PACKAGES = (
+    "llm4free.llm.Auth",
+    "llm4free.llm",
+    "llm4free.TTI",
+    "llm4free.TTS",
+    "llm4free.STT",
+)
+
+# What ``import llm4free`` used to bind, in the original import order (later
+# sources win on name clashes). "*" means the source's star-import names.
+TOP_LEVEL_SOURCES: Sequence[Tuple[str, Union[str, Tuple[str, ...]]]] = (
+    ("llm4free.litagent", ("LitAgent",)),
+    ("llm4free.AISEARCH", "*"),
+    ("llm4free.AIutel", "*"),
+    ("llm4free.client", ("Client",)),
+    ("llm4free.async_client", ("AsyncClient",)),
+    ("llm4free.Extra", "*"),
+    ("llm4free.llm", "*"),
+    ("llm4free.models", ("model",)),
+    ("llm4free.scout", "*"),
+    ("llm4free.search", "*"),
+    ("llm4free.STT", "*"),
+    ("llm4free.swiftcli", "*"),
+    ("llm4free.TTI", "*"),
+    ("llm4free.TTS", "*"),
+    ("llm4free.update_checker", ("check_for_updates",)),
+    ("llm4free.zeroart", "*"),
+)
+
+MANIFEST_PATH = Path(__file__).with_name("_exports.py")
+
+
+def _is_type_checking_block(node: ast.stmt) -> bool:
+    if not isinstance(node, ast.If):
+        return False
+    test = node.test
+    return (isinstance(test, ast.Name) and test.id == "TYPE_CHECKING") or (
+        isinstance(test, ast.Attribute) and test.attr == "TYPE_CHECKING"
+    )
+
+
+def _package_exports(package: str, manifest: Dict[str, Dict[str, str]]) -> Dict[str, str]:
+    """Read a lazy package's ``TYPE_CHECKING`` imports without importing it."""
+    spec = importlib.util.find_spec(package)
+    if spec is None or spec.origin is None:
+        raise ImportError(f"Cannot locate package {package}")
+    tree = ast.parse(Path(spec.origin).read_text(encoding="utf-8"))
+
+    exports: Dict[str, str] = {}
+    for node in tree.body:
+        if not _is_type_checking_block(node):
+            continue
+        for stmt in ast.walk(node):
+            if not isinstance(stmt, ast.ImportFrom):
+                continue
+            module = importlib.util.resolve_name("." * stmt.level + (stmt.module or ""), package)
+            for alias in stmt.names:
+                if alias.name == "*":
+                    raise ValueError(f"{package}: star imports cannot be resolved lazily")
+                inner = manifest.get(module, {})
+                exports[alias.asname or alias.name] = inner.get(alias.name, module)
+    return exports
+
+
+def _star_names(module: types.ModuleType) -> List[str]:
+    names = getattr(module, "__all__", None)
+    if names is None:
+        names = [name for name in vars(module) if not name.startswith("_")]
+    return [name for name in names if not isinstance(getattr(module, name, None), types.ModuleType)]
+
+
+def _top_level_exports(manifest: Dict[str, Dict[str, str]]) -> Dict[str, str]:
+    """Resolve the names ``import llm4free`` used to bind (imports the sources)."""
+    import llm4free
+
+    submodules = {info.name for info in pkgutil.iter_modules(llm4free.__path__)}
+    exports: Dict[str, str] = {}
+    for source, names in TOP_LEVEL_SOURCES:
+        module = importlib.import_module(source)
+        for name in _star_names(module) if names == "*" else names:
+            if name in submodules:
+                # ``from llm4free import <submodule>`` must import the submodule.
+                continue
+            exports[name] = manifest.get(source, {}).get(name, source)
+    return exports
+
+
+def generate_manifest() -> Dict[str, Dict[str, str]]:
+    """Compute the export manifest for the top-level and every lazy package."""
+    manifest: Dict[str, Dict[str, str]] = {}
+    for package in LAZY_PACKAGES:
+        manifest[package] = _package_exports(package, manifest)
+    manifest["llm4free"] = _top_level_exports(manifest)
+    return manifest
+
+
+def render_manifest(manifest: Dict[str, Dict[str, str]]) -> str:
+    """Render the manifest as the source of ``llm4free/_exports.py``."""
+    lines = [
+        "# Generated by `python -m llm4free.lazy_manifest`; do not edit by hand.",
+        '"""Lazy export manifest: package -> public name -> defining module."""',
+        "",
+        "from typing import Dict",
+        "",
+        "EXPORTS: Dict[str, Dict[str, str]] = {",
+    ]
+    for package in sorted(manifest):
+        lines.append(f"    {json.dumps(package)}: {{")
+        for name, module in sorted(manifest[package].items()):
+            lines.append(f"        {json.dumps(name)}: {json.dumps(module)},")
+        lines.append("    },")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: Sequence[str] = ()) -> int:
+    parser = argparse.ArgumentParser(description="Regenerate llm4free/_exports.py.")
+    parser.add_argument("--check", action="store_true", help="Fail if the manifest is out of date.")
+    args = parser.parse_args(argv or None)
+
+    rendered = render_manifest(generate_manifest())
+    current = MANIFEST_PATH.read_text(encoding="utf-8") if MANIFEST_PATH.exists() else ""
+    if args.check:
+        if rendered != current:
+            print(f"{MANIFEST_PATH} is out of date; run `python -m llm4free.lazy_manifest`.")
+            return 1
+        print(f"{MANIFEST_PATH} is up to date.")
+        return 0
+    MANIFEST_PATH.write_text(rendered, encoding="utf-8")
+    print(f"Wrote {MANIFEST_PATH}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,6 +13,7 @@ from llm4free.llm.base import (
     OpenAICompatibleProvider,
     SimpleModelList,
 )
+from llm4free.llm.openai_compat import OpenAICompatibleAsyncProvider
 from llm4free.llm.utils import (
     ChatCompletion,
     ChatCompletionChunk,
@@ -223,6 +224,7 @@ class Chat(BaseChat):
 
 
 class Cerebras(OpenAICompatibleProvider):
+    async_provider_class = OpenAICompatibleAsyncProvider
     required_auth = True
     AVAILABLE_MODELS = []
 
@@ -13,6 +13,7 @@ from llm4free.llm.base import (
     OpenAICompatibleProvider,
     SimpleModelList,
 )
+from llm4free.llm.openai_compat import OpenAICompatibleAsyncProvider
 from llm4free.llm.utils import (
     ChatCompletion,
     ChatCompletionChunk,
@@ -226,6 +227,8 @@ class DeepInfra(OpenAICompatibleProvider):
     API Documentation: https://deepinfra.com/docs/openai_api
     """
 
+    async_provider_class = OpenAICompatibleAsyncProvider
+
     required_auth = True
     AVAILABLE_MODELS = [
         "meta-llama/Llama-3.3-70B-Instruct-Turbo",
@@ -1,4 +1,3 @@
-import json
 import time
 import uuid
 from typing import Any, Dict, Generator, List, Optional, Union, cast
@@ -10,9 +9,11 @@ from curl_cffi.requests import Session
 
 # Attempt to import LitAgent, fallback if not available
 from llm4free.litagent import LitAgent
+from llm4free.utils import JSON_DECODE_ERRORS, json_loadb
 
 # Import base classes and utility structures
 from ..base import BaseChat, BaseCompletions, OpenAICompatibleProvider, SimpleModelList
+from ..openai_compat import OpenAICompatibleAsyncProvider
 from ..utils import (
     ChatCompletion,
     ChatCompletionChunk,
@@ -97,15 +98,15 @@ class Completions(BaseCompletions):
             completion_tokens = 0
             total_tokens = 0
 
-            for line in response.iter_lines(decode_unicode=True):
+            for line in response.iter_lines():
                 if line:
-                    if line.startswith("data: "):
+                    if line.startswith(b"data: "):
                         json_str = line[6:]
-                        if json_str == "[DONE]":
+                        if json_str == b"[DONE]":
                             break
 
                         try:
-                            data = json.loads(json_str)
+                            data = json_loadb(json_str)
                             choices = data.get("choices")
                             if not choices and choices is not None:
                                 continue
@@ -146,12 +147,6 @@ class Completions(BaseCompletions):
                                 system_fingerprint=data.get("system_fingerprint"),
                             )
 
-                            # Convert chunk to dict using Pydantic's API
-                            if hasattr(chunk, "model_dump"):
-                                chunk_dict = chunk.model_dump(exclude_none=True)
-                            else:
-                                chunk_dict = chunk.dict(exclude_none=True)
-
                             # Add usage information to match OpenAI format
                             usage_dict = {
                                 "prompt_tokens": prompt_tokens or 10,
@@ -180,11 +175,13 @@ class Completions(BaseCompletions):
                                 usage_dict["completion_tokens"] = completion_tokens
                                 usage_dict["total_tokens"] = total_tokens
 
-                            chunk_dict["usage"] = usage_dict
+                            # Usage is sent on the final chunk only
+                            if finish_reason:
+                                chunk.usage = usage_dict
 
                             yield chunk
-                        except json.JSONDecodeError:
-                            print(f"Warning: Could not decode JSON line: {json_str}")
+                        except JSON_DECODE_ERRORS:
+                            print(f"Warning: Could not decode JSON line: {json_str!r}")
                             continue
         except CurlError as e:
             print(f"Error during Groq stream request: {e}")
@@ -262,6 +259,7 @@ class Chat(BaseChat):
 
 
 class Groq(OpenAICompatibleProvider):
+    async_provider_class = OpenAICompatibleAsyncProvider
     required_auth = True
     AVAILABLE_MODELS = [
         "distil-whisper-large-v3-en",
@@ -12,6 +12,7 @@ from llm4free.llm.base import (
     OpenAICompatibleProvider,
     SimpleModelList,
 )
+from llm4free.llm.openai_compat import OpenAICompatibleAsyncProvider
 from llm4free.llm.utils import (
     ChatCompletion,
     ChatCompletionChunk,
@@ -233,6 +234,8 @@ class Nvidia(OpenAICompatibleProvider):
     OpenAI-compatible client for Nvidia NIM API.
     """
 
+    async_provider_class = OpenAICompatibleAsyncProvider
+
     required_auth = True
     AVAILABLE_MODELS = []
 
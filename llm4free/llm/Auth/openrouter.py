@@ -13,6 +13,7 @@ from llm4free.llm.base import (
     OpenAICompatibleProvider,
     SimpleModelList,
 )
+from llm4free.llm.openai_compat import OpenAICompatibleAsyncProvider
 from llm4free.llm.utils import (
     ChatCompletion,
     ChatCompletionChunk,
@@ -245,6 +246,8 @@ class OpenRouter(OpenAICompatibleProvider):
     Requires an API key from https://openrouter.ai/keys
     """
 
+    async_provider_class = OpenAICompatibleAsyncProvider
+
     required_auth = True
     AVAILABLE_MODELS = []
     supports_tools = True
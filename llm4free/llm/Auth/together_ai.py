@@ -12,6 +12,7 @@ from llm4free.llm.base import (
     OpenAICompatibleProvider,
     SimpleModelList,
 )
+from llm4free.llm.openai_compat import OpenAICompatibleAsyncProvider
 from llm4free.llm.utils import (
     ChatCompletion,
     ChatCompletionChunk,
@@ -225,6 +226,8 @@ class TogetherAI(OpenAICompatibleProvider):
     OpenAI-compatible client for TogetherAI API.
     """
 
+    async_provider_class = OpenAICompatibleAsyncProvider
+
     required_auth = True
     AVAILABLE_MODELS = []
 
@@ -139,12 +139,6 @@ class Completions(BaseCompletions):
                                 system_fingerprint=data.get("system_fingerprint"),
                             )
 
-                            # Convert chunk to dict using Pydantic's API
-                            if hasattr(chunk, "model_dump"):
-                                chunk_dict = chunk.model_dump(exclude_none=True)
-                            else:
-                                chunk_dict = chunk.dict(exclude_none=True)
-
                             # Add usage information to match OpenAI format
                             usage_dict = {
                                 "prompt_tokens": prompt_tokens or 10,
@@ -173,7 +167,9 @@ class Completions(BaseCompletions):
                                 usage_dict["completion_tokens"] = completion_tokens
                                 usage_dict["total_tokens"] = total_tokens
 
-                            chunk_dict["usage"] = usage_dict
+                            # Usage is sent on the final chunk only
+                            if finish_reason:
+                                chunk.usage = usage_dict
 
                             yield chunk
                         except json.JSONDecodeError:
@@ -5,7 +5,19 @@ import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from functools import wraps
-from typing import Any, Callable, Dict, Generator, List, Optional, TypedDict, Union, cast
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Type,
+    TypedDict,
+    Union,
+    cast,
+)
 
 from curl_cffi import requests
 from litprinter import ic
@@ -413,6 +425,8 @@ class OpenAICompatibleProvider(ABC):
     supports_tools: bool = False  # Whether the provider supports tools
     supports_tool_choice: bool = False  # Whether the provider supports tool_choice
     required_auth: bool = False  # Whether the provider requires authentication
+    # Native async counterpart, built on demand by ``aio`` (None = sync only)
+    async_provider_class: Optional[Type["AsyncOpenAICompatibleProvider"]] = None
 
     def __init_subclass__(cls, **kwargs: Any):
         super().__init_subclass__(**kwargs)
@@ -532,6 +546,23 @@ class OpenAICompatibleProvider(ABC):
             fallback_models=list(fallback_models) if fallback_models else [],
         )
 
+    @property
+    def aio(self) -> Optional["AsyncOpenAICompatibleProvider"]:
+        """
+        Native async view of this provider, or None if it only supports sync calls.
+
+        The async provider shares this instance's endpoint, headers and timeout
+        but owns its own ``curl_cffi.AsyncSession``.
+        """
+        async_cls = type(self).async_provider_class
+        if async_cls is None:
+            return None
+        provider = self.__dict__.get("_aio")
+        if provider is None:
+            provider = async_cls(self)
+            self.__dict__["_aio"] = provider
+        return provider
+
     def get_tool_by_name(self, name: str) -> Optional[Tool]:
         """Get a tool by name"""
         return self.available_tools.get(name)
@@ -565,3 +596,62 @@ class OpenAICompatibleProvider(ABC):
                 break
 
         return updated_messages
+
+
+class BaseAsyncCompletions(ABC):
+    @abstractmethod
+    async def create(
+        self,
+        *,
+        model: str,
+        messages: List[Dict[str, Any]],
+        max_tokens: Optional[int] = None,
+        stream: bool = False,
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+        tools: Optional[List[Union[Tool, Dict[str, Any]]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        timeout: Optional[int] = None,
+        proxies: Optional[dict] = None,
+        **kwargs: Any,
+    ) -> Union[ChatCompletion, AsyncGenerator[ChatCompletionChunk, None]]:
+        """
+        Async counterpart of ``BaseCompletions.create``.
+
+        Returns:
+            Either a completion object or an async generator of completion chunks
+            if streaming
+        """
+        raise NotImplementedError
+
+
+class BaseAsyncChat(ABC):
+    completions: BaseAsyncCompletions
+
+
+class AsyncOpenAICompatibleProvider(ABC):
+    """
+    Abstract Base Class for providers with a native async ``chat.completions.create``.
+
+    Async providers never block the event loop, so the server awaits them directly
+    instead of handing them to its worker pool.
+    """
+
+    chat: BaseAsyncChat
+    supports_tools: bool = False  # Whether the provider supports tools
+    required_auth: bool = False  # Whether the provider requires authentication
+
+    @property
+    @abstractmethod
+    def models(self) -> ModelList:
+        """Property that returns an object with a .list() method returning available models."""
+        raise NotImplementedError
+
+    async def aclose(self) -> None:
+        """Release network resources held by the provider."""
+
+    async def __aenter__(self) -> "AsyncOpenAICompatibleProvider":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
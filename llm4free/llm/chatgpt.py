@@ -830,6 +830,7 @@ class ChatGPT(OpenAICompatibleProvider):
     """
 
     required_auth = False
+    AVAILABLE_MODELS = ChatGPTReversed.AVAILABLE_MODELS
 
     def __init__(
         self,
@@ -849,10 +850,6 @@ class ChatGPT(OpenAICompatibleProvider):
         # Initialize chat interface
         self.chat = Chat(self)
 
-    @property
-    def AVAILABLE_MODELS(self):
-        return ChatGPTReversed.AVAILABLE_MODELS
-
     @property
     def models(self) -> SimpleModelList:
         return SimpleModelList(self.AVAILABLE_MODELS)
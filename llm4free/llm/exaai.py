@@ -174,22 +174,6 @@ class Completions(BaseCompletions):
                                 system_fingerprint=None,
                             )
 
-                            # Convert chunk to dict using Pydantic's API
-                            if hasattr(chunk, "model_dump"):
-                                chunk_dict = chunk.model_dump(exclude_none=True)
-                            else:
-                                chunk_dict = chunk.dict(exclude_none=True)
-
-                            # Add usage information to match OpenAI format
-                            usage_dict = {
-                                "prompt_tokens": prompt_tokens,
-                                "completion_tokens": completion_tokens,
-                                "total_tokens": total_tokens,
-                                "estimated_cost": None,
-                            }
-
-                            chunk_dict["usage"] = usage_dict
-
                             # Return the chunk object for internal processing
                             yield chunk
                     elif line.startswith("e:") or line.startswith("d:"):
@@ -214,14 +198,10 @@ class Completions(BaseCompletions):
                 system_fingerprint=None,
             )
 
-            if hasattr(chunk, "model_dump"):
-                chunk_dict = chunk.model_dump(exclude_none=True)
-            else:
-                chunk_dict = chunk.dict(exclude_none=True)
             if usage:
-                chunk_dict["usage"] = usage
+                chunk.usage = usage
             else:
-                chunk_dict["usage"] = {
+                chunk.usage = {
                     "prompt_tokens": prompt_tokens,
                     "completion_tokens": completion_tokens,
                     "total_tokens": total_tokens,
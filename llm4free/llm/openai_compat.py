@@ -0,0 +1,374 @@
+"""
+Shared async request/parse core for OpenAI-compatible chat completion APIs.
+
+Providers whose upstream speaks the OpenAI chat completions protocol opt in by
+setting ``async_provider_class = OpenAICompatibleAsyncProvider``. Their ``aio``
+property then returns an async provider that reuses the sync provider's
+endpoint, headers and timeout, but sends requests through a
+``curl_cffi.AsyncSession`` so streams never tie up a thread.
+"""
+
+import asyncio
+import functools
+import time
+import uuid
+from typing import Any, AsyncGenerator, Dict, List, Optional, Set, Union
+
+from curl_cffi import CurlError
+from curl_cffi.requests import AsyncSession
+
+from llm4free.AIbase import ModelList
+from llm4free.llm.base import (
+    AsyncOpenAICompatibleProvider,
+    BaseAsyncChat,
+    BaseAsyncCompletions,
+    OpenAICompatibleProvider,
+    Tool,
+)
+from llm4free.llm.utils import (
+    ChatCompletion,
+    ChatCompletionChunk,
+    ChatCompletionMessage,
+    Choice,
+    ChoiceDelta,
+    CompletionUsage,
+)
+from llm4free.utils import JSON_DECODE_ERRORS, json_loadb
+
+
+class AsyncCompletions(BaseAsyncCompletions):
+    def __init__(self, client: "OpenAICompatibleAsyncProvider"):
+        self._client = client
+
+    async def create(
+        self,
+        *,
+        model: str,
+        messages: List[Dict[str, Any]],
+        max_tokens: Optional[int] = None,
+        stream: bool = False,
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+        tools: Optional[List[Union[Tool, Dict[str, Any]]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        timeout: Optional[int] = None,
+        proxies: Optional[dict] = None,
+        **kwargs: Any,
+    ) -> Union[ChatCompletion, AsyncGenerator[ChatCompletionChunk, None]]:
+        """
+        Creates a model response for the given chat conversation.
+        Mimics openai.AsyncOpenAI().chat.completions.create
+        """
+        if tools and not self._client.supports_tools:
+            # Non-native tools run through the sync provider's XML tool loop,
+            # which always returns a whole completion.
+            create = functools.partial(
+                self._client.sync_provider.chat.completions.create,
+                model=model,
+                messages=messages,
+                max_tokens=max_tokens,
+                stream=False,
+                temperature=temperature,
+                top_p=top_p,
+                tools=tools,
+                tool_choice=tool_choice,
+                timeout=timeout,
+                proxies=proxies,
+                **kwargs,
+            )
+            completion = await asyncio.to_thread(create)
+            if stream:
+                return self._stream_completion(completion)
+            return completion
+
+        model_name = self._client.convert_model_name(model)
+        payload: Dict[str, Any] = {
+            "model": model_name,
+            "messages": messages,
+            "stream": stream,
+        }
+        if max_tokens is not None:
+            payload["max_tokens"] = max_tokens
+        if temperature is not None:
+            payload["temperature"] = temperature
+        if top_p is not None:
+            payload["top_p"] = top_p
+        if tools:
+            payload["tools"] = [t.to_dict() if isinstance(t, Tool) else t for t in tools]
+        if tool_choice is not None:
+            payload["tool_choice"] = tool_choice
+        payload.update(kwargs)
+
+        request_id = f"chatcmpl-{uuid.uuid4()}"
+        created_time = int(time.time())
+
+        if stream:
+            return self._create_stream(
+                request_id, created_time, model_name, payload, timeout, proxies
+            )
+        return await self._create_non_stream(
+            request_id, created_time, model_name, payload, timeout, proxies
+        )
+
+    async def _post(
+        self,
+        payload: Dict[str, Any],
+        stream: bool,
+        timeout: Optional[int] = None,
+        proxies: Optional[dict] = None,
+    ) -> Any:
+        request_kwargs: Dict[str, Any] = {
+            "headers": self._client.headers,
+            "json": payload,
+            "stream": stream,
+            "timeout": timeout or self._client.timeout,
+            "impersonate": self._client.impersonate,
+        }
+        if proxies:
+            request_kwargs["proxies"] = proxies
+        try:
+            response = await self._client.session.post(self._client.base_url, **request_kwargs)
+        except CurlError as e:
+            raise IOError(f"{self._client.name} request failed: {e}") from e
+
+        if response.status_code != 200:
+            body = await response.atext() if stream else response.text
+            if stream:
+                await response.aclose()
+            raise IOError(
+                f"{self._client.name} request failed with status code "
+                f"{response.status_code}: {body}"
+            )
+        return response
+
+    async def _create_stream(
+        self,
+        request_id: str,
+        created_time: int,
+        model: str,
+        payload: Dict[str, Any],
+        timeout: Optional[int] = None,
+        proxies: Optional[dict] = None,
+    ) -> AsyncGenerator[ChatCompletionChunk, None]:
+        response = await self._post(payload, True, timeout, proxies)
+
+        prompt_tokens = 0
+        completion_tokens = 0
+        total_tokens = 0
+        finished = False
+        try:
+            async for line in response.aiter_lines():
+                if not line or not line.startswith(b"data:"):
+                    continue
+                json_str = line[5:].strip()
+                if json_str == b"[DONE]":
+                    break
+                try:
+                    data = json_loadb(json_str)
+                except JSON_DECODE_ERRORS:
+                    continue
+
+                choices = data.get("choices")
+                if not choices and choices is not None:
+                    continue
+                choice_data = choices[0] if choices else {}
+                delta_data = choice_data.get("delta") or {}
+                finish_reason = choice_data.get("finish_reason")
+                if finish_reason:
+                    finished = True
+
+                usage_data = data.get("usage")
+                if usage_data:
+                    prompt_tokens = usage_data.get("prompt_tokens", prompt_tokens)
+                    completion_tokens = usage_data.get("completion_tokens", completion_tokens)
+                    total_tokens = usage_data.get("total_tokens", total_tokens)
+                elif delta_data.get("content"):
+                    completion_tokens += 1
+                    total_tokens = prompt_tokens + completion_tokens
+
+                delta = ChoiceDelta(
+                    content=delta_data.get("content"),
+                    role=delta_data.get("role"),
+                    tool_calls=delta_data.get("tool_calls"),
+                    reasoning_content=delta_data.get("reasoning_content"),
+                )
+                choice = Choice(
+                    index=choice_data.get("index", 0),
+                    delta=delta,
+                    finish_reason=finish_reason,
+                    logprobs=choice_data.get("logprobs"),
+                )
+                chunk = ChatCompletionChunk(
+                    id=request_id,
+                    choices=[choice],
+                    created=created_time,
+                    model=model,
+                    system_fingerprint=data.get("system_fingerprint"),
+                )
+                chunk.usage = {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": total_tokens,
+                    "estimated_cost": None,
+                }
+                yield chunk
+
+            if not finished:
+                # Final chunk with finish_reason="stop"
+                yield ChatCompletionChunk(
+                    id=request_id,
+                    choices=[Choice(index=0, delta=ChoiceDelta(), finish_reason="stop")],
+                    created=created_time,
+                    model=model,
+                    usage={
+                        "prompt_tokens": prompt_tokens,
+                        "completion_tokens": completion_tokens,
+                        "total_tokens": total_tokens,
+                        "estimated_cost": None,
+                    },
+                )
+        except CurlError as e:
+            raise IOError(f"{self._client.name} stream failed: {e}") from e
+        finally:
+            await response.aclose()
+
+    async def _stream_completion(
+        self, completion: ChatCompletion
+    ) -> AsyncGenerator[ChatCompletionChunk, None]:
+        """Replay a whole completion as a one-chunk stream."""
+        choices = [
+            Choice(
+                index=choice.index,
+                delta=ChoiceDelta(
+                    role=choice.message.role,
+                    content=choice.message.content,
+                    tool_calls=choice.message.tool_calls,
+                    reasoning_content=choice.message.reasoning_content,
+                ),
+                finish_reason=choice.finish_reason or "stop",
+            )
+            for choice in completion.choices
+        ]
+        yield ChatCompletionChunk(
+            id=completion.id,
+            choices=choices,
+            created=completion.created,
+            model=completion.model,
+            system_fingerprint=completion.system_fingerprint,
+            usage=completion.usage.model_dump() if completion.usage else None,
+        )
+
+    async def _create_non_stream(
+        self,
+        request_id: str,
+        created_time: int,
+        model: str,
+        payload: Dict[str, Any],
+        timeout: Optional[int] = None,
+        proxies: Optional[dict] = None,
+    ) -> ChatCompletion:
+        response = await self._post(payload, False, timeout, proxies)
+        data = response.json()
+
+        choices = []
+        for choice_d in data.get("choices", []):
+            message_d = choice_d.get("message") or choice_d.get("delta") or {}
+            message = ChatCompletionMessage(
+                role=message_d.get("role") or "assistant",
+                content=message_d.get("content") or "",
+                tool_calls=message_d.get("tool_calls"),
+                reasoning_content=message_d.get("reasoning_content"),
+            )
+            choices.append(
+                Choice(
+                    index=choice_d.get("index", 0),
+                    message=message,
+                    finish_reason=choice_d.get("finish_reason") or "stop",
+                )
+            )
+
+        usage_data = data.get("usage") or {}
+        usage = CompletionUsage(
+            prompt_tokens=usage_data.get("prompt_tokens", 0),
+            completion_tokens=usage_data.get("completion_tokens", 0),
+            total_tokens=usage_data.get("total_tokens", 0),
+        )
+        return ChatCompletion(
+            id=request_id,
+            choices=choices,
+            created=created_time,
+            model=data.get("model", model),
+            usage=usage,
+        )
+
+
+class AsyncChat(BaseAsyncChat):
+    def __init__(self, client: "OpenAICompatibleAsyncProvider"):
+        self.completions = AsyncCompletions(client)
+
+
+class OpenAICompatibleAsyncProvider(AsyncOpenAICompatibleProvider):
+    """
+    Async provider for any sync provider that talks to an OpenAI-compatible endpoint.
+
+    Reads ``base_url`` (or ``api_endpoint``), ``headers`` and ``timeout`` from the
+    wrapped sync provider, so credentials stay configured in one place.
+    """
+
+    max_clients: int = 256  # Concurrent transfers per AsyncSession
+
+    def __init__(self, sync_provider: OpenAICompatibleProvider):
+        self.sync_provider = sync_provider
+        self.name = type(sync_provider).__name__
+        self.base_url = getattr(sync_provider, "base_url", None) or getattr(
+            sync_provider, "api_endpoint"
+        )
+        self.headers: Dict[str, str] = getattr(sync_provider, "headers", {})
+        self.timeout = getattr(sync_provider, "timeout", None)
+        self.impersonate = getattr(sync_provider, "impersonate", "chrome120")
+        self.supports_tools = type(sync_provider).supports_tools
+        self.required_auth = type(sync_provider).required_auth
+        self._sessions: Dict[asyncio.AbstractEventLoop, AsyncSession] = {}
+        self._closing: Set["asyncio.Task[None]"] = set()
+        self.chat = AsyncChat(self)
+
+    @property
+    def session(self) -> AsyncSession:
+        """Return the AsyncSession bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None:
+            self._close_stale_sessions(loop)
+            proxies = getattr(self.sync_provider, "proxies", None)
+            session = AsyncSession(max_clients=self.max_clients, proxies=proxies or None)
+            self._sessions[loop] = session
+        return session
+
+    def _close_stale_sessions(self, loop: asyncio.AbstractEventLoop) -> None:
+        # Sessions of closed loops still hold their curl handles; close them here.
+        for stale_loop in [other for other in self._sessions if other.is_closed()]:
+            task = loop.create_task(self._sessions.pop(stale_loop).close())
+            self._closing.add(task)
+            task.add_done_callback(self._closed)
+
+    def _closed(self, task: "asyncio.Task[None]") -> None:
+        self._closing.discard(task)
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def models(self) -> ModelList:
+        return self.sync_provider.models
+
+    def convert_model_name(self, model: str) -> str:
+        convert = getattr(self.sync_provider, "convert_model_name", None)
+        return convert(model) if callable(convert) else model
+
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._close_stale_sessions(loop)
+        session = self._sessions.pop(loop, None)
+        if session is not None:
+            await session.close()
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
@@ -215,16 +215,6 @@ class Completions(BaseCompletions):
                     model=model,
                     system_fingerprint=None,
                 )
-                if hasattr(chunk, "model_dump"):
-                    chunk_dict = chunk.model_dump(exclude_none=True)
-                else:
-                    chunk_dict = chunk.dict(exclude_none=True)
-                chunk_dict["usage"] = {
-                    "prompt_tokens": prompt_tokens,
-                    "completion_tokens": completion_tokens,
-                    "total_tokens": prompt_tokens + completion_tokens,
-                    "estimated_cost": None,
-                }
                 yield chunk
 
                 cid = self._client._extract_conversation_id(payload_obj, version)
@@ -246,11 +236,7 @@ class Completions(BaseCompletions):
                 model=model,
                 system_fingerprint=None,
             )
-            if hasattr(stop_chunk, "model_dump"):
-                stop_dict = stop_chunk.model_dump(exclude_none=True)
-            else:
-                stop_dict = stop_chunk.dict(exclude_none=True)
-            stop_dict["usage"] = {
+            stop_chunk.usage = {
                 "prompt_tokens": prompt_tokens,
                 "completion_tokens": completion_tokens,
                 "total_tokens": prompt_tokens + completion_tokens,
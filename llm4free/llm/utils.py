@@ -1,9 +1,13 @@
+import os
 import time
 import uuid
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, ClassVar, Dict, List, Optional, Type, Union, cast
+
+from pydantic_core import core_schema
 
 from llm4free.llm.pydantic_imports import BaseModel, Field, StrictInt, StrictStr
+from llm4free.utils import json_dumpb
 
 # --- OpenAI Response Structure Mimics ---
 # Moved here for reusability across different OpenAI-compatible providers
@@ -16,6 +20,8 @@ class DictLikeMixin:
     type safety and IDE autocomplete support.
     """
 
+    __slots__ = ()
+
     def __getitem__(self, key):
         """Allow dict-like access."""
         return getattr(self, key)
@@ -69,6 +75,39 @@ class ToolCall(BaseModel):
     function: ToolFunction
 
 
+class ChoiceDeltaToolCallFunction(ToolFunction, DictLikeMixin):
+    """Function part of a streamed tool call; later deltas carry only ``arguments``."""
+
+    name: Optional[StrictStr] = None
+    arguments: Optional[StrictStr] = None
+
+
+class ChoiceDeltaToolCall(ToolCall, DictLikeMixin):
+    """
+    Streamed tool call delta. ``index`` identifies the call; ``id``, ``type``
+    and the function name are only sent in its first delta.
+    """
+
+    index: Optional[StrictInt] = None
+    id: Optional[StrictStr] = None
+    type: Optional[StrictStr] = None
+    function: Optional[ChoiceDeltaToolCallFunction] = None
+
+
+def _tool_call_delta(value: Any) -> Any:
+    """Wrap a raw tool call delta dict without validating it."""
+    if not isinstance(value, dict):
+        return value
+    function = value.get("function")
+    if isinstance(function, dict):
+        function = ChoiceDeltaToolCallFunction.model_construct(
+            name=function.get("name"), arguments=function.get("arguments")
+        )
+    return ChoiceDeltaToolCall.model_construct(
+        index=value.get("index"), id=value.get("id"), type=value.get("type"), function=function
+    )
+
+
 class CompletionUsage(BaseModel):
     """Token usage information."""
 
@@ -78,17 +117,6 @@ class CompletionUsage(BaseModel):
     prompt_tokens_details: Optional[Dict[str, Any]] = None
 
 
-class ChoiceDelta(BaseModel, DictLikeMixin):
-    """Delta content in streaming response - OpenAI SDK compatible."""
-
-    content: Optional[StrictStr] = None
-    function_call: Optional[FunctionCall] = None
-    role: Optional[StrictStr] = None
-    tool_calls: Optional[List[ToolCall]] = None
-    reasoning_content: Optional[StrictStr] = None  # For reasoning models
-    reasoning: Optional[StrictStr] = None  # For reasoning models
-
-
 class ChatCompletionMessage(BaseModel, DictLikeMixin):
     """Chat message in completion response."""
 
@@ -100,16 +128,210 @@ class ChatCompletionMessage(BaseModel, DictLikeMixin):
     reasoning: Optional[StrictStr] = None  # For reasoning models (alternative field)
 
 
-class Choice(BaseModel, DictLikeMixin):
-    """Choice in completion response - OpenAI SDK compatible."""
+class _ChoiceDeltaSchema(BaseModel):
+    """Validation schema for ``ChoiceDelta`` (used only when chunk validation is on)."""
+
+    content: Optional[StrictStr] = None
+    function_call: Optional[FunctionCall] = None
+    role: Optional[StrictStr] = None
+    tool_calls: Optional[List[ChoiceDeltaToolCall]] = None
+    reasoning_content: Optional[StrictStr] = None
+    reasoning: Optional[StrictStr] = None
+
+
+class _ChoiceSchema(BaseModel):
+    """Validation schema for ``Choice`` (used only when chunk validation is on)."""
 
     index: StrictInt
     message: Optional[ChatCompletionMessage] = None
-    delta: Optional[ChoiceDelta] = None
+    delta: Optional[_ChoiceDeltaSchema] = None
     finish_reason: Optional[StrictStr] = None
     logprobs: Optional[Dict[str, Any]] = None
 
 
+class _ChatCompletionChunkSchema(BaseModel):
+    """Validation schema for ``ChatCompletionChunk`` (used only when chunk validation is on)."""
+
+    model: StrictStr
+    choices: List[_ChoiceSchema]
+    id: StrictStr
+    created: StrictInt
+    object: StrictStr
+    system_fingerprint: Optional[StrictStr] = None
+    usage: Optional[Dict[str, Any]] = None
+
+
+_validate_chunks = os.getenv("LLM4FREE_VALIDATE_CHUNKS", "").lower() in ("1", "true", "yes")
+
+
+def set_chunk_validation(enabled: bool) -> None:
+    """
+    Turn pydantic validation of streaming chunk objects on or off.
+
+    Validation is off by default because chunks are built once per token. The
+    server enables it in debug mode; ``LLM4FREE_VALIDATE_CHUNKS=1`` enables it
+    everywhere.
+    """
+    global _validate_chunks
+    _validate_chunks = enabled
+
+
+def _dump_value(value: Any, exclude_none: bool) -> Any:
+    if isinstance(value, (StreamModel, BaseModel)):
+        return value.model_dump(exclude_none=exclude_none)
+    if isinstance(value, list):
+        return [_dump_value(item, exclude_none) for item in value]
+    return value
+
+
+class StreamModel(DictLikeMixin):
+    """
+    Slotted base for the objects built once per streamed token.
+
+    Exposes the attribute, dict-like and ``model_dump`` API of the pydantic
+    models it replaces, without their per-instance validation cost. Subclasses
+    list their fields in ``__slots__`` and set ``_schema`` to a pydantic model
+    that is used to validate instances when chunk validation is enabled.
+    """
+
+    __slots__ = ()
+    _schema: ClassVar[Type[BaseModel]]
+    _scalars = (str, int, float, bool, type(None))
+
+    def _validate(self) -> None:
+        self._schema.model_validate(self.model_dump())
+
+    def keys(self):
+        """Return dict-like keys."""
+        return list(self.__slots__)
+
+    def values(self):
+        """Return dict-like values."""
+        return [getattr(self, name) for name in self.__slots__]
+
+    def items(self):
+        """Return dict-like items."""
+        return [(name, getattr(self, name)) for name in self.__slots__]
+
+    def model_dump(self, *, exclude_none: bool = False, **kwargs: Any) -> Dict[str, Any]:
+        """Return the object as a plain dict, like pydantic's ``model_dump``."""
+        scalars = self._scalars
+        data = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is None:
+                if not exclude_none:
+                    data[name] = None
+            elif type(value) in scalars:
+                data[name] = value
+            else:
+                data[name] = _dump_value(value, exclude_none)
+        return data
+
+    def dict(self, *, exclude_none: bool = False, **kwargs: Any) -> Dict[str, Any]:
+        """Pydantic v1 alias of ``model_dump``."""
+        return self.model_dump(exclude_none=exclude_none)
+
+    def model_dump_json(self, *, exclude_none: bool = False, **kwargs: Any) -> str:
+        """Return the object as a JSON string."""
+        return json_dumpb(self.model_dump(exclude_none=exclude_none)).decode("utf-8")
+
+    def to_sse_bytes(self) -> bytes:
+        """Serialize to a ``data: ...`` server-sent event, straight to bytes."""
+        return b"data: " + json_dumpb(self.model_dump(exclude_none=True)) + b"\n\n"
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any) -> core_schema.CoreSchema:
+        # Lets pydantic models (e.g. ``ChatCompletion.choices``) hold these objects.
+        def coerce(value: Any) -> Any:
+            return cls(**value) if isinstance(value, dict) else value
+
+        def serialize(value: Any, info: Any) -> Any:
+            return value.model_dump(exclude_none=bool(info.exclude_none))
+
+        return core_schema.no_info_after_validator_function(
+            coerce,
+            core_schema.union_schema(
+                [core_schema.is_instance_schema(cls), core_schema.dict_schema()]
+            ),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                serialize, info_arg=True
+            ),
+        )
+
+
+class ChoiceDelta(StreamModel):
+    """Delta content in streaming response - OpenAI SDK compatible."""
+
+    __slots__ = (
+        "content",
+        "function_call",
+        "role",
+        "tool_calls",
+        "reasoning_content",  # For reasoning models
+        "reasoning",  # For reasoning models
+    )
+    _schema = _ChoiceDeltaSchema
+
+    def __init__(
+        self,
+        *,
+        content: Optional[str] = None,
+        function_call: Optional[FunctionCall] = None,
+        role: Optional[str] = None,
+        tool_calls: Optional[List[Any]] = None,
+        reasoning_content: Optional[str] = None,
+        reasoning: Optional[str] = None,
+        **extra: Any,
+    ) -> None:
+        self.content = content
+        self.function_call = function_call
+        self.role = role
+        self.tool_calls = [_tool_call_delta(call) for call in tool_calls] if tool_calls else None
+        self.reasoning_content = reasoning_content
+        self.reasoning = reasoning
+        if _validate_chunks:
+            self._validate()
+
+
+class Choice(StreamModel):
+    """Choice in completion response - OpenAI SDK compatible."""
+
+    __slots__ = ("index", "message", "delta", "finish_reason", "logprobs")
+    _schema = _ChoiceSchema
+
+    def __init__(
+        self,
+        *,
+        index: int,
+        message: Optional[ChatCompletionMessage] = None,
+        delta: Optional[ChoiceDelta] = None,
+        finish_reason: Optional[str] = None,
+        logprobs: Optional[Dict[str, Any]] = None,
+        **extra: Any,
+    ) -> None:
+        if isinstance(message, dict):
+            message = ChatCompletionMessage(**message)
+        if isinstance(delta, dict):
+            delta = ChoiceDelta(**delta)
+        self.index = index
+        self.message = message
+        self.delta = delta
+        self.finish_reason = finish_reason
+        self.logprobs = logprobs
+        if _validate_chunks:
+            self._validate()
+
+
 class ModelData(BaseModel):
     """OpenAI model info response."""
 
@@ -242,40 +464,33 @@ class ChatCompletion(BaseModel):
         return getattr(self, key, default)
 
 
-class ChatCompletionChunk(BaseModel):
+class ChatCompletionChunk(StreamModel):
     """Streaming chat completion response chunk - OpenAI SDK compatible."""
 
-    model: StrictStr
-    choices: List[Choice]
-    id: StrictStr = Field(default_factory=lambda: f"chatcmpl-{str(uuid.uuid4())}")
-    created: StrictInt = Field(default_factory=lambda: int(time.time()))
-    object: StrictStr = "chat.completion.chunk"
-    system_fingerprint: Optional[StrictStr] = None
-    usage: Optional[Dict[str, Any]] = None  # Add usage field for streaming chunks
-
-    def __getitem__(self, key):
-        """Allow dict-like access."""
-        return getattr(self, key)
-
-    def __setitem__(self, key, value):
-        """Allow dict-like assignment."""
-        setattr(self, key, value)
-
-    def keys(self):
-        """Return dict-like keys."""
-        return self.__dict__.keys()
-
-    def values(self):
-        """Return dict-like values."""
-        return self.__dict__.values()
-
-    def items(self):
-        """Return dict-like items."""
-        return self.__dict__.items()
-
-    def get(self, key, default=None):
-        """Dict-like get method with default value."""
-        return getattr(self, key, default)
+    __slots__ = ("model", "choices", "id", "created", "object", "system_fingerprint", "usage")
+    _schema = _ChatCompletionChunkSchema
+
+    def __init__(
+        self,
+        *,
+        model: str,
+        choices: List[Choice],
+        id: Optional[str] = None,
+        created: Optional[int] = None,
+        object: str = "chat.completion.chunk",
+        system_fingerprint: Optional[str] = None,
+        usage: Optional[Dict[str, Any]] = None,  # Add usage field for streaming chunks
+        **extra: Any,
+    ) -> None:
+        self.model = model
+        self.choices = [Choice(**c) if isinstance(c, dict) else c for c in choices]
+        self.id = id if id is not None else f"chatcmpl-{str(uuid.uuid4())}"
+        self.created = created if created is not None else int(time.time())
+        self.object = object
+        self.system_fingerprint = system_fingerprint
+        self.usage = usage
+        if _validate_chunks:
+            self._validate()
 
 
 # --- Helper Functions ---
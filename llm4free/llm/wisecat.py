@@ -164,11 +164,7 @@ class Completions(BaseCompletions):
                 system_fingerprint=None,
             )
 
-            if hasattr(chunk, "model_dump"):
-                chunk_dict = chunk.model_dump(exclude_none=True)
-            else:
-                chunk_dict = chunk.dict(exclude_none=True)
-            chunk_dict["usage"] = {
+            chunk.usage = {
                 "prompt_tokens": prompt_tokens,
                 "completion_tokens": completion_tokens,
                 "total_tokens": total_tokens,
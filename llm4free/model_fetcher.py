@@ -5,53 +5,200 @@ lists from various providers in the background, preventing blocking operations
 during initialization or model discovery.
 """
 
-import json
+import atexit
 import os
 import tempfile
 import threading
 import time
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, ClassVar, Dict, Optional
 
 from litprinter import ic
 
+from llm4free.utils import JSON_DECODE_ERRORS, json_dumpb, json_loadb
+
+try:
+    import fcntl
+except ImportError:  # Windows: cross-process locking is unavailable
+    fcntl = None
+
 # Constants
 DEFAULT_FETCH_TIMEOUT = 10
 DEFAULT_CACHE_TTL = 86400  # 24 hours in seconds
+CACHE_FLUSH_DELAY = 1.0  # seconds to batch writes before flushing to disk
 CACHE_DIR = Path(tempfile.gettempdir()) / "llm4free"
 
 
+class _CacheStore:
+    """Process-wide in-memory view of one cache file.
+
+    The file is read once, on first access, and re-read only when another
+    process has replaced it. Writes update memory immediately and are flushed
+    to disk in batches by a write-behind timer: the flush takes an exclusive
+    ``fcntl`` lock, merges entries written by other processes (newest timestamp
+    wins) and atomically replaces the file.
+    """
+
+    _stores: ClassVar[Dict[Path, "_CacheStore"]] = {}
+    _stores_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, path: Path, debug: bool = False) -> None:
+        self.path = path
+        self.lock_path = path.with_name(path.name + ".lock")
+        self.debug = debug
+        self.lock = threading.RLock()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        self._disk_stamp: Optional[tuple] = None
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+
+    @classmethod
+    def for_path(cls, path: Path, debug: bool = False) -> "_CacheStore":
+        with cls._stores_lock:
+            store = cls._stores.get(path)
+            if store is None:
+                store = cls._stores[path] = cls(path, debug)
+            return store
+
+    def _stamp(self) -> Optional[tuple]:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _file_lock(self, exclusive: bool) -> Optional[Any]:
+        if fcntl is None:
+            return None
+        handle = open(self.lock_path, "a+b")
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        return handle
+
+    def _read_disk(self) -> Dict[str, Dict[str, Any]]:
+        self._disk_stamp = self._stamp()
+        try:
+            data = json_loadb(self.path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, *JSON_DECODE_ERRORS) as e:
+            if self.debug:
+                ic(f"Failed to read cache: {e}")
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _merge(self, other: Dict[str, Dict[str, Any]]) -> None:
+        for provider_name, entry in other.items():
+            current = self.entries.get(provider_name)
+            if current is None or entry.get("timestamp", 0) > current.get("timestamp", 0):
+                self.entries[provider_name] = entry
+
+    def refresh(self) -> None:
+        """Load the file on first use, or merge it again if another process replaced it."""
+        with self.lock:
+            if self._loaded and self._stamp() == self._disk_stamp:
+                return
+            handle = self._file_lock(exclusive=False)
+            try:
+                self._merge(self._read_disk())
+            finally:
+                if handle is not None:
+                    handle.close()
+            self._loaded = True
+
+    def get(self, provider_name: str) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            if not self._loaded:
+                self.refresh()
+            return self.entries.get(provider_name)
+
+    def set(self, provider_name: str, entry: Dict[str, Any]) -> None:
+        with self.lock:
+            if not self._loaded:
+                self.refresh()
+            self.entries[provider_name] = entry
+            self._dirty = True
+            if self._timer is None:
+                self._timer = threading.Timer(CACHE_FLUSH_DELAY, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Write pending entries to disk (atomic rename under an exclusive file lock)."""
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                handle = self._file_lock(exclusive=True)
+                try:
+                    if self._stamp() != self._disk_stamp:
+                        self._merge(self._read_disk())
+                    tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                    tmp_path.write_bytes(json_dumpb(self.entries))
+                    os.replace(tmp_path, self.path)
+                    self._disk_stamp = self._stamp()
+                    self._dirty = False
+                finally:
+                    if handle is not None:
+                        handle.close()
+            except OSError as e:
+                if self.debug:
+                    ic(f"Failed to write cache: {e}")
+
+    @classmethod
+    def flush_all(cls) -> None:
+        with cls._stores_lock:
+            stores = list(cls._stores.values())
+        for store in stores:
+            store.flush()
+
+
+atexit.register(_CacheStore.flush_all)
+
+
 class ModelFetcherCache:
-    """Thread-safe file-based cache for model lists with TTL support.
+    """Thread-safe cache for model lists with per-entry TTL support.
 
     Stores cached model data in the system temp directory under `llm4free/model_cache.json`
-    with per-provider expiration times. Supports disabling via `LLM4FREE_NO_MODEL_CACHE`
-    env var.
+    with per-provider expiration times. All instances for the same file share one
+    process-wide in-memory store, which reads the file once and writes it back with
+    an atomic, file-locked write-behind, so multiple server workers can share it.
+    Supports disabling via `LLM4FREE_NO_MODEL_CACHE` env var.
 
     Attributes:
         cache_path: Path to the cache file.
-        lock: Threading lock for file operations.
+        lock: Lock guarding the shared in-memory store.
         ttl: Default TTL in seconds (from env or default).
         cache_disabled: Whether caching is disabled.
     """
 
-    def __init__(self, cache_ttl: Optional[int] = None, debug: bool = False) -> None:
+    def __init__(
+        self,
+        cache_ttl: Optional[int] = None,
+        debug: bool = False,
+        cache_path: Optional[Path] = None,
+    ) -> None:
         """Initialize the model fetcher cache.
 
         Args:
             cache_ttl: TTL in seconds. If None, reads from LLM4FREE_MODEL_CACHE_TTL
                        env var or uses DEFAULT_CACHE_TTL.
             debug: Enable debug logging via ic.
+            cache_path: Cache file to use. Defaults to `model_cache.json` in CACHE_DIR.
         """
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        self.cache_path = CACHE_DIR / "model_cache.json"
-        self.lock = threading.Lock()
+        self.cache_path = cache_path or CACHE_DIR / "model_cache.json"
         self.debug = debug
         self.cache_disabled = os.getenv("LLM4FREE_NO_MODEL_CACHE", "").lower() in (
             "1",
             "true",
             "yes",
         )
+        self._store = _CacheStore.for_path(self.cache_path, debug)
+        self.lock = self._store.lock
 
         if cache_ttl is not None:
             self.ttl = cache_ttl
@@ -71,26 +218,15 @@ class ModelFetcherCache:
         if self.cache_disabled:
             return None
 
-        with self.lock:
-            if not self.cache_path.exists():
-                return None
-
-            try:
-                with open(self.cache_path, "r") as f:
-                    cache_data = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                if self.debug:
-                    ic(f"Failed to read cache: {e}")
-                return None
-
-            if provider_name not in cache_data:
-                return None
-
-            entry = cache_data[provider_name]
-            if self._is_expired(entry["timestamp"]):
+        entry = self._store.get(provider_name)
+        if entry is None or self._is_expired(entry):
+            # Another worker may have fetched this provider since we last read the file.
+            self._store.refresh()
+            entry = self._store.get(provider_name)
+            if entry is None or self._is_expired(entry):
                 return None
 
-            return entry.get("models")
+        return entry.get("models")
 
     def set(self, provider_name: str, models: list[str], ttl: Optional[int] = None) -> None:
         """Cache models for a provider.
@@ -103,30 +239,18 @@ class ModelFetcherCache:
         if self.cache_disabled:
             return
 
-        ttl = ttl if ttl is not None else self.ttl
-
-        with self.lock:
-            cache_data = {}
-            if self.cache_path.exists():
-                try:
-                    with open(self.cache_path, "r") as f:
-                        cache_data = json.load(f)
-                except (json.JSONDecodeError, IOError) as e:
-                    if self.debug:
-                        ic(f"Failed to read existing cache: {e}")
-
-            cache_data[provider_name] = {
+        self._store.set(
+            provider_name,
+            {
                 "models": models,
                 "timestamp": time.time(),
-                "ttl": ttl,
-            }
+                "ttl": ttl if ttl is not None else self.ttl,
+            },
+        )
 
-            try:
-                with open(self.cache_path, "w") as f:
-                    json.dump(cache_data, f, indent=2)
-            except IOError as e:
-                if self.debug:
-                    ic(f"Failed to write cache: {e}")
+    def flush(self) -> None:
+        """Write pending cache entries to disk now instead of waiting for write-behind."""
+        self._store.flush()
 
     def is_valid(self, provider_name: str) -> bool:
         """Check if a provider has a valid cached entry.
@@ -139,44 +263,36 @@ class ModelFetcherCache:
         """
         return self.get(provider_name) is not None
 
-    def _is_expired(self, timestamp: float) -> bool:
+    def _is_expired(self, entry: Dict[str, Any]) -> bool:
         """Check if a cache entry has expired.
 
         Args:
-            timestamp: Timestamp when entry was created.
+            entry: Cache entry holding its creation timestamp and TTL.
 
         Returns:
             True if expired, False otherwise.
         """
-        entry_data = {}
-        try:
-            if self.cache_path.exists():
-                with open(self.cache_path, "r") as f:
-                    all_data = json.load(f)
-                    # Find the provider with this timestamp to get its TTL
-                    for provider, data in all_data.items():
-                        if data.get("timestamp") == timestamp:
-                            entry_data = data
-                            break
-        except (json.JSONDecodeError, IOError):
-            pass
-
-        ttl = entry_data.get("ttl", self.ttl)
-        return (time.time() - timestamp) > ttl
+        ttl = entry.get("ttl", self.ttl)
+        return (time.time() - entry.get("timestamp", 0)) > ttl
 
 
 class BackgroundModelFetcher:
     """Manages background threads for non-blocking model fetching.
 
     Fetches models asynchronously and stores results in cache. Falls back to
-    provided models on timeout or error.
+    provided models on timeout or error. In-flight fetches are tracked process-wide,
+    so concurrent `fetch_async` calls for one provider (from any fetcher instance)
+    coalesce into a single upstream fetch.
 
     Attributes:
         cache: ModelFetcherCache instance.
-        lock: Threading lock for thread-safe operations.
-        _threads: Dict tracking active fetch threads.
+        lock: Threading lock guarding the in-flight fetch registry.
+        _threads: Dict tracking active fetch threads, shared by all instances.
     """
 
+    _inflight: ClassVar[Dict[str, threading.Thread]] = {}
+    _inflight_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, cache: Optional[ModelFetcherCache] = None, debug: bool = False) -> None:
         """Initialize the background model fetcher.
 
@@ -186,8 +302,8 @@ class BackgroundModelFetcher:
         """
         self.cache = cache or ModelFetcherCache(debug=debug)
         self.debug = debug
-        self.lock = threading.Lock()
-        self._threads: dict[str, threading.Thread] = {}
+        self.lock = self._inflight_lock
+        self._threads = self._inflight
 
     def fetch_async(
         self,
@@ -199,7 +315,8 @@ class BackgroundModelFetcher:
         """Fetch models asynchronously in background thread.
 
         Immediately returns fallback models or cached models. Spawns a background
-        thread to fetch fresh models and update cache.
+        thread to fetch fresh models and update cache, unless a fetch for the same
+        provider is already running.
 
         Args:
             provider_name: Name of the provider.
@@ -217,15 +334,16 @@ class BackgroundModelFetcher:
 
         # Start background fetch if not already running
         with self.lock:
-            if provider_name not in self._threads or not self._threads[provider_name].is_alive():
+            thread = self._threads.get(provider_name)
+            if thread is None or not thread.is_alive():
                 thread = threading.Thread(
                     target=self._fetch_and_cache,
                     args=(provider_name, fetch_func, timeout),
                     daemon=True,
                     name=f"ModelFetcher-{provider_name}",
                 )
-                thread.start()
                 self._threads[provider_name] = thread
+                thread.start()
 
         return fallback_models
 
@@ -0,0 +1,229 @@
+"""
+Model index: fast model name -> provider lookup for the unified ``Client``.
+
+Resolving a requested model used to ask every available provider for its models
+and then scan all of them (case-insensitive equality, substring checks and
+``difflib.get_close_matches``) on every call. ``ModelIndex`` is built once from
+the providers' model lists and answers the same questions from a normalized-name
+map and a trigram index. Only models sharing a trigram with the request are
+scored with ``difflib``, and results are memoized per requested model string.
+
+``ModelIndexCache`` holds the index for one set of available providers and
+rebuilds it when that set changes, after ``ttl`` seconds (model lists may be
+refreshed in the background) or on ``invalidate()``.
+"""
+
+import difflib
+import functools
+import threading
+import time
+from collections import defaultdict
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+# Minimum difflib ratio for a fuzzy match, as in difflib.get_close_matches.
+FUZZY_CUTOFF = 0.5
+# Distinct requested model strings remembered per index.
+MEMO_SIZE = 1024
+# Seconds before a cached index is rebuilt from fresh model lists.
+MODEL_INDEX_TTL = 300.0
+
+
+class ModelMatch(NamedTuple):
+    """A resolved model: the provider serving it, its name and how it matched."""
+
+    provider: type
+    model: str
+    match_type: str  # "exact", "substring" or "fuzzy"
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class ModelIndex(Generic[T]):
+    """
+    Index of the models served by a list of providers.
+
+    Args:
+        providers: ``(name, provider_class, models)`` triples in preference order.
+            When several providers list the same model, the first one wins.
+    """
+
+    def __init__(self, providers: Sequence[Tuple[str, Type[T], Sequence[str]]]) -> None:
+        self.providers: List[Tuple[str, Type[T], List[str]]] = []
+        self._models: List[str] = []
+        self._lowered: List[str] = []
+        self._owners: List[Type[T]] = []
+        self._ids: Dict[str, int] = {}
+        self._by_lower: Dict[str, List[int]] = defaultdict(list)
+        self._by_trigram: Dict[str, Set[int]] = defaultdict(set)
+        self._provider_models: Dict[str, Set[str]] = {}
+        self._provider_ids: Dict[str, List[int]] = {}
+        self._max_length = 0
+
+        for name, provider_class, models in providers:
+            models = [model for model in models if isinstance(model, str) and model]
+            self.providers.append((name, provider_class, models))
+            self._provider_models[name] = set(models)
+            ids = self._provider_ids.setdefault(name, [])
+            for model in models:
+                model_id = self._ids.get(model)
+                if model_id is None:
+                    model_id = self._ids[model] = len(self._models)
+                    lowered = model.lower()
+                    self._models.append(model)
+                    self._lowered.append(lowered)
+                    self._owners.append(provider_class)
+                    self._max_length = max(self._max_length, len(lowered))
+                    self._by_lower[lowered].append(model_id)
+                    for trigram in _trigrams(lowered):
+                        self._by_trigram[trigram].add(model_id)
+                ids.append(model_id)
+
+        self.resolve = functools.lru_cache(maxsize=MEMO_SIZE)(self._resolve)
+        self.closest = functools.lru_cache(maxsize=MEMO_SIZE)(self._closest)
+        self._scores = functools.lru_cache(maxsize=MEMO_SIZE)(self._compute_scores)
+
+    @classmethod
+    def build(
+        cls,
+        available: Sequence[Tuple[str, Type[T]]],
+        get_models_fn: Callable[[Type[T]], List[str]],
+    ) -> "ModelIndex[T]":
+        """Index ``available`` ``(name, provider_class)`` pairs using ``get_models_fn``."""
+        return cls(
+            [
+                (name, provider_class, get_models_fn(provider_class))
+                for name, provider_class in available
+            ]
+        )
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def models_of(self, provider_name: str) -> Set[str]:
+        """Models listed by one provider."""
+        return self._provider_models.get(provider_name, set())
+
+    def provider_for(self, model: str) -> Optional[Type[T]]:
+        """First provider listing exactly ``model``."""
+        model_id = self._ids.get(model)
+        return None if model_id is None else self._owners[model_id]
+
+    def _resolve(self, model: str) -> Optional[ModelMatch]:
+        """
+        Match ``model`` case-insensitively, then as a substring (either way round),
+        then fuzzily. Returns None if nothing is close enough.
+        """
+        lowered = model.lower()
+        exact = self._by_lower.get(lowered)
+        if exact:
+            return ModelMatch(self._owners[exact[0]], self._models[exact[0]], "exact")
+
+        model_id = self._first_substring_match(lowered)
+        if model_id is not None:
+            return ModelMatch(self._owners[model_id], self._models[model_id], "substring")
+
+        scores = self._scores(model)
+        if scores:
+            model_id = max(scores, key=lambda i: (scores[i], self._models[i]))
+            return ModelMatch(self._owners[model_id], self._models[model_id], "fuzzy")
+        return None
+
+    def _closest(self, model: str) -> Dict[str, str]:
+        """Best fuzzy match for ``model`` among each provider's models, by provider name."""
+        scores = self._scores(model)
+        closest: Dict[str, str] = {}
+        if not scores:
+            return closest
+        for name, ids in self._provider_ids.items():
+            matches = [i for i in ids if i in scores]
+            if matches:
+                best = max(matches, key=lambda i: (scores[i], self._models[i]))
+                closest[name] = self._models[best]
+        return closest
+
+    def _first_substring_match(self, lowered: str) -> Optional[int]:
+        # Models containing the request: every trigram of the request must occur.
+        trigrams = _trigrams(lowered)
+        if trigrams:
+            postings = sorted((self._by_trigram.get(t, set()) for t in trigrams), key=len)
+            candidates = set.intersection(*postings)
+        else:
+            candidates = range(len(self._models))
+        hits = [i for i in candidates if lowered in self._lowered[i]]
+
+        # Models contained in the request: look up each of its substrings.
+        for start in range(len(lowered)):
+            for end in range(start + 1, min(len(lowered), start + self._max_length) + 1):
+                hits.extend(self._by_lower.get(lowered[start:end], ()))
+        return min(hits) if hits else None
+
+    def _candidates(self, lowered: str) -> Sequence[int]:
+        shared: Set[int] = set()
+        for trigram in _trigrams(lowered):
+            shared.update(self._by_trigram.get(trigram, ()))
+        return sorted(shared) if shared else range(len(self._models))
+
+    def _compute_scores(self, model: str) -> Dict[int, float]:
+        """difflib ratios of the candidate models scoring at least ``FUZZY_CUTOFF``."""
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(model)
+        scores: Dict[int, float] = {}
+        for model_id in self._candidates(model.lower()):
+            matcher.set_seq1(self._models[model_id])
+            if matcher.real_quick_ratio() < FUZZY_CUTOFF or matcher.quick_ratio() < FUZZY_CUTOFF:
+                continue
+            ratio = matcher.ratio()
+            if ratio >= FUZZY_CUTOFF:
+                scores[model_id] = ratio
+        return scores
+
+
+class ModelIndexCache(Generic[T]):
+    """
+    The ``ModelIndex`` of one set of available providers.
+
+    The index is rebuilt when the available providers change, once it is older
+    than ``ttl`` seconds, or after ``invalidate()``.
+    """
+
+    def __init__(self, ttl: float = MODEL_INDEX_TTL) -> None:
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._key: Optional[Tuple[Tuple[str, Type[T]], ...]] = None
+        self._index: Optional[ModelIndex[T]] = None
+        self._built_at = 0.0
+
+    def get(
+        self,
+        available: Sequence[Tuple[str, Type[T]]],
+        get_models_fn: Callable[[Type[T]], List[str]],
+    ) -> ModelIndex[T]:
+        key = tuple(available)
+        with self._lock:
+            index = self._index
+            if index is None or key != self._key or time.monotonic() - self._built_at > self.ttl:
+                index = self._index = ModelIndex.build(available, get_models_fn)
+                self._key = key
+                self._built_at = time.monotonic()
+            return index
+
+    def invalidate(self) -> None:
+        """Drop the index so the next lookup rebuilds it."""
+        with self._lock:
+            self._index = None
@@ -1,28 +1,71 @@
-import importlib
 import logging
-import pkgutil
-from typing import Any, Dict, List, Mapping, Optional, Union, cast
+from typing import Any, Dict, Iterator, List, Sequence, Union
 
-from llm4free.AIbase import Provider, TTSProvider
+from llm4free.provider_manifest import ProviderEntry, provider_entries
 
 logger = logging.getLogger(__name__)
 
-# Import TTI base class
-BaseImages = None
-try:
-    from llm4free.TTI.base import BaseImages as BaseImagesClass
-
-    BaseImages = BaseImagesClass
-    TTI_AVAILABLE = True
-except ImportError:
-    TTI_AVAILABLE = False
+# Common OpenAI-compatible chat parameters
+LLM_PARAMETERS = [
+    "model",
+    "messages",
+    "max_tokens",
+    "temperature",
+    "top_p",
+    "presence_penalty",
+    "frequency_penalty",
+    "stop",
+    "stream",
+    "user",
+]
+
+# Common TTI parameters
+TTI_PARAMETERS = [
+    "prompt",
+    "model",
+    "n",
+    "size",
+    "response_format",
+    "user",
+    "style",
+    "aspect_ratio",
+    "timeout",
+    "image_format",
+    "seed",
+]
+
+
+def _entries(kinds: Sequence[str]) -> Iterator[ProviderEntry]:
+    for kind in kinds:
+        yield from provider_entries(kind).values()
+
+
+def _provider_details(entry: ProviderEntry, parameters: List[str]) -> Dict[str, Any]:
+    models = sorted(entry.models)
+    metadata = {"description": entry.description} if entry.description else {}
+    return {
+        "name": entry.name,
+        "class": entry.name,
+        "module": entry.module.rsplit(".", 1)[-1],
+        "models": models,
+        "parameters": list(parameters),
+        "model_count": len(models),
+        "capabilities": list(entry.capabilities),
+        "required_auth": entry.required_auth,
+        "metadata": metadata,
+    }
 
 
 class _LLMModels:
     """
     A class for managing LLM provider models in the llm4free package.
+
+    Model lists come from the provider manifest (see llm4free.provider_manifest),
+    so no provider module is imported.
     """
 
+    _KINDS = ("chat", "aisearch", "stt")
+
     def list(self) -> Dict[str, List[str]]:
         """
         Gets all available models from each provider that has an AVAILABLE_MODELS attribute.
@@ -97,46 +140,7 @@ class _LLMModels:
         Returns:
             Dictionary mapping provider names to their available models
         """
-        provider_models = {}
-        provider_packages = ["llm4free.llm", "llm4free.AISEARCH", "llm4free.STT"]
-
-        for package_name in provider_packages:
-            try:
-                package = importlib.import_module(package_name)
-                for _, module_name, _ in pkgutil.iter_modules(package.__path__):
-                    try:
-                        module = importlib.import_module(f"{package_name}.{module_name}")
-                        for attr_name in dir(module):
-                            attr = getattr(module, attr_name)
-                            if (
-                                isinstance(attr, type)
-                                and issubclass(attr, Provider)
-                                and attr != Provider
-                            ):
-                                get_models = getattr(attr, "get_models", None)
-                                available_models = getattr(attr, "AVAILABLE_MODELS", None)
-                                if get_models and callable(get_models):
-                                    try:
-                                        models = get_models()
-                                        if isinstance(models, set):
-                                            models = list(models)
-                                        provider_models[attr_name] = cast(List[str], models)
-                                    except (RuntimeError, TypeError, ValueError):
-                                        provider_models[attr_name] = []
-                                elif available_models is not None:
-                                    # Convert any sets to lists to ensure serializability
-                                    models = available_models
-                                    if isinstance(models, set):
-                                        models = list(models)
-                                    provider_models[attr_name] = cast(List[str], models)
-                                else:
-                                    provider_models[attr_name] = []
-                    except (ImportError, AttributeError):
-                        pass
-            except (ImportError, ValueError):
-                pass
-
-        return provider_models
+        return {entry.name: list(entry.models) for entry in _entries(self._KINDS)}
 
     def _get_provider_details(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -145,82 +149,9 @@ class _LLMModels:
         Returns:
             Dictionary mapping provider names to detailed provider information
         """
-        provider_details = {}
-        provider_packages = ["llm4free.llm", "llm4free.AISEARCH", "llm4free.STT"]
-
-        for package_name in provider_packages:
-            try:
-                package = importlib.import_module(package_name)
-                for _, module_name, _ in pkgutil.iter_modules(package.__path__):
-                    try:
-                        module = importlib.import_module(f"{package_name}.{module_name}")
-                        for attr_name in dir(module):
-                            attr = getattr(module, attr_name)
-                            if (
-                                isinstance(attr, type)
-                                and issubclass(attr, Provider)
-                                and attr != Provider
-                            ):
-                                # Get available models
-                                models = []
-                                get_models = getattr(attr, "get_models", None)
-                                available_models = getattr(attr, "AVAILABLE_MODELS", None)
-                                if get_models and callable(get_models):
-                                    try:
-                                        fetched_models = get_models()
-                                        if isinstance(fetched_models, set):
-                                            models = list(fetched_models)
-                                        elif isinstance(fetched_models, (list, tuple)):
-                                            models = list(fetched_models)
-                                        else:
-                                            models = [str(fetched_models)] if fetched_models else []
-                                    except (RuntimeError, TypeError, ValueError):
-                                        models = []
-                                elif available_models is not None:
-                                    if isinstance(available_models, set):
-                                        models = list(available_models)
-                                    elif isinstance(available_models, (list, tuple)):
-                                        models = list(available_models)
-                                    else:
-                                        models = [str(available_models)]
-
-                                # Sort models
-                                models = sorted(models)
-
-                                # Get supported parameters (common OpenAI-compatible parameters)
-                                supported_params = [
-                                    "model",
-                                    "messages",
-                                    "max_tokens",
-                                    "temperature",
-                                    "top_p",
-                                    "presence_penalty",
-                                    "frequency_penalty",
-                                    "stop",
-                                    "stream",
-                                    "user",
-                                ]
-
-                                # Get additional metadata
-                                metadata = {}
-                                if hasattr(attr, "__doc__") and attr.__doc__:
-                                    metadata["description"] = attr.__doc__.strip().split("\n")[0]
-
-                                provider_details[attr_name] = {
-                                    "name": attr_name,
-                                    "class": attr.__name__,
-                                    "module": module_name,
-                                    "models": models,
-                                    "parameters": supported_params,
-                                    "model_count": len(models),
-                                    "metadata": metadata,
-                                }
-                    except (ImportError, AttributeError):
-                        pass
-            except (ImportError, ValueError):
-                pass
-
-        return provider_details
+        return {
+            entry.name: _provider_details(entry, LLM_PARAMETERS) for entry in _entries(self._KINDS)
+        }
 
 
 class _TTSModels:
@@ -288,33 +219,7 @@ class _TTSModels:
         Returns:
             Dictionary mapping TTS provider names to their available voices
         """
-        provider_voices = {}
-
-        try:
-            # Import the TTS package specifically
-            tts_package = importlib.import_module("llm4free.TTS")
-
-            # Iterate through TTS modules
-            for _, module_name, _ in pkgutil.iter_modules(tts_package.__path__):
-                try:
-                    module = importlib.import_module(f"llm4free.TTS.{module_name}")
-                    for attr_name in dir(module):
-                        attr = getattr(module, attr_name)
-                        if (
-                            isinstance(attr, type)
-                            and issubclass(attr, TTSProvider)
-                            and attr != TTSProvider
-                        ):
-                            # TTS providers typically use 'all_voices' instead of 'AVAILABLE_MODELS'
-                            all_voices = getattr(attr, "all_voices", None)
-                            if all_voices is not None:
-                                provider_voices[attr_name] = all_voices
-                except (ImportError, AttributeError):
-                    pass
-        except (ImportError, ValueError):
-            pass
-
-        return provider_voices
+        return {entry.name: list(entry.voices) for entry in _entries(("tts",)) if entry.voices}
 
 
 class _TTIModels:
@@ -396,33 +301,7 @@ class _TTIModels:
         Returns:
             Dictionary mapping TTI provider names to their available models
         """
-        if not TTI_AVAILABLE:
-            return {}
-
-        provider_models = {}
-        tti_package = importlib.import_module("llm4free.TTI")
-
-        for _, module_name, _ in pkgutil.iter_modules(tti_package.__path__):
-            try:
-                module = importlib.import_module(f"llm4free.TTI.{module_name}")
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if (
-                        isinstance(attr, type)
-                        and BaseImages
-                        and issubclass(attr, BaseImages)
-                        and attr != BaseImages
-                    ):
-                        if hasattr(attr, "AVAILABLE_MODELS"):
-                            # Convert any sets to lists to ensure serializability
-                            models = cast(List[str], getattr(attr, "AVAILABLE_MODELS", []))
-                            if isinstance(models, set):
-                                models = list(models)
-                            provider_models[attr_name] = models
-            except (ImportError, AttributeError):
-                pass
-
-        return provider_models
+        return {entry.name: list(entry.models) for entry in _entries(("tti",))}
 
     def _get_tti_provider_details(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -431,82 +310,9 @@ class _TTIModels:
         Returns:
             Dictionary mapping provider names to detailed provider information
         """
-        if not TTI_AVAILABLE:
-            return {}
-
-        provider_details = {}
-        tti_package = importlib.import_module("llm4free.TTI")
-
-        for _, module_name, _ in pkgutil.iter_modules(tti_package.__path__):
-            try:
-                module = importlib.import_module(f"llm4free.TTI.{module_name}")
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if (
-                        isinstance(attr, type)
-                        and BaseImages
-                        and issubclass(attr, BaseImages)
-                        and attr != BaseImages
-                    ):
-                        # Get available models
-                        models = []
-                        get_models = getattr(attr, "get_models", None)
-                        available_models = getattr(attr, "AVAILABLE_MODELS", None)
-                        if get_models and callable(get_models):
-                            try:
-                                fetched_models = get_models()
-                                if isinstance(fetched_models, set):
-                                    models = list(fetched_models)
-                                elif isinstance(fetched_models, (list, tuple)):
-                                    models = list(fetched_models)
-                                else:
-                                    models = [str(fetched_models)] if fetched_models else []
-                            except (RuntimeError, TypeError, ValueError):
-                                models = []
-                        elif available_models is not None:
-                            if isinstance(available_models, set):
-                                models = list(available_models)
-                            elif isinstance(available_models, (list, tuple)):
-                                models = list(available_models)
-                            else:
-                                models = [str(available_models)]
-
-                        # Sort models
-                        models = sorted(models)
-
-                        # Get supported parameters (common TTI parameters)
-                        supported_params = [
-                            "prompt",
-                            "model",
-                            "n",
-                            "size",
-                            "response_format",
-                            "user",
-                            "style",
-                            "aspect_ratio",
-                            "timeout",
-                            "image_format",
-                            "seed",
-                        ]
-
-                        # Get additional metadata
-                        metadata = {}
-                        if hasattr(attr, "__doc__") and attr.__doc__:
-                            metadata["description"] = attr.__doc__.strip().split("\n")[0]
-
-                        provider_details[attr_name] = {
-                            "name": attr_name,
-                            "class": attr.__name__,
-                            "module": module_name,
-                            "models": models,
-                            "parameters": supported_params,
-                            "model_count": len(models),
-                            "metadata": metadata,
-                        }
-            except (ImportError, AttributeError):
-                pass
-
-        return provider_details
+        return {
+            entry.name: _provider_details(entry, TTI_PARAMETERS) for entry in _entries(("tti",))
+        }
 
 
 # Create singleton instances
@@ -0,0 +1,319 @@
+"""
+Provider manifest: a generated, versioned registry of every llm4free provider.
+
+``llm4free/_providers.py`` records, for each provider class, its kind (chat,
+TTI, TTS, STT or AI search), the module that defines it, ``required_auth``, its
+static model list and capabilities. ``Client``, ``llm4free.models`` and the API
+server read the manifest instead of importing and scanning every provider
+module, so a provider's module is imported only when that provider is used.
+
+Usage::
+
+    python -m llm4free.provider_manifest           # rewrite llm4free/_providers.py
+    python -m llm4free.provider_manifest --check   # exit with status 1 if it is out of date
+"""
+
+import argparse
+import functools
+import importlib
+import itertools
+import json
+import sys
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from ._providers import MANIFEST_VERSION, PROVIDERS
+
+# Bump when the shape of a manifest entry changes.
+SCHEMA_VERSION = 1
+
+# kind -> (package whose public names are scanned, "module:Class" base class)
+PROVIDER_KINDS: Dict[str, Tuple[str, str]] = {
+    "chat": ("llm4free.llm", "llm4free.llm.base:OpenAICompatibleProvider"),
+    "tti": ("llm4free.TTI", "llm4free.TTI.base:TTICompatibleProvider"),
+    "tts": ("llm4free.TTS", "llm4free.TTS.base:BaseTTSProvider"),
+    "stt": ("llm4free.STT", "llm4free.STT.base:STTCompatibleProvider"),
+    "aisearch": ("llm4free.AISEARCH", "llm4free.AIbase:AISearch"),
+}
+
+# Class attributes holding a provider's static model list, in order of preference.
+MODEL_ATTRIBUTES: Dict[str, Tuple[str, ...]] = {
+    "tts": ("SUPPORTED_MODELS", "AVAILABLE_MODELS"),
+}
+
+MANIFEST_PATH = Path(__file__).with_name("_providers.py")
+
+
+class ProviderEntry(NamedTuple):
+    """A provider as recorded in the manifest."""
+
+    name: str
+    kind: str
+    module: str
+    required_auth: bool
+    models: Tuple[str, ...]
+    capabilities: Tuple[str, ...]
+    description: str = ""
+    voices: Tuple[str, ...] = ()
+
+    def load(self) -> type:
+        """Import the provider's module and return its class."""
+        return _load_class(self.module, self.name)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_class(module: str, name: str) -> type:
+    return getattr(importlib.import_module(module), name)
+
+
+@functools.lru_cache(maxsize=None)
+def provider_entries(kind: str) -> Dict[str, ProviderEntry]:
+    """
+    Return the manifest entries of one provider kind, keyed by class name.
+
+    Args:
+        kind: One of ``PROVIDER_KINDS`` ("chat", "tti", "tts", "stt", "aisearch").
+
+    Raises:
+        ValueError: If ``kind`` is unknown.
+    """
+    if kind not in PROVIDER_KINDS:
+        raise ValueError(f"Unknown provider kind {kind!r}; expected one of {list(PROVIDER_KINDS)}")
+    return {
+        name: ProviderEntry(
+            name=name,
+            kind=kind,
+            module=data["module"],
+            required_auth=data["required_auth"],
+            models=tuple(data["models"]),
+            capabilities=tuple(data["capabilities"]),
+            description=data.get("description", ""),
+            voices=tuple(data.get("voices", ())),
+        )
+        for name, data in PROVIDERS.get(kind, {}).items()
+    }
+
+
+def auth_required_providers(kind: str) -> Set[str]:
+    """Names of the providers of ``kind`` that need an API key or cookie."""
+    return {name for name, entry in provider_entries(kind).items() if entry.required_auth}
+
+
+_registry_versions = itertools.count(1)
+
+
+class ProviderRegistry(MutableMapping[str, Any]):
+    """
+    Mapping of names to provider classes that imports each class on first access.
+
+    Values may be ``ProviderEntry`` records (resolved and cached by ``__getitem__``)
+    or classes assigned directly. Membership tests, ``keys()`` and ``len()`` never
+    import anything; ``values()`` and ``items()`` import every provider they yield,
+    so prefer iterating keys and looking up only the providers you need.
+
+    ``version`` changes whenever a name is added, replaced or removed, so views
+    derived from the registry can tell when to rebuild. Versions are drawn from
+    one process-wide counter, so two registries never share one.
+    """
+
+    def __init__(self, entries: Optional[Dict[str, Union[ProviderEntry, type]]] = None) -> None:
+        self._entries: Dict[str, Union[ProviderEntry, type]] = dict(entries or {})
+        self.version = next(_registry_versions)
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._entries[key]
+        if isinstance(value, ProviderEntry):
+            value = self._entries[key] = value.load()
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._entries[key] = value
+        self.version = next(_registry_versions)
+
+    def __delitem__(self, key: str) -> None:
+        del self._entries[key]
+        self.version = next(_registry_versions)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def provider_name(self, key: str) -> str:
+        """Class name of the provider registered under ``key``, without importing it."""
+        value = self._entries[key]
+        return value.name if isinstance(value, ProviderEntry) else value.__name__
+
+    def provider_names(self) -> List[str]:
+        """Distinct class names of the registered providers, in registration order."""
+        return list(dict.fromkeys(self.provider_name(key) for key in self._entries))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._entries)!r})"
+
+
+# ---------------------------------------------------------------------------
+# Generation
+# ---------------------------------------------------------------------------
+
+
+def _import_object(path: str) -> Any:
+    module, _, name = path.partition(":")
+    return getattr(importlib.import_module(module), name)
+
+
+def _string_list(value: Any) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        value = list(value)
+    elif isinstance(value, (set, frozenset)):
+        value = sorted(value, key=str)
+    if isinstance(value, (list, tuple, set, frozenset)) or hasattr(value, "__iter__"):
+        return [item for item in value if isinstance(item, str) and item]
+    return []
+
+
+def _static_models(cls: type, attributes: Sequence[str]) -> List[str]:
+    """
+    Read a provider's static model list from its class attributes.
+
+    Providers are never instantiated here: a constructor may fetch models over
+    the network, which would make the manifest depend on what the upstream
+    returned. Property-based lists are skipped and resolved at runtime.
+    """
+    for attribute in attributes:
+        value = getattr(cls, attribute, None)
+        if isinstance(value, property):
+            continue
+        models = _string_list(value)
+        if models:
+            return models
+    return []
+
+
+def _capabilities(cls: type) -> List[str]:
+    capabilities = []
+    if getattr(cls, "supports_tools", False):
+        capabilities.append("tools")
+    if getattr(cls, "supports_tool_choice", False):
+        capabilities.append("tool_choice")
+    if getattr(cls, "async_provider_class", None) is not None:
+        capabilities.append("async")
+    return capabilities
+
+
+def _describe(cls: type) -> str:
+    doc = cls.__doc__ or ""
+    return doc.strip().split("\n")[0].strip()
+
+
+def _kind_entries(kind: str) -> Dict[str, Dict[str, Any]]:
+    package_name, base_path = PROVIDER_KINDS[kind]
+    package = importlib.import_module(package_name)
+    base = _import_object(base_path)
+    attributes = MODEL_ATTRIBUTES.get(kind, ("AVAILABLE_MODELS",))
+
+    entries: Dict[str, Dict[str, Any]] = {}
+    for name in dir(package):
+        if name.startswith(("Base", "_")):
+            continue
+        try:
+            cls = getattr(package, name)
+        except (ImportError, AttributeError):
+            continue
+        if not (isinstance(cls, type) and issubclass(cls, base) and cls is not base):
+            continue
+        entry: Dict[str, Any] = {
+            "module": cls.__module__,
+            "required_auth": bool(getattr(cls, "required_auth", False)),
+            "models": _static_models(cls, attributes),
+            "capabilities": _capabilities(cls),
+            "description": _describe(cls),
+        }
+        voices = _string_list(getattr(cls, "all_voices", None))
+        if voices:
+            entry["voices"] = voices
+        entries[name] = entry
+    return entries
+
+
+def generate_provider_manifest() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Import every provider package and compute the manifest."""
+    return {kind: _kind_entries(kind) for kind in PROVIDER_KINDS}
+
+
+def render_provider_manifest(manifest: Dict[str, Dict[str, Dict[str, Any]]]) -> str:
+    """Render the manifest as the source of ``llm4free/_providers.py``."""
+    lines = [
+        "# Generated by `python -m llm4free.provider_manifest`; do not edit by hand.",
+        '"""Provider manifest: kind -> provider class name -> metadata."""',
+        "",
+        "from typing import Any, Dict",
+        "",
+        f"MANIFEST_VERSION = {SCHEMA_VERSION}",
+        "",
+        "PROVIDERS: Dict[str, Dict[str, Dict[str, Any]]] = {",
+    ]
+    for kind in sorted(manifest):
+        lines.append(f"    {json.dumps(kind)}: {{")
+        for name, entry in sorted(manifest[kind].items()):
+            lines.append(f"        {json.dumps(name)}: {{")
+            for key, value in entry.items():
+                if isinstance(value, bool):
+                    value = "True" if value else "False"
+                    lines.append(f"            {json.dumps(key)}: {value},")
+                elif isinstance(value, list) and value:
+                    lines.append(f"            {json.dumps(key)}: [")
+                    lines.extend(
+                        f"                {json.dumps(item, ensure_ascii=False)}," for item in value
+                    )
+                    lines.append("            ],")
+                else:
+                    lines.append(
+                        f"            {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)},"
+                    )
+            lines.append("        },")
+        lines.append("    },")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: Sequence[str] = ()) -> int:
+    parser = argparse.ArgumentParser(description="Regenerate llm4free/_providers.py.")
+    parser.add_argument("--check", action="store_true", help="Fail if the manifest is out of date.")
+    args = parser.parse_args(argv or None)
+
+    rendered = render_provider_manifest(generate_provider_manifest())
+    current = MANIFEST_PATH.read_text(encoding="utf-8") if MANIFEST_PATH.exists() else ""
+    if args.check:
+        if rendered != current or MANIFEST_VERSION != SCHEMA_VERSION:
+            print(f"{MANIFEST_PATH} is out of date; run `python -m llm4free.provider_manifest`.")
+            return 1
+        print(f"{MANIFEST_PATH} is up to date.")
+        return 0
+    MANIFEST_PATH.write_text(rendered, encoding="utf-8")
+    print(f"Wrote {MANIFEST_PATH}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,371 @@
+"""
+Provider pool: bounded, thread-safe reuse of provider instances.
+
+Provider instances own an HTTP session (curl_cffi) and per-conversation state,
+neither of which is safe to share between concurrent requests. ``ProviderPool``
+keeps up to ``max_size`` instances per provider. A request checks one out with
+``acquire``/``lease``/``borrow`` and returns it when it is done. Instances are
+created lazily, on the first checkout that finds no idle instance;
+``reserve``/``create`` split that checkout so a slow constructor can run in a
+worker thread while the reservation is made by the caller.
+
+An instance is evicted (its session closed) when its request fails, when it has
+been idle for longer than ``idle_ttl`` seconds, or when it fails the health
+check run on checkout. When all ``max_size`` instances of a provider are in use,
+``acquire`` waits up to ``timeout`` seconds for one to be returned and then
+raises ``ProviderPoolTimeout``.
+
+``metrics()`` reports, per provider, checkouts, time spent waiting for an
+instance and utilization (average share of ``max_size`` instances in use).
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+# Instances kept per provider when ProviderPool(max_size=...) is not given.
+DEFAULT_POOL_SIZE = 4
+# Seconds an idle instance is kept before it is closed and recreated.
+DEFAULT_IDLE_TTL = 300.0
+# Seconds acquire() waits for a free instance before giving up.
+DEFAULT_ACQUIRE_TIMEOUT = 30.0
+
+
+class ProviderPoolTimeout(RuntimeError):
+    """No instance of a provider was returned to the pool in time."""
+
+
+def session_is_open(instance: Any) -> bool:
+    """Default health check: the instance's HTTP session, if any, is not closed."""
+    session = getattr(instance, "session", None)
+    return not getattr(session, "_closed", False)
+
+
+def close_instance(instance: Any) -> None:
+    """Close an evicted instance's HTTP session, ignoring errors."""
+    close = getattr(getattr(instance, "session", None), "close", None)
+    if callable(close):
+        try:
+            close()
+        except Exception:
+            pass
+
+
+class _Slot(Generic[T]):
+    """Instances of one provider plus its counters. Guarded by the pool's lock."""
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.idle: Deque[Tuple[T, float]] = deque()
+        self.in_use = 0
+        self.created = 0
+        self.evicted = 0
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+        self.busy_time = 0.0
+        self.busy_since = time.monotonic()
+        self.since = self.busy_since
+
+    def mark_busy(self, now: float) -> None:
+        # Integrate the number of in-use instances over time for utilization.
+        self.busy_time += self.in_use * (now - self.busy_since)
+        self.busy_since = now
+
+
+class ProviderLease(Generic[T]):
+    """
+    One checked-out provider instance.
+
+    Use as a context manager, or call ``release()`` when the request is done
+    (it is idempotent). ``mark_failed()`` makes the release evict the instance.
+
+    Leaving the ``with`` block on an ``Exception`` evicts the instance. On
+    cancellation (or any other ``BaseException``), and when a lease is garbage
+    collected unreleased, the instance may still be in use by a worker thread,
+    so it is dropped from the pool without being closed.
+    """
+
+    def __init__(self, pool: "ProviderPool[T]", key: str, instance: T) -> None:
+        self.pool = pool
+        self.key = key
+        self.instance = instance
+        self.failed = False
+        self._released = False
+
+    def mark_failed(self) -> None:
+        self.failed = True
+
+    def release(self, failed: bool = False) -> None:
+        if self._released:
+            return
+        self._released = True
+        self.pool.release(self.key, self.instance, failed=failed or self.failed)
+
+    def abandon(self) -> None:
+        """Drop the instance from the pool without closing it."""
+        if self._released:
+            return
+        self._released = True
+        self.pool.abandon(self.key, self.instance)
+
+    def __enter__(self) -> T:
+        return self.instance
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is None or issubclass(exc_type, Exception):
+            self.release(failed=exc_type is not None)
+        else:
+            self.abandon()
+
+    def __del__(self) -> None:
+        if not getattr(self, "_released", True):
+            self.abandon()
+
+
+class ProviderPool(Generic[T]):
+    """
+    Per-provider pools of reusable instances.
+
+    Args:
+        max_size: Instances per provider; also the number of concurrent requests
+            a provider can serve.
+        idle_ttl: Seconds an idle instance is kept. ``None`` keeps it forever.
+        acquire_timeout: Default seconds ``acquire`` waits for a free instance.
+            ``None`` waits indefinitely.
+        health_check: Called on an idle instance before it is handed out; a falsy
+            result evicts it. Defaults to checking its HTTP session is open.
+        close: Called on evicted instances. Defaults to closing its HTTP session.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_POOL_SIZE,
+        idle_ttl: Optional[float] = DEFAULT_IDLE_TTL,
+        acquire_timeout: Optional[float] = DEFAULT_ACQUIRE_TIMEOUT,
+        *,
+        health_check: Callable[[T], bool] = session_is_open,
+        close: Callable[[T], None] = close_instance,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+        self.acquire_timeout = acquire_timeout
+        self._health_check = health_check
+        self._close = close
+        self._slots: Dict[str, _Slot[T]] = {}
+        self._condition = threading.Condition()
+
+    def _slot(self, key: str) -> _Slot[T]:
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._slots[key] = _Slot(self.max_size)
+        return slot
+
+    def acquire(
+        self,
+        key: str,
+        factory: Callable[[], T],
+        timeout: Optional[float] = -1.0,
+    ) -> T:
+        """
+        Check out an instance for ``key``, creating it with ``factory`` if no
+        idle one is available. Waits ``timeout`` seconds (default:
+        ``acquire_timeout``) when all ``max_size`` instances are in use.
+
+        Raises:
+            ProviderPoolTimeout: If no instance became free in time.
+        """
+        instance = self.reserve(key, timeout)
+        if instance is None:
+            instance = self.create(key, factory)
+        return instance
+
+    def reserve(self, key: str, timeout: Optional[float] = -1.0) -> Optional[T]:
+        """
+        Check out an idle instance for ``key``, or reserve a place for a new
+        one and return None; the caller then builds it with ``create``. Waits
+        like ``acquire`` when all ``max_size`` instances are in use.
+
+        Raises:
+            ProviderPoolTimeout: If no instance became free in time.
+        """
+        if timeout is not None and timeout < 0:
+            timeout = self.acquire_timeout
+        evicted: List[T] = []
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+        with self._condition:
+            slot = self._slot(key)
+            waited = False
+            instance: Optional[T] = None
+            create = False
+            while True:
+                now = time.monotonic()
+                while slot.idle:
+                    candidate, idle_since = slot.idle.pop()
+                    if self._is_fresh(candidate, idle_since, now):
+                        instance = candidate
+                        break
+                    slot.evicted += 1
+                    evicted.append(candidate)
+                if instance is not None or slot.in_use + len(slot.idle) < slot.max_size:
+                    create = instance is None
+                    break
+                remaining = None if deadline is None else deadline - now
+                if remaining is not None and remaining <= 0:
+                    break
+                waited = True
+                self._condition.wait(remaining)
+
+            wait = time.monotonic() - start
+            if waited:
+                slot.waits += 1
+                slot.wait_time += wait
+                slot.max_wait = max(slot.max_wait, wait)
+            timed_out = instance is None and not create
+            if not timed_out:
+                slot.mark_busy(time.monotonic())
+                slot.in_use += 1
+                slot.checkouts += 1
+
+        for stale in evicted:
+            self._close(stale)
+        if timed_out:
+            raise ProviderPoolTimeout(
+                f"No {key} instance became available within {timeout:.1f}s ({self.max_size} in use)"
+            )
+        return instance
+
+    def create(self, key: str, factory: Callable[[], T]) -> T:
+        """
+        Build the instance for a checkout reserved by ``reserve``; if
+        ``factory`` raises, the reservation is given back.
+        """
+        try:
+            instance = factory()
+        except BaseException:
+            self._cancel_checkout(key)
+            raise
+        with self._condition:
+            self._slot(key).created += 1
+        return instance
+
+    def _is_fresh(self, instance: T, idle_since: float, now: float) -> bool:
+        if self.idle_ttl is not None and now - idle_since > self.idle_ttl:
+            return False
+        try:
+            return bool(self._health_check(instance))
+        except Exception:
+            return False
+
+    def _cancel_checkout(self, key: str) -> None:
+        """Give back a checkout whose instance could not be created."""
+        with self._condition:
+            slot = self._slot(key)
+            slot.mark_busy(time.monotonic())
+            slot.in_use -= 1
+            slot.checkouts -= 1
+            self._condition.notify()
+
+    def release(self, key: str, instance: T, failed: bool = False) -> None:
+        """Return a checked-out instance; ``failed`` evicts and closes it instead."""
+        self._check_in(key, instance, keep=not failed)
+        if failed:
+            self._close(instance)
+
+    def abandon(self, key: str, instance: T) -> None:
+        """Evict a checked-out instance without closing it (it may still be in use)."""
+        self._check_in(key, instance, keep=False)
+
+    def _check_in(self, key: str, instance: T, keep: bool) -> None:
+        with self._condition:
+            slot = self._slot(key)
+            now = time.monotonic()
+            slot.mark_busy(now)
+            slot.in_use -= 1
+            if keep:
+                slot.idle.append((instance, now))
+            else:
+                slot.evicted += 1
+            self._condition.notify()
+
+    def lease(
+        self,
+        key: str,
+        factory: Callable[[], T],
+        timeout: Optional[float] = -1.0,
+    ) -> ProviderLease[T]:
+        """Like ``acquire``, wrapped in a ``ProviderLease`` that releases it."""
+        return ProviderLease(self, key, self.acquire(key, factory, timeout))
+
+    @contextmanager
+    def borrow(
+        self,
+        key: str,
+        factory: Callable[[], T],
+        timeout: Optional[float] = -1.0,
+    ) -> Iterator[T]:
+        """Check out an instance for the duration of a ``with`` block."""
+        with self.lease(key, factory, timeout) as instance:
+            yield instance
+
+    def drain(self) -> List[T]:
+        """Remove and return every idle instance without closing it."""
+        with self._condition:
+            drained = [instance for slot in self._slots.values() for instance, _ in slot.idle]
+            for slot in self._slots.values():
+                slot.idle.clear()
+        return drained
+
+    def close(self) -> None:
+        """Close every idle instance. Checked-out instances are closed on release."""
+        for instance in self.drain():
+            self._close(instance)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-provider pool state and counters.
+
+        ``wait_time_*`` cover checkouts that had to wait for a free instance;
+        ``utilization`` is the time-averaged fraction of ``max_size`` in use.
+        """
+        now = time.monotonic()
+        result: Dict[str, Dict[str, Any]] = {}
+        with self._condition:
+            for key, slot in sorted(self._slots.items()):
+                slot.mark_busy(now)
+                elapsed = now - slot.since
+                result[key] = {
+                    "max_size": slot.max_size,
+                    "in_use": slot.in_use,
+                    "idle": len(slot.idle),
+                    "created": slot.created,
+                    "evicted": slot.evicted,
+                    "checkouts": slot.checkouts,
+                    "waits": slot.waits,
+                    "wait_time_total": round(slot.wait_time, 6),
+                    "wait_time_max": round(slot.max_wait, 6),
+                    "wait_time_avg": round(slot.wait_time / slot.waits, 6) if slot.waits else 0.0,
+                    "utilization": round(slot.busy_time / (slot.max_size * elapsed), 4)
+                    if elapsed > 0
+                    else 0.0,
+                }
+        return result
@@ -0,0 +1,550 @@
+"""
+Response cache for deterministic chat completions.
+
+Identical requests (same system prompt and user message at ``temperature=0``)
+are common in production traffic and each one pays a full upstream round-trip.
+``ResponseCache`` stores completions under a canonical hash of the request:
+model, messages, tools and sampling parameters. Spellings that mean the same
+request share a key: dict key order, text-only content parts versus a plain
+string, CRLF line endings, surrounding whitespace and sampling parameters left
+at their default value.
+
+Entries live in an in-memory LRU of ``max_entries`` completions and, when
+``path`` is given, in a SQLite file that survives restarts and evicts its least
+recently used entries beyond ``max_disk_bytes``. Both tiers expire entries after
+``ttl`` seconds.
+
+Only requests with ``temperature=0`` are cached unless the cache is created
+with ``deterministic_only=False``. Each lookup takes a mode: ``"use"`` returns a
+cached answer if there is one, ``"refresh"`` skips the lookup but stores the new
+answer and ``"bypass"`` leaves the cache alone. The API server maps the
+``Cache-Control: no-cache`` and ``no-store`` request headers to the last two.
+
+Cached answers are replayed to streaming requests as chunks by
+``replay_chunks``; ``wrap_stream`` stores a streamed answer once it has been
+received in full.
+"""
+
+import hashlib
+import inspect
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from llm4free.llm.utils import ChatCompletionChunk, Choice, ChoiceDelta
+from llm4free.utils import json_dumpb, json_loadb
+
+CACHE_USE = "use"
+CACHE_REFRESH = "refresh"
+CACHE_BYPASS = "bypass"
+CACHE_MODES = (CACHE_USE, CACHE_REFRESH, CACHE_BYPASS)
+
+# Completions kept in memory when ResponseCache(max_entries=...) is not given.
+DEFAULT_MAX_ENTRIES = 1024
+# Seconds a cached completion is served before it is fetched again.
+DEFAULT_TTL = 3600.0
+# Size of the SQLite tier before least recently used entries are evicted.
+DEFAULT_MAX_DISK_BYTES = 64 * 1024 * 1024
+
+# Request fields that do not change the answer.
+_IGNORED_PARAMS = frozenset({"stream", "stream_options", "timeout", "proxies", "user"})
+# Sampling parameters whose default value is left out of the key.
+_DEFAULT_PARAMS = {"top_p": 1, "presence_penalty": 0, "frequency_penalty": 0, "n": 1}
+
+
+def _plain(value: Any) -> Any:
+    """Convert request values (pydantic models, ``Tool`` dataclasses) to JSON types."""
+    model_dump = getattr(value, "model_dump", None)
+    if callable(model_dump):
+        return _plain(model_dump(exclude_none=True))
+    if is_dataclass(value) and not isinstance(value, type):
+        return _plain(asdict(value))
+    if isinstance(value, Mapping):
+        return {str(key): _plain(item) for key, item in value.items() if item is not None}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return str(value)
+
+
+def _canonical_content(content: Any) -> Any:
+    if isinstance(content, list) and all(
+        isinstance(part, str) or (isinstance(part, Mapping) and part.get("type") == "text")
+        for part in content
+    ):
+        content = "".join(
+            part if isinstance(part, str) else str(part.get("text") or "") for part in content
+        )
+    if isinstance(content, str):
+        return content.replace("\r\n", "\n").strip()
+    return _plain(content)
+
+
+def _canonical_request(params: Mapping[str, Any]) -> Dict[str, Any]:
+    canonical: Dict[str, Any] = {}
+    for key, value in params.items():
+        if key in _IGNORED_PARAMS or value is None:
+            continue
+        value = _plain(value)
+        if _DEFAULT_PARAMS.get(key, object()) == value:
+            continue
+        canonical[key] = value
+    if isinstance(canonical.get("model"), str):
+        canonical["model"] = canonical["model"].lower()
+    messages = []
+    for message in params.get("messages") or []:
+        message = _plain(message)
+        if isinstance(message, dict) and "content" in message:
+            message["content"] = _canonical_content(message["content"])
+        messages.append(message)
+    canonical["messages"] = messages
+    return canonical
+
+
+def request_key(params: Mapping[str, Any], namespace: str = "") -> str:
+    """SHA-256 of a request's parameters, independent of their order."""
+    canonical = json.dumps(
+        [namespace, _plain(params)],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def cache_key(params: Mapping[str, Any], namespace: str = "") -> str:
+    """SHA-256 of the canonical form of a chat request (see the module docstring)."""
+    return request_key(_canonical_request(params), namespace)
+
+
+def is_deterministic(params: Mapping[str, Any]) -> bool:
+    """Whether a request asks for greedy sampling (``temperature=0``)."""
+    temperature = params.get("temperature")
+    return temperature is not None and float(temperature) == 0
+
+
+def cache_mode_from_header(cache_control: Optional[str]) -> str:
+    """Map a ``Cache-Control`` request header to a cache mode."""
+    directives = {part.strip().lower() for part in (cache_control or "").split(",")}
+    if "no-store" in directives:
+        return CACHE_BYPASS
+    if "no-cache" in directives or "max-age=0" in directives:
+        return CACHE_REFRESH
+    return CACHE_USE
+
+
+def completion_to_dict(completion: Any) -> Optional[Dict[str, Any]]:
+    """
+    The JSON form of a completion, or None if it should not be cached
+    (no choices, an error finish reason, or neither content nor tool calls).
+    """
+    model_dump = getattr(completion, "model_dump", None)
+    if callable(model_dump):
+        data = model_dump(exclude_none=True)
+    elif isinstance(completion, Mapping):
+        data = _plain(completion)
+    else:
+        return None
+    choices = data.get("choices") or []
+    if not choices:
+        return None
+    for choice in choices:
+        message = choice.get("message") or {}
+        if choice.get("finish_reason") == "error":
+            return None
+        if not (message.get("content") or "").strip() and not message.get("tool_calls"):
+            return None
+    return data
+
+
+def build_completion(
+    model: str,
+    content: str,
+    finish_reason: Optional[str] = None,
+    usage: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """A chat completion in JSON form for a streamed answer."""
+    data: Dict[str, Any] = {
+        "id": f"chatcmpl-{uuid.uuid4()}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": finish_reason or "stop",
+            }
+        ],
+    }
+    if usage:
+        data["usage"] = usage
+    return data
+
+
+def replay_chunks(
+    data: Mapping[str, Any], request_id: Optional[str] = None
+) -> Iterator[ChatCompletionChunk]:
+    """Replay a cached completion as a stream: one content chunk and one final chunk per choice."""
+    common = {
+        "model": data.get("model", ""),
+        "id": request_id or data.get("id"),
+        "created": int(time.time()),
+    }
+    choices = data.get("choices") or []
+    for position, choice in enumerate(choices):
+        index = choice.get("index", 0)
+        message = choice.get("message") or {}
+        delta: Dict[str, Any] = {"role": message.get("role") or "assistant"}
+        for field in ("content", "reasoning_content", "reasoning"):
+            if message.get(field) is not None:
+                delta[field] = message[field]
+        if message.get("tool_calls"):
+            delta["tool_calls"] = [
+                dict(call, index=call_index)
+                for call_index, call in enumerate(message["tool_calls"])
+            ]
+        yield ChatCompletionChunk(
+            choices=[Choice(index=index, delta=ChoiceDelta(**delta))], **common
+        )
+        last = position == len(choices) - 1
+        yield ChatCompletionChunk(
+            choices=[
+                Choice(
+                    index=index,
+                    delta=ChoiceDelta(),
+                    finish_reason=choice.get("finish_reason") or "stop",
+                )
+            ],
+            usage=data.get("usage") if last else None,
+            **common,
+        )
+
+
+def _field(obj: Any, name: str) -> Any:
+    if isinstance(obj, Mapping):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+class _StreamCollector:
+    """Reassembles the first choice of a stream into a completion."""
+
+    def __init__(self) -> None:
+        self.model = ""
+        self.parts: List[str] = []
+        self.finish_reason: Optional[str] = None
+        self.usage: Optional[Dict[str, Any]] = None
+        self.tool_calls = False
+
+    def add(self, chunk: Any) -> None:
+        self.model = _field(chunk, "model") or self.model
+        usage = _field(chunk, "usage")
+        if usage:
+            self.usage = _plain(usage)
+        for choice in _field(chunk, "choices") or []:
+            if (_field(choice, "index") or 0) != 0:
+                continue
+            delta = _field(choice, "delta") or _field(choice, "message")
+            if delta is not None:
+                content = _field(delta, "content")
+                if content:
+                    self.parts.append(content)
+                if _field(delta, "tool_calls"):
+                    self.tool_calls = True
+            self.finish_reason = _field(choice, "finish_reason") or self.finish_reason
+
+    def completion(self) -> Optional[Dict[str, Any]]:
+        # Streamed tool calls arrive as fragments; they are not reassembled.
+        if self.tool_calls:
+            return None
+        return build_completion(self.model, "".join(self.parts), self.finish_reason, self.usage)
+
+
+class _SQLiteTier:
+    """Persistent tier: one row per completion, evicted by last access beyond ``max_bytes``."""
+
+    def __init__(self, path: Union[str, Path], max_bytes: int) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+            "expires REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def size(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def get(self, key: str, now: float) -> Optional[bytes]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, expires FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            return bytes(row[0])
+
+    def set(self, key: str, value: bytes, expires: float, now: float) -> int:
+        """Store one entry and return the number of entries evicted to make room."""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value), expires, now),
+            )
+            evicted = self._db.execute("DELETE FROM responses WHERE expires <= ?", (now,)).rowcount
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total <= self.max_bytes:
+                return evicted
+            stale = []
+            for old_key, size in self._db.execute(
+                "SELECT key, size FROM responses ORDER BY accessed"
+            ).fetchall():
+                stale.append((old_key,))
+                total -= size
+                if total <= self.max_bytes:
+                    break
+            self._db.executemany("DELETE FROM responses WHERE key = ?", stale)
+            return evicted + len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class ResponseCache:
+    """
+    Two-tier cache of chat completions keyed by ``cache_key``.
+
+    Args:
+        max_entries: Completions kept in the in-memory LRU.
+        ttl: Seconds an entry is served. ``None`` keeps entries until evicted.
+        path: SQLite file for the persistent tier. ``None`` keeps the cache in
+            memory only.
+        max_disk_bytes: Size of the persistent tier before its least recently
+            used entries are evicted.
+        deterministic_only: Only cache requests with ``temperature=0``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: Optional[float] = DEFAULT_TTL,
+        path: Optional[Union[str, Path]] = None,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+        deterministic_only: bool = True,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.path = path
+        self.deterministic_only = deterministic_only
+        self._memory: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._disk = _SQLiteTier(path, max_disk_bytes) if path else None
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(
+            (
+                "hits",
+                "memory_hits",
+                "disk_hits",
+                "misses",
+                "refreshes",
+                "bypasses",
+                "uncacheable",
+                "stores",
+                "evictions",
+            ),
+            0,
+        )
+
+    @property
+    def persistent(self) -> bool:
+        """Whether lookups may read from disk (callers on an event loop run them in a thread)."""
+        return self._disk is not None
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+    def lookup(
+        self,
+        params: Mapping[str, Any],
+        namespace: str = "",
+        mode: str = CACHE_USE,
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Look up a chat request.
+
+        Returns ``(key, completion)``. ``key`` is None when the request is not
+        cached (bypassed, or not deterministic); otherwise the caller stores the
+        new answer under it. ``completion`` is the cached answer in JSON form,
+        with a fresh ``id`` and ``created``, or None on a miss or refresh.
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode {mode!r}; expected one of {CACHE_MODES}")
+        if mode == CACHE_BYPASS:
+            self._count("bypasses")
+            return None, None
+        if self.deterministic_only and not is_deterministic(params):
+            self._count("uncacheable")
+            return None, None
+        key = cache_key(params, namespace)
+        if mode == CACHE_REFRESH:
+            self._count("refreshes")
+            return key, None
+        return key, self.get(key)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """The completion stored under ``key``, or None (counted as a miss)."""
+        now = time.time()
+        value = None
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    value = entry[1]
+                    self._counters["memory_hits"] += 1
+                else:
+                    del self._memory[key]
+        if value is None and self._disk is not None:
+            value = self._disk.get(key, now)
+            if value is not None:
+                self._count("disk_hits")
+                self._remember(key, value, self._expires(now))
+        if value is None:
+            self._count("misses")
+            return None
+        self._count("hits")
+        data = json_loadb(value)
+        data["id"] = f"chatcmpl-{uuid.uuid4()}"
+        data["created"] = int(now)
+        return data
+
+    def _expires(self, now: float) -> float:
+        return now + self.ttl if self.ttl is not None else float("inf")
+
+    def _remember(self, key: str, value: bytes, expires: float) -> None:
+        with self._lock:
+            self._memory[key] = (expires, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def set(self, key: str, completion: Any) -> bool:
+        """Store a completion (object or JSON form); returns False if it is not cacheable."""
+        data = completion_to_dict(completion)
+        if data is None:
+            return False
+        value = json_dumpb(data)
+        now = time.time()
+        expires = self._expires(now)
+        self._remember(key, value, expires)
+        if self._disk is not None:
+            self._count("evictions", self._disk.set(key, value, expires, now))
+        self._count("stores")
+        return True
+
+    def store(self, key: str, response: Any) -> Any:
+        """
+        Store a provider response and return it. Streams are wrapped so the
+        answer is stored once they have been consumed in full.
+        """
+        if hasattr(response, "__aiter__"):
+            return self.wrap_async_stream(key, response)
+        if inspect.isgenerator(response):
+            return self.wrap_stream(key, response)
+        self.set(key, response)
+        return response
+
+    def wrap_stream(self, key: str, stream: Iterator[Any]) -> Iterator[Any]:
+        """Pass ``stream`` through and store its answer if it ends without an error."""
+        collector = _StreamCollector()
+        try:
+            for chunk in stream:
+                collector.add(chunk)
+                yield chunk
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+        completion = collector.completion()
+        if completion is not None:
+            self.set(key, completion)
+
+    async def wrap_async_stream(self, key: str, stream: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        """Async counterpart of ``wrap_stream``."""
+        collector = _StreamCollector()
+        try:
+            async for chunk in stream:
+                collector.add(chunk)
+                yield chunk
+        finally:
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        completion = collector.completion()
+        if completion is not None:
+            self.set(key, completion)
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    def close(self) -> None:
+        """Close the persistent tier. The in-memory tier stays usable."""
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters, entry counts and the hit rate of lookups."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._counters)
+            stats["memory_entries"] = len(self._memory)
+        if self._disk is not None:
+            stats["disk_entries"] = len(self._disk)
+            stats["disk_bytes"] = self._disk.size()
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        return stats
@@ -0,0 +1,409 @@
+"""
+Health-scored provider routing for the unified ``Client``.
+
+``ProviderRouter`` keeps per-provider and per-model statistics collected from
+real calls: an EWMA of time-to-first-token (TTFT), an EWMA of streaming
+throughput, an EWMA error rate and a circuit breaker. ``Client`` asks it which
+provider to try first and in which order to walk the fallback queue, so
+providers that keep failing or stall are tried last (or not at all while their
+circuit is open) instead of being picked at random.
+
+Circuit breaker states:
+
+- ``closed``: healthy, always eligible.
+- ``open``: ``failure_threshold`` consecutive failures; skipped until the
+  cooldown elapses. The cooldown doubles each time a probe fails, up to
+  ``max_cooldown``.
+- ``half_open``: the cooldown elapsed; exactly one probe request is let through.
+  Success closes the circuit, failure opens it again.
+
+Stats can be persisted across restarts by passing ``state_path`` (or setting
+``LLM4FREE_ROUTER_STATE``); they are loaded on creation and saved on exit.
+"""
+
+import atexit
+import math
+import os
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from litprinter import ic
+
+from llm4free.utils import JSON_DECODE_ERRORS, json_dumpb, json_loadb
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass
+class ProviderStats:
+    """Rolling health statistics for one provider or one ``provider/model`` pair."""
+
+    ttft: Optional[float] = None  # EWMA seconds to first token (or full response)
+    throughput: Optional[float] = None  # EWMA chunks per second after the first token
+    error_rate: float = 0.0  # EWMA of the failure indicator, 0..1
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    state: str = CLOSED
+    opened_at: float = 0.0  # wall-clock time the circuit last opened
+    cooldown: float = 0.0  # seconds the circuit stays open
+    last_error: str = ""
+    last_used: float = 0.0
+
+    @property
+    def calls(self) -> int:
+        return self.successes + self.failures
+
+
+def _ewma(previous: Optional[float], sample: float, alpha: float) -> float:
+    return sample if previous is None else alpha * sample + (1 - alpha) * previous
+
+
+class ProviderRouter:
+    """
+    Scores providers from observed latency and errors and orders them for ``Client``.
+
+    Args:
+        alpha: EWMA smoothing factor for new samples (0..1).
+        failure_threshold: Consecutive failures that open a provider's circuit.
+        cooldown: Seconds an opened circuit waits before a half-open probe.
+        max_cooldown: Upper bound for the doubling cooldown.
+        prior_ttft: TTFT assumed for providers without samples, so new providers
+            still get explored.
+        error_penalty: How strongly the error rate inflates a provider's score.
+        state_path: Optional JSON file used to persist stats across restarts.
+
+    Examples:
+        >>> router = ProviderRouter()
+        >>> router.record_success("Groq", "llama-3", ttft=0.4)
+        >>> router.record_failure("Slow", "m", "timeout")
+        >>> router.order(["Slow", "Groq"])
+        ['Groq', 'Slow']
+    """
+
+    def __init__(
+        self,
+        *,
+        alpha: float = 0.3,
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+        max_cooldown: float = 600.0,
+        prior_ttft: float = 2.0,
+        error_penalty: float = 4.0,
+        state_path: Optional[Union[str, Path]] = None,
+    ) -> None:
+        self.alpha = alpha
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.prior_ttft = prior_ttft
+        self.error_penalty = error_penalty
+        self.state_path = Path(state_path) if state_path else None
+        self._lock = threading.Lock()
+        self._providers: Dict[str, ProviderStats] = {}
+        self._models: Dict[Tuple[str, str], ProviderStats] = {}
+        self._probing: Dict[str, float] = {}
+        if self.state_path is not None:
+            self.load()
+            atexit.register(self.save)
+
+    # -- recording ---------------------------------------------------------
+
+    def _entries(self, provider: str, model: Optional[str]) -> List[ProviderStats]:
+        entries = [self._providers.setdefault(provider, ProviderStats())]
+        if model:
+            entries.append(self._models.setdefault((provider, model), ProviderStats()))
+        return entries
+
+    def record_success(
+        self,
+        provider: str,
+        model: Optional[str] = None,
+        *,
+        ttft: Optional[float] = None,
+        throughput: Optional[float] = None,
+    ) -> None:
+        """
+        Record a successful call.
+
+        Args:
+            provider: Provider class name.
+            model: Model used, if known.
+            ttft: Seconds until the first chunk (or the full non-streaming response).
+            throughput: Chunks per second after the first chunk, for streams.
+        """
+        now = time.time()
+        with self._lock:
+            for stats in self._entries(provider, model):
+                if ttft is not None:
+                    stats.ttft = _ewma(stats.ttft, ttft, self.alpha)
+                if throughput is not None:
+                    stats.throughput = _ewma(stats.throughput, throughput, self.alpha)
+                stats.error_rate = _ewma(stats.error_rate, 0.0, self.alpha)
+                stats.successes += 1
+                stats.consecutive_failures = 0
+                stats.last_used = now
+            provider_stats = self._providers[provider]
+            provider_stats.state = CLOSED
+            provider_stats.cooldown = 0.0
+            self._probing.pop(provider, None)
+
+    def record_throughput(self, provider: str, model: Optional[str], throughput: float) -> None:
+        """Fold a stream's chunks-per-second into the stats once the stream is drained."""
+        with self._lock:
+            for stats in self._entries(provider, model):
+                stats.throughput = _ewma(stats.throughput, throughput, self.alpha)
+
+    def record_failure(
+        self, provider: str, model: Optional[str] = None, error: Optional[object] = None
+    ) -> None:
+        """
+        Record a failed call and open the provider's circuit if it keeps failing.
+
+        Args:
+            provider: Provider class name.
+            model: Model used, if known.
+            error: The exception or message, kept as ``last_error``.
+        """
+        now = time.time()
+        with self._lock:
+            for stats in self._entries(provider, model):
+                stats.error_rate = _ewma(stats.error_rate, 1.0, self.alpha)
+                stats.failures += 1
+                stats.consecutive_failures += 1
+                stats.last_used = now
+                if error is not None:
+                    stats.last_error = str(error)[:200]
+            stats = self._providers[provider]
+            probe_failed = self._probing.pop(provider, None) is not None
+            if probe_failed or self._refresh_state(stats, now) == HALF_OPEN:
+                # The half-open probe failed: back off for longer.
+                stats.cooldown = min(max(stats.cooldown, self.base_cooldown) * 2, self.max_cooldown)
+                stats.state = OPEN
+                stats.opened_at = now
+            elif stats.state == CLOSED and stats.consecutive_failures >= self.failure_threshold:
+                stats.cooldown = self.base_cooldown
+                stats.state = OPEN
+                stats.opened_at = now
+
+    # -- selection ---------------------------------------------------------
+
+    def _refresh_state(self, stats: ProviderStats, now: float) -> str:
+        if stats.state == OPEN and now - stats.opened_at >= stats.cooldown:
+            stats.state = HALF_OPEN
+        return stats.state
+
+    def is_available(self, provider: str) -> bool:
+        """Whether ``provider`` may be tried now (closed, or half-open with no probe running)."""
+        with self._lock:
+            stats = self._providers.get(provider)
+            if stats is None:
+                return True
+            state = self._refresh_state(stats, time.time())
+            return state == CLOSED or (state == HALF_OPEN and provider not in self._probing)
+
+    def acquire(self, provider: str) -> bool:
+        """
+        Claim permission to call ``provider``.
+
+        For a half-open circuit only the first caller gets the probe; others are
+        refused until it reports back (or the probe is abandoned for ``cooldown``).
+        """
+        now = time.time()
+        with self._lock:
+            stats = self._providers.get(provider)
+            if stats is None:
+                return True
+            state = self._refresh_state(stats, now)
+            if state == CLOSED:
+                return True
+            if state == OPEN:
+                return False
+            started = self._probing.get(provider)
+            if started is not None and now - started < max(stats.cooldown, self.base_cooldown):
+                return False
+            self._probing[provider] = now
+            return True
+
+    def score(self, provider: str, model: Optional[str] = None) -> float:
+        """Expected cost of calling ``provider`` (lower is better)."""
+        with self._lock:
+            return self._score(provider, model)
+
+    def _score(self, provider: str, model: Optional[str]) -> float:
+        stats = self._models.get((provider, model)) if model else None
+        if stats is None or stats.ttft is None:
+            stats = self._providers.get(provider)
+        if stats is None:
+            return self.prior_ttft
+        ttft = stats.ttft if stats.ttft is not None else self.prior_ttft
+        return ttft * (1.0 + self.error_penalty * stats.error_rate)
+
+    def choose(
+        self,
+        items: Sequence[T],
+        key: Callable[[T], Union[str, Tuple[str, Optional[str]]]] = str,
+    ) -> T:
+        """
+        Pick one item by power-of-two-choices: sample two, keep the lower score.
+
+        Items whose provider circuit is open are only picked if nothing else is
+        available.
+
+        Args:
+            items: Candidates (provider names or tuples carrying them).
+            key: Maps an item to a provider name or a ``(provider, model)`` pair.
+        """
+        if not items:
+            raise IndexError("cannot choose from an empty sequence")
+        pool = [item for item in items if self.is_available(self._split(key(item))[0])]
+        pool = pool or list(items)
+        if len(pool) == 1:
+            return pool[0]
+        first, second = random.sample(pool, 2)
+        with self._lock:
+            first_score = self._score(*self._split(key(first)))
+            second_score = self._score(*self._split(key(second)))
+        return first if first_score <= second_score else second
+
+    def order(
+        self,
+        items: Sequence[T],
+        key: Callable[[T], Union[str, Tuple[str, Optional[str]]]] = str,
+        *,
+        skip_unavailable: bool = False,
+    ) -> List[T]:
+        """
+        Order items for a fallback walk by repeated power-of-two-choices draws.
+
+        Healthy, fast providers tend to come first while slower ones still get
+        occasional traffic. Providers with an open circuit go last, or are
+        dropped when ``skip_unavailable`` is set.
+        """
+        available = [item for item in items if self.is_available(self._split(key(item))[0])]
+        unavailable = [item for item in items if item not in available]
+        ordered: List[T] = []
+        while available:
+            choice = self.choose(available, key)
+            available.remove(choice)
+            ordered.append(choice)
+        return ordered if skip_unavailable else ordered + unavailable
+
+    @staticmethod
+    def _split(
+        value: Union[str, Tuple[str, Optional[str]]],
+    ) -> Tuple[str, Optional[str]]:
+        if isinstance(value, tuple):
+            return value[0], value[1]
+        return value, None
+
+    # -- introspection and persistence -----------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of all collected stats.
+
+        Returns:
+            ``{"providers": {name: {...}}, "models": {"provider/model": {...}}}`` where
+            each entry holds the ``ProviderStats`` fields plus ``score`` and ``calls``.
+        """
+        now = time.time()
+        with self._lock:
+            providers = {}
+            for name, stats in self._providers.items():
+                self._refresh_state(stats, now)
+                providers[name] = dict(
+                    asdict(stats), score=self._score(name, None), calls=stats.calls
+                )
+            models = {
+                f"{provider}/{model}": dict(
+                    asdict(stats), score=self._score(provider, model), calls=stats.calls
+                )
+                for (provider, model), stats in self._models.items()
+            }
+        return {"providers": providers, "models": models}
+
+    def reset(self, provider: Optional[str] = None) -> None:
+        """Forget stats for one provider, or for every provider."""
+        with self._lock:
+            if provider is None:
+                self._providers.clear()
+                self._models.clear()
+                self._probing.clear()
+                return
+            self._providers.pop(provider, None)
+            self._probing.pop(provider, None)
+            for key in [key for key in self._models if key[0] == provider]:
+                del self._models[key]
+
+    def save(self, path: Optional[Union[str, Path]] = None) -> None:
+        """Write stats to ``path`` (default ``state_path``) with an atomic rename."""
+        target = Path(path) if path else self.state_path
+        if target is None:
+            return
+        with self._lock:
+            data = {
+                "providers": {name: asdict(stats) for name, stats in self._providers.items()},
+                "models": {
+                    f"{provider}/{model}": asdict(stats)
+                    for (provider, model), stats in self._models.items()
+                },
+            }
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(json_dumpb(data))
+            os.replace(tmp_path, target)
+        except OSError as e:
+            ic(f"Failed to save router state: {e}")
+
+    def load(self, path: Optional[Union[str, Path]] = None) -> None:
+        """Load stats saved by ``save``; missing or corrupt files are ignored."""
+        source = Path(path) if path else self.state_path
+        if source is None or not source.exists():
+            return
+        try:
+            data = json_loadb(source.read_bytes())
+        except (OSError, *JSON_DECODE_ERRORS) as e:
+            ic(f"Failed to load router state: {e}")
+            return
+        known = {field.name for field in fields(ProviderStats)}
+
+        def build(raw: Dict[str, Any]) -> ProviderStats:
+            values = {k: v for k, v in raw.items() if k in known}
+            for key in ("ttft", "throughput"):
+                if isinstance(values.get(key), float) and not math.isfinite(values[key]):
+                    values[key] = None
+            return ProviderStats(**values)
+
+        with self._lock:
+            for name, raw in data.get("providers", {}).items():
+                self._providers[name] = build(raw)
+            for key, raw in data.get("models", {}).items():
+                provider, _, model = key.partition("/")
+                self._models[(provider, model)] = build(raw)
+
+
+_default_router: Optional[ProviderRouter] = None
+_default_router_lock = threading.Lock()
+
+
+def get_default_router() -> ProviderRouter:
+    """
+    The process-wide router shared by ``Client`` instances that are not given one.
+
+    Stats persist across restarts when ``LLM4FREE_ROUTER_STATE`` names a file.
+    """
+    global _default_router
+    with _default_router_lock:
+        if _default_router is None:
+            _default_router = ProviderRouter(state_path=os.getenv("LLM4FREE_ROUTER_STATE") or None)
+        return _default_router
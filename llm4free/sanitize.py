@@ -8,6 +8,7 @@ marker-based extraction, and customizable output response formatting.
 import asyncio
 import codecs
 import functools
+import inspect
 import json
 import re
 import sys
@@ -23,10 +24,13 @@ from typing import (
     List,
     Literal,
     Optional,
+    Tuple,
     Union,
     overload,
 )
 
+from llm4free.utils import json_loadb
+
 # Expanded encoding types
 EncodingType = Literal[
     "utf-8",
@@ -50,6 +54,8 @@ EncodingType = Literal[
 # Public API
 __all__ = [
     "sanitize_stream",
+    "compile_sanitizer",
+    "SanitizerPipeline",
     "LITSTREAM",
     "sanitize_stream_decorator",
     "lit_streamer",
@@ -93,116 +99,386 @@ def _compile_regexes(
     return compiled_patterns
 
 
-def _process_chunk(
-    chunk: str,
+_SKIP = object()
+
+
+def _extract_first(regexes: List[re.Pattern[str]], text: str) -> Optional[str]:
+    """Return the first regex extraction from ``text``, or None if nothing matches."""
+    for regex in regexes:
+        match = regex.search(text)
+        if match:
+            groups = match.groups()
+            if groups:
+                return match.group(1) if len(groups) == 1 else str(groups)
+            return match.group(0)
+    return None
+
+
+def _build_record_handler(
     intro_value: Optional[str],
     to_json: bool,
-    skip_markers: List[str],
+    skip_markers: Optional[Iterable[str]],
     strip_chars: Optional[str],
     yield_raw_on_error: bool,
-    error_handler: Optional[Callable[[Exception, str], Optional[Any]]] = None,
-    skip_regexes: Optional[List[re.Pattern[str]]] = None,
-    extract_regexes: Optional[List[re.Pattern[str]]] = None,
-) -> Union[str, Dict[str, Any], None]:
+    error_handler: Optional[Callable[[Exception, str], Optional[Any]]],
+    skip_regexes: Optional[List[re.Pattern[str]]],
+    extract_regexes: Optional[List[re.Pattern[str]]],
+    content_extractor: Optional[Callable[[Union[str, Dict[str, Any]]], Optional[Any]]],
+    output_formatter: Optional[Callable[[Any], Any]],
+) -> Callable[[str], Any]:
     """
-    Sanitizes and potentially parses a single chunk of text.
+    Build a per-record function specialized for one set of sanitize options.
 
-    This function performs several operations on the input chunk:
-    - Removes a specified prefix (`intro_value`).
-    - Strips leading/trailing characters (`strip_chars`).
-    - Skips chunks matching specific markers (`skip_markers`).
-    - Skips chunks matching regex patterns (`skip_regexes`).
-    - Extracts content using regex capturing groups (`extract_regexes`).
-    - Optionally parses the chunk as JSON (`to_json`).
-    - Handles JSON parsing errors with an optional callback (`error_handler`).
+    Option analysis happens once here, so the returned function only runs the
+    steps that are configured. Each record (a line, or an SSE event when
+    ``sse_events`` is enabled) goes through:
 
-    Args:
-        chunk (str): The chunk of text to process.
-        intro_value (str): The prefix to remove from the chunk.
-        to_json (bool): If True, attempts to parse the chunk as JSON.
-        skip_markers (List[str]): A list of markers; chunks matching these are skipped.
-        strip_chars (Optional[str]): Characters to strip from the beginning and end of the chunk.
-        yield_raw_on_error (bool): If True, returns the raw chunk when JSON parsing fails; otherwise, returns None.
-        error_handler (Optional[Callable[[Exception, str], Optional[Any]]]): An optional callback function that is called when JSON parsing fails.
-            It receives the exception and the sanitized chunk as arguments.  It should return a value to yield instead of the raw chunk, or None to ignore.
-        skip_regexes (Optional[List[Pattern[str]]]): A list of compiled regex patterns; chunks matching any of these are skipped.
-        extract_regexes (Optional[List[Pattern[str]]]): A list of compiled regex patterns for extracting content using capturing groups.
+    - removal of the ``intro_value`` prefix,
+    - stripping (``strip_chars``, or leading whitespace by default),
+    - dropping empty records and exact ``skip_markers`` matches,
+    - regex extraction (``extract_regexes``) and filtering (``skip_regexes``),
+    - JSON parsing (``to_json``) with ``error_handler``/``yield_raw_on_error`` fallbacks,
+    - ``content_extractor`` and ``output_formatter``.
 
+    Returns:
+        A callable mapping a record to the item to yield, or ``_SKIP``.
     """
-    if not isinstance(chunk, str):
-        return None
+    markers = frozenset(skip_markers or ())
+    prefix = intro_value or ""
+    prefix_len = len(prefix)
+    # With a content_extractor, extract_regexes run on the extracted content instead.
+    pre_extract = extract_regexes if not content_extractor else None
 
-    # Fast path for empty chunks
-    if not chunk:
-        return None
+    # --- Stage 1: prefix removal, stripping and marker checks ---
+    if prefix and strip_chars is not None:
 
-    # Use slicing for prefix removal (faster than startswith+slicing)
-    sanitized_chunk = chunk
-    if intro_value and len(chunk) >= len(intro_value) and chunk[: len(intro_value)] == intro_value:
-        sanitized_chunk = chunk[len(intro_value) :]
+        def clean(record: str) -> Optional[str]:
+            if record.startswith(prefix):
+                record = record[prefix_len:]
+            record = record.strip(strip_chars)
+            return None if not record or record in markers else record
 
-    # Optimize string stripping operations
-    if strip_chars is not None:
-        sanitized_chunk = sanitized_chunk.strip(strip_chars)
-    else:
-        # lstrip() is faster than strip() when we only need leading whitespace removed
-        sanitized_chunk = sanitized_chunk.lstrip()
+    elif prefix:
 
-    # Skip empty chunks and markers
-    if not sanitized_chunk or any(marker == sanitized_chunk for marker in skip_markers):
-        return None
+        def clean(record: str) -> Optional[str]:
+            if record.startswith(prefix):
+                record = record[prefix_len:]
+            record = record.lstrip()
+            return None if not record or record in markers else record
 
-    # Apply regex-based extraction first (if provided)
-    if extract_regexes:
-        extracted_content = None
-        for regex in extract_regexes:
-            match = regex.search(sanitized_chunk)
-            if match:
-                # If there are capturing groups, return the first group or all groups as a tuple
-                if match.groups():
-                    if len(match.groups()) == 1:
-                        extracted_content = match.group(1)
-                    else:
-                        # Multiple groups - return as tuple converted to string for JSON compatibility
-                        extracted_content = str(match.groups())
-                else:
-                    # No capturing groups, return the full match
-                    extracted_content = match.group(0)
-                break  # Use first matching extraction regex
-
-        if extracted_content is None:
-            if to_json:
-                pass
-            else:
-                return None
-        else:
-            sanitized_chunk = extracted_content
+    elif strip_chars is not None:
 
-    if skip_regexes:
-        if any(regex.search(sanitized_chunk) for regex in skip_regexes):
-            return None
+        def clean(record: str) -> Optional[str]:
+            record = record.strip(strip_chars)
+            return None if not record or record in markers else record
+
+    else:
 
-    if to_json:
+        def clean(record: str) -> Optional[str]:
+            record = record.lstrip()
+            return None if not record or record in markers else record
+
+    # --- Stage 2: regex extraction/filtering and JSON parsing ---
+    loads = json_loadb
+
+    def parse_json(text: str) -> Any:
         try:
             # Only strip before JSON parsing if both boundaries are incorrect
-            if (
-                len(sanitized_chunk) >= 2
-                and sanitized_chunk[0] not in "{["
-                and sanitized_chunk[-1] not in "}]"
-            ):
-                sanitized_chunk = sanitized_chunk.strip()
-            return json.loads(sanitized_chunk)
-        except (json.JSONDecodeError, Exception) as e:
+            if len(text) >= 2 and text[0] not in "{[" and text[-1] not in "}]":
+                text = text.strip()
+            return loads(text)
+        except Exception as e:
             if error_handler:
                 try:
-                    handled = error_handler(e, sanitized_chunk)
+                    handled = error_handler(e, text)
                     if handled is not None:
                         return handled
                 except Exception:
                     pass
-            return sanitized_chunk if yield_raw_on_error else None
+            return text if yield_raw_on_error else None
+
+    parse: Optional[Callable[[str], Any]]
+    if pre_extract or skip_regexes:
+
+        def parse(text: str) -> Any:
+            if pre_extract:
+                extracted = _extract_first(pre_extract, text)
+                if extracted is not None:
+                    text = extracted
+                elif not to_json:
+                    return None
+            if skip_regexes and any(regex.search(text) for regex in skip_regexes):
+                return None
+            return parse_json(text) if to_json else text
+
+    elif to_json:
+        parse = parse_json
+    else:
+        parse = None
+
+    # --- Stage 3: content extraction and output formatting ---
+    if content_extractor is None and output_formatter is None:
+        if parse is None:
+
+            def handle(record: str) -> Any:
+                text = clean(record)
+                return _SKIP if text is None else text
+
+        else:
+
+            def handle(record: str) -> Any:
+                text = clean(record)
+                if text is None:
+                    return _SKIP
+                result = parse(text)
+                return _SKIP if result is None else result
+
+        return handle
+
+    def finish(result: Any) -> Any:
+        if content_extractor is None:
+            return output_formatter(result) if output_formatter else result
+        try:
+            final_content = content_extractor(result)
+            if final_content is None:
+                return _SKIP
+            if extract_regexes and isinstance(final_content, str):
+                final_content = _extract_first(extract_regexes, final_content)
+                if final_content is None:
+                    return _SKIP
+            return output_formatter(final_content) if output_formatter else final_content
+        except Exception:
+            return _SKIP
+
+    def handle(record: str) -> Any:
+        text = clean(record)
+        if text is None:
+            return _SKIP
+        result = parse(text) if parse is not None else text
+        return _SKIP if result is None else finish(result)
+
+    return handle
 
-    return sanitized_chunk
+
+def _json_record_check(intro_value: Optional[str]) -> Callable[[str], bool]:
+    """Return a check for whether a partial line already holds a whole JSON value."""
+    prefix = intro_value or ""
+
+    def complete(line: str) -> bool:
+        text = line.strip()
+        if prefix and text.startswith(prefix):
+            text = text[len(prefix) :].lstrip()
+        # Cheap bracket test first, so lines split mid-object are rarely parsed.
+        if not text or text[0] not in "{[" or text[-1] not in "}]":
+            return False
+        try:
+            json_loadb(text)
+        except Exception:
+            return False
+        return True
+
+    return complete
+
+
+class _StreamFramer:
+    """
+    Incremental framer that turns input chunks into complete records.
+
+    By default every input chunk holds whole lines, as from ``iter_lines()``:
+    a chunk without a line terminator is still one record. With ``fragments``
+    enabled the chunks are arbitrary pieces of one text stream, as from
+    ``iter_content()``. Only the trailing partial line is then kept between
+    chunks (as a list of pieces, joined once its delimiter arrives), so a JSON
+    payload split across network reads is parsed whole and long streams are
+    framed in linear time.
+
+    Records are lines split on ``line_delimiter`` (``None`` means ``\\n``,
+    ``\\r\\n`` or ``\\r``). With ``sse_events`` enabled, consecutive ``data:``
+    lines are joined with ``\\n`` and emitted as one record per SSE event
+    (terminated by a blank line). ``start_marker``/``end_marker`` restrict
+    framing to the text between the markers, even when a marker itself is
+    split across fragments.
+
+    ``complete`` is an optional check for the trailing partial line in
+    ``fragments`` mode: when it returns True the partial line is emitted as a
+    record without waiting for a delimiter. This keeps streams that send one complete JSON object per chunk
+    with no line terminator (such as Monica or WebPilot) flowing record by
+    record.
+    """
+
+    __slots__ = (
+        "_delimiter",
+        "_universal",
+        "_parts",
+        "_start_marker",
+        "_end_marker",
+        "_gated",
+        "_active",
+        "_held",
+        "_sse_events",
+        "_event",
+        "_complete",
+        "_fragments",
+    )
+
+    def __init__(
+        self,
+        line_delimiter: Optional[str] = None,
+        start_marker: Optional[str] = None,
+        end_marker: Optional[str] = None,
+        sse_events: bool = False,
+        complete: Optional[Callable[[str], bool]] = None,
+        fragments: bool = False,
+    ) -> None:
+        self._universal = not line_delimiter
+        self._delimiter = line_delimiter or "\n"
+        self._parts: List[str] = []
+        self._start_marker = start_marker or None
+        self._end_marker = end_marker or None
+        self._gated = bool(self._start_marker or self._end_marker)
+        self._active = self._start_marker is None
+        self._held = ""
+        self._sse_events = sse_events
+        self._event: List[str] = []
+        self._fragments = fragments
+        self._complete = complete if fragments and not sse_events else None
+
+    def feed(self, text: str) -> List[str]:
+        """Consume an input chunk and return the records it completed."""
+        records: List[str] = []
+        if not self._gated:
+            self._split(text, records)
+        else:
+            for segment, closes_region in self._gate(text):
+                self._split(segment, records)
+                if closes_region:
+                    self._finish(records)
+        if self._parts and not self._fragments:
+            # The chunk ends its last line even without a terminator.
+            line = "".join(self._parts)
+            self._parts.clear()
+            self._line(line, records)
+        return records
+
+    def close(self) -> List[str]:
+        """Flush the trailing partial record at end of stream."""
+        records: List[str] = []
+        if self._gated and self._active and self._held:
+            self._split(self._held, records)
+        self._held = ""
+        self._finish(records)
+        return records
+
+    def _gate(self, text: str) -> List[Any]:
+        """Split ``text`` into ``(segment, closes_region)`` pairs inside the markers."""
+        out: List[Any] = []
+        buf = self._held + text if self._held else text
+        self._held = ""
+        while buf:
+            if not self._active:
+                start = self._start_marker
+                if start is None:
+                    # End marker seen and no start marker to reopen a region.
+                    return out
+                idx = buf.find(start)
+                if idx == -1:
+                    # Keep a possible partial start marker.
+                    self._held = buf[-(len(start) - 1) :] if len(start) > 1 else ""
+                    return out
+                buf = buf[idx + len(start) :]
+                self._active = True
+                continue
+            end = self._end_marker
+            if end is None:
+                out.append((buf, False))
+                return out
+            idx = buf.find(end)
+            if idx == -1:
+                # Hold back a possible partial end marker.
+                keep = min(len(end) - 1, len(buf))
+                if keep:
+                    self._held = buf[len(buf) - keep :]
+                    buf = buf[: len(buf) - keep]
+                if buf:
+                    out.append((buf, False))
+                return out
+            out.append((buf[:idx], True))
+            buf = buf[idx + len(end) :]
+            self._active = False
+        return out
+
+    def _split(self, text: str, records: List[str]) -> None:
+        """Split ``text`` on the delimiter, buffering the trailing partial line."""
+        delimiter = self._delimiter
+        step = len(delimiter)
+        if step > 1 and self._parts:
+            # A multi-character delimiter may straddle the fragment boundary.
+            text = "".join(self._parts) + text
+            self._parts.clear()
+        find = text.find
+        idx = find(delimiter)
+        if idx == -1:
+            if text:
+                self._parts.append(text)
+                self._flush_complete(records)
+            return
+        start = 0
+        if self._parts:
+            self._parts.append(text[:idx])
+            line = "".join(self._parts)
+            self._parts.clear()
+            self._line(line, records)
+            start = idx + step
+            idx = find(delimiter, start)
+        while idx != -1:
+            self._line(text[start:idx], records)
+            start = idx + step
+            idx = find(delimiter, start)
+        if start < len(text):
+            self._parts.append(text[start:])
+            self._flush_complete(records)
+
+    def _flush_complete(self, records: List[str]) -> None:
+        """Emit the trailing partial line if ``complete`` says it is a whole record."""
+        if self._complete is None:
+            return
+        line = "".join(self._parts)
+        if self._complete(line):
+            self._parts.clear()
+            self._line(line, records)
+
+    def _finish(self, records: List[str]) -> None:
+        """Emit the pending partial line and any pending SSE event."""
+        if self._parts:
+            line = "".join(self._parts)
+            self._parts.clear()
+            self._line(line, records)
+        if self._event:
+            records.append("\n".join(self._event))
+            self._event.clear()
+
+    def _line(self, line: str, records: List[str]) -> None:
+        if self._universal and "\r" in line:
+            if line[-1] == "\r":
+                line = line[:-1]
+            if "\r" in line:
+                for piece in line.split("\r"):
+                    self._record(piece, records)
+                return
+        self._record(line, records)
+
+    def _record(self, line: str, records: List[str]) -> None:
+        if not self._sse_events:
+            records.append(line)
+            return
+        if not line:
+            if self._event:
+                records.append("\n".join(self._event))
+                self._event.clear()
+        elif line[:5] == "data:":
+            value = line[5:]
+            self._event.append(value[1:] if value[:1] == " " else value)
+        # Comments (":...") and other SSE fields (event/id/retry) carry no payload.
 
 
 def _decode_byte_stream(
@@ -350,6 +626,115 @@ async def _decode_byte_stream_async(
         yield f"[Encoding Error: Could not decode final bytes with {encoding}]\n"
 
 
+def _run_framed_sync(
+    data: Any,
+    framer: "_StreamFramer",
+    handle_record: Callable[[str], Any],
+    encoding: EncodingType = "utf-8",
+    encoding_errors: str = "replace",
+    buffer_size: int = 8192,
+) -> Generator[Any, None, None]:
+    """Decode a string or sync iterable, frame it into records and process each one."""
+    line_iterator: Iterable[str]
+
+    if isinstance(data, str):
+        line_iterator = (data,)
+    elif hasattr(data, "__iter__"):  # data is an iterable (but not a string)
+        _iter = iter(data)
+        first_item = next(_iter, None)
+
+        if first_item is None:  # Iterable was empty
+            return
+
+        # Reconstruct the full iterable including the first_item
+        stream_input_iterable = chain([first_item], _iter)
+
+        if isinstance(first_item, bytes):
+            # Ensure stream_input_iterable is typed as Iterable[bytes] for _decode_byte_stream
+            line_iterator = _decode_byte_stream(
+                stream_input_iterable,
+                encoding=encoding,
+                errors=encoding_errors,
+                buffer_size=buffer_size,
+            )
+        elif isinstance(first_item, str):
+            # Ensure stream_input_iterable is typed as Iterable[str]
+            line_iterator = stream_input_iterable
+        else:
+            raise TypeError(
+                f"Iterable must yield strings or bytes, not {type(first_item).__name__}"
+            )
+    else:  # Not a string and not an iterable
+        raise TypeError(f"Input must be a string or an iterable, not {type(data).__name__}")
+
+    try:
+        for text in line_iterator:
+            if not text:
+                continue
+            for record in framer.feed(text):
+                item = handle_record(record)
+                if item is not _SKIP:
+                    yield item
+        for record in framer.close():
+            item = handle_record(record)
+            if item is not _SKIP:
+                yield item
+    except Exception as e:
+        print(f"Stream processing error: {e}", file=sys.stderr)
+
+
+async def _run_framed_async(
+    data: AsyncIterable[Any],
+    framer: "_StreamFramer",
+    handle_record: Callable[[str], Any],
+    encoding: EncodingType = "utf-8",
+    encoding_errors: str = "replace",
+    buffer_size: int = 8192,
+) -> AsyncGenerator[Any, None]:
+    """Decode an async iterable, frame it into records and process each one."""
+    iterator = data.__aiter__()
+    first_item = None
+    async for first_item in iterator:
+        break
+    if first_item is None:
+        return
+
+    async def _chain(first: Any, it: AsyncIterable[Any]) -> AsyncGenerator[Any, None]:
+        """Chain the first item with the rest of the async iterator."""
+        yield first
+        async for x in it:
+            yield x
+
+    stream: AsyncGenerator[Any, None] = _chain(first_item, iterator)
+
+    if isinstance(first_item, bytes):
+        line_iterator = _decode_byte_stream_async(
+            stream,
+            encoding=encoding,
+            errors=encoding_errors,
+            buffer_size=buffer_size,
+        )
+    elif isinstance(first_item, str):
+        line_iterator = stream
+    else:
+        raise TypeError(f"Stream must yield strings or bytes, not {type(first_item).__name__}")
+
+    try:
+        async for text in line_iterator:
+            if not text:
+                continue
+            for record in framer.feed(text):
+                item = handle_record(record)
+                if item is not _SKIP:
+                    yield item
+        for record in framer.close():
+            item = handle_record(record)
+            if item is not _SKIP:
+                yield item
+    except Exception as e:
+        print(f"Async stream processing error: {e}", file=sys.stderr)
+
+
 def _sanitize_stream_sync(
     data: Any,
     intro_value: Optional[str] = "data:",
@@ -369,6 +754,8 @@ def _sanitize_stream_sync(
     extract_regexes: Optional[List[Union[str, re.Pattern[str]]]] = None,
     raw: bool = False,
     output_formatter: Optional[Callable[[Any], Any]] = None,
+    sse_events: bool = False,
+    fragments: bool = False,
 ) -> Generator[Any, None, None]:
     """
     Processes a stream of data (strings or bytes) in real-time, applying various transformations and filtering.
@@ -392,13 +779,18 @@ def _sanitize_stream_sync(
         encoding_errors: How to handle encoding errors.
         buffer_size: Buffer size for byte decoding.
         line_delimiter: Delimiter used to split incoming text into lines. ``None``
-            uses ``str.splitlines()``.
+            splits on ``\\n``, ``\\r\\n`` and ``\\r``.
         error_handler: Callback invoked with ``(Exception, str)`` when JSON
             parsing fails. If the callback returns a value, it is yielded instead of the raw line.
         skip_regexes: List of regex patterns (strings or compiled) for skipping lines that match.
         extract_regexes: List of regex patterns (strings or compiled) for extracting content using capturing groups.
         raw: If True, yields the raw response as returned by the API, chunk by chunk (no processing).
         output_formatter: Custom callable to format/transform each output item before yielding.
+        sse_events: If True, join multi-line SSE ``data:`` fields and process one
+            record per event (events end at a blank line).
+        fragments: If True, input chunks are arbitrary pieces of one stream (such as
+            network reads) and lines may span several chunks. Otherwise each chunk
+            holds whole lines, as from ``iter_lines()``.
 
     Yields:
         Any: Processed data, which can be a string, a dictionary (if `to_json` is True),
@@ -426,210 +818,27 @@ def _sanitize_stream_sync(
             return
     # --- END RAW MODE ---
 
-    # --- OUTPUT FORMATTING SETUP ---
-    def _apply_output_format(item: Any) -> Any:
-        """Apply output formatting to a processed item."""
-        if output_formatter is not None:
-            return output_formatter(item)
-        return item
-
-    # --- END OUTPUT FORMATTING SETUP ---
-
-    effective_skip_markers = skip_markers or []
-    # Compile regex patterns
-    compiled_skip_regexes = _compile_regexes(skip_regexes)
-    compiled_extract_regexes = _compile_regexes(extract_regexes)
-
-    processing_active = start_marker is None
-    buffer = ""
-    found_start = False if start_marker else True
-    line_iterator: Iterable[str]
-
-    if isinstance(data, str):
-        # If data is a string, decide whether to split it into lines
-        # or treat it as an iterable containing a single chunk.
-        temp_lines: List[str]
-        if line_delimiter is None:  # Default: split by newlines if present
-            if "\n" in data or "\r" in data:
-                temp_lines = data.splitlines()
-            else:
-                temp_lines = [data]  # Treat as a single line/chunk
-        elif line_delimiter in data:  # Custom delimiter found in string
-            temp_lines = data.split(line_delimiter)
-        else:  # Custom delimiter not found, or string is effectively a single segment
-            temp_lines = [data]
-        line_iterator = iter(temp_lines)
-    elif hasattr(data, "__iter__"):  # data is an iterable (but not a string)
-        _iter = iter(data)
-        first_item = next(_iter, None)
-
-        if first_item is None:  # Iterable was empty
-            return
-
-        # Reconstruct the full iterable including the first_item
-        stream_input_iterable = chain([first_item], _iter)
-
-        if isinstance(first_item, bytes):
-            # Ensure stream_input_iterable is typed as Iterable[bytes] for _decode_byte_stream
-            line_iterator = _decode_byte_stream(
-                stream_input_iterable,
-                encoding=encoding,
-                errors=encoding_errors,
-                buffer_size=buffer_size,
-            )
-        elif isinstance(first_item, str):
-            # Ensure stream_input_iterable is typed as Iterable[str]
-            line_iterator = stream_input_iterable
-        else:
-            raise TypeError(
-                f"Iterable must yield strings or bytes, not {type(first_item).__name__}"
-            )
-    else:  # Not a string and not an iterable
-        raise TypeError(f"Input must be a string or an iterable, not {type(data).__name__}")
-
-    try:
-        for line in line_iterator:
-            if not line:
-                continue
-            buffer += line
-            while True:
-                # Look for start marker if needed
-                if not found_start and start_marker:
-                    idx = buffer.find(start_marker)
-                    if idx != -1:
-                        found_start = True
-                        buffer = buffer[idx + len(start_marker) :]
-                    else:
-                        # Not found, keep buffering
-                        buffer = buffer[-max(len(start_marker), 256) :]  # avoid unbounded growth
-                        break
-                # Look for end marker if needed
-                if found_start and end_marker:
-                    idx = buffer.find(end_marker)
-                    if idx != -1:
-                        chunk = buffer[:idx]
-                        buffer = buffer[idx + len(end_marker) :]
-                        processing_active = False
-                    else:
-                        chunk = buffer
-                        buffer = ""
-                        processing_active = True
-                    # Process chunk if we are in active region
-                    if chunk and processing_active:
-                        for subline in (
-                            chunk.split(line_delimiter)
-                            if line_delimiter is not None
-                            else chunk.splitlines()
-                        ):
-                            use_extract_in_process = (
-                                compiled_extract_regexes if not content_extractor else None
-                            )
-
-                            result = _process_chunk(
-                                subline,
-                                intro_value,
-                                to_json,
-                                effective_skip_markers,
-                                strip_chars,
-                                yield_raw_on_error,
-                                error_handler,
-                                compiled_skip_regexes,
-                                use_extract_in_process,
-                            )
-                            if result is None:
-                                continue
-                            if content_extractor:
-                                try:
-                                    final_content = content_extractor(result)
-                                    if final_content is not None:
-                                        if compiled_extract_regexes and isinstance(
-                                            final_content, str
-                                        ):
-                                            extracted = None
-                                            for regex in compiled_extract_regexes:
-                                                match = regex.search(final_content)
-                                                if match:
-                                                    if match.groups():
-                                                        extracted = (
-                                                            match.group(1)
-                                                            if len(match.groups()) == 1
-                                                            else str(match.groups())
-                                                        )
-                                                    else:
-                                                        extracted = match.group(0)
-                                                    break
-                                            if extracted is not None:
-                                                yield _apply_output_format(extracted)
-                                        else:
-                                            yield _apply_output_format(final_content)
-                                except Exception:
-                                    pass
-                            else:
-                                yield _apply_output_format(result)
-                    if not processing_active:
-                        found_start = False
-                    if idx == -1:
-                        break
-                elif found_start:
-                    # No end marker, process all buffered content
-                    chunk = buffer
-                    buffer = ""
-                    if chunk:
-                        for subline in (
-                            chunk.split(line_delimiter)
-                            if line_delimiter is not None
-                            else chunk.splitlines()
-                        ):
-                            use_extract_in_process = (
-                                compiled_extract_regexes if not content_extractor else None
-                            )
-
-                            result = _process_chunk(
-                                subline,
-                                intro_value,
-                                to_json,
-                                effective_skip_markers,
-                                strip_chars,
-                                yield_raw_on_error,
-                                error_handler,
-                                compiled_skip_regexes,
-                                use_extract_in_process,
-                            )
-                            if result is None:
-                                continue
-                            if content_extractor:
-                                try:
-                                    final_content = content_extractor(result)
-                                    if final_content is not None:
-                                        if compiled_extract_regexes and isinstance(
-                                            final_content, str
-                                        ):
-                                            extracted = None
-                                            for regex in compiled_extract_regexes:
-                                                match = regex.search(final_content)
-                                                if match:
-                                                    if match.groups():
-                                                        extracted = (
-                                                            match.group(1)
-                                                            if len(match.groups()) == 1
-                                                            else str(match.groups())
-                                                        )
-                                                    else:
-                                                        extracted = match.group(0)
-                                                    break
-                                            if extracted is not None:
-                                                yield _apply_output_format(extracted)
-                                        else:
-                                            yield _apply_output_format(final_content)
-                                except Exception:
-                                    pass
-                            else:
-                                yield _apply_output_format(result)
-                    break
-                else:
-                    break
-    except Exception as e:
-        print(f"Stream processing error: {e}", file=sys.stderr)
+    handle_record = _build_record_handler(
+        intro_value,
+        to_json,
+        skip_markers or [],
+        strip_chars,
+        yield_raw_on_error,
+        error_handler,
+        _compile_regexes(skip_regexes),
+        _compile_regexes(extract_regexes),
+        content_extractor,
+        output_formatter,
+    )
+    framer = _StreamFramer(
+        line_delimiter,
+        start_marker,
+        end_marker,
+        sse_events,
+        _json_record_check(intro_value) if to_json else None,
+        fragments,
+    )
+    yield from _run_framed_sync(data, framer, handle_record, encoding, encoding_errors, buffer_size)
 
 
 async def _sanitize_stream_async(
@@ -651,6 +860,8 @@ async def _sanitize_stream_async(
     extract_regexes: Optional[List[Union[str, re.Pattern[str]]]] = None,
     raw: bool = False,
     output_formatter: Optional[Callable[[Any], Any]] = None,
+    sse_events: bool = False,
+    fragments: bool = False,
 ) -> AsyncGenerator[Any, None]:
     """
     Asynchronously processes a stream of data (strings or bytes), applying transformations and filtering.
@@ -673,12 +884,14 @@ async def _sanitize_stream_async(
         encoding: Byte stream encoding.
         encoding_errors: How to handle encoding errors.
         buffer_size: Buffer size for byte decoding.
-        line_delimiter: Delimiter used to split incoming text into lines. ``None`` uses ``str.splitlines()``.
+        line_delimiter: Delimiter used to split incoming text into lines. ``None`` splits on ``\\n``, ``\\r\\n`` and ``\\r``.
         error_handler: Callback invoked with ``(Exception, str)`` when JSON parsing fails. If the callback returns a value, it is yielded in place of the raw line.
         skip_regexes: List of regex patterns (strings or compiled) for skipping lines that match.
         extract_regexes: List of regex patterns (strings or compiled) for extracting content using capturing groups.
         raw: If True, yields the raw response as returned by the API, chunk by chunk (no processing).
         output_formatter: Custom callable to format/transform each output item before yielding.
+        sse_events: If True, join multi-line SSE ``data:`` fields and process one record per event.
+        fragments: If True, input chunks are pieces of one stream and lines may span chunks.
     """
     # --- RAW MODE: yield each chunk exactly as returned by the API ---
     if raw:
@@ -725,6 +938,8 @@ async def _sanitize_stream_async(
             extract_regexes=extract_regexes,
             raw=raw,
             output_formatter=output_formatter,
+            sse_events=sse_events,
+            fragments=fragments,
         ):
             yield item
         return
@@ -750,199 +965,36 @@ async def _sanitize_stream_async(
             extract_regexes=extract_regexes,
             raw=raw,
             output_formatter=output_formatter,
+            sse_events=sse_events,
+            fragments=fragments,
         ):
             yield item
         return
 
-    # --- OUTPUT FORMATTING SETUP FOR ASYNC ---
-    def _apply_output_format(item: Any) -> Any:
-        """Apply output formatting to a processed item."""
-        if output_formatter is not None:
-            return output_formatter(item)
-        return item
-
-    # --- END OUTPUT FORMATTING SETUP ---
-
-    effective_skip_markers = skip_markers or []
-    # Compile regex patterns
-    compiled_skip_regexes = _compile_regexes(skip_regexes)
-    compiled_extract_regexes = _compile_regexes(extract_regexes)
-
-    processing_active = start_marker is None
-    buffer = ""
-    found_start = False if start_marker else True
-
-    iterator = data.__aiter__()
-    first_item = None
-    async for first_item in iterator:
-        break
-    if first_item is None:
-        return
-
-    async def _chain(first: Any, it: AsyncIterable[Any]) -> AsyncGenerator[Any, None]:
-        """Chain the first item with the rest of the async iterator."""
-        yield first
-        async for x in it:
-            yield x
-
-    stream: AsyncGenerator[Any, None] = _chain(first_item, iterator)
-
-    if isinstance(first_item, bytes):
-        line_iterator = _decode_byte_stream_async(
-            stream,
-            encoding=encoding,
-            errors=encoding_errors,
-            buffer_size=buffer_size,
-        )
-    elif isinstance(first_item, str):
-        line_iterator = stream
-    else:
-        raise TypeError(f"Stream must yield strings or bytes, not {type(first_item).__name__}")
-
-    try:
-        async for line in line_iterator:
-            if not line:
-                continue
-            buffer += line
-            while True:
-                # Look for start marker if needed
-                if not found_start and start_marker:
-                    idx = buffer.find(start_marker)
-                    if idx != -1:
-                        found_start = True
-                        buffer = buffer[idx + len(start_marker) :]
-                    else:
-                        # Not found, keep buffering
-                        buffer = buffer[-max(len(start_marker), 256) :]
-                        break
-                # Look for end marker if needed
-                if found_start and end_marker:
-                    idx = buffer.find(end_marker)
-                    if idx != -1:
-                        chunk = buffer[:idx]
-                        buffer = buffer[idx + len(end_marker) :]
-                        processing_active = False
-                    else:
-                        chunk = buffer
-                        buffer = ""
-                        processing_active = True
-                    # Process chunk if we are in active region
-                    if chunk and processing_active:
-                        for subline in (
-                            chunk.split(line_delimiter)
-                            if line_delimiter is not None
-                            else chunk.splitlines()
-                        ):
-                            use_extract_in_process = (
-                                compiled_extract_regexes if not content_extractor else None
-                            )
-
-                            result = _process_chunk(
-                                subline,
-                                intro_value,
-                                to_json,
-                                effective_skip_markers,
-                                strip_chars,
-                                yield_raw_on_error,
-                                error_handler,
-                                compiled_skip_regexes,
-                                use_extract_in_process,
-                            )
-                            if result is None:
-                                continue
-                            if content_extractor:
-                                try:
-                                    final_content = content_extractor(result)
-                                    if final_content is not None:
-                                        if compiled_extract_regexes and isinstance(
-                                            final_content, str
-                                        ):
-                                            extracted = None
-                                            for regex in compiled_extract_regexes:
-                                                match = regex.search(final_content)
-                                                if match:
-                                                    if match.groups():
-                                                        extracted = (
-                                                            match.group(1)
-                                                            if len(match.groups()) == 1
-                                                            else str(match.groups())
-                                                        )
-                                                    else:
-                                                        extracted = match.group(0)
-                                                    break
-                                            if extracted is not None:
-                                                yield _apply_output_format(extracted)
-                                        else:
-                                            yield _apply_output_format(final_content)
-                                except Exception:
-                                    pass
-                            else:
-                                yield _apply_output_format(result)
-                    if not processing_active:
-                        found_start = False
-                    if idx == -1:
-                        break
-                elif found_start:
-                    # No end marker, process all buffered content
-                    chunk = buffer
-                    buffer = ""
-                    if chunk:
-                        for subline in (
-                            chunk.split(line_delimiter)
-                            if line_delimiter is not None
-                            else chunk.splitlines()
-                        ):
-                            use_extract_in_process = (
-                                compiled_extract_regexes if not content_extractor else None
-                            )
-
-                            result = _process_chunk(
-                                subline,
-                                intro_value,
-                                to_json,
-                                effective_skip_markers,
-                                strip_chars,
-                                yield_raw_on_error,
-                                error_handler,
-                                compiled_skip_regexes,
-                                use_extract_in_process,
-                            )
-                            if result is None:
-                                continue
-                            if content_extractor:
-                                try:
-                                    final_content = content_extractor(result)
-                                    if final_content is not None:
-                                        # Apply extract_regexes to extracted content if provided
-                                        if compiled_extract_regexes and isinstance(
-                                            final_content, str
-                                        ):
-                                            extracted = None
-                                            for regex in compiled_extract_regexes:
-                                                match = regex.search(final_content)
-                                                if match:
-                                                    if match.groups():
-                                                        extracted = (
-                                                            match.group(1)
-                                                            if len(match.groups()) == 1
-                                                            else str(match.groups())
-                                                        )
-                                                    else:
-                                                        extracted = match.group(0)
-                                                    break
-                                            if extracted is not None:
-                                                yield _apply_output_format(extracted)
-                                        else:
-                                            yield _apply_output_format(final_content)
-                                except Exception:
-                                    pass
-                            else:
-                                yield _apply_output_format(result)
-                    break
-                else:
-                    break
-    except Exception as e:
-        print(f"Async stream processing error: {e}", file=sys.stderr)
+    handle_record = _build_record_handler(
+        intro_value,
+        to_json,
+        skip_markers or [],
+        strip_chars,
+        yield_raw_on_error,
+        error_handler,
+        _compile_regexes(skip_regexes),
+        _compile_regexes(extract_regexes),
+        content_extractor,
+        output_formatter,
+    )
+    framer = _StreamFramer(
+        line_delimiter,
+        start_marker,
+        end_marker,
+        sse_events,
+        _json_record_check(intro_value) if to_json else None,
+        fragments,
+    )
+    async for item in _run_framed_async(
+        data, framer, handle_record, encoding, encoding_errors, buffer_size
+    ):
+        yield item
 
 
 @overload
@@ -977,6 +1029,8 @@ def sanitize_stream(
     object_mode: Literal["as_is", "json", "str"] = "json",
     raw: bool = False,
     output_formatter: Optional[Callable[[Any], Any]] = None,
+    sse_events: bool = False,
+    fragments: bool = False,
 ) -> Generator[Any, None, None]: ...
 
 
@@ -1004,6 +1058,8 @@ def sanitize_stream(
     object_mode: Literal["as_is", "json", "str"] = "json",
     raw: bool = False,
     output_formatter: Optional[Callable[[Any], Any]] = None,
+    sse_events: bool = False,
+    fragments: bool = False,
 ) -> AsyncGenerator[Any, None]: ...
 
 
@@ -1027,6 +1083,8 @@ def sanitize_stream(
     object_mode: Literal["as_is", "json", "str"] = "json",
     raw: bool = False,
     output_formatter: Optional[Callable[[Any], Any]] = None,
+    sse_events: bool = False,
+    fragments: bool = False,
 ) -> Union[Generator[Any, None, None], AsyncGenerator[Any, None]]:
     """
     Processes streaming data (strings or bytes) in either synchronous or asynchronous mode.
@@ -1049,7 +1107,7 @@ def sanitize_stream(
         encoding_errors (str): How to handle encoding errors. Defaults to "replace".
         buffer_size (int): Buffer size for byte decoding. Defaults to 8192.
         line_delimiter (Optional[str]): Delimiter used to split incoming text into lines.
-            ``None`` uses ``str.splitlines()``. Defaults to None.
+            ``None`` splits on ``\\n``, ``\\r\\n`` and ``\\r``. Defaults to None.
         error_handler (Optional[Callable[[Exception, str], Optional[Any]]]):
             Callback invoked with ``(Exception, str)`` when JSON parsing fails.
             If the callback returns a value, it is yielded in place of the raw line. Defaults to None.
@@ -1063,6 +1121,12 @@ def sanitize_stream(
         output_formatter (Optional[Callable[[Any], Any]]): Custom callable to format/transform each output item
             before yielding. Use this to structure output into any desired format (e.g., OpenAI-like responses,
             custom dictionaries, etc.). The formatter receives the processed content and returns the formatted output.
+        sse_events (bool): If True, consecutive SSE ``data:`` lines are joined with ``\\n`` and
+            processed as one record per event (events end at a blank line). Defaults to False.
+        fragments (bool): If True, input chunks are arbitrary pieces of one stream, such as
+            ``iter_content()`` reads, so lines and JSON payloads may span several chunks.
+            Otherwise each chunk holds whole lines (as from ``iter_lines()``) and a chunk
+            without a line terminator is one record. Defaults to False.
 
     Returns:
         Union[Generator[Any, None, None], AsyncGenerator[Any, None]]:
@@ -1165,6 +1229,8 @@ def sanitize_stream(
             extract_regexes,
             raw,
             output_formatter,
+            sse_events,
+            fragments,
         )
 
     # Handle string directly
@@ -1188,6 +1254,8 @@ def sanitize_stream(
             extract_regexes,
             raw,
             output_formatter,
+            sse_events,
+            fragments,
         )
 
     # Handle dict, list, int, float, bool (non-iterable, non-string/bytes)
@@ -1218,6 +1286,8 @@ def sanitize_stream(
                 extract_regexes,
                 raw,
                 output_formatter,
+                sse_events,
+                fragments,
             )
         else:  # "json"
             try:
@@ -1243,6 +1313,8 @@ def sanitize_stream(
                 extract_regexes,
                 raw,
                 output_formatter,
+                sse_events,
+                fragments,
             )
 
     # Handle file-like objects (optional, treat as string if .read exists)
@@ -1270,6 +1342,8 @@ def sanitize_stream(
                 extract_regexes,
                 raw,
                 output_formatter,
+                sse_events,
+                fragments,
             )
         except Exception:
             pass  # fallback to next
@@ -1296,6 +1370,8 @@ def sanitize_stream(
             extract_regexes,
             raw,
             output_formatter,
+            sse_events,
+            fragments,
         )
     elif isinstance(content_attr, bytes):
         try:
@@ -1321,6 +1397,8 @@ def sanitize_stream(
             extract_regexes,
             raw,
             output_formatter,
+            sse_events,
+            fragments,
         )
 
     # Handle async iterables
@@ -1344,6 +1422,8 @@ def sanitize_stream(
             extract_regexes,
             raw,
             output_formatter,
+            sse_events,
+            fragments,
         )
     # Handle sync iterables (but not strings/bytes)
     if hasattr(data, "__iter__"):
@@ -1366,6 +1446,8 @@ def sanitize_stream(
             extract_regexes,
             raw,
             output_formatter,
+            sse_events,
+            fragments,
         )
     # Fallback: treat as string
     return _sanitize_stream_sync(
@@ -1387,9 +1469,139 @@ def sanitize_stream(
         extract_regexes,
         raw,
         output_formatter,
+        sse_events,
+        fragments,
     )
 
 
+# --- Compiled pipelines ---
+
+_SANITIZE_DEFAULTS: Dict[str, Any] = {
+    name: param.default
+    for name, param in inspect.signature(sanitize_stream).parameters.items()
+    if name != "data"
+}
+
+
+def _is_stream_source(data: Any) -> bool:
+    """Return True if ``sanitize_stream`` would frame ``data`` as a text/byte stream."""
+    if isinstance(data, (str, bytes)):
+        return True
+    if data is None or isinstance(data, (dict, list, int, float, bool)):
+        return False
+    if callable(getattr(data, "read", None)):
+        return False
+    if isinstance(getattr(data, "text", None), str):
+        return False
+    if isinstance(getattr(data, "content", None), bytes):
+        return False
+    return hasattr(data, "__aiter__") or hasattr(data, "__iter__")
+
+
+class SanitizerPipeline:
+    """
+    A ``sanitize_stream`` configuration compiled once and reusable across streams.
+
+    Created by :func:`compile_sanitizer`. Calling the pipeline returns the same
+    generator (or async generator) as ``sanitize_stream(data, **options)``, but
+    regexes, the skip-marker set and the specialized per-record function are
+    built only once.
+    """
+
+    __slots__ = ("options", "_handle_record", "_framing", "_decoding", "_raw")
+
+    def __init__(self, **options: Any) -> None:
+        self.options = options
+        settings = {**_SANITIZE_DEFAULTS, **options}
+        self._handle_record = _build_record_handler(
+            settings["intro_value"],
+            settings["to_json"],
+            settings["skip_markers"],
+            settings["strip_chars"],
+            settings["yield_raw_on_error"],
+            settings["error_handler"],
+            _compile_regexes(settings["skip_regexes"]),
+            _compile_regexes(settings["extract_regexes"]),
+            settings["content_extractor"],
+            settings["output_formatter"],
+        )
+        self._framing = (
+            settings["line_delimiter"],
+            settings["start_marker"],
+            settings["end_marker"],
+            settings["sse_events"],
+            _json_record_check(settings["intro_value"]) if settings["to_json"] else None,
+            settings["fragments"],
+        )
+        self._decoding = (
+            settings["encoding"],
+            settings["encoding_errors"],
+            settings["buffer_size"],
+        )
+        self._raw = settings["raw"]
+
+    def __call__(self, data: Any) -> Union[Generator[Any, None, None], AsyncGenerator[Any, None]]:
+        """Sanitize ``data`` with this pipeline's options."""
+        if self._raw or not _is_stream_source(data):
+            return sanitize_stream(data, **self.options)
+        if isinstance(data, bytes):
+            encoding, encoding_errors, _ = self._decoding
+            data = data.decode(encoding, encoding_errors)
+        framer = _StreamFramer(*self._framing)
+        if hasattr(data, "__aiter__"):
+            return _run_framed_async(data, framer, self._handle_record, *self._decoding)
+        return _run_framed_sync(data, framer, self._handle_record, *self._decoding)
+
+    def __repr__(self) -> str:
+        return f"SanitizerPipeline({', '.join(f'{k}={v!r}' for k, v in self.options.items())})"
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_sanitizer_cached(key: Tuple[Tuple[str, Any], ...]) -> SanitizerPipeline:
+    return SanitizerPipeline(**dict(key))
+
+
+def compile_sanitizer(**options: Any) -> SanitizerPipeline:
+    """
+    Compile ``sanitize_stream`` options into a reusable pipeline.
+
+    Accepts the same keyword arguments as ``sanitize_stream`` (except ``data``).
+    Pipelines are cached by their options, so calling this with the same
+    arguments returns the same pipeline. Pass module-level functions as
+    ``content_extractor``/``output_formatter``; a lambda created per call is a
+    new cache key every time.
+
+    Args:
+        **options: ``sanitize_stream`` keyword arguments.
+
+    Returns:
+        SanitizerPipeline: Callable as ``pipeline(stream)``.
+
+    Raises:
+        TypeError: If an unknown option is given.
+        ValueError: If any regex pattern is invalid.
+
+    Examples:
+        >>> _SSE_TEXT = compile_sanitizer(intro_value="data:", skip_markers=["[DONE]"])
+        >>> for chunk in _SSE_TEXT(response.iter_content(chunk_size=None)):
+        ...     print(chunk)
+    """
+    unknown = options.keys() - _SANITIZE_DEFAULTS.keys()
+    if unknown:
+        raise TypeError(
+            f"compile_sanitizer() got unexpected option(s): {', '.join(sorted(unknown))}"
+        )
+    frozen = {
+        name: tuple(value) if isinstance(value, list) else value for name, value in options.items()
+    }
+    key = tuple(sorted(frozen.items()))
+    try:
+        return _compile_sanitizer_cached(key)
+    except TypeError:
+        # Unhashable option value; compile without caching.
+        return SanitizerPipeline(**frozen)
+
+
 # --- Decorator version of sanitize_stream ---
 
 
@@ -1414,6 +1626,8 @@ def _sanitize_stream_decorator(
     object_mode: Literal["as_is", "json", "str"] = "json",
     raw: bool = False,
     output_formatter: Optional[Callable[[Any], Any]] = None,
+    sse_events: bool = False,
+    fragments: bool = False,
 ):
     """
     Decorator for sanitize_stream. Can be used as @sanitize_stream or @sanitize_stream(...).
@@ -1446,6 +1660,8 @@ def _sanitize_stream_decorator(
                     object_mode=object_mode,
                     raw=raw,
                     output_formatter=output_formatter,
+                    sse_events=sse_events,
+                    fragments=fragments,
                 )
 
             return async_wrapper
@@ -1474,6 +1690,8 @@ def _sanitize_stream_decorator(
                     object_mode=object_mode,
                     raw=raw,
                     output_formatter=output_formatter,
+                    sse_events=sse_events,
+                    fragments=fragments,
                 )
 
             return sync_wrapper
@@ -16,12 +16,7 @@ try:
 except ImportError:
     LitAgent: Any = None
 
-try:
-    from curl_cffi.requests import Session
-except ImportError:
-    from curl_cffi import requests
-
-    Session: Any = requests.Session
+from llm4free.http_session import shared_session
 
 from ..parsers import ParserRegistry
 from .scout import Scout
@@ -97,7 +92,7 @@ class ScoutCrawler:
         self.tags_to_remove = tags_to_remove if tags_to_remove is not None else ["script", "style"]
         self.visited_urls = set()
         self.crawled_pages = []
-        self.session = session or Session()
+        self.session = session or shared_session()
         # LitAgent may not be available in minimal installs - provide a safe fallback
         if LitAgent is not None:
             self.agent = LitAgent()
@@ -772,9 +772,9 @@ class Scout:
     def fetch_and_parse(self, url: str, session=None, **kwargs) -> "Scout":
         """Fetch HTML from a URL and parse it with Scout. Prefers curl_cffi."""
         try:
-            from curl_cffi import requests as curleq
+            from llm4free.http_session import shared_session
 
-            s = session or curleq.Session()
+            s = session or shared_session()
             resp = s.get(url, **kwargs)
             return Scout(resp.content, features=self.features)
         except ImportError:
@@ -3,9 +3,11 @@
 from .base import BaseSearch, BaseSearchEngine
 from .bing_main import BingSearch
 from .brave_main import BraveSearch
+from .cache import SearchCache, get_search_cache, set_search_cache
 from .duckduckgo_main import DuckDuckGoSearch
 
 # Import new search engines
+from .engines.meta import MetaSearch
 from .engines.mojeek import Mojeek
 from .engines.wikipedia import Wikipedia
 
@@ -16,6 +18,7 @@ from .results import (
     NewsResult,
     TextResult,
     VideosResult,
+    serialize_results,
 )
 from .yahoo_main import YahooSearch
 
@@ -29,12 +32,18 @@ __all__ = [
     "BingSearch",
     "YahooSearch",
     # Individual engines
+    "MetaSearch",
     "Mojeek",
     "Wikipedia",
+    # Result cache
+    "SearchCache",
+    "get_search_cache",
+    "set_search_cache",
     # Result models
     "TextResult",
     "ImagesResult",
     "VideosResult",
     "NewsResult",
     "BooksResult",
+    "serialize_results",
 ]
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import functools
+import inspect
 from abc import ABC, abstractmethod
 from collections.abc import Mapping
 from functools import cached_property
-from typing import Any, Generic, Literal, Optional, TypeVar
+from typing import Any, Callable, Generic, Literal, Optional, TypeVar
 
 from litprinter import ic
 
@@ -21,11 +23,57 @@ except ImportError:
     html: Any = None
     LHTMLParser: Any = None
 
+from .cache import cached_search
 from .http_client import HttpClient
 from .results import BooksResult, ImagesResult, NewsResult, TextResult, VideosResult
 
 T = TypeVar("T")
 
+SEARCH_TYPES = (
+    "text",
+    "images",
+    "videos",
+    "news",
+    "answers",
+    "suggestions",
+    "maps",
+    "translate",
+    "weather",
+)
+
+
+def _cached_method(
+    method: Callable[..., Any], engine: str | None = None, type_name: str | None = None
+) -> Callable[..., Any]:
+    """
+    Route calls of a search method through ``cached_search``, keyed by its bound
+    arguments. Without ``engine``/``type_name`` the instance's ``name`` and
+    ``category`` are used.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        try:
+            bound = signature.bind(self, *args, **kwargs)
+        except TypeError:
+            return method(self, *args, **kwargs)
+        bound.apply_defaults()
+        params = dict(bound.arguments)
+        for name, parameter in signature.parameters.items():
+            if parameter.kind is parameter.VAR_KEYWORD:
+                params.update(params.pop(name, None) or {})
+            elif parameter.kind is parameter.VAR_POSITIONAL:
+                params[name] = list(params.get(name, ()))
+        return cached_search(
+            engine or self.name,
+            type_name or self.category,
+            params,
+            lambda: method(self, *args, **kwargs),
+        )
+
+    return wrapper
+
 
 class BaseSearchEngine(ABC, Generic[T]):
     """Abstract base class for all search engine backends."""
@@ -45,6 +93,13 @@ class BaseSearchEngine(ABC, Generic[T]):
     elements_xpath: Mapping[str, str] = {}
     elements_replace: Mapping[str, str] = {}
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Engines that override search() go through the search cache as well.
+        search = cls.__dict__.get("search")
+        if callable(search):
+            cls.search = _cached_method(search)  # type: ignore[method-assign]
+
     def __init__(self, proxy: str | None = None, timeout: int | None = None, verify: bool = True):
         """Initialize search engine.
 
@@ -199,8 +254,22 @@ class BaseSearchEngine(ABC, Generic[T]):
 
 
 # Legacy base class for backwards compatibility
+BaseSearchEngine.search = _cached_method(BaseSearchEngine.search)  # type: ignore[method-assign]
+
+
 class BaseSearch(ABC):
-    """Base class for synchronous search engines (legacy)."""
+    """Base class for synchronous search engines (legacy).
+
+    The search methods of subclasses go through the installed search cache,
+    keyed by the subclass name, the method name and the call arguments.
+    """
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for type_name in SEARCH_TYPES:
+            method = cls.__dict__.get(type_name)
+            if callable(method):
+                setattr(cls, type_name, _cached_method(method, cls.__name__, type_name))
 
     @abstractmethod
     def text(self, *args, **kwargs) -> list[Any]:
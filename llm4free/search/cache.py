@@ -0,0 +1,357 @@
+"""
+Search result cache.
+
+Search engines rate-limit aggressively (``RatelimitE``) and popular queries are
+repeated often. ``SearchCache`` keeps results under a hash of ``(engine, type,
+query, region, safesearch, timelimit, page, ...)``, with a time-to-live per
+search type: suggestions change slowly, news quickly.
+
+Entries live in an in-memory LRU and, when ``path`` is given, in a SQLite file
+that can be shared by several worker processes. An entry older than its TTL is
+stale: for another ``stale_while_revalidate`` seconds it is still returned
+while one background refresh fetches the new results. If the refresh fails
+(for example on a rate limit) the stale entry keeps being served until it
+expires.
+
+The cache is opt-in. Install one with ``set_search_cache``; it is then used by
+``BaseSearchEngine.search``, the ``BaseSearch`` interfaces (``DuckDuckGoSearch``,
+``BraveSearch``, ...) and the API server's ``/search`` route. Empty results are
+not cached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar, Union
+
+from litprinter import ic
+
+from ..utils import json_dumpb, json_loadb
+
+T = TypeVar("T")
+
+# Seconds results are fresh, per search type.
+DEFAULT_TTLS: dict[str, float] = {
+    "text": 3600.0,
+    "images": 6 * 3600.0,
+    "videos": 6 * 3600.0,
+    "news": 300.0,
+    "suggestions": 86400.0,
+    "answers": 86400.0,
+    "maps": 86400.0,
+    "translate": 86400.0,
+    "weather": 900.0,
+    "books": 86400.0,
+}
+# Seconds results of a type missing from the TTL table are fresh.
+DEFAULT_TTL = 3600.0
+# Seconds past its TTL a stale entry is served while it is refreshed.
+DEFAULT_STALE_WHILE_REVALIDATE = 600.0
+# Entries kept in memory when SearchCache(max_entries=...) is not given.
+DEFAULT_MAX_ENTRIES = 2048
+# Size of the SQLite tier before least recently used entries are evicted.
+DEFAULT_MAX_DISK_BYTES = 64 * 1024 * 1024
+
+# Call arguments that do not change the results.
+_IGNORED_PARAMS = frozenset({"self", "headers", "cookies", "timeout", "proxy", "proxies"})
+# Argument names engines use for the query text.
+_QUERY_PARAMS = frozenset({"query", "keywords", "q", "location"})
+
+
+def search_key(engine: str, type: str, params: Mapping[str, Any]) -> str:
+    """SHA-256 of a search: engine, type and the arguments that select results."""
+    canonical: dict[str, Any] = {}
+    for name, value in params.items():
+        if name in _IGNORED_PARAMS or value is None:
+            continue
+        if name in _QUERY_PARAMS and isinstance(value, str):
+            value = " ".join(value.split())
+        canonical[name] = value
+    data = json.dumps([engine, type, canonical], sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _encode(value: Any) -> Any:
+    """Results as JSON data; result dataclasses are tagged with their class."""
+    if is_dataclass(value) and not isinstance(value, type):
+        cls = type(value)
+        return {
+            "__dataclass__": f"{cls.__module__}:{cls.__qualname__}",
+            "fields": {field.name: _encode(getattr(value, field.name)) for field in fields(value)},
+        }
+    if isinstance(value, Mapping):
+        return {str(key): _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    return value
+
+
+def _dataclass(name: str) -> Any:
+    module_name, _, qualname = name.partition(":")
+    # Only rebuild result classes defined by this package.
+    if not module_name.startswith("llm4free."):
+        raise ValueError(f"Refusing to load cached result class {name!r}")
+    cls: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        cls = getattr(cls, part)
+    if not is_dataclass(cls):
+        raise ValueError(f"Cached result class {name!r} is not a dataclass")
+    return cls
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, dict):
+        name = value.get("__dataclass__")
+        if name is not None:
+            data = {key: _decode(item) for key, item in value["fields"].items()}
+            return _dataclass(name)(**data)
+        return {key: _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+class SearchCache:
+    """
+    Two-tier cache of search results with per-type TTLs and stale-while-revalidate.
+
+    Args:
+        max_entries: Results kept in the in-memory LRU.
+        ttls: Seconds results are fresh, by search type; merged over
+            ``DEFAULT_TTLS``.
+        default_ttl: Seconds results of other types are fresh.
+        stale_while_revalidate: Seconds past its TTL an entry is still served
+            while a background refresh runs.
+        path: SQLite file for the shared persistent tier. ``None`` keeps the
+            cache in memory only.
+        max_disk_bytes: Size of the persistent tier before its least recently
+            used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: float = DEFAULT_TTL,
+        stale_while_revalidate: float = DEFAULT_STALE_WHILE_REVALIDATE,
+        path: Optional[Union[str, Path]] = None,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.path = path
+        self._memory: OrderedDict[str, tuple[float, float, bytes]] = OrderedDict()
+        self._disk: Any = None
+        if path:
+            from ..response_cache import _SQLiteTier
+
+            self._disk = _SQLiteTier(path, max_disk_bytes)
+        self._lock = threading.Lock()
+        self._refreshing: set[str] = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._counters = dict.fromkeys(
+            (
+                "hits",
+                "stale_hits",
+                "misses",
+                "stores",
+                "refreshes",
+                "refresh_errors",
+                "evictions",
+            ),
+            0,
+        )
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+    def ttl_for(self, type: str) -> float:
+        """Seconds results of ``type`` are fresh."""
+        return self.ttls.get(type, self.default_ttl)
+
+    def get(self, key: str) -> Optional[tuple[Any, bool]]:
+        """``(results, fresh)`` stored under ``key``, or None if there is no live entry."""
+        now = time.time()
+        entry = None
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                if cached[1] > now:
+                    self._memory.move_to_end(key)
+                    entry = cached
+                else:
+                    del self._memory[key]
+        if entry is None and self._disk is not None:
+            value = self._disk.get(key, now)
+            if value is not None:
+                record = json_loadb(value)
+                entry = (record["fresh_until"], record["expires"], value)
+                self._remember(key, entry)
+        if entry is None:
+            return None
+        return _decode(json_loadb(entry[2])["results"]), entry[0] > now
+
+    def _remember(self, key: str, entry: tuple[float, float, bytes]) -> None:
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def set(self, key: str, type: str, results: Any) -> bool:
+        """Store results; returns False for empty or unserializable ones, which are not cached."""
+        if not results:
+            return False
+        now = time.time()
+        fresh_until = now + self.ttl_for(type)
+        expires = fresh_until + self.stale_while_revalidate
+        try:
+            record = {"fresh_until": fresh_until, "expires": expires, "results": _encode(results)}
+            value = json_dumpb(record)
+        except (TypeError, ValueError):
+            return False
+        self._remember(key, (fresh_until, expires, value))
+        if self._disk is not None:
+            self._count("evictions", self._disk.set(key, value, expires, now))
+        self._count("stores")
+        return True
+
+    def fetch(
+        self,
+        engine: str,
+        type: str,
+        params: Mapping[str, Any],
+        fetch: Callable[[], T],
+    ) -> T:
+        """
+        Results for a search: from the cache when there is a live entry,
+        otherwise from ``fetch()`` (then stored). A stale entry is returned
+        at once and refreshed in the background.
+        """
+        if _local.depth:
+            # An outer cached call (e.g. DuckDuckGoSearch.text) already covers this one.
+            return fetch()
+        key = search_key(engine, type, params)
+        try:
+            cached = self.get(key)
+        except Exception as ex:
+            ic.configureOutput(prefix="WARNING| ")
+            ic(f"Ignoring unreadable search cache entry: {ex}")
+            cached = None
+        if cached is not None:
+            results, fresh = cached
+            if fresh:
+                self._count("hits")
+            else:
+                self._count("stale_hits")
+                self._refresh(key, type, fetch)
+            return results
+        self._count("misses")
+        results = _run_uncached(fetch)
+        self.set(key, type, results)
+        return results
+
+    def _refresh(self, key: str, type: str, fetch: Callable[[], Any]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="llm4free-search-cache"
+                )
+            executor = self._executor
+
+        def refresh() -> None:
+            try:
+                self.set(key, type, _run_uncached(fetch))
+                self._count("refreshes")
+            except Exception as ex:
+                # Keep serving the stale entry (e.g. while rate limited).
+                self._count("refresh_errors")
+                ic.configureOutput(prefix="WARNING| ")
+                ic(f"Search cache refresh failed: {ex}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        executor.submit(refresh)
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    def close(self) -> None:
+        """Stop background refreshes and close the persistent tier."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters, entry counts and the hit rate of lookups."""
+        with self._lock:
+            stats: dict[str, Any] = dict(self._counters)
+            stats["memory_entries"] = len(self._memory)
+        if self._disk is not None:
+            stats["disk_entries"] = len(self._disk)
+            stats["disk_bytes"] = self._disk.size()
+        hits = stats["hits"] + stats["stale_hits"]
+        lookups = hits + stats["misses"]
+        stats["hit_rate"] = round(hits / lookups, 4) if lookups else 0.0
+        return stats
+
+
+class _Local(threading.local):
+    depth = 0
+
+
+_local = _Local()
+
+
+def _run_uncached(fetch: Callable[[], T]) -> T:
+    _local.depth += 1
+    try:
+        return fetch()
+    finally:
+        _local.depth -= 1
+
+
+_cache: Optional[SearchCache] = None
+
+
+def get_search_cache() -> Optional[SearchCache]:
+    """The installed search cache, or None."""
+    return _cache
+
+
+def set_search_cache(cache: Optional[SearchCache]) -> None:
+    """Install ``cache`` for every search engine in this process (None removes it)."""
+    global _cache
+    _cache = cache
+
+
+def cached_search(engine: str, type: str, params: Mapping[str, Any], fetch: Callable[[], T]) -> T:
+    """``fetch()`` through the installed search cache, if there is one."""
+    cache = _cache
+    if cache is None:
+        return fetch()
+    return cache.fetch(engine, type, params, fetch)
@@ -24,6 +24,7 @@ from .duckduckgo import (
     DuckDuckGoVideos,
     DuckDuckGoWeather,
 )
+from .meta import MetaImages, MetaNews, MetaSearch, MetaVideos
 from .mojeek import Mojeek
 from .wikipedia import Wikipedia
 from .yahoo import (
@@ -43,23 +44,27 @@ ENGINES = {
         "bing": BingTextSearch,
         "duckduckgo": DuckDuckGoTextSearch,
         "yahoo": YahooText,
+        "meta": MetaSearch,
     },
     "images": {
         "bing": BingImagesSearch,
         "brave": BraveImages,
         "duckduckgo": DuckDuckGoImages,
         "yahoo": YahooImages,
+        "meta": MetaImages,
     },
     "videos": {
         "brave": BraveVideos,
         "duckduckgo": DuckDuckGoVideos,
         "yahoo": YahooVideos,
+        "meta": MetaVideos,
     },
     "news": {
         "brave": BraveNews,
         "bing": BingNewsSearch,
         "duckduckgo": DuckDuckGoNews,
         "yahoo": YahooNews,
+        "meta": MetaNews,
     },
     "suggestions": {
         "brave": BraveSuggestions,
@@ -88,6 +93,10 @@ __all__ = [
     "BraveVideos",
     "BraveNews",
     "BraveSuggestions",
+    "MetaSearch",
+    "MetaImages",
+    "MetaVideos",
+    "MetaNews",
     "Mojeek",
     "Wikipedia",
     "BingBase",
@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-from curl_cffi.requests import Session
-
+from llm4free.http_session import shared_session
 from llm4free.litagent import LitAgent
 
 
@@ -25,12 +24,10 @@ class BingBase:
         self.lang = lang
         self.sleep_interval = sleep_interval
         self.base_url = "https://www.bing.com"
-        from typing import Any, Optional, cast
-
-        self.session = Session(
-            proxies=cast(Any, proxies),
-            verify=verify,
+        self.session = shared_session(
+            impersonate,
+            proxies,
+            verify,
+            headers=LitAgent().generate_fingerprint(),
             timeout=timeout,
-            impersonate=cast(Any, impersonate),
         )
-        self.session.headers.update(LitAgent().generate_fingerprint())
@@ -2,10 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, cast
-
-from curl_cffi.requests import Session
-
+from llm4free.http_session import shared_session
 from llm4free.litagent import LitAgent
 
 
@@ -38,10 +35,10 @@ class BraveBase:
         self.sleep_interval = sleep_interval
         self.base_url = "https://search.brave.com"
 
-        self.session = Session(
-            proxies=cast(Any, proxies),
-            verify=verify,
+        self.session = shared_session(
+            impersonate,
+            proxies,
+            verify,
+            headers=LitAgent().generate_fingerprint(),
             timeout=timeout,
-            impersonate=cast(Any, impersonate),
         )
-        self.session.headers.update(LitAgent().generate_fingerprint())
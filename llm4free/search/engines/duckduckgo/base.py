@@ -10,8 +10,6 @@ from random import choice
 from time import sleep, time
 from typing import Any, Optional, cast
 
-import curl_cffi.requests
-
 try:
     from lxml.html import HTMLParser as LHTMLParser
     from lxml.html import document_fromstring
@@ -22,6 +20,7 @@ except ImportError:
     LHTMLParser = None  # type: ignore
     document_fromstring = None  # type: ignore
 
+from llm4free.http_session import shared_session
 from llm4free.litagent import LitAgent
 
 from ....exceptions import LLM4FreeE, RatelimitE, TimeoutE
@@ -102,12 +101,8 @@ class DuckDuckGoBase:
         self.headers.update(default_headers)
 
         impersonate_browser = choice(self._impersonates)
-        self.client = curl_cffi.requests.Session(
-            headers=self.headers,
-            proxies={"http": self.proxy, "https": self.proxy} if self.proxy else None,
-            timeout=timeout,  # ty:ignore[invalid-argument-type]
-            impersonate=impersonate_browser,  # ty:ignore[invalid-argument-type]
-            verify=verify,
+        self.client = shared_session(
+            impersonate_browser, self.proxy, verify, headers=self.headers, timeout=timeout
         )
         self.timeout = timeout
         self.sleep_timestamp = 0.0
@@ -0,0 +1,207 @@
+"""Metasearch: query several engines at once and merge their results."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from litprinter import ic
+
+from ...exceptions import LLM4FreeE, TimeoutE
+from ...provider_pool import ProviderPool
+from ...utils import _normalize_url
+
+# Seconds a metasearch waits for its engines before returning what it has.
+DEFAULT_DEADLINE = 5.0
+# Reciprocal-rank fusion constant: larger values flatten the rank weighting.
+RRF_K = 60
+
+
+def normalize_result_url(url: str) -> str:
+    """
+    Dedup key for a result URL.
+
+    The scheme, a leading ``www.``, the fragment and a trailing slash are
+    dropped, the host is lowercased and query parameters are sorted, so
+    ``https://www.Example.com/a/?y=2&x=1`` and ``http://example.com/a?x=1&y=2``
+    share a key.
+    """
+    parts = urlsplit(_normalize_url(url).strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    key = host + (parts.path.rstrip("/") or "")
+    return f"{key}?{query}" if query else key
+
+
+def _field(result: Any, name: str) -> Any:
+    if isinstance(result, dict):
+        return result.get(name)
+    return getattr(result, name, None)
+
+
+def _result_key(result: Any) -> Optional[str]:
+    for name in ("href", "url", "content"):
+        url = _field(result, name)
+        if url:
+            return normalize_result_url(url)
+    title = _field(result, "title")
+    return f"title:{title.strip().lower()}" if title else None
+
+
+def fuse_results(rankings: Sequence[Sequence[Any]], k: int = RRF_K) -> list[Any]:
+    """
+    Merge ranked result lists with reciprocal-rank fusion.
+
+    Each result scores ``1 / (k + rank)`` for every list it appears in (ranks
+    start at 1); results with the same normalized URL are merged into the
+    first one seen at the best rank. Results are returned by descending score.
+    """
+    scores: dict[str, float] = {}
+    best: dict[str, tuple[int, int, Any]] = {}
+    for position, ranking in enumerate(rankings):
+        for rank, result in enumerate(ranking, start=1):
+            key = _result_key(result)
+            if key is None:
+                continue
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+            if key not in best or (rank, position) < best[key][:2]:
+                best[key] = (rank, position, result)
+    order = sorted(scores, key=lambda key: (-scores[key], best[key][:2]))
+    return [best[key][2] for key in order]
+
+
+class MetaSearch:
+    """
+    Text search across several engines, merged with reciprocal-rank fusion.
+
+    Every engine is queried in parallel. ``run`` returns once ``quorum``
+    engines have answered or ``deadline`` seconds have passed, whichever comes
+    first, so latency is set by the fastest engines rather than the slowest.
+    Engines that miss the deadline keep running in the background and their
+    results are dropped; engines that fail are skipped.
+
+    Args:
+        engines: Engine names from ``ENGINES[category]``; all of them by default.
+        deadline: Seconds to wait for the engines.
+        quorum: Engines that must answer before returning early; a majority of
+            ``engines`` by default.
+        k: Reciprocal-rank fusion constant.
+    """
+
+    name = "meta"
+    category = "text"
+    provider = "meta"
+
+    _executor: ThreadPoolExecutor = ThreadPoolExecutor(thread_name_prefix="llm4free-meta")
+    # Engine instances are not thread-safe, so each query borrows one.
+    _engines: ProviderPool[Any] = ProviderPool(max_size=16)
+
+    def __init__(
+        self,
+        engines: Optional[Sequence[str]] = None,
+        deadline: float = DEFAULT_DEADLINE,
+        quorum: Optional[int] = None,
+        k: int = RRF_K,
+    ) -> None:
+        from . import ENGINES
+
+        available = {
+            name: engine_cls
+            for name, engine_cls in ENGINES.get(self.category, {}).items()
+            if not issubclass(engine_cls, MetaSearch)
+        }
+        names = list(engines) if engines else list(available)
+        unknown = [name for name in names if name not in available]
+        if unknown or not names:
+            raise ValueError(
+                f"Unknown {self.category} engines {unknown}; use any of {sorted(available)}"
+            )
+        self.engines = {name: available[name] for name in names}
+        self.deadline = deadline
+        self.quorum = min(quorum or len(names) // 2 + 1, len(names))
+        self.k = k
+        self.last_status: dict[str, str] = {}
+
+    def _query(self, name: str, **kwargs: Any) -> list[Any]:
+        key = f"{self.category}:{name}"
+        with self._engines.borrow(key, self.engines[name], timeout=self.deadline) as engine:
+            return list(engine.run(**kwargs) or [])
+
+    def run(self, *args: Any, **kwargs: Any) -> list[Any]:
+        """Run a metasearch.
+
+        Args:
+            keywords: Search query.
+            region: Region code.
+            safesearch: Safe search level.
+            max_results: Maximum number of merged results.
+
+        Returns:
+            Merged results, best first.
+        """
+        keywords = args[0] if args else kwargs.get("keywords")
+        region = args[1] if len(args) > 1 else kwargs.get("region", "us-en")
+        safesearch = args[2] if len(args) > 2 else kwargs.get("safesearch", "moderate")
+        max_results = args[3] if len(args) > 3 else kwargs.get("max_results")
+        assert keywords, "keywords is mandatory"
+
+        params = {"keywords": keywords, "region": region, "safesearch": safesearch}
+        if max_results:
+            params["max_results"] = max_results
+        futures: dict[Future[list[Any]], str] = {
+            self._executor.submit(self._query, name, **params): name for name in self.engines
+        }
+        rankings: dict[str, list[Any]] = {}
+        status = {name: "timeout" for name in self.engines}
+        errors = []
+        pending = set(futures)
+        stop_at = time.monotonic() + self.deadline
+        while pending and len(rankings) < self.quorum:
+            remaining = stop_at - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = futures[future]
+                try:
+                    rankings[name] = future.result()
+                    status[name] = "ok"
+                except Exception as ex:
+                    status[name] = "error"
+                    errors.append(f"{name}: {ex}")
+                    ic.configureOutput(prefix="WARNING| ")
+                    ic(f"Metasearch engine {name} failed: {ex}")
+        self.last_status = status
+
+        if not rankings:
+            if pending:
+                raise TimeoutE(f"No search engine answered within {self.deadline}s")
+            raise LLM4FreeE(f"All search engines failed: {'; '.join(errors)}")
+        # Merge in the configured engine order so ties are stable.
+        merged = fuse_results(
+            [rankings[name] for name in self.engines if name in rankings], k=self.k
+        )
+        return merged[:max_results] if max_results else merged
+
+
+class MetaImages(MetaSearch):
+    """Images search across several engines."""
+
+    category = "images"
+
+
+class MetaVideos(MetaSearch):
+    """Videos search across several engines."""
+
+    category = "videos"
+
+
+class MetaNews(MetaSearch):
+    """News search across several engines."""
+
+    category = "news"
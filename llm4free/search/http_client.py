@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from random import choice
-from typing import Any, Literal, Optional, cast
+from typing import Any, Literal, Optional
 
 import curl_cffi.requests
 
 from ..exceptions import LLM4FreeE, RatelimitE, TimeoutE
+from ..http_session import shared_session
 
 
 class HttpClient:
@@ -64,13 +65,10 @@ class HttpClient:
         # Choose random browser to impersonate
         impersonate_browser = choice(self._impersonates)
 
-        # Initialize curl_cffi session
-        self.client = curl_cffi.requests.Session(
-            headers=headers or {},
-            proxies={"http": self.proxy, "https": self.proxy} if self.proxy else None,
-            timeout=cast(Any, timeout),
-            impersonate=impersonate_browser,  # ty:ignore[invalid-argument-type]
-            verify=verify,
+        # Requests go through the process-wide session for this browser/proxy,
+        # reusing its connections; headers and cookies stay per client.
+        self.client = shared_session(
+            impersonate_browser, self.proxy, verify, headers=headers, timeout=timeout
         )
 
     def request(
@@ -154,9 +152,8 @@ class HttpClient:
         self.client.cookies.update(cookies)
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        if hasattr(self.client, "close"):
-            self.client.close()
+        """Close the HTTP client. The shared session it uses stays open."""
+        self.client.close()
 
     def __enter__(self) -> HttpClient:
         """Context manager entry."""
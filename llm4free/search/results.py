@@ -156,3 +156,25 @@ class BooksResult:
             "filesize": self.filesize,
             "extension": self.extension,
         }
+
+
+def serialize_result(result: Any) -> Any:
+    """JSON-ready form of one result: ``to_dict()`` for result models, else unchanged."""
+    to_dict = getattr(result, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
+    if hasattr(result, "__dict__"):
+        return dict(vars(result))
+    return result
+
+
+def serialize_results(results: Any) -> Any:
+    """
+    Convert an engine's results to plain JSON data.
+
+    Lists are converted item by item with ``serialize_result``; dicts, strings
+    and other values are returned unchanged.
+    """
+    if isinstance(results, list):
+        return [serialize_result(result) for result in results]
+    return serialize_result(results)
@@ -7,6 +7,8 @@ from typing import Any, Dict, List, Optional
 
 from litprinter import ic
 
+from llm4free.provider_manifest import ProviderRegistry
+
 # Configuration constants
 DEFAULT_PORT = 8000
 DEFAULT_HOST = "0.0.0.0"
@@ -30,6 +32,86 @@ class ServerConfig:
         self.request_logging_enabled: bool = (
             os.getenv("LLM4FREE_REQUEST_LOGGING", "true").lower() == "true"
         )  # Enable request logging by default
+        self.request_log_sinks: str = os.getenv(
+            "LLM4FREE_REQUEST_LOG_SINKS", "stdout"
+        )  # Comma-separated request log sinks: stdout, jsonl, sqlite
+        self.request_log_path: str = os.getenv(
+            "LLM4FREE_REQUEST_LOG_PATH", "request-log.jsonl"
+        )  # File of the jsonl sink
+        self.request_log_max_bytes: int = int(
+            os.getenv("LLM4FREE_REQUEST_LOG_MAX_BYTES", str(50 * 1024 * 1024))
+        )  # Size at which the jsonl file is rotated
+        self.request_log_backups: int = int(
+            os.getenv("LLM4FREE_REQUEST_LOG_BACKUPS", "5")
+        )  # Rotated jsonl files kept
+        self.request_log_db: str = os.getenv(
+            "LLM4FREE_REQUEST_LOG_DB", "request-log.db"
+        )  # SQLite file of the sqlite sink
+        self.request_log_buffer: int = int(
+            os.getenv("LLM4FREE_REQUEST_LOG_BUFFER", "10000")
+        )  # Records queued before the oldest are dropped
+        self.request_log_sample_rate: float = float(
+            os.getenv("LLM4FREE_REQUEST_LOG_SAMPLE_RATE", "1.0")
+        )  # Fraction of successful requests logged; errors always are
+        self.request_log_max_chars: int = int(
+            os.getenv("LLM4FREE_REQUEST_LOG_MAX_CHARS", "4096")
+        )  # Characters of each question and answer kept
+        self.provider_max_workers: int = int(os.getenv("LLM4FREE_PROVIDER_MAX_WORKERS", "256"))
+        self.provider_concurrency_limit: int = int(
+            os.getenv("LLM4FREE_PROVIDER_CONCURRENCY", "64")
+        )  # Max in-flight calls per provider class
+        self.stream_queue_size: int = int(os.getenv("LLM4FREE_STREAM_QUEUE_SIZE", "64"))
+        self.provider_pool_size: int = int(
+            os.getenv("LLM4FREE_PROVIDER_POOL_SIZE", "16")
+        )  # Provider instances per provider class
+        self.provider_pool_idle_ttl: float = float(
+            os.getenv("LLM4FREE_PROVIDER_POOL_IDLE_TTL", "300")
+        )  # Seconds before an idle provider instance is closed
+        self.provider_pool_timeout: float = float(
+            os.getenv("LLM4FREE_PROVIDER_POOL_TIMEOUT", "30")
+        )  # Seconds a request waits for a free provider instance
+        self.response_cache_enabled: bool = (
+            os.getenv("LLM4FREE_RESPONSE_CACHE", "false").lower() == "true"
+        )  # Cache deterministic (temperature 0) chat completions
+        self.response_cache_size: int = int(
+            os.getenv("LLM4FREE_RESPONSE_CACHE_SIZE", "1024")
+        )  # Completions kept in memory
+        self.response_cache_ttl: float = float(
+            os.getenv("LLM4FREE_RESPONSE_CACHE_TTL", "3600")
+        )  # Seconds a cached completion is served
+        self.response_cache_path: Optional[str] = (
+            os.getenv("LLM4FREE_RESPONSE_CACHE_PATH") or None
+        )  # SQLite file for a persistent cache tier
+        self.response_cache_max_bytes: int = int(
+            os.getenv("LLM4FREE_RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+        )  # Size of the persistent tier before LRU eviction
+        self.search_cache_enabled: bool = (
+            os.getenv("LLM4FREE_SEARCH_CACHE", "false").lower() == "true"
+        )  # Cache /search results (TTL per search type)
+        self.search_cache_size: int = int(
+            os.getenv("LLM4FREE_SEARCH_CACHE_SIZE", "2048")
+        )  # Search results kept in memory
+        self.search_cache_stale: float = float(
+            os.getenv("LLM4FREE_SEARCH_CACHE_STALE", "600")
+        )  # Seconds stale results are served while they are refreshed
+        self.search_cache_path: Optional[str] = (
+            os.getenv("LLM4FREE_SEARCH_CACHE_PATH") or None
+        )  # SQLite file shared by worker processes
+        self.coalesce_requests: bool = (
+            os.getenv("LLM4FREE_COALESCE_REQUESTS", "true").lower() == "true"
+        )  # Share one upstream call between identical in-flight requests
+        self.stream_coalesce_ms: float = float(
+            os.getenv("LLM4FREE_STREAM_COALESCE_MS", "0")
+        )  # Merge streamed content deltas arriving within this window (0 disables)
+        self.stream_coalesce_chars: int = int(
+            os.getenv("LLM4FREE_STREAM_COALESCE_CHARS", "1024")
+        )  # Flush a merged delta once it holds this many characters
+        self.metrics_dir: Optional[str] = (
+            os.getenv("LLM4FREE_METRICS_DIR") or None
+        )  # Directory where worker processes share their /metrics snapshots
+        self.metrics_interval: float = float(
+            os.getenv("LLM4FREE_METRICS_INTERVAL", "5")
+        )  # Seconds between metrics snapshots written to the directory
 
     def update(self, **kwargs) -> None:
         """Update configuration with provided values."""
@@ -55,9 +137,10 @@ class ServerConfig:
 class AppConfig:
     """Legacy configuration class for backward compatibility."""
 
-    provider_map = {}
-    tti_provider_map = {}  # Add TTI provider map
-    tts_provider_map = {}  # Add TTS provider map
+    # Lazy registries: provider classes are imported on first lookup
+    provider_map = ProviderRegistry()
+    tti_provider_map = ProviderRegistry()  # Add TTI provider map
+    tts_provider_map = ProviderRegistry()  # Add TTS provider map
     default_provider = "ChatGPT"
     default_tti_provider = "PollinationsAI"  # Add default TTI provider
     default_tts_provider = "ElevenLabs"  # Add default TTS provider
@@ -67,6 +150,86 @@ class AppConfig:
     request_logging_enabled: bool = (
         os.getenv("LLM4FREE_REQUEST_LOGGING", "true").lower() == "true"
     )  # Enable request logging by default
+    request_log_sinks: str = os.getenv(
+        "LLM4FREE_REQUEST_LOG_SINKS", "stdout"
+    )  # Comma-separated request log sinks: stdout, jsonl, sqlite
+    request_log_path: str = os.getenv(
+        "LLM4FREE_REQUEST_LOG_PATH", "request-log.jsonl"
+    )  # File of the jsonl sink
+    request_log_max_bytes: int = int(
+        os.getenv("LLM4FREE_REQUEST_LOG_MAX_BYTES", str(50 * 1024 * 1024))
+    )  # Size at which the jsonl file is rotated
+    request_log_backups: int = int(
+        os.getenv("LLM4FREE_REQUEST_LOG_BACKUPS", "5")
+    )  # Rotated jsonl files kept
+    request_log_db: str = os.getenv(
+        "LLM4FREE_REQUEST_LOG_DB", "request-log.db"
+    )  # SQLite file of the sqlite sink
+    request_log_buffer: int = int(
+        os.getenv("LLM4FREE_REQUEST_LOG_BUFFER", "10000")
+    )  # Records queued before the oldest are dropped
+    request_log_sample_rate: float = float(
+        os.getenv("LLM4FREE_REQUEST_LOG_SAMPLE_RATE", "1.0")
+    )  # Fraction of successful requests logged; errors always are
+    request_log_max_chars: int = int(
+        os.getenv("LLM4FREE_REQUEST_LOG_MAX_CHARS", "4096")
+    )  # Characters of each question and answer kept
+    provider_max_workers: int = int(os.getenv("LLM4FREE_PROVIDER_MAX_WORKERS", "256"))
+    provider_concurrency_limit: int = int(
+        os.getenv("LLM4FREE_PROVIDER_CONCURRENCY", "64")
+    )  # Max in-flight calls per provider class
+    stream_queue_size: int = int(os.getenv("LLM4FREE_STREAM_QUEUE_SIZE", "64"))
+    provider_pool_size: int = int(
+        os.getenv("LLM4FREE_PROVIDER_POOL_SIZE", "16")
+    )  # Provider instances per provider class
+    provider_pool_idle_ttl: float = float(
+        os.getenv("LLM4FREE_PROVIDER_POOL_IDLE_TTL", "300")
+    )  # Seconds before an idle provider instance is closed
+    provider_pool_timeout: float = float(
+        os.getenv("LLM4FREE_PROVIDER_POOL_TIMEOUT", "30")
+    )  # Seconds a request waits for a free provider instance
+    response_cache_enabled: bool = (
+        os.getenv("LLM4FREE_RESPONSE_CACHE", "false").lower() == "true"
+    )  # Cache deterministic (temperature 0) chat completions
+    response_cache_size: int = int(
+        os.getenv("LLM4FREE_RESPONSE_CACHE_SIZE", "1024")
+    )  # Completions kept in memory
+    response_cache_ttl: float = float(
+        os.getenv("LLM4FREE_RESPONSE_CACHE_TTL", "3600")
+    )  # Seconds a cached completion is served
+    response_cache_path: Optional[str] = (
+        os.getenv("LLM4FREE_RESPONSE_CACHE_PATH") or None
+    )  # SQLite file for a persistent cache tier
+    response_cache_max_bytes: int = int(
+        os.getenv("LLM4FREE_RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+    )  # Size of the persistent tier before LRU eviction
+    search_cache_enabled: bool = (
+        os.getenv("LLM4FREE_SEARCH_CACHE", "false").lower() == "true"
+    )  # Cache /search results (TTL per search type)
+    search_cache_size: int = int(
+        os.getenv("LLM4FREE_SEARCH_CACHE_SIZE", "2048")
+    )  # Search results kept in memory
+    search_cache_stale: float = float(
+        os.getenv("LLM4FREE_SEARCH_CACHE_STALE", "600")
+    )  # Seconds stale results are served while they are refreshed
+    search_cache_path: Optional[str] = (
+        os.getenv("LLM4FREE_SEARCH_CACHE_PATH") or None
+    )  # SQLite file shared by worker processes
+    coalesce_requests: bool = (
+        os.getenv("LLM4FREE_COALESCE_REQUESTS", "true").lower() == "true"
+    )  # Share one upstream call between identical in-flight requests
+    stream_coalesce_ms: float = float(
+        os.getenv("LLM4FREE_STREAM_COALESCE_MS", "0")
+    )  # Merge streamed content deltas arriving within this window (0 disables)
+    stream_coalesce_chars: int = int(
+        os.getenv("LLM4FREE_STREAM_COALESCE_CHARS", "1024")
+    )  # Flush a merged delta once it holds this many characters
+    metrics_dir: Optional[str] = (
+        os.getenv("LLM4FREE_METRICS_DIR") or None
+    )  # Directory where worker processes share their /metrics snapshots
+    metrics_interval: float = float(
+        os.getenv("LLM4FREE_METRICS_INTERVAL", "5")
+    )  # Seconds between metrics snapshots written to the directory
 
     @classmethod
     def set_config(cls, **data):
@@ -0,0 +1,255 @@
+"""
+Thread-pool bridge for running blocking provider calls off the event loop.
+
+Most providers are synchronous (``curl_cffi`` sessions, blocking generators), so
+the server hands their calls to a shared, bounded thread pool. Streaming
+generators are drained by a worker thread and handed to the event loop through
+a bounded queue, which keeps one slow upstream from stalling other clients.
+Providers with a native async interface are awaited directly.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional, Tuple
+
+from litprinter import ic
+
+from llm4free.llm.base import AsyncOpenAICompatibleProvider
+
+from .config import AppConfig
+
+_ITEM = 0
+_ERROR = 1
+_DONE = 2
+
+
+class ProviderExecutor:
+    """Sized thread pool with per-provider concurrency caps.
+
+    Attributes:
+        max_workers: Maximum number of worker threads in the pool.
+        concurrency_limit: Maximum in-flight calls per provider (0 disables the cap).
+        queue_size: Maximum number of chunks buffered per stream.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        concurrency_limit: Optional[int] = None,
+        queue_size: Optional[int] = None,
+    ) -> None:
+        self.max_workers = max_workers or AppConfig.provider_max_workers
+        self.concurrency_limit = (
+            concurrency_limit
+            if concurrency_limit is not None
+            else AppConfig.provider_concurrency_limit
+        )
+        self.queue_size = max(1, queue_size or AppConfig.stream_queue_size)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        """Return the underlying thread pool, creating it on first use."""
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="llm4free-provider"
+                    )
+        return self._pool
+
+    def _get_semaphore(self, provider_name: Optional[str]) -> Optional[asyncio.Semaphore]:
+        """Return the concurrency semaphore for a provider on the running loop."""
+        if not provider_name or self.concurrency_limit <= 0:
+            return None
+        loop = asyncio.get_running_loop()
+        entry = self._semaphores.get(provider_name)
+        if entry is None or entry[0] is not loop:
+            entry = (loop, asyncio.Semaphore(self.concurrency_limit))
+            self._semaphores[provider_name] = entry
+        return entry[1]
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        provider_name: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Run a blocking callable in the pool and return its result."""
+        loop = asyncio.get_running_loop()
+        call = functools.partial(func, *args, **kwargs)
+        semaphore = self._get_semaphore(provider_name)
+        if semaphore is None:
+            return await loop.run_in_executor(self.pool, call)
+        async with semaphore:
+            return await loop.run_in_executor(self.pool, call)
+
+    async def iterate(
+        self, iterable: Iterable[Any], provider_name: Optional[str] = None
+    ) -> AsyncIterator[Any]:
+        """Drain a blocking iterable in a worker thread and yield its items.
+
+        At most ``queue_size`` items are buffered; the worker blocks when the
+        consumer falls behind. Closing the async iterator (client disconnect)
+        stops the worker and closes the underlying generator.
+        """
+        semaphore = self._get_semaphore(provider_name)
+        if semaphore is not None:
+            await semaphore.acquire()
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        slots = threading.Semaphore(self.queue_size)
+        stop = threading.Event()
+
+        def _push(kind: int, value: Any = None) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, (kind, value))
+            except RuntimeError:
+                # Event loop already closed; nobody is listening anymore.
+                stop.set()
+
+        def _produce() -> None:
+            iterator = iter(iterable)
+            try:
+                while not stop.is_set():
+                    if not slots.acquire(timeout=0.5):
+                        continue
+                    if stop.is_set():
+                        break
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        break
+                    _push(_ITEM, item)
+            except BaseException as exc:  # forwarded to the consumer
+                _push(_ERROR, exc)
+            finally:
+                close = getattr(iterator, "close", None)
+                if stop.is_set() and callable(close):
+                    try:
+                        close()
+                    except Exception as exc:
+                        ic.configureOutput(prefix="WARNING| ")
+                        ic(f"Error closing provider stream: {exc}")
+                _push(_DONE)
+
+        # The worker finishes on its own once it observes ``stop``.
+        loop.run_in_executor(self.pool, _produce)
+        try:
+            while True:
+                kind, value = await queue.get()
+                if kind == _DONE:
+                    break
+                if kind == _ERROR:
+                    raise value
+                slots.release()
+                yield value
+        finally:
+            stop.set()
+            slots.release()  # wake a producer blocked on a full queue
+            if semaphore is not None:
+                semaphore.release()
+
+    def stats(self) -> Dict[str, int]:
+        """Worker threads started and calls waiting for one."""
+        pool = self._pool
+        if pool is None:
+            return {"max_workers": self.max_workers, "threads": 0, "queued": 0}
+        # ThreadPoolExecutor exposes no public queue length.
+        return {
+            "max_workers": self.max_workers,
+            "threads": len(pool._threads),
+            "queued": pool._work_queue.qsize(),
+        }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Shut down the thread pool."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=wait, cancel_futures=True)
+                self._pool = None
+        self._semaphores.clear()
+
+
+_executor: Optional[ProviderExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_provider_executor() -> ProviderExecutor:
+    """Return the process-wide provider executor."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ProviderExecutor()
+    return _executor
+
+
+def shutdown_provider_executor(wait: bool = False) -> None:
+    """Shut down the process-wide provider executor, if it was created."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait)
+            _executor = None
+
+
+def provider_executor_stats() -> Dict[str, int]:
+    """Stats of the process-wide provider executor, without creating it."""
+    executor = _executor
+    if executor is None:
+        return {"max_workers": AppConfig.provider_max_workers, "threads": 0, "queued": 0}
+    return executor.stats()
+
+
+async def run_in_provider_pool(
+    func: Callable[..., Any], *args: Any, provider_name: Optional[str] = None, **kwargs: Any
+) -> Any:
+    """Run a blocking provider call in the shared provider pool."""
+    return await get_provider_executor().run(func, *args, provider_name=provider_name, **kwargs)
+
+
+def iterate_in_provider_pool(
+    iterable: Iterable[Any], provider_name: Optional[str] = None
+) -> AsyncIterator[Any]:
+    """Iterate a blocking provider stream through the shared provider pool."""
+    return get_provider_executor().iterate(iterable, provider_name=provider_name)
+
+
+def get_async_provider(provider: Any) -> Optional[AsyncOpenAICompatibleProvider]:
+    """Return the native async interface of a provider instance, if it has one."""
+    if isinstance(provider, AsyncOpenAICompatibleProvider):
+        return provider
+    return getattr(provider, "aio", None)
+
+
+async def create_completion(
+    provider: Any, provider_name: Optional[str] = None, **params: Any
+) -> Any:
+    """Create a chat completion, awaiting async providers and pooling sync ones."""
+    async_provider = get_async_provider(provider)
+    if async_provider is not None:
+        return await async_provider.chat.completions.create(**params)
+    return await run_in_provider_pool(
+        provider.chat.completions.create, provider_name=provider_name, **params
+    )
+
+
+def is_completion_stream(completion: Any) -> bool:
+    """Return True if a completion result is a (sync or async) chunk stream."""
+    if hasattr(completion, "__aiter__"):
+        return True
+    return hasattr(completion, "__iter__") and not isinstance(completion, (str, bytes, dict))
+
+
+def iterate_completion(stream: Any, provider_name: Optional[str] = None) -> AsyncIterator[Any]:
+    """Iterate a completion stream, bridging sync generators through the pool."""
+    if hasattr(stream, "__aiter__"):
+        return stream
+    return iterate_in_provider_pool(stream, provider_name=provider_name)
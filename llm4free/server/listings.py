@@ -0,0 +1,178 @@
+"""
+Precomputed model and provider listings for the API server.
+
+Health checkers and SDK clients poll ``/v1/models`` and friends constantly, but
+the listings only change when a provider registry does. Each listing is built
+once per registry version, serialized to JSON bytes and served with an
+``ETag``; a request whose ``If-None-Match`` matches gets ``304 Not Modified``.
+"""
+
+import hashlib
+import threading
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+from fastapi import Request, Response
+
+from llm4free.utils import json_dumpb
+
+from .config import AppConfig
+
+# Parameters advertised by the provider listings, per provider kind.
+SUPPORTED_PARAMETERS: Dict[str, List[str]] = {
+    "chat": [
+        "model",
+        "messages",
+        "max_tokens",
+        "temperature",
+        "top_p",
+        "presence_penalty",
+        "frequency_penalty",
+        "stop",
+        "stream",
+        "user",
+    ],
+    "tti": [
+        "prompt",
+        "model",
+        "n",
+        "size",
+        "response_format",
+        "user",
+        "style",
+        "aspect_ratio",
+        "timeout",
+        "image_format",
+        "seed",
+    ],
+    "tts": [
+        "input",
+        "model",
+        "voice",
+        "response_format",
+        "instructions",
+        "stream",
+    ],
+}
+
+
+class Listing(NamedTuple):
+    body: bytes
+    etag: str
+
+
+def _registry(kind: str) -> Any:
+    return {
+        "chat": AppConfig.provider_map,
+        "tti": AppConfig.tti_provider_map,
+        "tts": AppConfig.tts_provider_map,
+    }[kind]
+
+
+def _model_names(registry: Any) -> List[str]:
+    # Registry keys are unique; "Provider/model" keys are models, the rest providers.
+    names = [key for key in registry if "/" in key]
+    # Sort models alphabetically by the part after the first '/'
+    return sorted(names, key=lambda name: name.split("/", 1)[1].lower())
+
+
+def model_list(kind: str) -> Dict[str, Any]:
+    """The OpenAI-style model list for one provider kind."""
+    created = int(time.time())
+    models = [
+        {"id": name, "object": "model", "created": created, "owned_by": "llm4free"}
+        for name in _model_names(_registry(kind))
+    ]
+    return {"object": "list", "data": models}
+
+
+def anthropic_model_list(kind: str) -> Dict[str, Any]:
+    """The Anthropic-style model list for one provider kind."""
+    created = int(time.time())
+    models = [
+        {
+            "id": name,
+            "type": "model",
+            "display_name": name.split("/", 1)[1],
+            "created_at": created,
+        }
+        for name in _model_names(_registry(kind))
+    ]
+    return {"data": models}
+
+
+def provider_list(kind: str) -> Dict[str, Any]:
+    """Providers of one kind with their models and supported parameters."""
+    registry = _registry(kind)
+    models: Dict[str, List[str]] = {}
+    for key in registry:
+        provider_name, _, model_name = key.partition("/")
+        if model_name:
+            models.setdefault(provider_name, []).append(model_name)
+    providers = {}
+    for provider_name in sorted(key for key in registry if "/" not in key):
+        provider_models = sorted(models.get(provider_name, []))
+        providers[provider_name] = {
+            "name": provider_name,
+            "class": registry.provider_name(provider_name),
+            "models": provider_models,
+            "parameters": SUPPORTED_PARAMETERS[kind],
+            "model_count": len(provider_models),
+        }
+    return {"providers": providers, "total_providers": len(providers)}
+
+
+LISTINGS: Dict[str, Callable[[str], Dict[str, Any]]] = {
+    "models": model_list,
+    "anthropic_models": anthropic_model_list,
+    "providers": provider_list,
+}
+
+_listings: Dict[Tuple[str, str], Tuple[Tuple[int, int], Listing]] = {}
+_lock = threading.Lock()
+
+
+def _version(kind: str) -> Tuple[int, int]:
+    registry = _registry(kind)
+    return id(registry), registry.version
+
+
+def get_listing(kind: str, name: str) -> Listing:
+    """The serialized listing, rebuilt only when the registry has changed."""
+    version = _version(kind)
+    cached = _listings.get((kind, name))
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    with _lock:
+        cached = _listings.get((kind, name))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        body = json_dumpb(LISTINGS[name](kind))
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        listing = Listing(body, etag)
+        _listings[(kind, name)] = (version, listing)
+        return listing
+
+
+def prime_listings(kind: str) -> None:
+    """Build the listings of a provider kind, e.g. right after its registry is filled."""
+    names = (
+        ("models", "anthropic_models", "providers") if kind == "chat" else ("models", "providers")
+    )
+    for name in names:
+        get_listing(kind, name)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def listing_response(request: Request, kind: str, name: str) -> Response:
+    """Serve a listing, or ``304 Not Modified`` if the client already has it."""
+    listing = get_listing(kind, name)
+    headers = {"ETag": listing.etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, listing.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(listing.body, media_type="application/json", headers=headers)
@@ -0,0 +1,623 @@
+"""
+Runtime metrics for the API server, served at ``/metrics`` in the Prometheus
+text exposition format.
+
+Request handlers update counters, gauges and histograms kept in the process
+(``registry``); pools, executors and caches are read when the metrics are
+collected. Each metric has its own lock, taken only for the few instructions
+of an update, so contention stays low.
+
+With several uvicorn workers, set ``LLM4FREE_METRICS_DIR`` to a directory
+shared by the workers. Each worker writes a snapshot of its metrics there
+every ``LLM4FREE_METRICS_INTERVAL`` seconds and when it stops, and
+``/metrics`` on any worker serves the sum over all snapshots. Counters and
+histograms of workers that have exited are kept; gauges of snapshots older
+than three intervals are left out.
+"""
+
+import asyncio
+import bisect
+import math
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from litprinter import ic
+
+from llm4free.utils import json_dumpb, json_loadb
+
+from .config import AppConfig
+
+# Seconds, for request and completion durations.
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+# Seconds until the first content token of a completion.
+TTFT_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0)
+# Output tokens per second.
+RATE_BUCKETS = (1.0, 5.0, 10.0, 20.0, 40.0, 80.0, 160.0, 320.0)
+# Rough characters per token, for completions that report no usage.
+CHARS_PER_TOKEN = 4
+
+
+class Sample(NamedTuple):
+    """One value read by a collector."""
+
+    name: str
+    kind: str  # "counter" or "gauge"
+    help: str
+    labels: Dict[str, str]
+    value: float
+
+
+class Metric:
+    """A metric family: one value per combination of label values."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._values: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labels)
+
+    def values(self) -> List[Tuple[Tuple[str, ...], Any]]:
+        with self._lock:
+            return [(key, _copy(value)) for key, value in self._values.items()]
+
+
+def _copy(value: Any) -> Any:
+    return list(value) if isinstance(value, list) else value
+
+
+class Counter(Metric):
+    """A value that only goes up."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(Metric):
+    """A value that goes up and down."""
+
+    kind = "gauge"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(Metric):
+    """Observations counted in buckets, with their count and sum."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        # Per bucket counts (not cumulative), the +Inf bucket, then the sum.
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._values.get(key)
+            if counts is None:
+                counts = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            counts[index] += 1
+            counts[-1] += value
+
+
+class MetricsRegistry:
+    """
+    Metrics of this process, plus collectors read at collection time.
+
+    Args:
+        directory: Directory shared by the worker processes, or None to serve
+            this process only.
+        interval: Seconds between snapshots written to ``directory``.
+    """
+
+    def __init__(self, directory: Optional[str] = None, interval: float = 5.0) -> None:
+        self.directory = directory
+        self.interval = interval
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Callable[[], Iterable[Sample]]] = []
+        self._lock = threading.Lock()
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _register(self, metric: Metric) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labels))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help, labels, buckets))
+
+    def add_collector(self, collector: Callable[[], Iterable[Sample]]) -> None:
+        """Read ``collector()`` samples on every collection."""
+        self._collectors.append(collector)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """The current metrics of this process as JSON data."""
+        families: Dict[str, Dict[str, Any]] = {}
+        for metric in list(self._metrics.values()):
+            family = {
+                "kind": metric.kind,
+                "help": metric.help,
+                "labels": list(metric.labels),
+                "values": [[list(key), value] for key, value in metric.values()],
+            }
+            if isinstance(metric, Histogram):
+                family["buckets"] = list(metric.buckets)
+            families[metric.name] = family
+        for collector in self._collectors:
+            try:
+                samples = list(collector())
+            except Exception as ex:
+                ic.configureOutput(prefix="WARNING| ")
+                ic(f"Metrics collector {getattr(collector, '__name__', collector)} failed: {ex}")
+                continue
+            for sample in samples:
+                family = families.setdefault(
+                    sample.name,
+                    {
+                        "kind": sample.kind,
+                        "help": sample.help,
+                        "labels": list(sample.labels),
+                        "values": [],
+                    },
+                )
+                key = [str(sample.labels.get(name, "")) for name in family["labels"]]
+                family["values"].append([key, sample.value])
+        return {"pid": os.getpid(), "time": time.time(), "metrics": families}
+
+    def _snapshot_path(self) -> Path:
+        assert self.directory is not None
+        return Path(self.directory) / f"llm4free-{os.getpid()}.json"
+
+    def write_snapshot(self) -> None:
+        """Write this process's snapshot to the shared directory, if there is one."""
+        if not self.directory:
+            return
+        path = self._snapshot_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(json_dumpb(self.snapshot()))
+        os.replace(tmp, path)
+
+    def _snapshots(self) -> List[Dict[str, Any]]:
+        own = self.snapshot()
+        if not self.directory:
+            return [own]
+        snapshots = [own]
+        for path in Path(self.directory).glob("llm4free-*.json"):
+            if path == self._snapshot_path():
+                continue
+            try:
+                snapshots.append(json_loadb(path.read_bytes()))
+            except (OSError, ValueError):
+                continue  # being replaced or removed
+        return snapshots
+
+    def collect(self) -> Dict[str, Dict[str, Any]]:
+        """Metric families summed over the snapshots of every worker."""
+        merged: Dict[str, Dict[str, Any]] = {}
+        stale_before = time.time() - 3 * self.interval
+        for position, snapshot in enumerate(self._snapshots()):
+            stale = position > 0 and snapshot.get("time", 0) < stale_before
+            for name, family in snapshot.get("metrics", {}).items():
+                if stale and family["kind"] == "gauge":
+                    continue
+                target = merged.setdefault(name, {**family, "values": {}})
+                if family.get("buckets") != target.get("buckets"):
+                    continue  # bucket layout changed between versions
+                values = target["values"]
+                for key, value in family["values"]:
+                    key = tuple(key)
+                    current = values.get(key)
+                    if current is None:
+                        values[key] = _copy(value)
+                    elif isinstance(current, list):
+                        values[key] = [a + b for a, b in zip(current, value)]
+                    else:
+                        values[key] = current + value
+        _add_hit_ratios(merged)
+        return merged
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for name, family in sorted(self.collect().items()):
+            lines.append(f"# HELP {name} {_escape_help(family['help'])}")
+            lines.append(f"# TYPE {name} {family['kind']}")
+            labels = family["labels"]
+            for key, value in sorted(family["values"].items()):
+                if family["kind"] != "histogram":
+                    lines.append(f"{name}{_labels(labels, key)} {_number(value)}")
+                    continue
+                cumulative = 0.0
+                for bound, count in zip(family["buckets"], value):
+                    cumulative += count
+                    le = _labels(labels + ["le"], key + (_number(bound),))
+                    lines.append(f"{name}_bucket{le} {_number(cumulative)}")
+                cumulative += value[-2]
+                le = _labels(labels + ["le"], key + ("+Inf",))
+                lines.append(f"{name}_bucket{le} {_number(cumulative)}")
+                lines.append(f"{name}_sum{_labels(labels, key)} {_number(value[-1])}")
+                lines.append(f"{name}_count{_labels(labels, key)} {_number(cumulative)}")
+        return "\n".join(lines) + "\n"
+
+    def start_exporter(self) -> None:
+        """Write snapshots in the background while the running loop lives."""
+        if not self.directory:
+            return
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._loop is not loop:
+            self._loop = loop
+            self._task = loop.create_task(self._export())
+
+    async def _export(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                await loop.run_in_executor(None, self.write_snapshot)
+            except Exception as ex:
+                ic.configureOutput(prefix="WARNING| ")
+                ic(f"Failed to write metrics snapshot: {ex}")
+            await asyncio.sleep(self.interval)
+
+    def close(self) -> None:
+        """Stop the exporter and write a final snapshot."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+        try:
+            self.write_snapshot()
+        except OSError as ex:
+            ic.configureOutput(prefix="WARNING| ")
+            ic(f"Failed to write metrics snapshot: {ex}")
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_label(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _number(value: float) -> str:
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if value.is_integer():
+            return str(int(value))
+    return repr(value)
+
+
+def _add_hit_ratios(merged: Dict[str, Dict[str, Any]]) -> None:
+    hits = merged.get("llm4free_cache_hits_total")
+    misses = merged.get("llm4free_cache_misses_total")
+    if hits is None or misses is None:
+        return
+    ratios = {}
+    for key, hit_count in hits["values"].items():
+        lookups = hit_count + misses["values"].get(key, 0.0)
+        ratios[key] = hit_count / lookups if lookups else 0.0
+    merged["llm4free_cache_hit_ratio"] = {
+        "kind": "gauge",
+        "help": "Fraction of cache lookups that were hits.",
+        "labels": hits["labels"],
+        "values": ratios,
+    }
+
+
+registry = MetricsRegistry()
+
+http_requests = registry.counter(
+    "llm4free_http_requests_total",
+    "HTTP requests by route, method and status.",
+    ("route", "method", "status"),
+)
+http_request_duration = registry.histogram(
+    "llm4free_http_request_duration_seconds",
+    "HTTP request duration, to the end of the response body.",
+    ("route", "method"),
+)
+http_requests_in_flight = registry.gauge(
+    "llm4free_http_requests_in_flight", "HTTP requests being served."
+)
+completions = registry.counter(
+    "llm4free_completions_total",
+    "Chat completions by provider, model, streaming and outcome.",
+    ("provider", "model", "stream", "status"),
+)
+completion_duration = registry.histogram(
+    "llm4free_completion_duration_seconds",
+    "Chat completion duration.",
+    ("provider", "model", "stream"),
+)
+time_to_first_token = registry.histogram(
+    "llm4free_time_to_first_token_seconds",
+    "Time from the request to the first streamed content.",
+    ("provider", "model"),
+    TTFT_BUCKETS,
+)
+output_tokens = registry.counter(
+    "llm4free_output_tokens_total",
+    "Completion tokens, as reported by the provider or estimated from the text.",
+    ("provider", "model"),
+)
+tokens_per_second = registry.histogram(
+    "llm4free_tokens_per_second",
+    "Completion tokens per second of generation.",
+    ("provider", "model"),
+    RATE_BUCKETS,
+)
+streams_in_flight = registry.gauge(
+    "llm4free_streams_in_flight", "Completion streams being served.", ("provider",)
+)
+
+
+class CompletionTimer:
+    """Records the metrics of one chat completion."""
+
+    __slots__ = ("provider", "model", "stream", "start", "first_token_at")
+
+    def __init__(self, provider: Optional[str], model: str, stream: bool, start: float) -> None:
+        self.provider = provider or "unknown"
+        self.model = model
+        self.stream = stream
+        self.start = start
+        self.first_token_at: Optional[float] = None
+        if stream:
+            streams_in_flight.inc(provider=self.provider)
+
+    def first_token(self) -> None:
+        """Mark the first content of the completion."""
+        if self.first_token_at is None:
+            self.first_token_at = time.time()
+            time_to_first_token.observe(
+                self.first_token_at - self.start, provider=self.provider, model=self.model
+            )
+
+    def finish(
+        self, failed: bool = False, text_chars: int = 0, tokens: Optional[int] = None
+    ) -> None:
+        """
+        Record the outcome; ``tokens`` is the provider's completion token count,
+        estimated from ``text_chars`` when it is not known.
+        """
+        now = time.time()
+        stream = "true" if self.stream else "false"
+        if self.stream:
+            streams_in_flight.dec(provider=self.provider)
+        status = "error" if failed else "ok"
+        completions.inc(provider=self.provider, model=self.model, stream=stream, status=status)
+        completion_duration.observe(
+            now - self.start, provider=self.provider, model=self.model, stream=stream
+        )
+        if failed:
+            return
+        if tokens is None:
+            tokens = round(text_chars / CHARS_PER_TOKEN)
+        if tokens <= 0:
+            return
+        output_tokens.inc(tokens, provider=self.provider, model=self.model)
+        elapsed = now - (self.first_token_at or self.start)
+        if elapsed > 0:
+            tokens_per_second.observe(tokens / elapsed, provider=self.provider, model=self.model)
+
+
+class MetricsMiddleware:
+    """ASGI middleware counting HTTP requests and timing them by route template."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+        status = "500"
+
+        async def send_with_status(message: Dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        http_requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_flight.dec()
+            # The route template, set by the router; raw paths would explode the label set.
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            method = scope.get("method", "")
+            http_requests.inc(route=route, method=method, status=status)
+            http_request_duration.observe(time.perf_counter() - start, route=route, method=method)
+            registry.start_exporter()
+
+
+def server_samples() -> List[Sample]:
+    """Provider pools, the provider thread pool, caches and coalescing."""
+    from llm4free.search.cache import get_search_cache
+
+    from .executor import provider_executor_stats
+    from .providers import provider_pools
+    from .request_log import get_request_log
+    from .request_processing import get_response_cache
+    from .single_flight import single_flight
+
+    samples: List[Sample] = []
+    executor = provider_executor_stats()
+    samples.append(
+        Sample(
+            "llm4free_provider_executor_threads",
+            "gauge",
+            "Worker threads of the provider thread pool.",
+            {},
+            executor["threads"],
+        )
+    )
+    samples.append(
+        Sample(
+            "llm4free_provider_executor_queue_depth",
+            "gauge",
+            "Provider calls waiting for a worker thread.",
+            {},
+            executor["queued"],
+        )
+    )
+    for kind, pool in list(provider_pools.items()):
+        for key, state in pool.metrics().items():
+            labels = {"kind": kind, "key": key}
+            samples.extend(
+                (
+                    Sample(
+                        "llm4free_pool_in_use",
+                        "gauge",
+                        "Pooled instances checked out.",
+                        labels,
+                        state["in_use"],
+                    ),
+                    Sample(
+                        "llm4free_pool_max_size",
+                        "gauge",
+                        "Instances a pool may hold.",
+                        labels,
+                        state["max_size"],
+                    ),
+                    Sample(
+                        "llm4free_pool_utilization",
+                        "gauge",
+                        "Time-averaged fraction of a pool in use.",
+                        labels,
+                        state["utilization"],
+                    ),
+                    Sample(
+                        "llm4free_pool_waits_total",
+                        "counter",
+                        "Checkouts that waited for a free instance.",
+                        labels,
+                        state["waits"],
+                    ),
+                    Sample(
+                        "llm4free_pool_wait_seconds_total",
+                        "counter",
+                        "Seconds checkouts waited for a free instance.",
+                        labels,
+                        state["wait_time_total"],
+                    ),
+                )
+            )
+    caches = []
+    response_cache = get_response_cache()
+    if response_cache is not None:
+        stats = response_cache.stats()
+        caches.append(("response", stats["hits"], stats["misses"]))
+    search_cache = get_search_cache()
+    if search_cache is not None:
+        stats = search_cache.stats()
+        caches.append(("search", stats["hits"] + stats["stale_hits"], stats["misses"]))
+    for cache, hits, misses in caches:
+        labels = {"cache": cache}
+        samples.append(Sample("llm4free_cache_hits_total", "counter", "Cache hits.", labels, hits))
+        samples.append(
+            Sample("llm4free_cache_misses_total", "counter", "Cache misses.", labels, misses)
+        )
+    flight = single_flight.stats()
+    samples.append(
+        Sample(
+            "llm4free_coalesced_requests_total",
+            "counter",
+            "Requests that joined an identical request in flight.",
+            {},
+            flight["coalesced"],
+        )
+    )
+    request_log = get_request_log()
+    if request_log is not None:
+        stats = request_log.stats()
+        samples.append(
+            Sample(
+                "llm4free_request_log_queued",
+                "gauge",
+                "Request log records waiting to be written.",
+                {},
+                stats["queued"],
+            )
+        )
+        samples.append(
+            Sample(
+                "llm4free_request_log_dropped_total",
+                "counter",
+                "Request log records dropped while the writer was behind.",
+                {},
+                stats["dropped"],
+            )
+        )
+    return samples
+
+
+registry.add_collector(server_samples)
+
+
+def configure_metrics() -> None:
+    """Apply ``LLM4FREE_METRICS_DIR`` and ``LLM4FREE_METRICS_INTERVAL``."""
+    registry.directory = AppConfig.metrics_dir
+    registry.interval = AppConfig.metrics_interval
+
+
+def close_metrics() -> None:
+    """Write the final snapshot of this worker, if metrics are shared."""
+    registry.close()
@@ -2,83 +2,57 @@
 Provider management and initialization for the LLM4Free API.
 """
 
-import inspect
-import sys
-from typing import Any, Dict, Optional, Tuple
+import asyncio
+import functools
+from typing import Any, AsyncIterator, Dict, Iterator, MutableMapping, Optional, Tuple
 
 from litprinter import ic
-from starlette.status import HTTP_404_NOT_FOUND, HTTP_500_INTERNAL_SERVER_ERROR
+from starlette.status import (
+    HTTP_404_NOT_FOUND,
+    HTTP_500_INTERNAL_SERVER_ERROR,
+    HTTP_503_SERVICE_UNAVAILABLE,
+)
+
+from llm4free.provider_manifest import provider_entries
+from llm4free.provider_pool import ProviderLease, ProviderPool, ProviderPoolTimeout
 
 from .config import AppConfig
 from .exceptions import APIError
-
-# Cache for provider instances to avoid reinitialization on every request
-provider_instances: Dict[str, Any] = {}
-tti_provider_instances: Dict[str, Any] = {}
-tts_provider_instances: Dict[str, Any] = {}
-
-
-def _get_available_models(
-    provider_class: Any, attribute_name: str = "AVAILABLE_MODELS"
-) -> list[str]:
-    """Return a normalized list of model names for a provider class."""
-    available = getattr(provider_class, attribute_name, None)
-
-    # Many providers expose AVAILABLE_MODELS as a property on the instance.
-    if isinstance(available, property):
-        try:
-            available = getattr(provider_class(), attribute_name, [])
-        except Exception:
-            available = []
-
-    if available is None:
-        return []
-
-    if isinstance(available, str):
-        return [available]
-
-    if isinstance(available, (list, tuple, set)):
-        return [model for model in available if isinstance(model, str) and model]
-
-    if hasattr(available, "__iter__"):
-        return [model for model in available if isinstance(model, str) and model]
-
-    return []
+from .executor import run_in_provider_pool
+from .listings import prime_listings
+
+# Provider instances per kind ("chat", "tti", "tts"); each request borrows one
+provider_pools: Dict[str, ProviderPool] = {}
+
+
+def _register_free_providers(registry: MutableMapping[str, Any], kind: str) -> Tuple[int, int]:
+    """
+    Register every provider of ``kind`` that needs no authentication, plus one
+    ``Provider/model`` key per model, from the provider manifest.
+
+    Entries are stored unresolved, so a provider's module is only imported when a
+    request first resolves to it.
+    """
+    provider_count = 0
+    model_count = 0
+    for provider_name, entry in provider_entries(kind).items():
+        if entry.required_auth:
+            continue
+        registry[provider_name] = entry
+        provider_count += 1
+        for model in entry.models:
+            registry[f"{provider_name}/{model}"] = entry
+            model_count += 1
+    return provider_count, model_count
 
 
 def initialize_provider_map() -> None:
-    """Initialize the provider map by discovering available providers."""
+    """Initialize the provider map from the provider manifest."""
     ic.configureOutput(prefix="INFO| ")
     ic("Initializing provider map...")
 
     try:
-        import importlib
-
-        # Ensure llm is loaded in sys.modules
-        importlib.import_module("llm4free.llm")
-        module = sys.modules["llm4free.llm"]
-        from llm4free.llm.base import OpenAICompatibleProvider, SimpleModelList
-
-        provider_count = 0
-        model_count = 0
-
-        for name, obj in inspect.getmembers(module):
-            if (
-                inspect.isclass(obj)
-                and issubclass(obj, OpenAICompatibleProvider)
-                and obj.__name__ != "OpenAICompatibleProvider"
-            ):
-                # Only include providers that don't require authentication
-                if hasattr(obj, "required_auth") and not getattr(obj, "required_auth", True):
-                    provider_name = obj.__name__
-                    AppConfig.provider_map[provider_name] = obj
-                    provider_count += 1
-
-                    # Register available models for this provider
-                    for model in _get_available_models(obj):
-                        model_key = f"{provider_name}/{model}"
-                        AppConfig.provider_map[model_key] = obj
-                        model_count += 1
+        provider_count, model_count = _register_free_providers(AppConfig.provider_map, "chat")
 
         if not AppConfig.provider_map:
             ic.configureOutput(prefix="ERROR| ")
@@ -87,6 +61,7 @@ def initialize_provider_map() -> None:
 
         ic.configureOutput(prefix="INFO| ")
         ic(f"Initialized {provider_count} providers with {model_count} models")
+        prime_listings("chat")
 
     except Exception as e:
         ic.configureOutput(prefix="ERROR| ")
@@ -95,38 +70,12 @@ def initialize_provider_map() -> None:
 
 
 def initialize_tti_provider_map() -> None:
-    """Initialize the TTI provider map by discovering available TTI providers."""
+    """Initialize the TTI provider map from the provider manifest."""
     ic.configureOutput(prefix="INFO| ")
     ic("Initializing TTI provider map...")
 
     try:
-        import importlib
-
-        # Ensure TTI is loaded in sys.modules
-        importlib.import_module("llm4free.TTI")
-        module = sys.modules["llm4free.TTI"]
-        from llm4free.TTI.base import TTICompatibleProvider
-
-        provider_count = 0
-        model_count = 0
-
-        for name, obj in inspect.getmembers(module):
-            if (
-                inspect.isclass(obj)
-                and issubclass(obj, TTICompatibleProvider)
-                and obj.__name__ != "TTICompatibleProvider"
-                and obj.__name__ != "BaseImages"
-                and not getattr(obj, "required_auth", True)
-            ):
-                provider_name = obj.__name__
-                AppConfig.tti_provider_map[provider_name] = obj
-                provider_count += 1
-
-                # Register available models for this TTI provider
-                for model in _get_available_models(obj):
-                    model_key = f"{provider_name}/{model}"
-                    AppConfig.tti_provider_map[model_key] = obj
-                    model_count += 1
+        provider_count, model_count = _register_free_providers(AppConfig.tti_provider_map, "tti")
 
         if not AppConfig.tti_provider_map:
             ic.configureOutput(prefix="ERROR| ")
@@ -135,6 +84,7 @@ def initialize_tti_provider_map() -> None:
 
         ic.configureOutput(prefix="INFO| ")
         ic(f"Initialized {provider_count} TTI providers with {model_count} models")
+        prime_listings("tti")
 
     except Exception as e:
         ic.configureOutput(prefix="ERROR| ")
@@ -143,39 +93,12 @@ def initialize_tti_provider_map() -> None:
 
 
 def initialize_tts_provider_map() -> None:
-    """Initialize the TTS provider map by discovering available TTS providers."""
+    """Initialize the TTS provider map from the provider manifest."""
     ic.configureOutput(prefix="INFO| ")
     ic("Initializing TTS provider map...")
 
     try:
-        import importlib
-
-        # Ensure TTS is loaded in sys.modules
-        importlib.import_module("llm4free.TTS")
-        module = sys.modules["llm4free.TTS"]
-        from llm4free.TTS.base import BaseTTSProvider
-
-        provider_count = 0
-        model_count = 0
-
-        for name, obj in inspect.getmembers(module):
-            if (
-                inspect.isclass(obj)
-                and issubclass(obj, BaseTTSProvider)
-                and obj.__name__ not in ("BaseTTSProvider", "TTSProvider")
-                and not getattr(obj, "required_auth", True)
-            ):
-                provider_name = obj.__name__
-                AppConfig.tts_provider_map[provider_name] = obj
-                provider_count += 1
-
-                # Register available models for this TTS provider
-                for model in _get_available_models(
-                    obj, "SUPPORTED_MODELS"
-                ) or _get_available_models(obj):
-                    model_key = f"{provider_name}/{model}"
-                    AppConfig.tts_provider_map[model_key] = obj
-                    model_count += 1
+        provider_count, model_count = _register_free_providers(AppConfig.tts_provider_map, "tts")
 
         if not AppConfig.tts_provider_map:
             ic("No TTS providers found")
@@ -183,6 +106,7 @@ def initialize_tts_provider_map() -> None:
 
         ic.configureOutput(prefix="INFO| ")
         ic(f"Initialized {provider_count} TTS providers with {model_count} models")
+        prime_listings("tts")
 
     except Exception as e:
         ic.configureOutput(prefix="ERROR| ")
@@ -207,7 +131,7 @@ def resolve_provider_and_model(model_identifier: str) -> Tuple[Any, str]:
         model_name = model_identifier
 
     if not provider_class:
-        available_providers = list(set(v.__name__ for v in AppConfig.provider_map.values()))
+        available_providers = AppConfig.provider_map.provider_names()
         raise APIError(
             f"Provider for model '{model_identifier}' not found. Available providers: {available_providers}",
             HTTP_404_NOT_FOUND,
@@ -259,7 +183,7 @@ def resolve_tti_provider_and_model(model_identifier: str) -> Tuple[Any, str]:
         model_name = model_identifier
 
     if not provider_class:
-        available_providers = list(set(v.__name__ for v in AppConfig.tti_provider_map.values()))
+        available_providers = AppConfig.tti_provider_map.provider_names()
         raise APIError(
             f"TTI Provider for model '{model_identifier}' not found. Available TTI providers: {available_providers}",
             HTTP_404_NOT_FOUND,
@@ -294,50 +218,6 @@ def resolve_tti_provider_and_model(model_identifier: str) -> Tuple[Any, str]:
     return provider_class, model_name
 
 
-def get_provider_instance(provider_class: Any):
-    """Return a cached instance of the provider, creating it if necessary."""
-    key = provider_class.__name__
-    instance = provider_instances.get(key)
-    if instance is None:
-        try:
-            instance = provider_class()
-        except TypeError as e:
-            # Handle abstract class instantiation error
-            if "abstract class" in str(e):
-                from .exceptions import APIError
-
-                raise APIError(
-                    f"Provider misconfiguration: Cannot instantiate abstract class '{provider_class.__name__}'. Please check the provider implementation.",
-                    HTTP_500_INTERNAL_SERVER_ERROR,
-                    "provider_error",
-                )
-            raise
-        provider_instances[key] = instance
-    return instance
-
-
-def get_tti_provider_instance(provider_class: Any):
-    """Return a cached instance of the TTI provider, creating it if needed."""
-    key = provider_class.__name__
-    instance = tti_provider_instances.get(key)
-    if instance is None:
-        try:
-            instance = provider_class()
-        except TypeError as e:
-            # Handle abstract class instantiation error
-            if "abstract class" in str(e):
-                from .exceptions import APIError
-
-                raise APIError(
-                    f"Provider misconfiguration: Cannot instantiate abstract class '{provider_class.__name__}'. Please check the provider implementation.",
-                    HTTP_500_INTERNAL_SERVER_ERROR,
-                    "provider_error",
-                )
-            raise
-        tti_provider_instances[key] = instance
-    return instance
-
-
 def resolve_tts_provider_and_model(model_identifier: str) -> Tuple[Any, str]:
     """Resolve TTS provider class and model name from model identifier."""
     provider_class = None
@@ -355,7 +235,7 @@ def resolve_tts_provider_and_model(model_identifier: str) -> Tuple[Any, str]:
         model_name = model_identifier
 
     if not provider_class:
-        available_providers = list(set(v.__name__ for v in AppConfig.tts_provider_map.values()))
+        available_providers = AppConfig.tts_provider_map.provider_names()
         raise APIError(
             f"TTS Provider for model '{model_identifier}' not found. Available TTS providers: {available_providers}",
             HTTP_404_NOT_FOUND,
@@ -390,22 +270,128 @@ def resolve_tts_provider_and_model(model_identifier: str) -> Tuple[Any, str]:
     return provider_class, model_name
 
 
-def get_tts_provider_instance(provider_class: Any):
-    """Return a cached instance of the TTS provider, creating it if needed."""
+def get_provider_pool(kind: str = "chat") -> ProviderPool:
+    """Return the instance pool for one provider kind, creating it on first use."""
+    pool = provider_pools.get(kind)
+    if pool is None:
+        pool = provider_pools.setdefault(
+            kind,
+            ProviderPool(
+                max_size=AppConfig.provider_pool_size,
+                idle_ttl=AppConfig.provider_pool_idle_ttl,
+                acquire_timeout=AppConfig.provider_pool_timeout,
+            ),
+        )
+    return pool
+
+
+def close_provider_pools() -> None:
+    """Close the idle instances of every provider pool."""
+    for pool in list(provider_pools.values()):
+        pool.close()
+    provider_pools.clear()
+
+
+def _instantiate_provider(provider_class: Any) -> Any:
+    try:
+        return provider_class()
+    except TypeError as e:
+        # Handle abstract class instantiation error
+        if "abstract class" in str(e):
+            raise APIError(
+                f"Provider misconfiguration: Cannot instantiate abstract class '{provider_class.__name__}'. Please check the provider implementation.",
+                HTTP_500_INTERNAL_SERVER_ERROR,
+                "provider_error",
+            )
+        raise
+
+
+def _keep_created(pool: ProviderPool, key: str, task: "asyncio.Future[Any]") -> None:
+    # The checkout was cancelled while its instance was being built: pool it.
+    if not task.cancelled() and task.exception() is None:
+        pool.release(key, task.result())
+
+
+async def checkout_provider(provider_class: Any, kind: str = "chat") -> ProviderLease:
+    """
+    Borrow an instance of the provider from its pool for one request.
+
+    A free instance is handed out directly. New instances are built in the
+    provider pool, since constructors may fingerprint, set up sessions or hit
+    the network; when all instances are in use the wait runs there too, so the
+    event loop only does the pool bookkeeping.
+    """
+    pool = get_provider_pool(kind)
     key = provider_class.__name__
-    instance = tts_provider_instances.get(key)
+    factory = functools.partial(_instantiate_provider, provider_class)
+    try:
+        try:
+            instance = pool.reserve(key, timeout=0)
+        except ProviderPoolTimeout:
+            return await run_in_provider_pool(pool.lease, key, factory)
+    except ProviderPoolTimeout as e:
+        raise APIError(
+            f"Provider {key} is busy: {e}", HTTP_503_SERVICE_UNAVAILABLE, "provider_busy"
+        )
     if instance is None:
+        task = asyncio.ensure_future(run_in_provider_pool(pool.create, key, factory))
         try:
-            instance = provider_class()
-        except TypeError as e:
-            if "abstract class" in str(e):
-                from .exceptions import APIError
-
-                raise APIError(
-                    f"Provider misconfiguration: Cannot instantiate abstract class '{provider_class.__name__}'. Please check the provider implementation.",
-                    HTTP_500_INTERNAL_SERVER_ERROR,
-                    "provider_error",
-                )
+            instance = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            task.add_done_callback(functools.partial(_keep_created, pool, key))
             raise
-        tts_provider_instances[key] = instance
-    return instance
+    return ProviderLease(pool, key, instance)
+
+
+async def checkout_tti_provider(provider_class: Any) -> ProviderLease:
+    """Borrow an instance of the TTI provider from its pool."""
+    return await checkout_provider(provider_class, "tti")
+
+
+async def checkout_tts_provider(provider_class: Any) -> ProviderLease:
+    """Borrow an instance of the TTS provider from its pool."""
+    return await checkout_provider(provider_class, "tts")
+
+
+def _release_after(stream: Iterator[Any], lease: ProviderLease) -> Iterator[Any]:
+    try:
+        yield from stream
+    except Exception:
+        lease.release(failed=True)
+        raise
+    finally:
+        lease.release()
+
+
+async def _release_after_async(
+    stream: AsyncIterator[Any], lease: ProviderLease
+) -> AsyncIterator[Any]:
+    try:
+        async for item in stream:
+            yield item
+    except Exception:
+        lease.release(failed=True)
+        raise
+    finally:
+        lease.release()
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def release_when_done(completion: Any, lease: Optional[ProviderLease]) -> Any:
+    """
+    Return the leased instance to its pool once ``completion`` is finished with.
+
+    Streams release it when they end or are closed; sync streams are closed by
+    the worker thread draining them, so the instance is never handed to another
+    request while a chunk is still being read. Other results release it at once.
+    """
+    if lease is None:
+        return completion
+    if hasattr(completion, "__aiter__"):
+        return _release_after_async(completion, lease)
+    if isinstance(completion, Iterator):
+        return _release_after(completion, lease)
+    lease.release()
+    return completion
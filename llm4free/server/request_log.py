@@ -0,0 +1,352 @@
+"""
+Structured request log for the API server.
+
+``RequestLog.record`` is all the request path pays for a log record: the
+record is appended to a bounded in-memory ring buffer and the call returns.
+A background task drains the buffer in batches and hands each batch to the
+sinks in a dedicated writer thread, so file, database and console I/O never
+run on the event loop. Building the record is deferred too: a streamed answer
+may be passed as its list of parts, which the writer thread joins and
+truncates.
+
+Memory is bounded by the buffer size. When the writer falls behind, the
+oldest records are dropped and counted. Successful requests can be sampled;
+errors are always kept.
+
+Sinks:
+
+- ``stdout``: one JSON object per line on standard output.
+- ``jsonl``: a JSON lines file, rotated like ``logging.RotatingFileHandler``.
+- ``sqlite``: a ``request_log`` table in a SQLite file.
+"""
+
+import asyncio
+import os
+import random
+import sqlite3
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Sequence, TextIO, Union
+
+from litprinter import ic
+
+from llm4free.utils import json_dumpb
+
+from .config import AppConfig
+
+# Records kept in memory while the writer catches up.
+DEFAULT_BUFFER_SIZE = 10000
+# Records handed to the sinks at once.
+DEFAULT_BATCH_SIZE = 256
+# Seconds between writes when fewer than a batch of records is queued.
+DEFAULT_FLUSH_INTERVAL = 1.0
+# Characters of the question and the answer kept in a record.
+DEFAULT_MAX_CHARS = 4096
+
+# Record fields, in the order of the SQLite columns.
+FIELDS = (
+    "time",
+    "request_id",
+    "ip_address",
+    "model",
+    "provider",
+    "status_code",
+    "response_time_ms",
+    "question",
+    "answer",
+    "answer_chars",
+    "error",
+    "user_agent",
+)
+
+
+class LogSink:
+    """A destination for request log records; methods run in the writer thread."""
+
+    def write(self, records: List[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class StdoutSink(LogSink):
+    """Write each record as a JSON line to ``stream`` (standard output by default)."""
+
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        self.stream = stream
+
+    def write(self, records: List[Dict[str, Any]]) -> None:
+        stream = self.stream or sys.stdout
+        stream.write(b"".join(json_dumpb(record) + b"\n" for record in records).decode("utf-8"))
+        stream.flush()
+
+
+class JsonlSink(LogSink):
+    """
+    Append records to a JSON lines file.
+
+    When the file reaches ``max_bytes`` it is renamed to ``path.1`` (``path.1``
+    to ``path.2`` and so on) and a new file is started; ``backups`` old files
+    are kept.
+    """
+
+    def __init__(
+        self, path: Union[str, Path], max_bytes: int = 50 * 1024 * 1024, backups: int = 5
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._file: Any = None
+
+    def write(self, records: List[Dict[str, Any]]) -> None:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "ab")
+        self._file.write(b"".join(json_dumpb(record) + b"\n" for record in records))
+        self._file.flush()
+        if self.max_bytes and self._file.tell() >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        self._file.close()
+        self._file = None
+        if self.backups <= 0:
+            os.remove(self.path)
+            return
+        for i in range(self.backups - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{i}")
+            if source.exists():
+                os.replace(source, self.path.with_name(f"{self.path.name}.{i + 1}"))
+        os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class SQLiteSink(LogSink):
+    """Insert records into the ``request_log`` table of a SQLite file."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # Connected from the writer thread, the only one that uses it.
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS request_log ("
+            "time REAL, request_id TEXT, ip_address TEXT, model TEXT, provider TEXT, "
+            "status_code INTEGER, response_time_ms INTEGER, question TEXT, answer TEXT, "
+            "answer_chars INTEGER, error TEXT, user_agent TEXT)"
+        )
+        return conn
+
+    def write(self, records: List[Dict[str, Any]]) -> None:
+        if self._conn is None:
+            self._conn = self._connect()
+        placeholders = ", ".join("?" for _ in FIELDS)
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT INTO request_log ({', '.join(FIELDS)}) VALUES ({placeholders})",
+                [tuple(record.get(name) for name in FIELDS) for record in records],
+            )
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def _text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    return "".join(value)
+
+
+class RequestLog:
+    """
+    Bounded ring buffer of request records drained to ``sinks`` in the background.
+
+    Args:
+        sinks: Where records are written.
+        buffer_size: Records kept while the writer catches up; beyond it the
+            oldest are dropped.
+        batch_size: Records written at once; a full batch wakes the writer.
+        flush_interval: Seconds between writes of a partial batch.
+        sample_rate: Fraction of successful requests recorded; errors always are.
+        max_chars: Characters of the question and the answer kept per record.
+    """
+
+    def __init__(
+        self,
+        sinks: Sequence[LogSink],
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        sample_rate: float = 1.0,
+        max_chars: int = DEFAULT_MAX_CHARS,
+    ) -> None:
+        self.sinks = list(sinks)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.sample_rate = sample_rate
+        self.max_chars = max_chars
+        self._buffer: Deque[Dict[str, Any]] = deque(maxlen=buffer_size)
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="llm4free-request-log"
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._counters = dict.fromkeys(
+            ("recorded", "sampled_out", "dropped", "written", "batches", "sink_errors"), 0
+        )
+
+    def record(self, **fields: Any) -> bool:
+        """
+        Queue one record without blocking; returns False if it was sampled out.
+
+        ``question`` and ``answer`` may be strings or lists of string parts.
+        """
+        status_code = fields.get("status_code") or 200
+        if status_code < 400 and self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            self._counters["sampled_out"] += 1
+            return False
+        fields["time"] = time.time()
+        if len(self._buffer) == self._buffer.maxlen:
+            self._counters["dropped"] += 1
+        self._buffer.append(fields)
+        self._counters["recorded"] += 1
+        self._start_writer()
+        if self._wakeup is not None and len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    def _start_writer(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Queued records are written by the next writer or by close().
+            return
+        if self._task is None or self._task.done() or self._loop is not loop:
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._stop = asyncio.Event()
+            self._task = loop.create_task(self._run(self._wakeup, self._stop))
+
+    async def _run(self, wakeup: asyncio.Event, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+            await self.flush()
+
+    def _prepare(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        answer = _text(record.get("answer"))
+        question = _text(record.get("question"))
+        record["answer_chars"] = len(answer)
+        record["answer"] = answer[: self.max_chars]
+        record["question"] = question[: self.max_chars]
+        return record
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        # Runs in the writer thread, the only one updating these counters.
+        records = [self._prepare(record) for record in batch]
+        for sink in self.sinks:
+            try:
+                sink.write(records)
+            except Exception as ex:
+                self._counters["sink_errors"] += 1
+                ic.configureOutput(prefix="WARNING| ")
+                ic(f"Request log sink {type(sink).__name__} failed: {ex}")
+        self._counters["written"] += len(records)
+        self._counters["batches"] += 1
+
+    async def flush(self) -> None:
+        """Write every queued record to the sinks."""
+        loop = asyncio.get_running_loop()
+        while self._buffer:
+            count = min(self.batch_size, len(self._buffer))
+            batch = [self._buffer.popleft() for _ in range(count)]
+            # A popped batch is written even if the flush is cancelled.
+            await asyncio.shield(loop.run_in_executor(self._executor, self._write, batch))
+
+    async def close(self) -> None:
+        """Stop the writer, write the queued records and close the sinks."""
+        task, self._task = self._task, None
+        loop = asyncio.get_running_loop()
+        if task is not None and not task.done() and self._loop is loop:
+            # Let the writer finish the batch it is writing, then stop it.
+            assert self._wakeup is not None and self._stop is not None
+            self._stop.set()
+            self._wakeup.set()
+            await task
+        await self.flush()
+        for sink in self.sinks:
+            await loop.run_in_executor(self._executor, sink.close)
+        self._executor.shutdown(wait=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """Records recorded, sampled out, dropped and written, and the queue length."""
+        stats: Dict[str, Any] = dict(self._counters)
+        stats["queued"] = len(self._buffer)
+        stats["buffer_size"] = self._buffer.maxlen
+        return stats
+
+
+def sinks_from_config() -> List[LogSink]:
+    """The sinks named by ``LLM4FREE_REQUEST_LOG_SINKS``."""
+    sinks: List[LogSink] = []
+    for name in AppConfig.request_log_sinks.split(","):
+        name = name.strip().lower()
+        if name == "stdout":
+            sinks.append(StdoutSink())
+        elif name == "jsonl":
+            sinks.append(
+                JsonlSink(
+                    AppConfig.request_log_path,
+                    AppConfig.request_log_max_bytes,
+                    AppConfig.request_log_backups,
+                )
+            )
+        elif name == "sqlite":
+            sinks.append(SQLiteSink(AppConfig.request_log_db))
+        elif name:
+            raise ValueError(f"Unknown request log sink {name!r}; use stdout, jsonl or sqlite")
+    return sinks
+
+
+_request_log: Optional[RequestLog] = None
+
+
+def get_request_log() -> Optional[RequestLog]:
+    """Return the request log, or None unless LLM4FREE_REQUEST_LOGGING is enabled."""
+    global _request_log
+    if _request_log is None and AppConfig.request_logging_enabled:
+        _request_log = RequestLog(
+            sinks_from_config(),
+            buffer_size=AppConfig.request_log_buffer,
+            sample_rate=AppConfig.request_log_sample_rate,
+            max_chars=AppConfig.request_log_max_chars,
+        )
+    return _request_log
+
+
+async def close_request_log() -> None:
+    """Write the queued records and close the request log, if one was opened."""
+    global _request_log
+    request_log, _request_log = _request_log, None
+    if request_log is not None:
+        await request_log.close()
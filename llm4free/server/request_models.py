@@ -94,6 +94,26 @@ class ToolFunction(BaseModel):
 ToolUnion = Union[ToolFunction, Dict[str, Any]]
 
 
+class StreamOptions(BaseModel):
+    """Options for streaming chat completion responses."""
+
+    include_usage: Optional[bool] = Field(
+        None, description="If set, a usage chunk is streamed before the final [DONE] message."
+    )
+    coalesce_ms: Optional[float] = Field(
+        None,
+        ge=0,
+        description="Merge content deltas arriving within this many milliseconds into one chunk (0 disables).",
+    )
+    coalesce_chars: Optional[int] = Field(
+        None,
+        ge=0,
+        description="Flush a merged delta once it holds this many characters.",
+    )
+
+    model_config = ConfigDict(extra="allow")
+
+
 class ChatCompletionRequest(BaseModel):
     """Request model for chat completions."""
 
@@ -115,6 +135,9 @@ class ChatCompletionRequest(BaseModel):
     stream: Optional[bool] = Field(
         False, description="If set, partial message deltas will be sent, like in ChatGPT."
     )
+    stream_options: Optional[StreamOptions] = Field(
+        None, description="Options for streaming responses."
+    )
     max_tokens: Optional[int] = Field(
         None, description="The maximum number of tokens to generate in the chat completion."
     )
@@ -5,22 +5,43 @@ Request processing utilities for the LLM4Free API.
 import json
 import time
 import uuid
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from litprinter import ic
 from starlette.status import HTTP_422_UNPROCESSABLE_CONTENT, HTTP_500_INTERNAL_SERVER_ERROR
 
 from llm4free.llm.utils import (
     ChatCompletion,
+    ChatCompletionChunk,
     ChatCompletionMessage,
     Choice,
     CompletionUsage,
 )
+from llm4free.response_cache import (
+    CACHE_BYPASS,
+    ResponseCache,
+    build_completion,
+    cache_key,
+    cache_mode_from_header,
+    is_deterministic,
+    replay_chunks,
+)
+from llm4free.search.cache import SearchCache, get_search_cache, set_search_cache
+from llm4free.utils import json_dumpb
 
 # from .simple_logger import log_api_request, get_client_ip, generate_request_id
 from .config import AppConfig
 from .exceptions import APIError, clean_text
+from .executor import (
+    create_completion,
+    is_completion_stream,
+    iterate_completion,
+    run_in_provider_pool,
+)
+from .metrics import CHARS_PER_TOKEN, CompletionTimer
+from .providers import ProviderLease, release_when_done
+from .request_log import get_request_log
 from .request_models import (
     AnthropicImageBlock,
     AnthropicMessage,
@@ -37,6 +58,7 @@ from .request_models import (
     ChatCompletionRequest,
     Message,
 )
+from .stream_coalescing import CoalesceOptions, coalesce_chunks
 
 
 def get_client_ip(request) -> str:
@@ -58,11 +80,25 @@ def generate_request_id() -> str:
 
 
 async def log_api_request(
-    request_id: str, ip_address: str, model: str, question: str, answer: str, **kwargs
+    request_id: str,
+    ip_address: str,
+    model: str,
+    question: str,
+    answer: Union[str, Sequence[str]],
+    **kwargs,
 ) -> bool:
-    """Convenience function to log API requests."""
-    ic(f"Request {request_id}: model={model}, ip={ip_address}")
-    return True
+    """Queue an API request record on the request log; returns False if it was not logged."""
+    request_log = get_request_log()
+    if request_log is None:
+        return False
+    return request_log.record(
+        request_id=request_id,
+        ip_address=ip_address,
+        model=model,
+        question=question,
+        answer=answer,
+        **kwargs,
+    )
 
 
 async def log_request(
@@ -70,16 +106,19 @@ async def log_request(
     ip_address: str,
     model_used: str,
     question: str,
-    answer: str,
+    answer: Union[str, Sequence[str]],
     response_time_ms: int,
     status_code: int = 200,
     error_message: Optional[str] = None,
     provider: Optional[str] = None,
     request_obj=None,
 ):
-    """Log API request."""
+    """Log API request.
+
+    ``answer`` may be the list of streamed parts; it is joined by the request
+    log's writer, off the request path.
+    """
     try:
-        # Use simple logger if request logging is enabled
         if AppConfig.request_logging_enabled:
             user_agent = None
             if request_obj:
@@ -92,7 +131,8 @@ async def log_request(
                 question=question,
                 answer=answer,
                 provider=provider,
-                processing_time_ms=response_time_ms,
+                status_code=status_code,
+                response_time_ms=response_time_ms,
                 error=error_message,
                 user_agent=user_agent,
             )
@@ -229,6 +269,138 @@ def prepare_provider_params(
     return params
 
 
+SSE_DONE = b"data: [DONE]\n\n"
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the chat completion cache, or None unless LLM4FREE_RESPONSE_CACHE is enabled."""
+    global _response_cache
+    if _response_cache is None and AppConfig.response_cache_enabled:
+        _response_cache = ResponseCache(
+            max_entries=AppConfig.response_cache_size,
+            ttl=AppConfig.response_cache_ttl,
+            path=AppConfig.response_cache_path,
+            max_disk_bytes=AppConfig.response_cache_max_bytes,
+        )
+    return _response_cache
+
+
+def close_response_cache() -> None:
+    """Close the persistent tier of the chat completion cache, if one was opened."""
+    global _response_cache
+    if _response_cache is not None:
+        _response_cache.close()
+        _response_cache = None
+
+
+def search_result_cache() -> Optional[SearchCache]:
+    """Return the search result cache, or None unless LLM4FREE_SEARCH_CACHE is enabled."""
+    cache = get_search_cache()
+    if cache is None and AppConfig.search_cache_enabled:
+        cache = SearchCache(
+            max_entries=AppConfig.search_cache_size,
+            stale_while_revalidate=AppConfig.search_cache_stale,
+            path=AppConfig.search_cache_path,
+        )
+        set_search_cache(cache)
+    return cache
+
+
+def close_search_cache() -> None:
+    """Close the search result cache, if one was opened."""
+    cache = get_search_cache()
+    if cache is not None:
+        cache.close()
+        set_search_cache(None)
+
+
+async def lookup_cached_completion(
+    params: Dict[str, Any], provider_name: str, cache_control: Optional[str]
+) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """Look up a chat request in the response cache; see ``ResponseCache.lookup``."""
+    cache = get_response_cache()
+    if cache is None:
+        return None, None
+    mode = cache_mode_from_header(cache_control)
+    if cache.persistent:
+        return await run_in_provider_pool(cache.lookup, params, provider_name, mode)
+    return cache.lookup(params, provider_name, mode)
+
+
+async def store_cached_completion(cache_key: str, completion: Any) -> None:
+    """Store a completion in the response cache under a key from ``lookup_cached_completion``."""
+    cache = get_response_cache()
+    if cache is None:
+        return
+    if cache.persistent:
+        await run_in_provider_pool(cache.set, cache_key, completion)
+    else:
+        cache.set(cache_key, completion)
+
+
+def coalescing_key(
+    params: Dict[str, Any],
+    provider_name: str,
+    cache_control: Optional[str],
+    coalesce: Optional[CoalesceOptions] = None,
+) -> Optional[str]:
+    """
+    Key under which identical in-flight chat requests share one upstream call,
+    or None if this request must not be coalesced.
+
+    A shared stream is batched with the options of the request that started
+    it, so streams are only shared between requests with the same ``coalesce``
+    settings.
+    """
+    if not AppConfig.coalesce_requests or not is_deterministic(params):
+        return None
+    if cache_mode_from_header(cache_control) == CACHE_BYPASS:
+        return None
+    key = cache_key(params, provider_name)
+    if coalesce is not None:
+        key = f"{key}:coalesce={coalesce.window}:{coalesce.max_chars}"
+    return key
+
+
+def cached_completion_response(
+    completion: Dict[str, Any], request_id: str, stream: bool
+) -> Union[JSONResponse, StreamingResponse]:
+    """Answer a chat request from the cache, replaying it as SSE chunks if it streams."""
+    completion["id"] = request_id
+    for choice in completion.get("choices", []):
+        message = choice.get("message") or {}
+        if message.get("content"):
+            message["content"] = clean_text(message["content"])
+    headers = {"X-Cache": "HIT"}
+    if not stream:
+        return JSONResponse(completion, headers=headers)
+
+    def streaming():
+        for chunk in replay_chunks(completion):
+            yield chunk.to_sse_bytes()
+        yield SSE_DONE
+
+    return StreamingResponse(streaming(), media_type="text/event-stream", headers=headers)
+
+
+def format_sse(data: Any, event: Optional[str] = None) -> bytes:
+    """Encode one server-sent event, serializing ``data`` straight to JSON bytes."""
+    if event is None:
+        return b"data: " + json_dumpb(data) + b"\n\n"
+    return b"event: " + event.encode("utf-8") + b"\ndata: " + json_dumpb(data) + b"\n\n"
+
+
+def _has_tool_calls(choice: Dict[str, Any]) -> bool:
+    """Return True if a serialized choice carries tool calls."""
+    for field in ("delta", "message"):
+        message = choice.get(field)
+        if isinstance(message, dict) and message.get("tool_calls"):
+            return True
+    return False
+
+
 async def handle_streaming_response(
     provider: Any,
     params: Dict[str, Any],
@@ -239,23 +411,62 @@ async def handle_streaming_response(
     start_time: float,
     provider_name: Optional[str] = None,
     request_obj=None,
+    lease: Optional[ProviderLease] = None,
+    cache_key: Optional[str] = None,
+    coalesce: Optional[CoalesceOptions] = None,
 ) -> StreamingResponse:
-    """Handle streaming chat completion response."""
+    """Handle streaming chat completion response.
+
+    If ``lease`` is given, the provider instance is returned to its pool when
+    the upstream stream ends (or evicted if the call fails). If ``cache_key``
+    is given, a stream that runs to completion without an error or tool calls
+    is stored in the response cache under it; a cancelled stream is never
+    cached. If ``coalesce`` is given, consecutive content deltas are
+    merged before they are sent (see ``stream_coalescing``).
+    """
     collected_content = []
 
     async def streaming():
         nonlocal collected_content
+        failed = False
+        completed = False
+        has_tool_calls = False
+        timer = CompletionTimer(provider_name, model_name, True, start_time)
         try:
             ic.configureOutput(prefix="DEBUG| ")
             ic(f"Starting streaming response for request {request_id}")
-            completion_stream = provider.chat.completions.create(**params)
+            # Async providers are awaited; sync ones run in the provider pool
+            try:
+                completion_stream = await create_completion(provider, provider_name, **params)
+            except Exception:
+                if lease is not None:
+                    lease.release(failed=True)
+                raise
+            completion_stream = release_when_done(completion_stream, lease)
 
             # Check if it's iterable (generator, iterator, or other iterable types)
-            if hasattr(completion_stream, "__iter__") and not isinstance(
-                completion_stream, (str, bytes, dict)
-            ):
+            if is_completion_stream(completion_stream):
                 try:
-                    for chunk in completion_stream:
+                    chunks = iterate_completion(completion_stream, provider_name)
+                    if coalesce is not None:
+                        chunks = coalesce_chunks(chunks, *coalesce)
+                    async for chunk in chunks:
+                        if isinstance(chunk, ChatCompletionChunk):
+                            # Built-in chunks serialize themselves; clean content in place
+                            for choice in chunk.choices:
+                                message = choice.delta or choice.message
+                                if message is None:
+                                    continue
+                                if message.tool_calls:
+                                    has_tool_calls = True
+                                if message.content:
+                                    collected_content.append(message.content)
+                                    message.content = clean_text(message.content)
+                            if timer.first_token_at is None and collected_content:
+                                timer.first_token()
+                            yield chunk.to_sse_bytes()
+                            continue
+
                         # Standardize chunk format before sending
                         model_dump = getattr(chunk, "model_dump", None)
                         model_dict = getattr(chunk, "dict", None)
@@ -272,6 +483,8 @@ async def handle_streaming_response(
                         if isinstance(chunk_data, dict) and "choices" in chunk_data:
                             for choice in chunk_data.get("choices", []):
                                 if isinstance(choice, dict):
+                                    if _has_tool_calls(choice):
+                                        has_tool_calls = True
                                     # Handle delta for streaming
                                     if (
                                         "delta" in choice
@@ -293,7 +506,9 @@ async def handle_streaming_response(
                                             collected_content.append(content)
                                         choice["message"]["content"] = clean_text(content)
 
-                        yield f"data: {json.dumps(chunk_data, ensure_ascii=False)}\n\n"
+                        if timer.first_token_at is None and collected_content:
+                            timer.first_token()
+                        yield format_sse(chunk_data)
                 except TypeError as te:
                     ic.configureOutput(prefix="ERROR| ")
                     ic(f"Error iterating over completion_stream: {te}")
@@ -311,6 +526,8 @@ async def handle_streaming_response(
                     if isinstance(response_data, dict) and "choices" in response_data:
                         for choice in response_data.get("choices", []):
                             if isinstance(choice, dict):
+                                if _has_tool_calls(choice):
+                                    has_tool_calls = True
                                 if (
                                     "delta" in choice
                                     and isinstance(choice["delta"], dict)
@@ -330,7 +547,7 @@ async def handle_streaming_response(
                                         collected_content.append(content)
                                     choice["message"]["content"] = clean_text(content)
 
-                    yield f"data: {json.dumps(response_data, ensure_ascii=False)}\n\n"
+                    yield format_sse(response_data)
             else:  # Non-generator response
                 model_dump = getattr(completion_stream, "model_dump", None)
                 model_dict = getattr(completion_stream, "dict", None)
@@ -345,6 +562,8 @@ async def handle_streaming_response(
                 if isinstance(response_data, dict) and "choices" in response_data:
                     for choice in response_data.get("choices", []):
                         if isinstance(choice, dict):
+                            if _has_tool_calls(choice):
+                                has_tool_calls = True
                             if (
                                 "delta" in choice
                                 and isinstance(choice["delta"], dict)
@@ -364,9 +583,11 @@ async def handle_streaming_response(
                                     collected_content.append(content)
                                 choice["message"]["content"] = clean_text(content)
 
-                yield f"data: {json.dumps(response_data, ensure_ascii=False)}\n\n"
+                yield format_sse(response_data)
+            completed = True
 
         except Exception as e:
+            failed = True
             ic.configureOutput(prefix="ERROR| ")
             ic(f"Error in streaming response for request {request_id}: {e}")
             error_message = clean_text(str(e))
@@ -377,7 +598,7 @@ async def handle_streaming_response(
                     "code": "streaming_error",
                 }
             }
-            yield f"data: {json.dumps(error_data, ensure_ascii=False)}\n\n"
+            yield format_sse(error_data)
 
             # Log error request
             response_time_ms = int((time.time() - start_time) * 1000)
@@ -394,23 +615,31 @@ async def handle_streaming_response(
                 request_obj=request_obj,
             )
         finally:
-            yield "data: [DONE]\n\n"
+            timer.finish(failed, text_chars=sum(map(len, collected_content)))
 
-            # Log successful streaming request
-            if collected_content:
+        # Not reached when the stream is cancelled or closed: the cancellation
+        # propagates, so no [DONE] marks a truncated stream as finished.
+        yield SSE_DONE
+
+        # Log successful streaming request
+        if collected_content:
+            if cache_key is not None and completed and not has_tool_calls:
                 answer = "".join(collected_content)
-                response_time_ms = int((time.time() - start_time) * 1000)
-                await log_request(
-                    request_id=request_id,
-                    ip_address=ip_address,
-                    model_used=model_name,
-                    question=question,
-                    answer=answer,
-                    response_time_ms=response_time_ms,
-                    status_code=200,
-                    provider=provider_name,
-                    request_obj=request_obj,
+                await store_cached_completion(
+                    cache_key, build_completion(params.get("model", model_name), answer)
                 )
+            response_time_ms = int((time.time() - start_time) * 1000)
+            await log_request(
+                request_id=request_id,
+                ip_address=ip_address,
+                model_used=model_name,
+                question=question,
+                answer=collected_content,
+                response_time_ms=response_time_ms,
+                status_code=200,
+                provider=provider_name,
+                request_obj=request_obj,
+            )
 
     return StreamingResponse(streaming(), media_type="text/event-stream")
 
@@ -427,10 +656,11 @@ async def handle_non_streaming_response(
     request_obj=None,
 ) -> Dict[str, Any]:
     """Handle non-streaming chat completion response."""
+    timer = CompletionTimer(provider_name, model_name, False, start_time)
     try:
         ic.configureOutput(prefix="DEBUG| ")
         ic(f"Starting non-streaming response for request {request_id}")
-        completion = provider.chat.completions.create(**params)
+        completion = await create_completion(provider, provider_name, **params)
 
         if completion is None:
             # Return a valid OpenAI-compatible error response
@@ -449,6 +679,7 @@ async def handle_non_streaming_response(
                 ],
                 usage=CompletionUsage(prompt_tokens=0, completion_tokens=0, total_tokens=0),
             ).model_dump(exclude_none=True)
+            timer.finish(failed=True)
 
             # Log error request
             response_time_ms = int((time.time() - start_time) * 1000)
@@ -492,6 +723,11 @@ async def handle_non_streaming_response(
                             answer = content
                         choice["message"]["content"] = clean_text(content)
 
+        usage = response_data.get("usage") if isinstance(response_data, dict) else None
+        timer.finish(
+            text_chars=len(answer),
+            tokens=(usage.get("completion_tokens") or None) if isinstance(usage, dict) else None,
+        )
         elapsed = time.time() - start_time
         response_time_ms = int(elapsed * 1000)
         ic.configureOutput(prefix="INFO| ")
@@ -515,6 +751,7 @@ async def handle_non_streaming_response(
     except Exception as e:
         ic.configureOutput(prefix="ERROR| ")
         ic(f"Error in non-streaming response for request {request_id}: {e}")
+        timer.finish(failed=True)
         error_message = clean_text(str(e))
 
         # Log error request
@@ -768,95 +1005,176 @@ def convert_openai_to_anthropic_response(
     }
 
 
-def convert_openai_chunk_to_anthropic_events(
-    chunk: Dict[str, Any], anthropic_model: str, is_first: bool = False
-) -> List[Dict[str, Any]]:
-    """Convert OpenAI streaming chunk to Anthropic streaming events."""
-    events = []
-
-    if is_first:
-        # Send message_start event
-        message_id = chunk.get("id", f"msg_{uuid.uuid4().hex[:24]}")
-        events.append(
-            {
-                "type": "message_start",
-                "message": {
-                    "id": message_id,
-                    "type": "message",
-                    "role": "assistant",
-                    "content": [],
-                    "model": anthropic_model,
-                    "stop_reason": None,
-                    "stop_sequence": None,
-                    "usage": {"input_tokens": 0, "output_tokens": 0},
-                },
-            }
+_STOP_REASONS = {"length": "max_tokens", "tool_calls": "tool_use", "function_call": "tool_use"}
+
+
+class AnthropicStreamTranslator:
+    """
+    Translate one OpenAI chat completion stream into Anthropic streaming events.
+
+    The translator keeps the state of the stream: the first chunk opens the
+    message, text opens a single text block that then only receives
+    ``text_delta`` events, and tool call argument fragments are accumulated by
+    their index until the block is closed. ``finish`` closes the open blocks and
+    reports the stop reason and token usage (the provider's, or an estimate from
+    the answer length). Events are returned as SSE bytes.
+    """
+
+    def __init__(self, anthropic_model: str, message_id: Optional[str] = None) -> None:
+        self.anthropic_model = anthropic_model
+        self.message_id = message_id
+        self.started = False
+        self.finished = False
+        self.finish_reason: Optional[str] = None
+        self.usage: Dict[str, Any] = {}
+        self.text_parts: List[str] = []
+        self._index = 0
+        self._text_prefix: Optional[bytes] = None
+        # Tool calls being streamed, by their OpenAI index.
+        self._tools: Dict[int, Dict[str, Any]] = {}
+
+    @property
+    def text(self) -> str:
+        """The text streamed so far."""
+        return "".join(self.text_parts)
+
+    def _start(self, chunk: Dict[str, Any]) -> bytes:
+        self.started = True
+        if self.message_id is None:
+            self.message_id = chunk.get("id") or f"msg_{uuid.uuid4().hex[:24]}"
+        message = {
+            "id": self.message_id,
+            "type": "message",
+            "role": "assistant",
+            "content": [],
+            "model": self.anthropic_model,
+            "stop_reason": None,
+            "stop_sequence": None,
+            "usage": {"input_tokens": 0, "output_tokens": 0},
+        }
+        return format_sse({"type": "message_start", "message": message}, "message_start")
+
+    def _open_text(self) -> bytes:
+        index = self._index
+        self._index += 1
+        self._text_prefix = (
+            b'event: content_block_delta\ndata: {"type":"content_block_delta","index":'
+            + str(index).encode("ascii")
+            + b',"delta":{"type":"text_delta","text":'
         )
-
-    # Process choices
-    choices = chunk.get("choices", [])
-    for choice in choices:
-        delta = choice.get("delta", {})
-        finish_reason = choice.get("finish_reason")
-
-        # Handle content delta
-        content = delta.get("content")
-        if content:
-            events.append(
-                {
-                    "type": "content_block_start",
-                    "index": 0,
-                    "content_block": {"type": "text", "text": ""},
-                }
-            )
-            events.append(
-                {
-                    "type": "content_block_delta",
-                    "index": 0,
-                    "delta": {"type": "text_delta", "text": content},
-                }
-            )
-            events.append({"type": "content_block_stop", "index": 0})
-
-        # Handle tool calls
-        tool_calls = delta.get("tool_calls", [])
-        for i, tc in enumerate(tool_calls):
-            if tc.get("type") == "function":
-                func = tc.get("function", {})
-                tc_id = tc.get("id", f"toolu_{uuid.uuid4().hex[:24]}")
-                tc_name = func.get("name", "")
-                tc_args = func.get("arguments", "{}")
-
-                events.append(
-                    {
-                        "type": "content_block_start",
-                        "index": i + 1,
-                        "content_block": {"type": "tool_use", "id": tc_id, "name": tc_name},
-                    }
+        event = {
+            "type": "content_block_start",
+            "index": index,
+            "content_block": {"type": "text", "text": ""},
+        }
+        return format_sse(event, "content_block_start")
+
+    def _close_text(self) -> bytes:
+        if self._text_prefix is None:
+            return b""
+        self._text_prefix = None
+        index = self._index - 1
+        return format_sse({"type": "content_block_stop", "index": index}, "content_block_stop")
+
+    def _close_tools(self) -> bytes:
+        out = []
+        for tool in self._tools.values():
+            index = self._index
+            self._index += 1
+            block = {
+                "type": "tool_use",
+                "id": tool["id"] or f"toolu_{uuid.uuid4().hex[:24]}",
+                "name": tool["name"],
+                "input": {},
+            }
+            out.append(
+                format_sse(
+                    {"type": "content_block_start", "index": index, "content_block": block},
+                    "content_block_start",
                 )
-                events.append(
-                    {
-                        "type": "content_block_delta",
-                        "index": i + 1,
-                        "delta": {"type": "input_json_delta", "partial_json": tc_args},
-                    }
+            )
+            delta = {"type": "input_json_delta", "partial_json": "".join(tool["args"]) or "{}"}
+            out.append(
+                format_sse(
+                    {"type": "content_block_delta", "index": index, "delta": delta},
+                    "content_block_delta",
                 )
-                events.append({"type": "content_block_stop", "index": i + 1})
-
-        # Handle finish
-        if finish_reason:
-            stop_reason = "end_turn"
-            if finish_reason == "length":
-                stop_reason = "max_tokens"
-            elif finish_reason == "tool_calls":
-                stop_reason = "tool_use"
-
-            events.append(
-                {
-                    "type": "message_delta",
-                    "delta": {"stop_reason": stop_reason, "stop_sequence": None},
-                    "usage": {"output_tokens": 0},
-                }
             )
-
-    return events
+            out.append(
+                format_sse({"type": "content_block_stop", "index": index}, "content_block_stop")
+            )
+        self._tools.clear()
+        return b"".join(out)
+
+    def _add_tool_call(self, position: int, tool_call: Dict[str, Any]) -> None:
+        index = tool_call.get("index")
+        if index is None:
+            index = position
+        tool = self._tools.get(index)
+        if tool is None:
+            tool = self._tools[index] = {"id": None, "name": "", "args": []}
+        if tool_call.get("id"):
+            tool["id"] = tool_call["id"]
+        function = tool_call.get("function") or {}
+        if function.get("name"):
+            tool["name"] = function["name"]
+        if function.get("arguments"):
+            tool["args"].append(function["arguments"])
+
+    def feed(self, chunk: Dict[str, Any]) -> bytes:
+        """Events for one chunk; a complete (non-streamed) completion is accepted too."""
+        out = b"" if self.started else self._start(chunk)
+        usage = chunk.get("usage")
+        if usage:
+            self.usage = usage
+        for choice in chunk.get("choices") or ():
+            delta = choice.get("delta") or choice.get("message") or {}
+            content = delta.get("content")
+            if content:
+                if self._tools:
+                    out += self._close_tools()
+                if self._text_prefix is None:
+                    out += self._open_text()
+                self.text_parts.append(content)
+                out += self._text_prefix + json_dumpb(content) + b"}}\n\n"
+            tool_calls = delta.get("tool_calls")
+            if tool_calls:
+                out += self._close_text()
+                for position, tool_call in enumerate(tool_calls):
+                    self._add_tool_call(position, tool_call)
+            if choice.get("finish_reason"):
+                self.finish_reason = choice["finish_reason"]
+        return out
+
+    def error(self, message: str) -> bytes:
+        """An ``error`` event; the stream then ends without a stop reason."""
+        self.finished = True
+        event = {"type": "error", "error": {"type": "api_error", "message": message}}
+        return format_sse(event, "error")
+
+    def _output_tokens(self) -> int:
+        if "completion_tokens" in self.usage:
+            return self.usage["completion_tokens"] or 0
+        # Rough estimate when the provider reports no usage; encoding the
+        # answer with tiktoken here would block the event loop.
+        chars = sum(map(len, self.text_parts))
+        return -(-chars // CHARS_PER_TOKEN)
+
+    def finish(self) -> bytes:
+        """Close the open blocks and end the message with its stop reason and usage."""
+        if self.finished:
+            return format_sse({"type": "message_stop"}, "message_stop")
+        self.finished = True
+        out = b"" if self.started else self._start({})
+        out += self._close_text() + self._close_tools()
+        usage = {"output_tokens": self._output_tokens()}
+        if self.usage.get("prompt_tokens") is not None:
+            usage["input_tokens"] = self.usage["prompt_tokens"]
+        stop_reason = _STOP_REASONS.get(self.finish_reason or "", "end_turn")
+        event = {
+            "type": "message_delta",
+            "delta": {"stop_reason": stop_reason, "stop_sequence": None},
+            "usage": usage,
+        }
+        out += format_sse(event, "message_delta")
+        return out + format_sse({"type": "message_stop"}, "message_stop")
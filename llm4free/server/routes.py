@@ -2,13 +2,14 @@
 API routes for the LLM4Free server.
 """
 
+import asyncio
 import json
 import time
 import uuid
 from pathlib import Path
 from typing import Any, Dict, Optional, cast
 
-from fastapi import Body, FastAPI, Query, Request
+from fastapi import Body, FastAPI, Query, Request, Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from litprinter import ic
@@ -17,18 +18,34 @@ from starlette.status import (
     HTTP_500_INTERNAL_SERVER_ERROR,
 )
 
+from llm4free.response_cache import request_key
+from llm4free.search.base import SEARCH_TYPES
 from llm4free.search.engines import ENGINES
+from llm4free.search.results import serialize_results
 
 from .config import AppConfig
-from .exceptions import APIError
+from .exceptions import APIError, clean_text
+from .executor import (
+    create_completion,
+    is_completion_stream,
+    iterate_completion,
+    run_in_provider_pool,
+)
+from .listings import listing_response
+from .metrics import CompletionTimer, registry
 from .providers import (
-    get_provider_instance,
-    get_tti_provider_instance,
-    get_tts_provider_instance,
+    ProviderLease,
+    checkout_provider,
+    checkout_tti_provider,
+    checkout_tts_provider,
+    get_provider_pool,
+    provider_pools,
+    release_when_done,
     resolve_provider_and_model,
     resolve_tti_provider_and_model,
     resolve_tts_provider_and_model,
 )
+from .request_log import get_request_log
 from .request_models import (
     AnthropicMessagesRequest,
     ChatCompletionRequest,
@@ -37,15 +54,23 @@ from .request_models import (
     SpeechGenerationRequest,
 )
 from .request_processing import (
+    AnthropicStreamTranslator,
+    cached_completion_response,
+    coalescing_key,
     convert_anthropic_to_openai,
-    convert_openai_chunk_to_anthropic_events,
     convert_openai_to_anthropic_response,
+    get_response_cache,
     handle_non_streaming_response,
     handle_streaming_response,
     log_request,
+    lookup_cached_completion,
     prepare_provider_params,
     process_messages,
+    search_result_cache,
+    store_cached_completion,
 )
+from .single_flight import single_flight
+from .stream_coalescing import coalesce_chunks, coalesce_options
 
 
 class Api:
@@ -156,6 +181,43 @@ class Api:
             """Health check endpoint for monitoring."""
             return {"status": "healthy", "service": "llm4free-api", "version": "0.2.0"}
 
+        @self.app.get("/monitor/cache", include_in_schema=False)
+        async def response_cache_stats():
+            """Chat completion cache hits, misses and size."""
+            cache = get_response_cache()
+            return {"enabled": cache is not None, **(cache.stats() if cache else {})}
+
+        @self.app.get("/monitor/search-cache", include_in_schema=False)
+        async def search_cache_stats():
+            """Search result cache hits (fresh and stale), misses and size."""
+            cache = search_result_cache()
+            return {"enabled": cache is not None, **(cache.stats() if cache else {})}
+
+        @self.app.get("/metrics", include_in_schema=False)
+        async def metrics():
+            """Runtime metrics in the Prometheus text format."""
+            text = await asyncio.to_thread(registry.render)
+            return Response(text, media_type="text/plain; version=0.0.4; charset=utf-8")
+
+        @self.app.get("/monitor/request-log", include_in_schema=False)
+        async def request_log_stats():
+            """Request log records written, sampled out and dropped, and the queue length."""
+            request_log = get_request_log()
+            return {
+                "enabled": request_log is not None,
+                **(request_log.stats() if request_log else {}),
+            }
+
+        @self.app.get("/monitor/coalescing", include_in_schema=False)
+        async def coalescing_stats():
+            """Upstream calls started and identical requests that joined one in flight."""
+            return single_flight.stats()
+
+        @self.app.get("/monitor/pools", include_in_schema=False)
+        async def provider_pool_metrics():
+            """Provider instance pool usage (checkouts, wait time, utilization)."""
+            return {kind: pool.metrics() for kind, pool in provider_pools.items()}
+
     def _register_model_routes(self):
         """Register model listing routes."""
 
@@ -165,24 +227,8 @@ class Api:
             tags=["Chat Completions"],
             description="List all available chat completion models.",
         )
-        async def list_models():
-            models = []
-            for model_name, provider_class in AppConfig.provider_map.items():
-                if "/" not in model_name:
-                    continue  # Skip provider names
-                if any(m["id"] == model_name for m in models):
-                    continue
-                models.append(
-                    {
-                        "id": model_name,
-                        "object": "model",
-                        "created": int(time.time()),
-                        "owned_by": "llm4free",  # Set owned_by to llm4free
-                    }
-                )
-            # Sort models alphabetically by the part after the first '/'
-            models = sorted(models, key=lambda m: m["id"].split("/", 1)[1].lower())
-            return {"object": "list", "data": models}
+        async def list_models(request: Request):
+            return listing_response(request, "chat", "models")
 
         @self.app.get(
             "/v1/models/{model}",
@@ -211,52 +257,9 @@ class Api:
             tags=["Chat Completions"],
             description="Get details about available chat completion providers including supported models and parameters.",
         )
-        async def list_providers():
+        async def list_providers(request: Request):
             """Get information about all available chat completion providers."""
-            providers = {}
-
-            # Extract unique provider names (exclude model mappings)
-            provider_names = set()
-            for key, provider_class in AppConfig.provider_map.items():
-                if "/" not in key:  # Provider name, not model mapping
-                    provider_names.add(key)
-
-            for provider_name in sorted(provider_names):
-                provider_class = AppConfig.provider_map[provider_name]
-
-                # Get available models for this provider
-                models = []
-                for key, cls in AppConfig.provider_map.items():
-                    if key.startswith(f"{provider_name}/"):
-                        model_name = key.split("/", 1)[1]
-                        models.append(model_name)
-
-                # Sort models
-                models = sorted(models)
-
-                # Get supported parameters (common OpenAI-compatible parameters)
-                supported_params = [
-                    "model",
-                    "messages",
-                    "max_tokens",
-                    "temperature",
-                    "top_p",
-                    "presence_penalty",
-                    "frequency_penalty",
-                    "stop",
-                    "stream",
-                    "user",
-                ]
-
-                providers[provider_name] = {
-                    "name": provider_name,
-                    "class": provider_class.__name__,
-                    "models": models,
-                    "parameters": supported_params,
-                    "model_count": len(models),
-                }
-
-            return {"providers": providers, "total_providers": len(providers)}
+            return listing_response(request, "chat", "providers")
 
         @self.app.get(
             "/v1/TTI/models",
@@ -264,77 +267,17 @@ class Api:
             tags=["Image Generation"],
             description="List all available text-to-image (TTI) models.",
         )
-        async def list_tti_models():
-            models = []
-            for model_name, provider_class in AppConfig.tti_provider_map.items():
-                if "/" not in model_name:
-                    continue  # Skip provider names
-                if any(m["id"] == model_name for m in models):
-                    continue
-                models.append(
-                    {
-                        "id": model_name,
-                        "object": "model",
-                        "created": int(time.time()),
-                        "owned_by": "llm4free",  # Set owned_by to llm4free
-                    }
-                )
-            # Sort models alphabetically by the part after the first '/'
-            models = sorted(models, key=lambda m: m["id"].split("/", 1)[1].lower())
-            return {"object": "list", "data": models}
+        async def list_tti_models(request: Request):
+            return listing_response(request, "tti", "models")
 
         @self.app.get(
             "/v1/TTI/providers",
             tags=["Image Generation"],
             description="Get details about available text-to-image (TTI) providers including supported models and parameters.",
         )
-        async def list_tti_providers():
+        async def list_tti_providers(request: Request):
             """Get information about all available TTI providers."""
-            providers = {}
-
-            # Extract unique provider names (exclude model mappings)
-            provider_names = set()
-            for key, provider_class in AppConfig.tti_provider_map.items():
-                if "/" not in key:  # Provider name, not model mapping
-                    provider_names.add(key)
-
-            for provider_name in sorted(provider_names):
-                provider_class = AppConfig.tti_provider_map[provider_name]
-
-                # Get available models for this provider
-                models = []
-                for key, cls in AppConfig.tti_provider_map.items():
-                    if key.startswith(f"{provider_name}/"):
-                        model_name = key.split("/", 1)[1]
-                        models.append(model_name)
-
-                # Sort models
-                models = sorted(models)
-
-                # Get supported parameters (common TTI parameters)
-                supported_params = [
-                    "prompt",
-                    "model",
-                    "n",
-                    "size",
-                    "response_format",
-                    "user",
-                    "style",
-                    "aspect_ratio",
-                    "timeout",
-                    "image_format",
-                    "seed",
-                ]
-
-                providers[provider_name] = {
-                    "name": provider_name,
-                    "class": provider_class.__name__,
-                    "models": models,
-                    "parameters": supported_params,
-                    "model_count": len(models),
-                }
-
-            return {"providers": providers, "total_providers": len(providers)}
+            return listing_response(request, "tti", "providers")
 
     def _register_chat_routes(self):
         """Register chat completion routes."""
@@ -359,7 +302,7 @@ class Api:
             },
         )
         async def chat_completions(
-            request: Request, chat_request: ChatCompletionRequest = Body(...)
+            request: Request, response: Response, chat_request: ChatCompletionRequest = Body(...)
         ):
             """Handle chat completion requests with comprehensive error handling."""
             start_time = time.time()
@@ -374,20 +317,6 @@ class Api:
                 # Resolve provider and model
                 provider_class, model_name = resolve_provider_and_model(chat_request.model)
 
-                # Initialize provider with caching and error handling
-                try:
-                    provider = get_provider_instance(provider_class)
-                    ic.configureOutput(prefix="DEBUG| ")
-                    ic(f"Using provider instance: {provider_class.__name__}")
-                except Exception as e:
-                    ic.configureOutput(prefix="ERROR| ")
-                    ic(f"Failed to initialize provider {provider_class.__name__}: {e}")
-                    raise APIError(
-                        f"Failed to initialize provider {provider_class.__name__}: {e}",
-                        HTTP_500_INTERNAL_SERVER_ERROR,
-                        "provider_error",
-                    )
-
                 # Process and validate messages
                 processed_messages = process_messages(chat_request.messages)
 
@@ -421,10 +350,39 @@ class Api:
                                     break
                         break
 
-                # Handle streaming vs non-streaming
-                if chat_request.stream:
-                    return await handle_streaming_response(
-                        provider,
+                # Answer repeated deterministic requests from the response cache
+                cache_key, cached = await lookup_cached_completion(
+                    params, provider_class.__name__, request.headers.get("cache-control")
+                )
+                if cached is not None:
+                    ic.configureOutput(prefix="INFO| ")
+                    ic(f"Serving chat completion {request_id} from the response cache")
+                    return cached_completion_response(cached, request_id, bool(chat_request.stream))
+
+                async def checkout():
+                    # Borrow a provider instance for the duration of the request
+                    try:
+                        lease = await checkout_provider(provider_class)
+                        ic.configureOutput(prefix="DEBUG| ")
+                        ic(f"Using provider instance: {provider_class.__name__}")
+                        return lease
+                    except APIError:
+                        raise
+                    except Exception as e:
+                        ic.configureOutput(prefix="ERROR| ")
+                        ic(f"Failed to initialize provider {provider_class.__name__}: {e}")
+                        raise APIError(
+                            f"Failed to initialize provider {provider_class.__name__}: {e}",
+                            HTTP_500_INTERNAL_SERVER_ERROR,
+                            "provider_error",
+                        )
+
+                coalesce = coalesce_options(chat_request.stream_options)
+
+                async def open_stream():
+                    lease = await checkout()
+                    streaming_response = await handle_streaming_response(
+                        lease.instance,
                         params,
                         request_id,
                         client_ip,
@@ -433,19 +391,49 @@ class Api:
                         start_time,
                         provider_class.__name__,
                         request,
+                        lease=lease,
+                        cache_key=cache_key,
+                        coalesce=coalesce,
                     )
-                else:
-                    return await handle_non_streaming_response(
-                        provider,
-                        params,
-                        request_id,
-                        start_time,
-                        client_ip,
-                        question,
-                        model_name,
-                        provider_class.__name__,
-                        request,
+                    return streaming_response.body_iterator
+
+                async def complete():
+                    lease = await checkout()
+                    with lease:
+                        result = await handle_non_streaming_response(
+                            lease.instance,
+                            params,
+                            request_id,
+                            start_time,
+                            client_ip,
+                            question,
+                            model_name,
+                            provider_class.__name__,
+                            request,
+                        )
+                    if cache_key is not None:
+                        await store_cached_completion(cache_key, result)
+                    return result
+
+                # Identical deterministic requests in flight share one upstream call
+                flight_key = coalescing_key(
+                    params,
+                    provider_class.__name__,
+                    request.headers.get("cache-control"),
+                    coalesce if chat_request.stream else None,
+                )
+                cache_headers = {}
+                if get_response_cache() is not None:
+                    cache_headers["X-Cache"] = "MISS" if cache_key is not None else "BYPASS"
+                if chat_request.stream:
+                    return StreamingResponse(
+                        await single_flight.stream(flight_key, open_stream),
+                        media_type="text/event-stream",
+                        headers=cache_headers,
                     )
+                result = await single_flight.do(flight_key, complete)
+                response.headers.update(cache_headers)
+                return result
 
             except APIError:
                 # Re-raise API errors as-is
@@ -486,20 +474,6 @@ class Api:
                 # Resolve provider and model
                 provider_class, model_name = resolve_provider_and_model(openai_params["model"])
 
-                # Initialize provider
-                try:
-                    provider = get_provider_instance(provider_class)
-                    ic.configureOutput(prefix="DEBUG| ")
-                    ic(f"Using provider instance: {provider_class.__name__}")
-                except Exception as e:
-                    ic.configureOutput(prefix="ERROR| ")
-                    ic(f"Failed to initialize provider {provider_class.__name__}: {e}")
-                    raise APIError(
-                        f"Failed to initialize provider {provider_class.__name__}: {e}",
-                        HTTP_500_INTERNAL_SERVER_ERROR,
-                        "provider_error",
-                    )
-
                 # Update model name in params
                 openai_params["model"] = model_name
 
@@ -519,6 +493,23 @@ class Api:
                             question = content
                         break
 
+                # Borrow a provider instance for the duration of the request
+                try:
+                    lease = await checkout_provider(provider_class)
+                    provider = lease.instance
+                    ic.configureOutput(prefix="DEBUG| ")
+                    ic(f"Using provider instance: {provider_class.__name__}")
+                except APIError:
+                    raise
+                except Exception as e:
+                    ic.configureOutput(prefix="ERROR| ")
+                    ic(f"Failed to initialize provider {provider_class.__name__}: {e}")
+                    raise APIError(
+                        f"Failed to initialize provider {provider_class.__name__}: {e}",
+                        HTTP_500_INTERNAL_SERVER_ERROR,
+                        "provider_error",
+                    )
+
                 # Handle streaming
                 if anthropic_request.stream:
                     return await _handle_anthropic_streaming_response(
@@ -532,20 +523,22 @@ class Api:
                         provider_class.__name__,
                         request,
                         anthropic_request.model,
+                        lease=lease,
                     )
                 else:
-                    return await _handle_anthropic_non_streaming_response(
-                        provider,
-                        openai_params,
-                        request_id,
-                        start_time,
-                        client_ip,
-                        question,
-                        model_name,
-                        provider_class.__name__,
-                        request,
-                        anthropic_request.model,
-                    )
+                    with lease:
+                        return await _handle_anthropic_non_streaming_response(
+                            provider,
+                            openai_params,
+                            request_id,
+                            start_time,
+                            client_ip,
+                            question,
+                            model_name,
+                            provider_class.__name__,
+                            request,
+                            anthropic_request.model,
+                        )
 
             except APIError:
                 raise
@@ -563,24 +556,9 @@ class Api:
             tags=["Anthropic Messages"],
             description="List available models (Anthropic-compatible endpoint).",
         )
-        async def anthropic_list_models():
+        async def anthropic_list_models(request: Request):
             """List available models in Anthropic-compatible format."""
-            models = []
-            for model_name, provider_class in AppConfig.provider_map.items():
-                if "/" not in model_name:
-                    continue
-                if any(m["id"] == model_name for m in models):
-                    continue
-                models.append(
-                    {
-                        "id": model_name,
-                        "type": "model",
-                        "display_name": model_name.split("/", 1)[1],
-                        "created_at": int(time.time()),
-                    }
-                )
-            models = sorted(models, key=lambda m: m["id"].split("/", 1)[1].lower())
-            return {"data": models}
+            return listing_response(request, "chat", "anthropic_models")
 
     def _register_image_routes(self):
         """Register image generation routes."""
@@ -606,7 +584,8 @@ class Api:
 
                 # Initialize TTI provider
                 try:
-                    provider = get_tti_provider_instance(provider_class)
+                    lease = await checkout_tti_provider(provider_class)
+                    provider = lease.instance
                     ic.configureOutput(prefix="DEBUG| ")
                     ic(f"Using TTI provider instance: {provider_class.__name__}")
                 except APIError as e:
@@ -653,8 +632,11 @@ class Api:
                     if value is not None:
                         params[param] = value
 
-                # Generate images
-                response = provider.images.create(**params)
+                # Generate images off the event loop
+                with lease:
+                    response = await run_in_provider_pool(
+                        provider.images.create, provider_name=provider_class.__name__, **params
+                    )
 
                 # Standardize response format
                 if hasattr(response, "model_dump"):
@@ -695,72 +677,17 @@ class Api:
             tags=["Audio Generation"],
             description="List all available text-to-speech (TTS) models.",
         )
-        async def list_tts_models():
-            models = []
-            for model_name, provider_class in AppConfig.tts_provider_map.items():
-                if "/" not in model_name:
-                    continue  # Skip provider names
-                if any(m["id"] == model_name for m in models):
-                    continue
-                models.append(
-                    {
-                        "id": model_name,
-                        "object": "model",
-                        "created": int(time.time()),
-                        "owned_by": "llm4free",  # Set owned_by to llm4free
-                    }
-                )
-            # Sort models alphabetically by the part after the first '/'
-            models = sorted(models, key=lambda m: m["id"].split("/", 1)[1].lower())
-            return {"object": "list", "data": models}
+        async def list_tts_models(request: Request):
+            return listing_response(request, "tts", "models")
 
         @self.app.get(
             "/v1/TTS/providers",
             tags=["Audio Generation"],
             description="Get details about available text-to-speech (TTS) providers including supported models and parameters.",
         )
-        async def list_tts_providers():
+        async def list_tts_providers(request: Request):
             """Get information about all available TTS providers."""
-            providers = {}
-
-            # Extract unique provider names (exclude model mappings)
-            provider_names = set()
-            for key, provider_class in AppConfig.tts_provider_map.items():
-                if "/" not in key:  # Provider name, not model mapping
-                    provider_names.add(key)
-
-            for provider_name in sorted(provider_names):
-                provider_class = AppConfig.tts_provider_map[provider_name]
-
-                # Get available models for this provider
-                models = []
-                for key, cls in AppConfig.tts_provider_map.items():
-                    if key.startswith(f"{provider_name}/"):
-                        model_name = key.split("/", 1)[1]
-                        models.append(model_name)
-
-                # Sort models
-                models = sorted(models)
-
-                # Get supported parameters (common TTS parameters)
-                supported_params = [
-                    "input",
-                    "model",
-                    "voice",
-                    "response_format",
-                    "instructions",
-                    "stream",
-                ]
-
-                providers[provider_name] = {
-                    "name": provider_name,
-                    "class": provider_class.__name__,
-                    "models": models,
-                    "parameters": supported_params,
-                    "model_count": len(models),
-                }
-
-            return {"providers": providers, "total_providers": len(providers)}
+            return listing_response(request, "tts", "providers")
 
         @self.app.post(
             "/v1/audio/speech",
@@ -783,7 +710,8 @@ class Api:
 
                 # Initialize TTS provider
                 try:
-                    provider = get_tts_provider_instance(provider_class)
+                    lease = await checkout_tts_provider(provider_class)
+                    provider = lease.instance
                     ic.configureOutput(prefix="DEBUG| ")
                     ic(f"Using TTS provider instance: {provider_class.__name__}")
                 except APIError as e:
@@ -819,8 +747,11 @@ class Api:
                 if speech_request.instructions is not None:
                     params["instructions"] = speech_request.instructions
 
-                # Generate audio
-                audio_file = provider.create_speech(**params)
+                # Generate audio off the event loop
+                with lease:
+                    audio_file = await run_in_provider_pool(
+                        provider.create_speech, provider_name=provider_class.__name__, **params
+                    )
 
                 if not audio_file or not Path(audio_file).exists():
                     raise APIError(
@@ -914,93 +845,37 @@ class Api:
             language: str = Query("en", description="Language for weather"),
         ):
             """Unified web search endpoint."""
-            github_footer = "If you believe this is a bug, please pull an issue at https://github.com/OEvortex/LLM4Free."
-            try:
-                # Dynamically support all engines in ENGINES
-                found = False
-                for category, engines in ENGINES.items():
-                    if engine in engines:
-                        found = True
-                        engine_cls = engines[engine]
-                        searcher = engine_cls()
-                        # Try to call the appropriate method based on 'type'
-                        if hasattr(searcher, "run"):
-                            method = getattr(searcher, "run")
-                            # Some engines may require different params
-                            try:
-                                if type in ("text", "images", "news", "videos"):
-                                    results = method(
-                                        keywords=q,
-                                        region=region,
-                                        safesearch=safesearch,
-                                        max_results=max_results,
-                                    )
-                                elif type == "suggestions":
-                                    # Suggestions method might have different signature
-                                    try:
-                                        results = method(q, region=region, max_results=max_results)
-                                    except TypeError:
-                                        results = method(q, max_results=max_results)
-                                elif type == "answers":
-                                    results = method(keywords=q)
-                                elif type == "maps":
-                                    results = method(
-                                        keywords=q,
-                                        place=place,
-                                        street=street,
-                                        city=city,
-                                        county=county,
-                                        state=state,
-                                        country=country,
-                                        postalcode=postalcode,
-                                        latitude=latitude,
-                                        longitude=longitude,
-                                        radius=radius,
-                                        max_results=max_results,
-                                    )
-                                elif type == "translate":
-                                    results = method(keywords=q, from_=from_, to=to)
-                                elif type == "weather":
-                                    results = method(location=q, language=language)
-                                else:
-                                    return {
-                                        "error": f"{engine} does not support type '{type}'.",
-                                        "footer": github_footer,
-                                    }
-                                # Try to serialize results if needed
-                                if (
-                                    isinstance(results, list)
-                                    and results
-                                    and hasattr(results[0], "__dict__")
-                                ):
-                                    results = [r.__dict__ for r in results]
-                                return {"engine": engine, "type": type, "results": results}
-                            except Exception as ex:
-                                return {
-                                    "error": f"Error running {engine}.{type}: {ex}",
-                                    "footer": github_footer,
-                                }
-                        else:
-                            return {
-                                "error": f"{engine} does not support type '{type}'.",
-                                "footer": github_footer,
-                            }
-                if not found:
-                    return {
-                        "error": f"Unknown engine. Use one of: {', '.join(sorted(set(name for cat in ENGINES.values() for name in cat)))}.",
-                        "footer": github_footer,
-                    }
-            except Exception as e:
-                # Special handling for rate limit errors
-                msg = str(e)
-                if "429" in msg or "rate limit" in msg.lower():
-                    return {
-                        "error": "You have hit the search rate limit. Please try again later.",
-                        "details": msg,
-                        "code": 429,
-                        "footer": github_footer,
-                    }
-                return {"error": f"Search request failed: {msg}", "footer": github_footer}
+            search_params = {
+                "q": q,
+                "engine": engine,
+                "max_results": max_results,
+                "region": region,
+                "safesearch": safesearch,
+                "type": type,
+                "place": place,
+                "street": street,
+                "city": city,
+                "county": county,
+                "state": state,
+                "country": country,
+                "postalcode": postalcode,
+                "latitude": latitude,
+                "longitude": longitude,
+                "radius": radius,
+                "from_": from_,
+                "to": to,
+                "language": language,
+            }
+            # Identical searches in flight share one upstream call
+            flight_key = (
+                request_key(search_params, "search") if AppConfig.coalesce_requests else None
+            )
+            return await single_flight.do(
+                flight_key,
+                lambda: run_in_provider_pool(
+                    _run_web_search, provider_name=f"search:{engine}", **search_params
+                ),
+            )
 
         @self.app.get(
             "/search/provider",
@@ -1078,6 +953,145 @@ class Api:
 # ============================================================================
 
 
+def _search_engine_class(engine: str, type: str) -> Optional[Any]:
+    """The engine class for ``type``, or the first category that has ``engine``."""
+    engine_cls = ENGINES.get(type, {}).get(engine)
+    if engine_cls is None:
+        for engines in ENGINES.values():
+            if engine in engines:
+                return engines[engine]
+    return engine_cls
+
+
+def _run_web_search(
+    q: str,
+    engine: str,
+    max_results: int,
+    region: str,
+    safesearch: str,
+    type: str,
+    place: Optional[str],
+    street: Optional[str],
+    city: Optional[str],
+    county: Optional[str],
+    state: Optional[str],
+    country: Optional[str],
+    postalcode: Optional[str],
+    latitude: Optional[str],
+    longitude: Optional[str],
+    radius: int,
+    from_: Optional[str],
+    to: str,
+    language: str,
+) -> Dict[str, Any]:
+    """Run one ``/search`` request (blocking; called in the provider pool)."""
+    github_footer = "If you believe this is a bug, please pull an issue at https://github.com/OEvortex/LLM4Free."
+    try:
+        engine_cls = _search_engine_class(engine, type)
+        if engine_cls is None:
+            return {
+                "error": f"Unknown engine. Use one of: {', '.join(sorted(set(name for cat in ENGINES.values() for name in cat)))}.",
+                "footer": github_footer,
+            }
+        if type not in SEARCH_TYPES or not hasattr(engine_cls, "run"):
+            return {
+                "error": f"{engine} does not support type '{type}'.",
+                "footer": github_footer,
+            }
+
+        def fetch() -> Any:
+            # Engine instances are long-lived: borrow one per engine/type from the
+            # pool. An instance that raises is evicted rather than reused.
+            with get_provider_pool("search").borrow(f"{type}:{engine}", engine_cls) as searcher:
+                method = getattr(searcher, "run")
+                # Some engines may require different params
+                if type in ("text", "images", "news", "videos"):
+                    return method(
+                        keywords=q,
+                        region=region,
+                        safesearch=safesearch,
+                        max_results=max_results,
+                    )
+                elif type == "suggestions":
+                    # Suggestions method might have different signature
+                    try:
+                        return method(q, region=region, max_results=max_results)
+                    except TypeError:
+                        return method(q, max_results=max_results)
+                elif type == "answers":
+                    return method(keywords=q)
+                elif type == "maps":
+                    return method(
+                        keywords=q,
+                        place=place,
+                        street=street,
+                        city=city,
+                        county=county,
+                        state=state,
+                        country=country,
+                        postalcode=postalcode,
+                        latitude=latitude,
+                        longitude=longitude,
+                        radius=radius,
+                        max_results=max_results,
+                    )
+                elif type == "translate":
+                    return method(keywords=q, from_=from_, to=to)
+                else:  # weather
+                    return method(location=q, language=language)
+
+        cache_params = {
+            "q": q,
+            "max_results": max_results,
+            "region": region,
+            "safesearch": safesearch,
+            "place": place,
+            "street": street,
+            "city": city,
+            "county": county,
+            "state": state,
+            "country": country,
+            "postalcode": postalcode,
+            "latitude": latitude,
+            "longitude": longitude,
+            "radius": radius,
+            "from_": from_,
+            "to": to,
+            "language": language,
+        }
+        try:
+            cache = search_result_cache()
+            results = cache.fetch(engine, type, cache_params, fetch) if cache else fetch()
+        except Exception as ex:
+            return {
+                "error": f"Error running {engine}.{type}: {ex}",
+                "footer": github_footer,
+            }
+        return {"engine": engine, "type": type, "results": serialize_results(results)}
+    except Exception as e:
+        # Special handling for rate limit errors
+        msg = str(e)
+        if "429" in msg or "rate limit" in msg.lower():
+            return {
+                "error": "You have hit the search rate limit. Please try again later.",
+                "details": msg,
+                "code": 429,
+                "footer": github_footer,
+            }
+        return {"error": f"Search request failed: {msg}", "footer": github_footer}
+
+
+def _chunk_data(chunk: Any) -> Any:
+    """A completion or chunk object as a plain dict."""
+    model_dump = getattr(chunk, "model_dump", None)
+    if callable(model_dump):
+        return model_dump(exclude_none=True)
+    model_dict = getattr(chunk, "dict", None)
+    if callable(model_dict):
+        return model_dict(exclude_none=True)
+    return chunk
+
+
 async def _handle_anthropic_streaming_response(
     provider: Any,
     params: Dict[str, Any],
@@ -1089,110 +1103,91 @@ async def _handle_anthropic_streaming_response(
     provider_name: Optional[str],
     request_obj: Any,
     anthropic_model: str,
+    lease: Optional[ProviderLease] = None,
 ) -> StreamingResponse:
     """Handle streaming response in Anthropic format."""
-    collected_content = []
+    translator = AnthropicStreamTranslator(anthropic_model)
 
     async def streaming():
-        nonlocal collected_content
+        timer = CompletionTimer(provider_name, model_name, True, start_time)
+        failed = False
         try:
             ic.configureOutput(prefix="DEBUG| ")
             ic(f"Starting Anthropic streaming response for request {request_id}")
-            completion_stream = provider.chat.completions.create(**params)
-
-            is_first_chunk = True
+            try:
+                completion_stream = await create_completion(provider, provider_name, **params)
+            except Exception:
+                if lease is not None:
+                    lease.release(failed=True)
+                raise
+            completion_stream = release_when_done(completion_stream, lease)
 
-            if hasattr(completion_stream, "__iter__") and not isinstance(
-                completion_stream, (str, bytes, dict)
-            ):
+            if is_completion_stream(completion_stream):
                 try:
-                    for chunk in completion_stream:
-                        model_dump = getattr(chunk, "model_dump", None)
-                        model_dict = getattr(chunk, "dict", None)
-                        if model_dump and callable(model_dump):
-                            chunk_data = model_dump(exclude_none=True)
-                        elif model_dict and callable(model_dict):
-                            chunk_data = model_dict(exclude_none=True)
-                        elif isinstance(chunk, dict):
-                            chunk_data = chunk
-                        else:
-                            chunk_data = chunk
-
-                        # Collect content for logging
-                        if isinstance(chunk_data, dict) and "choices" in chunk_data:
-                            for choice in chunk_data.get("choices", []):
-                                if isinstance(choice, dict):
-                                    delta = choice.get("delta", {})
-                                    content = delta.get("content")
-                                    if content:
-                                        collected_content.append(content)
-
-                        # Convert to Anthropic events
-                        events = convert_openai_chunk_to_anthropic_events(
-                            chunk_data, anthropic_model, is_first_chunk
-                        )
-                        is_first_chunk = False
-
-                        for event in events:
-                            yield f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
-
+                    chunks = iterate_completion(completion_stream, provider_name)
+                    coalesce = coalesce_options()
+                    if coalesce is not None:
+                        chunks = coalesce_chunks(chunks, *coalesce)
+                    async for chunk in chunks:
+                        events = translator.feed(_chunk_data(chunk))
+                        if timer.first_token_at is None and translator.text_parts:
+                            timer.first_token()
+                        if events:
+                            yield events
                 except TypeError:
                     # Fall back to non-generator response
-                    model_dump = getattr(completion_stream, "model_dump", None)
-                    model_dict = getattr(completion_stream, "dict", None)
-                    if model_dump and callable(model_dump):
-                        response_data = model_dump(exclude_none=True)
-                    elif model_dict and callable(model_dict):
-                        response_data = model_dict(exclude_none=True)
-                    else:
-                        response_data = completion_stream
-
-                    events = convert_openai_chunk_to_anthropic_events(
-                        response_data, anthropic_model, True
-                    )
-                    for event in events:
-                        yield f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+                    yield translator.feed(_chunk_data(completion_stream))
             else:
                 # Non-generator response
-                model_dump = getattr(completion_stream, "model_dump", None)
-                model_dict = getattr(completion_stream, "dict", None)
-                if model_dump and callable(model_dump):
-                    response_data = model_dump(exclude_none=True)
-                elif model_dict and callable(model_dict):
-                    response_data = model_dict(exclude_none=True)
-                else:
-                    response_data = completion_stream
-
-                events = convert_openai_chunk_to_anthropic_events(
-                    response_data, anthropic_model, True
-                )
-                for event in events:
-                    yield f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+                yield translator.feed(_chunk_data(completion_stream))
 
         except Exception as e:
             ic.configureOutput(prefix="ERROR| ")
             ic(f"Error in Anthropic streaming response for request {request_id}: {e}")
-            error_event = {"type": "error", "error": {"type": "api_error", "message": str(e)}}
-            yield f"event: error\ndata: {json.dumps(error_event, ensure_ascii=False)}\n\n"
+            failed = True
+            error_message = clean_text(str(e))
+            yield translator.error(error_message)
+
+            # Log error request
+            response_time_ms = int((time.time() - start_time) * 1000)
+            await log_request(
+                request_id=request_id,
+                ip_address=ip_address,
+                model_used=model_name,
+                question=question,
+                answer="",
+                response_time_ms=response_time_ms,
+                status_code=500,
+                error_message=error_message,
+                provider=provider_name,
+                request_obj=request_obj,
+            )
 
         finally:
-            yield "event: message_stop\ndata: {}\n\n"
-
-            # Log request
-            if collected_content:
-                answer = "".join(collected_content)
-                response_time_ms = int((time.time() - start_time) * 1000)
-                await log_request(
-                    request_id=request_id,
-                    ip_address=ip_address,
-                    model_used=model_name,
-                    question=question,
-                    answer=answer,
-                    response_time_ms=response_time_ms,
-                    status_code=200,
-                    provider=provider_name,
-                    request_obj=request_obj,
-                )
+            timer.finish(
+                failed,
+                text_chars=sum(map(len, translator.text_parts)),
+                tokens=translator.usage.get("completion_tokens") or None,
+            )
+
+        # Not reached when the stream is cancelled or closed, as in the OpenAI path.
+        yield translator.finish()
+
+        # Log request
+        if translator.text_parts:
+            answer = translator.text_parts
+            response_time_ms = int((time.time() - start_time) * 1000)
+            await log_request(
+                request_id=request_id,
+                ip_address=ip_address,
+                model_used=model_name,
+                question=question,
+                answer=answer,
+                response_time_ms=response_time_ms,
+                status_code=200,
+                provider=provider_name,
+                request_obj=request_obj,
+            )
 
     return StreamingResponse(streaming(), media_type="text/event-stream")
 
@@ -1210,15 +1205,17 @@ async def _handle_anthropic_non_streaming_response(
     anthropic_model: str,
 ) -> Dict[str, Any]:
     """Handle non-streaming response in Anthropic format."""
+    timer = CompletionTimer(provider_name, model_name, False, start_time)
     try:
         ic.configureOutput(prefix="DEBUG| ")
         ic(f"Starting Anthropic non-streaming response for request {request_id}")
 
         # Ensure stream is False for non-streaming
         params["stream"] = False
-        completion = provider.chat.completions.create(**params)
+        completion = await create_completion(provider, provider_name, **params)
 
         if completion is None:
+            timer.finish(failed=True)
             return {
                 "id": f"msg_{request_id}",
                 "type": "message",
@@ -1256,6 +1253,10 @@ async def _handle_anthropic_non_streaming_response(
         for block in anthropic_response.get("content", []):
             if block.get("type") == "text":
                 answer += block.get("text", "")
+        timer.finish(
+            text_chars=len(answer),
+            tokens=anthropic_response.get("usage", {}).get("output_tokens") or None,
+        )
 
         await log_request(
             request_id=request_id,
@@ -1274,6 +1275,7 @@ async def _handle_anthropic_non_streaming_response(
     except Exception as e:
         ic.configureOutput(prefix="ERROR| ")
         ic(f"Error in Anthropic non-streaming response for request {request_id}: {e}")
+        timer.finish(failed=True)
         error_message = str(e)
 
         await log_request(
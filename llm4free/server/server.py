@@ -18,12 +18,20 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_swagger_ui_html
 from starlette.responses import HTMLResponse
 
+from llm4free.http_session import close_shared_sessions
+from llm4free.llm.utils import set_chunk_validation
+
 from .config import AppConfig, ServerConfig
+from .executor import shutdown_provider_executor
+from .metrics import MetricsMiddleware, close_metrics, configure_metrics
 from .providers import (
+    close_provider_pools,
     initialize_provider_map,
     initialize_tti_provider_map,
     initialize_tts_provider_map,
 )
+from .request_log import close_request_log
+from .request_processing import close_response_cache, close_search_cache
 from .routes import Api
 from .ui_templates import LANDING_PAGE_HTML, SWAGGER_CSS
 
@@ -54,7 +62,14 @@ async def lifespan(app: FastAPI):
     if hasattr(app.state, "startup_event"):
         await app.state.startup_event()
     yield
-    # Shutdown (if needed in the future)
+    # Shutdown
+    shutdown_provider_executor()
+    close_provider_pools()
+    close_shared_sessions()
+    close_response_cache()
+    close_search_cache()
+    await close_request_log()
+    close_metrics()
 
 
 def create_app():
@@ -109,6 +124,10 @@ def create_app():
         allow_headers=["*"],
     )
 
+    # Count and time requests by route (outermost, so it sees every response)
+    configure_metrics()
+    app.add_middleware(MetricsMiddleware)
+
     # Initialize API routes
     api = Api(app)
     api.register_validation_exception_handler()
@@ -129,6 +148,8 @@ def create_app():
 
 def create_app_debug():
     """Create app in debug mode."""
+    # Validate every streamed chunk against its pydantic schema while debugging
+    set_chunk_validation(True)
     return create_app()
 
 
@@ -206,23 +227,23 @@ def run_api(
         print(f"Log Level: {log_level}")
         print(f"Debug Mode: {'Enabled' if debug else 'Disabled'}")
 
-        providers = list(set(v.__name__ for v in AppConfig.provider_map.values()))
+        providers = AppConfig.provider_map.provider_names()
         print(f"\n--- Available Providers ({len(providers)}) ---")
         for i, provider_name in enumerate(sorted(providers), 1):
             print(f"{i}. {provider_name}")
 
-        provider_class_names = set(v.__name__ for v in AppConfig.provider_map.values())
+        provider_class_names = set(providers)
         models = sorted(
             [model for model in AppConfig.provider_map.keys() if model not in provider_class_names]
         )
         if models:
             print(f"\n--- Available Models ({len(models)}) ---")
             for i, model_name in enumerate(models, 1):
-                print(f"{i}. {model_name} (via {AppConfig.provider_map[model_name].__name__})")
+                print(f"{i}. {model_name} (via {AppConfig.provider_map.provider_name(model_name)})")
         else:
             print("\nNo specific models registered. Use provider names as models.")
 
-        tti_providers = list(set(v.__name__ for v in AppConfig.tti_provider_map.values()))
+        tti_providers = AppConfig.tti_provider_map.provider_names()
         print(f"\n--- Available TTI Providers ({len(tti_providers)}) ---")
         for i, provider_name in enumerate(sorted(tti_providers), 1):
             print(f"{i}. {provider_name}")
@@ -233,7 +254,9 @@ def run_api(
         if tti_models:
             print(f"\n--- Available TTI Models ({len(tti_models)}) ---")
             for i, model_name in enumerate(tti_models, 1):
-                print(f"{i}. {model_name} (via {AppConfig.tti_provider_map[model_name].__name__})")
+                print(
+                    f"{i}. {model_name} (via {AppConfig.tti_provider_map.provider_name(model_name)})"
+                )
         else:
             print("\nNo specific TTI models registered. Use TTI provider names as models.")
 
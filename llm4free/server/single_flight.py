@@ -0,0 +1,182 @@
+"""
+Request coalescing for the API server.
+
+Dashboards, retries and fan-out agents often send the same request several
+times at once. ``SingleFlight`` lets identical in-flight requests share one
+upstream call. They are matched by the canonical request hash also used by the
+response cache.
+
+- ``do`` runs one call per key; concurrent callers with the same key await its
+  result (followers get their own copy).
+- ``stream`` runs one stream per key and multicasts its items through a
+  broadcast buffer. A subscriber that joins late first receives the items
+  already sent, then follows the live stream.
+
+Upstream calls run in their own task, so a client that disconnects does not
+cancel the call the other clients are waiting for. A stream is cancelled once
+every subscriber has gone; the buffer and the key are dropped when it ends, so
+later requests start a new call.
+"""
+
+import asyncio
+import copy
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+
+def _retrieve(task: "asyncio.Future[Any]") -> None:
+    # Mark the exception as retrieved when every caller has gone away.
+    if not task.cancelled():
+        task.exception()
+
+
+class _Broadcast:
+    """One upstream stream and the items it has produced so far."""
+
+    def __init__(self) -> None:
+        loop = asyncio.get_running_loop()
+        self.items: List[Any] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.subscribers = 0
+        self.abandoned = False
+        self.opened: "asyncio.Future[None]" = loop.create_future()
+        self.opened.add_done_callback(_retrieve)
+        self._changed = asyncio.Event()
+        self.task: Optional["asyncio.Task[None]"] = None
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def pump(self, open_stream: Callable[[], Awaitable[AsyncIterator[Any]]]) -> None:
+        source: Optional[AsyncIterator[Any]] = None
+        try:
+            source = await open_stream()
+            self.opened.set_result(None)
+            async for item in source:
+                self.items.append(item)
+                self._notify()
+        except asyncio.CancelledError as exc:
+            self.opened.cancel()
+            self.error = exc
+            raise
+        except Exception as exc:
+            if not self.opened.done():
+                self.opened.set_exception(exc)
+            self.error = exc
+        finally:
+            self.done = True
+            self._notify()
+            aclose = getattr(source, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    async def subscribe(self) -> AsyncIterator[Any]:
+        index = 0
+        try:
+            while True:
+                if index < len(self.items):
+                    index += 1
+                    yield self.items[index - 1]
+                    continue
+                if self.done:
+                    if self.error is not None:
+                        raise self.error
+                    return
+                await self._changed.wait()
+        finally:
+            self.subscribers -= 1
+            if self.subscribers == 0 and not self.done and self.task is not None:
+                # The upstream generator sees the cancellation and stops without
+                # finishing the stream, so a truncated stream is never cached.
+                self.abandoned = True
+                self.task.cancel()
+
+
+class SingleFlight:
+    """Coalesces identical in-flight calls and streams by key."""
+
+    def __init__(self) -> None:
+        self._calls: Dict[str, "asyncio.Future[Any]"] = {}
+        self._streams: Dict[str, _Broadcast] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def do(self, key: Optional[str], func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await ``func()``, or the identical call already in flight for ``key``.
+        A ``None`` key always calls ``func``.
+        """
+        if key is None:
+            return await func()
+        task = self._calls.get(key)
+        leader = task is None
+        if task is None:
+            self.started += 1
+            task = self._calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(_retrieve)
+            task.add_done_callback(lambda done: self._forget(self._calls, key, done))
+        else:
+            self.coalesced += 1
+        result = await asyncio.shield(task)
+        return result if leader else copy.deepcopy(result)
+
+    async def stream(
+        self,
+        key: Optional[str],
+        open_stream: Callable[[], Awaitable[AsyncIterator[T]]],
+    ) -> AsyncIterator[T]:
+        """
+        Subscribe to the stream in flight for ``key``, starting it with
+        ``open_stream()`` if there is none. Errors raised while opening the
+        stream are raised to every subscriber; a ``None`` key always opens a
+        new stream.
+        """
+        if key is None:
+            return await open_stream()
+        broadcast = self._streams.get(key)
+        if broadcast is None or broadcast.abandoned:
+            self.started += 1
+            broadcast = self._streams[key] = _Broadcast()
+            broadcast.task = asyncio.ensure_future(broadcast.pump(open_stream))
+            broadcast.task.add_done_callback(_retrieve)
+            broadcast.task.add_done_callback(
+                lambda done: self._forget(self._streams, key, broadcast)
+            )
+        else:
+            self.coalesced += 1
+        broadcast.subscribers += 1
+        try:
+            await asyncio.shield(broadcast.opened)
+        except BaseException:
+            broadcast.subscribers -= 1
+            raise
+        return broadcast.subscribe()
+
+    @staticmethod
+    def _forget(registry: Dict[str, Any], key: str, entry: Any) -> None:
+        if registry.get(key) is entry:
+            del registry[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Upstream calls started, requests that joined one, and calls in flight."""
+        return {
+            "started": self.started,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls),
+            "streams_in_flight": len(self._streams),
+        }
+
+
+single_flight = SingleFlight()
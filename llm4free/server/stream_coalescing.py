@@ -0,0 +1,159 @@
+"""
+Coalescing of streamed chat completion chunks.
+
+Some providers stream a single character per chunk, so every character costs a
+JSON encode and a socket write. ``coalesce_chunks`` merges consecutive content
+deltas that arrive within a short window into one chunk. A merged chunk is
+flushed when the window closes, once it holds ``max_chars`` characters, or as
+soon as a chunk that cannot be merged arrives (tool calls, reasoning, a finish
+reason, usage), which is then passed on unchanged. No delta is held back for
+longer than the window.
+
+Coalescing is off by default. It is enabled globally with
+``LLM4FREE_STREAM_COALESCE_MS`` and per request with ``stream_options``
+(``{"coalesce_ms": 20, "coalesce_chars": 512}``).
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, List, NamedTuple, Optional
+
+from .config import AppConfig
+from .request_models import StreamOptions
+
+
+class CoalesceOptions(NamedTuple):
+    window: float  # seconds
+    max_chars: int
+
+
+def coalesce_options(stream_options: Optional[StreamOptions] = None) -> Optional[CoalesceOptions]:
+    """The coalescing settings of a request, or None if its stream is sent as is."""
+    window_ms = AppConfig.stream_coalesce_ms
+    max_chars = AppConfig.stream_coalesce_chars
+    if stream_options is not None:
+        if stream_options.coalesce_ms is not None:
+            window_ms = stream_options.coalesce_ms
+        if stream_options.coalesce_chars is not None:
+            max_chars = stream_options.coalesce_chars
+    if window_ms <= 0 or max_chars <= 1:
+        return None
+    return CoalesceOptions(window_ms / 1000.0, max_chars)
+
+
+def _field(value: Any, name: str) -> Any:
+    if isinstance(value, dict):
+        return value.get(name)
+    return getattr(value, name, None)
+
+
+def _content_delta(chunk: Any) -> Optional[Any]:
+    """The delta of a chunk that carries nothing but text content, else None."""
+    if _field(chunk, "usage"):
+        return None
+    choices = _field(chunk, "choices")
+    if not choices or len(choices) != 1:
+        return None
+    choice = choices[0]
+    if _field(choice, "finish_reason") or _field(choice, "logprobs"):
+        return None
+    delta = _field(choice, "delta")
+    if delta is None or not isinstance(_field(delta, "content"), str):
+        return None
+    if not _field(delta, "content"):
+        return None
+    for name in ("tool_calls", "function_call", "reasoning_content", "reasoning"):
+        if _field(delta, name):
+            return None
+    return delta
+
+
+def _set_content(delta: Any, content: str) -> None:
+    if isinstance(delta, dict):
+        delta["content"] = content
+    else:
+        delta.content = content
+
+
+async def coalesce_chunks(
+    chunks: AsyncIterator[Any], window: float, max_chars: int
+) -> AsyncIterator[Any]:
+    """
+    Merge consecutive content-only chunks of ``chunks`` arriving within ``window`` seconds.
+
+    The first chunk of a run is kept and its delta receives the merged text.
+    """
+    loop = asyncio.get_running_loop()
+    iterator = chunks.__aiter__()
+    pending: Optional["asyncio.Future[Any]"] = None
+    first: Any = None
+    first_delta: Any = None
+    first_index: Any = None
+    parts: List[str] = []
+    size = 0
+    flush_at = 0.0
+
+    def merged() -> Any:
+        nonlocal first
+        if len(parts) > 1:
+            _set_content(first_delta, "".join(parts))
+        chunk, first = first, None
+        parts.clear()
+        return chunk
+
+    try:
+        while True:
+            if first is None:
+                try:
+                    if pending is not None:
+                        # Still waiting for the chunk after a flushed one.
+                        future, pending = pending, None
+                        chunk = await future
+                    else:
+                        chunk = await iterator.__anext__()
+                except StopAsyncIteration:
+                    return
+            else:
+                # Wait for the next chunk only until the merged one is due.
+                if pending is None:
+                    pending = asyncio.ensure_future(iterator.__anext__())
+                timeout = flush_at - loop.time()
+                if timeout > 0:
+                    await asyncio.wait((pending,), timeout=timeout)
+                if not pending.done():
+                    yield merged()
+                    continue
+                future, pending = pending, None
+                try:
+                    chunk = future.result()
+                except StopAsyncIteration:
+                    yield merged()
+                    return
+                except Exception:
+                    # Deliver the merged text before the upstream error.
+                    yield merged()
+                    raise
+
+            delta = _content_delta(chunk)
+            index = _field(_field(chunk, "choices")[0], "index") if delta is not None else None
+            if first is not None and (delta is None or index != first_index):
+                yield merged()
+            if delta is None:
+                yield chunk
+                continue
+            content = _field(delta, "content")
+            if first is None:
+                first, first_delta, first_index, size = chunk, delta, index, 0
+                flush_at = loop.time() + window
+            parts.append(content)
+            size += len(content)
+            if size >= max_chars:
+                yield merged()
+    finally:
+        if pending is not None:
+            pending.cancel()
+            await asyncio.wait((pending,))
+            if not pending.cancelled():
+                pending.exception()
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
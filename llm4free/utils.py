@@ -1,9 +1,10 @@
 import json
+import os
 import re
 from decimal import Decimal
 from html import unescape
 from math import atan2, cos, radians, sin, sqrt
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from urllib.parse import unquote
 
 from .exceptions import LLM4FreeE
@@ -16,6 +17,104 @@ def _expand_proxy_tb_alias(proxy: Optional[str]) -> Optional[str]:
     return "socks5://127.0.0.1:9150" if proxy == "tb" else proxy
 
 
+JSON_BACKENDS = ("orjson", "msgspec", "json")
+
+try:
+    import msgspec
+
+    JSON_DECODE_ERRORS: Tuple[type, ...] = (ValueError, msgspec.DecodeError)
+except ImportError:
+    msgspec = None
+    JSON_DECODE_ERRORS = (ValueError,)
+
+
+def _stdlib_dumpb(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _load_json_backend(name: str) -> Tuple[Callable[[Any], Any], Callable[[Any], bytes]]:
+    """Return ``(loads, dumpb)`` for a backend, raising ImportError if it is missing."""
+    if name == "orjson":
+        import orjson
+
+        option = orjson.OPT_NON_STR_KEYS
+
+        def orjson_dumpb(obj: Any) -> bytes:
+            return orjson.dumps(obj, option=option)
+
+        return orjson.loads, orjson_dumpb
+    if name == "msgspec":
+        if msgspec is None:
+            raise ImportError("msgspec is not installed")
+        return msgspec.json.Decoder().decode, msgspec.json.Encoder().encode
+    if name == "json":
+        return json.loads, _stdlib_dumpb
+    raise ValueError(f"Unknown JSON backend {name!r}; expected one of {JSON_BACKENDS}")
+
+
+def set_json_backend(name: Optional[str] = None) -> str:
+    """Select the JSON backend used by ``json_loadb``/``json_dumpb``.
+
+    Args:
+        name: "orjson", "msgspec" or "json". ``None`` picks the first installed
+            backend in that order.
+
+    Returns:
+        The name of the selected backend.
+
+    Raises:
+        ImportError: If the requested backend is not installed.
+        ValueError: If the backend name is unknown.
+    """
+    global _json_backend, _json_loads, _json_dumpb
+    candidates = (name,) if name else JSON_BACKENDS
+    for candidate in candidates:
+        try:
+            _json_loads, _json_dumpb = _load_json_backend(candidate)
+        except ImportError:
+            if name:
+                raise
+            continue
+        _json_backend = candidate
+        break
+    return _json_backend
+
+
+def get_json_backend() -> str:
+    """Return the name of the active JSON backend."""
+    return _json_backend
+
+
+def json_loadb(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """Parse JSON from ``str`` or UTF-8 ``bytes`` with the fastest available backend.
+
+    Raises:
+        One of ``JSON_DECODE_ERRORS`` if ``data`` is not valid JSON.
+    """
+    return _json_loads(data)
+
+
+def json_dumpb(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact UTF-8 JSON bytes with the fastest available backend.
+
+    Falls back to the standard library for values the backend cannot encode
+    (for example integers wider than 64 bits).
+    """
+    try:
+        return _json_dumpb(obj)
+    except Exception:
+        return _stdlib_dumpb(obj)
+
+
+_json_backend = "json"
+_json_loads: Callable[[Any], Any] = json.loads
+_json_dumpb: Callable[[Any], bytes] = _stdlib_dumpb
+try:
+    set_json_backend(os.getenv("LLM4FREE_JSON_BACKEND") or None)
+except (ImportError, ValueError):
+    set_json_backend()
+
+
 def json_dumps(obj: Any) -> str:
     """Serialize object to JSON string.
 
@@ -47,7 +146,7 @@ def json_loads(obj: Union[str, bytes]) -> Any:
         LLM4FreeE: If deserialization fails
     """
     try:
-        return json.loads(obj)
+        return json_loadb(obj)
     except Exception as ex:
         raise LLM4FreeE(f"{type(ex).__name__}: {ex}") from ex
 
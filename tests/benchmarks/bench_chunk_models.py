@@ -0,0 +1,96 @@
+"""
+Per-chunk CPU and allocation cost of streaming chunk objects.
+
+Compares the slotted ``ChoiceDelta``/``Choice``/``ChatCompletionChunk`` objects
+with the equivalent pydantic models they replaced (kept in ``llm4free.llm.utils``
+as the debug-mode validation schemas). Each variant builds a chunk the way a
+provider does and serializes it the way the server does.
+
+Usage:
+    python tests/benchmarks/bench_chunk_models.py [--chunks 50000]
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Any, Callable, List
+
+from llm4free.llm.utils import (
+    ChatCompletionChunk,
+    Choice,
+    ChoiceDelta,
+    _ChatCompletionChunkSchema,
+    _ChoiceDeltaSchema,
+    _ChoiceSchema,
+)
+from llm4free.utils import json_dumpb
+
+
+def build_pydantic(i: int) -> Any:
+    delta = _ChoiceDeltaSchema(content=f"tok{i} ", role=None, tool_calls=None)
+    choice = _ChoiceSchema(index=0, delta=delta, finish_reason=None, logprobs=None)
+    return _ChatCompletionChunkSchema(
+        id="chatcmpl-bench",
+        choices=[choice],
+        created=0,
+        model="bench",
+        object="chat.completion.chunk",
+    )
+
+
+def build_slotted(i: int) -> Any:
+    delta = ChoiceDelta(content=f"tok{i} ", role=None, tool_calls=None)
+    choice = Choice(index=0, delta=delta, finish_reason=None, logprobs=None)
+    return ChatCompletionChunk(id="chatcmpl-bench", choices=[choice], created=0, model="bench")
+
+
+def serve_pydantic(chunk: Any) -> bytes:
+    return b"data: " + json_dumpb(chunk.model_dump(exclude_none=True)) + b"\n\n"
+
+
+def serve_slotted(chunk: Any) -> bytes:
+    return chunk.to_sse_bytes()
+
+
+def cpu(build: Callable[[int], Any], serve: Callable[[Any], bytes], n: int) -> float:
+    """Best-of-3 microseconds per chunk to build and serialize."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for i in range(n):
+            serve(build(i))
+        best = min(best, time.perf_counter() - start)
+    return best / n * 1e6
+
+
+def retained_bytes(build: Callable[[int], Any], n: int) -> float:
+    """Bytes held per live chunk object graph."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    chunks: List[Any] = [build(i) for i in range(n)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del chunks
+    return size / n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=50000)
+    args = parser.parse_args()
+
+    assert serve_pydantic(build_pydantic(1)) == serve_slotted(build_slotted(1))
+
+    print(f"{'variant':>9} {'us/chunk':>9} {'bytes/chunk':>12}")
+    for name, build, serve in (
+        ("pydantic", build_pydantic, serve_pydantic),
+        ("slotted", build_slotted, serve_slotted),
+    ):
+        us = cpu(build, serve, args.chunks)
+        size = retained_bytes(build, min(args.chunks, 20000))
+        print(f"{name:>9} {us:>9.2f} {size:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
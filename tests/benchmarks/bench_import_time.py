@@ -0,0 +1,78 @@
+"""
+Cold-start cost of ``import llm4free`` and the ``llm4free`` CLI.
+
+Each statement runs in a fresh interpreter; the benchmark reports how long the
+statement took and how many ``llm4free`` modules it loaded. Use
+``python -X importtime -c "import llm4free"`` to drill into a regression. ``--budget-ms`` fails the run when ``import llm4free``
+exceeds the budget, so the benchmark can gate CI.
+
+Usage:
+    python tests/benchmarks/bench_import_time.py [--runs 5] [--budget-ms 100]
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+TARGETS = (
+    "import llm4free",
+    "import llm4free.cli",
+    "import llm4free.client",
+    "from llm4free import Groq",
+)
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = (time.perf_counter() - start) * 1000
+print(elapsed, sum(1 for name in sys.modules if name.startswith("llm4free")))
+"""
+
+
+def import_cost(statement: str) -> Tuple[float, int]:
+    """Return (ms spent executing ``statement``, number of llm4free modules loaded)."""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(statement=statement)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed, loaded = result.stdout.split()
+    return float(elapsed), int(loaded)
+
+
+def cli_help() -> float:
+    """Wall-clock ms for ``python -m llm4free.cli --help``."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "llm4free.cli", "--help"], capture_output=True, check=True
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    print(f"{'statement':<28} {'best ms':>8} {'modules':>8}")
+    top_level: List[float] = []
+    for statement in TARGETS:
+        samples = [import_cost(statement) for _ in range(args.runs)]
+        best = min(ms for ms, _ in samples)
+        if statement == "import llm4free":
+            top_level.append(best)
+        print(f"{statement:<28} {best:>8.1f} {samples[0][1]:>8}")
+    help_ms = min(cli_help() for _ in range(args.runs))
+    print(f"{'llm4free --help (wall)':<28} {help_ms:>8.1f}")
+
+    if args.budget_ms is not None and top_level[0] > args.budget_ms:
+        sys.exit(f"import llm4free took {top_level[0]:.1f}ms (budget {args.budget_ms}ms)")
+
+
+if __name__ == "__main__":
+    main()
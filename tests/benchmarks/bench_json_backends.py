@@ -0,0 +1,96 @@
+"""
+Benchmark server streaming throughput for each installed JSON backend.
+
+Drives ``handle_streaming_response`` with an in-memory provider that yields
+``ChatCompletionChunk`` objects as fast as possible, drains the SSE body and
+reports tokens/sec. A parse-only column measures ``json_loadb`` on the same SSE
+payloads, which is the provider-side cost per chunk.
+
+Usage:
+    python tests/benchmarks/bench_json_backends.py [--tokens 20000]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Iterator, List
+
+from llm4free.llm.utils import ChatCompletionChunk, Choice, ChoiceDelta
+from llm4free.server.executor import shutdown_provider_executor
+from llm4free.server.request_processing import handle_streaming_response
+from llm4free.utils import JSON_BACKENDS, json_dumpb, json_loadb, set_json_backend
+
+
+class _Completions:
+    def __init__(self, tokens: int) -> None:
+        self.tokens = tokens
+
+    def create(self, **params) -> Iterator[ChatCompletionChunk]:
+        for i in range(self.tokens):
+            yield ChatCompletionChunk(
+                id="chatcmpl-bench",
+                choices=[Choice(index=0, delta=ChoiceDelta(content=f"tok{i} é"))],
+                created=0,
+                model="bench",
+            )
+
+
+class _Chat:
+    def __init__(self, tokens: int) -> None:
+        self.completions = _Completions(tokens)
+
+
+class BenchProvider:
+    def __init__(self, tokens: int) -> None:
+        self.chat = _Chat(tokens)
+
+
+async def serve(tokens: int) -> float:
+    """Stream ``tokens`` chunks through the server path and return the wall time."""
+    response = await handle_streaming_response(
+        BenchProvider(tokens),
+        {"model": "bench", "messages": [], "stream": True},
+        request_id="bench",
+        ip_address="127.0.0.1",
+        question="",
+        model_name="bench",
+        start_time=time.time(),
+        provider_name="BenchProvider",
+    )
+    start = time.perf_counter()
+    async for _ in response.body_iterator:
+        pass
+    return time.perf_counter() - start
+
+
+def parse(lines: List[bytes]) -> float:
+    start = time.perf_counter()
+    for line in lines:
+        json_loadb(line[6:])
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=20000)
+    args = parser.parse_args()
+
+    sample = {"id": "chatcmpl-bench", "choices": [{"index": 0, "delta": {"content": "tok é"}}]}
+    lines = [b"data: " + json_dumpb(sample)] * args.tokens
+
+    print(f"{'backend':>8} {'server tok/s':>13} {'parse tok/s':>12}")
+    for name in JSON_BACKENDS:
+        try:
+            set_json_backend(name)
+        except ImportError:
+            print(f"{name:>8} {'not installed':>13}")
+            continue
+        elapsed = min(asyncio.run(serve(args.tokens)) for _ in range(3))
+        parsed = min(parse(lines) for _ in range(3))
+        print(f"{name:>8} {args.tokens / elapsed:>13,.0f} {args.tokens / parsed:>12,.0f}")
+    set_json_backend()
+    shutdown_provider_executor()
+
+
+if __name__ == "__main__":
+    main()
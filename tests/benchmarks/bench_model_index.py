@@ -0,0 +1,101 @@
+"""
+Cost of resolving a requested model name to a provider.
+
+Compares the linear scan the client used to run on every request (substring
+checks and ``difflib.get_close_matches`` over every registered model) with
+``llm4free.model_index.ModelIndex``: a cold lookup (first time a model string is
+seen) and a warm, memoized one. The model lists are synthetic but shaped like
+real provider catalogues.
+
+Usage:
+    python tests/benchmarks/bench_model_index.py [--providers 60] [--models 20]
+"""
+
+import argparse
+import difflib
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from llm4free.model_index import ModelIndex
+
+FAMILIES = ("gpt", "llama", "qwen", "claude", "gemini", "mistral", "deepseek", "phi", "command")
+SUFFIXES = ("instruct", "turbo", "mini", "preview", "chat", "vision", "latest", "versatile")
+QUERIES = ("gpt-4o-mini", "llama-3.3-70b", "claude-sonnet", "deepsek-r1", "unknown-model-x")
+
+
+def synthetic_providers(providers: int, models: int) -> List[Tuple[str, type, List[str]]]:
+    rng = random.Random(0)
+    result = []
+    for p in range(providers):
+        names = {
+            f"{rng.choice(FAMILIES)}-{rng.randint(1, 4)}.{rng.randint(0, 9)}-"
+            f"{rng.choice((8, 70, 405))}b-{rng.choice(SUFFIXES)}"
+            for _ in range(models)
+        }
+        result.append((f"Provider{p}", type(f"Provider{p}", (), {}), sorted(names)))
+    return result
+
+
+def legacy_resolve(model: str, providers: Sequence[Tuple[str, type, List[str]]]) -> Optional[Any]:
+    model_to_provider: Dict[str, type] = {}
+    for _, cls, names in providers:
+        for name in names:
+            model_to_provider.setdefault(name, cls)
+    lowered = model.lower()
+    for name in model_to_provider:
+        if name.lower() == lowered:
+            return model_to_provider[name], name
+    for name in model_to_provider:
+        if lowered in name.lower() or name.lower() in lowered:
+            return model_to_provider[name], name
+    matches = difflib.get_close_matches(model, model_to_provider.keys(), n=1, cutoff=0.5)
+    return (model_to_provider[matches[0]], matches[0]) if matches else None
+
+
+def per_call_us(fn: Callable[[str], Any], runs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        for query in QUERIES:
+            fn(query)
+    return (time.perf_counter() - start) / (runs * len(QUERIES)) * 1e6
+
+
+def cold_us(providers: Sequence[Tuple[str, type, List[str]]], runs: int) -> float:
+    """Microseconds per first-time lookup on a freshly built index."""
+    elapsed = 0.0
+    for _ in range(runs):
+        index = ModelIndex(providers)
+        start = time.perf_counter()
+        for query in QUERIES:
+            index.resolve(query)
+        elapsed += time.perf_counter() - start
+    return elapsed / (runs * len(QUERIES)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--providers", type=int, default=60)
+    parser.add_argument("--models", type=int, default=20, help="models per provider")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    providers = synthetic_providers(args.providers, args.models)
+    total = sum(len(names) for _, _, names in providers)
+
+    start = time.perf_counter()
+    index = ModelIndex(providers)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    legacy = per_call_us(lambda q: legacy_resolve(q, providers), args.runs)
+    cold = cold_us(providers, args.runs)
+    warm = per_call_us(index.resolve, args.runs * 100)
+
+    print(f"{args.providers} providers, {total} model entries, index built in {build_ms:.1f} ms")
+    print(f"{'legacy scan':<14} {legacy:>12.1f} us/lookup")
+    print(f"{'index (cold)':<14} {cold:>12.1f} us/lookup")
+    print(f"{'index (warm)':<14} {warm:>12.1f} us/lookup")
+
+
+if __name__ == "__main__":
+    main()
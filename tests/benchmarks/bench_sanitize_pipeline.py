@@ -0,0 +1,145 @@
+"""
+Micro-benchmark for compiled ``sanitize_stream`` pipelines.
+
+Streams many OpenAI-style SSE responses through ``sanitize_stream`` with a
+per-call lambda (the way providers used to call it) and through a pipeline
+from ``compile_sanitizer``. Each response is fed both as one chunk per event
+and as fixed-size network reads that split events. Reports the per-event
+cost of each variant and checks that the outputs match.
+
+Pass ``--baseline`` a copy of ``llm4free/sanitize.py`` from before compiled
+pipelines (for example ``git show <rev>:llm4free/sanitize.py > old.py``) to
+also time its ``_process_chunk`` loop on the same streams.
+
+Usage:
+    python tests/benchmarks/bench_sanitize_pipeline.py [--streams 2000] [--chunks 50]
+        [--read-size 512] [--baseline old_sanitize.py]
+"""
+
+import argparse
+import importlib.util
+import json
+import time
+from typing import Any, Callable, List, Optional
+
+from llm4free.sanitize import compile_sanitizer, sanitize_stream
+
+
+def build_stream(chunks: int) -> bytes:
+    """Build one OpenAI-style SSE response."""
+    lines = []
+    for i in range(chunks):
+        payload = {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion.chunk",
+            "created": 1700000000,
+            "model": "bench-model",
+            "choices": [{"index": 0, "delta": {"content": f"tok{i} "}, "finish_reason": None}],
+        }
+        lines.append(f"data: {json.dumps(payload)}\n\n")
+    lines.append("data: [DONE]\n\n")
+    return "".join(lines).encode("utf-8")
+
+
+def per_event(stream: bytes) -> List[bytes]:
+    return [event + b"\n\n" for event in stream.split(b"\n\n") if event]
+
+
+def network_reads(stream: bytes, size: int) -> List[bytes]:
+    return [stream[i : i + size] for i in range(0, len(stream), size)]
+
+
+def _delta(chunk: Any) -> Optional[str]:
+    if isinstance(chunk, dict):
+        return chunk.get("choices", [{}])[0].get("delta", {}).get("content")
+    return None
+
+
+OPTIONS = {
+    "intro_value": "data:",
+    "to_json": True,
+    "skip_markers": ["[DONE]"],
+    "yield_raw_on_error": False,
+}
+
+
+def make_per_call(
+    sanitize: Callable[..., Any], **options: Any
+) -> Callable[[List[bytes]], List[Any]]:
+    def per_call(chunks: List[bytes]) -> List[Any]:
+        return list(
+            sanitize(
+                iter(chunks),
+                content_extractor=lambda chunk: (
+                    chunk.get("choices", [{}])[0].get("delta", {}).get("content")
+                    if isinstance(chunk, dict)
+                    else None
+                ),
+                **OPTIONS,
+                **options,
+            )
+        )
+
+    return per_call
+
+
+def compiled(chunks: List[bytes]) -> List[Any]:
+    pipeline = compile_sanitizer(content_extractor=_delta, fragments=True, **OPTIONS)
+    return list(pipeline(iter(chunks)))
+
+
+def run(func: Callable[[List[bytes]], List[Any]], chunks: List[bytes], streams: int) -> float:
+    """Return the best-of-3 wall time for ``streams`` responses."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(streams):
+            func(chunks)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def load_baseline(path: str) -> Callable[..., Any]:
+    spec = importlib.util.spec_from_file_location("baseline_sanitize", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.sanitize_stream
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--streams", type=int, default=2000)
+    parser.add_argument("--chunks", type=int, default=50)
+    parser.add_argument("--read-size", type=int, default=512)
+    parser.add_argument("--baseline", help="sanitize.py from before compiled pipelines")
+    args = parser.parse_args()
+
+    variants = []
+    if args.baseline:
+        variants.append(("baseline", make_per_call(load_baseline(args.baseline))))
+    variants += [
+        ("per-call", make_per_call(sanitize_stream, fragments=True)),
+        ("compiled", compiled),
+    ]
+
+    stream = build_stream(args.chunks)
+    events = args.chunks + 1
+    print(f"{args.streams} streams x {events} events")
+    print(f"{'input':>14} {'variant':>10} {'total (s)':>10} {'us/event':>10}")
+    for shape, chunks in (
+        ("per event", per_event(stream)),
+        (f"{args.read_size} B reads", network_reads(stream, args.read_size)),
+    ):
+        expected = compiled(chunks)
+        for name, func in variants:
+            # The baseline does not reassemble events split across reads.
+            if name != "baseline" or shape == "per event":
+                assert func(chunks) == expected, f"{name} output differs ({shape})"
+            elapsed = run(func, chunks, args.streams)
+            per_event_us = elapsed / args.streams / events * 1e6
+            print(f"{shape:>14} {name:>10} {elapsed:>10.3f} {per_event_us:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
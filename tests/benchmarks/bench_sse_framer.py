@@ -0,0 +1,76 @@
+"""
+Micro-benchmark for the incremental SSE framer in ``llm4free.sanitize``.
+
+Feeds ~1 MB of SSE in 1-byte, 17-byte and 64 KB fragments and checks that every
+fragment size yields identical output and that time grows linearly with size.
+
+Usage:
+    python tests/benchmarks/bench_sse_framer.py [--size-mb 1.0]
+"""
+
+import argparse
+import json
+import time
+from typing import Iterator, List
+
+from llm4free.sanitize import sanitize_stream
+
+FRAGMENT_SIZES = (1, 17, 64 * 1024)
+
+
+def build_sse(size_bytes: int) -> bytes:
+    """Build an OpenAI-style SSE stream of roughly ``size_bytes`` bytes."""
+    events: List[str] = []
+    total = 0
+    i = 0
+    while total < size_bytes:
+        payload = {"id": "chatcmpl-bench", "choices": [{"delta": {"content": f"tok{i} ü"}}]}
+        event = f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+        events.append(event)
+        total += len(event.encode("utf-8"))
+        i += 1
+    events.append("data: [DONE]\n\n")
+    return "".join(events).encode("utf-8")
+
+
+def fragments(data: bytes, size: int) -> Iterator[bytes]:
+    view = memoryview(data)
+    for i in range(0, len(data), size):
+        yield bytes(view[i : i + size])
+
+
+def run(data: bytes, fragment_size: int, repeat: int = 3) -> "tuple[float, list]":
+    """Return the best-of-``repeat`` wall time and the parsed output."""
+    best = float("inf")
+    out: list = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        stream = fragments(data, fragment_size)
+        out = list(sanitize_stream(stream, skip_markers=["[DONE]"], fragments=True))
+        best = min(best, time.perf_counter() - start)
+    return best, out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=1.0)
+    args = parser.parse_args()
+
+    full = build_sse(int(args.size_mb * 1024 * 1024))
+    half = build_sse(int(args.size_mb * 512 * 1024))
+    print(f"stream: {len(full) / 1024 / 1024:.2f} MB")
+    print(f"{'fragment':>10} {'half (s)':>10} {'full (s)':>10} {'ratio':>7} {'events':>8}")
+
+    reference = None
+    for size in FRAGMENT_SIZES:
+        t_half, _ = run(half, size)
+        t_full, out = run(full, size)
+        if reference is None:
+            reference = out
+        assert out == reference, f"output differs for {size}-byte fragments"
+        print(f"{size:>10} {t_half:>10.3f} {t_full:>10.3f} {t_full / t_half:>7.2f} {len(out):>8}")
+    print("identical output for all fragment sizes; ratio ~2.0 means linear time")
+
+
+if __name__ == "__main__":
+    main()
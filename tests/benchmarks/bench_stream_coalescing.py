@@ -0,0 +1,96 @@
+"""
+Socket writes and CPU per 1k tokens of a streamed chat completion, with and
+without SSE write coalescing.
+
+A fake provider streams one character per chunk, optionally sleeping between
+chunks to model a token rate. The chunks go through the server's
+``handle_streaming_response`` and every SSE frame is written to a socket pair
+with one ``send`` call, as the ASGI server does, while a thread drains the
+other end.
+
+Usage:
+    python tests/benchmarks/bench_stream_coalescing.py [--tokens 5000] [--rate 2000]
+"""
+
+import argparse
+import asyncio
+import socket
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from llm4free.llm.utils import ChatCompletionChunk, Choice, ChoiceDelta
+from llm4free.server.request_processing import handle_streaming_response
+from llm4free.server.stream_coalescing import CoalesceOptions
+
+
+class FakeProvider:
+    def __init__(self, tokens: int, rate: float) -> None:
+        self.tokens = tokens
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.chat = self
+        self.completions = self
+
+    def create(self, **kwargs: Any) -> Iterator[ChatCompletionChunk]:
+        for i in range(self.tokens):
+            if self.interval:
+                time.sleep(self.interval)
+            delta = ChoiceDelta(content="abcdefghij"[i % 10])
+            choice = Choice(index=0, delta=delta, finish_reason=None)
+            yield ChatCompletionChunk(id="chatcmpl-bench", choices=[choice], created=0, model="m")
+        choice = Choice(index=0, delta=ChoiceDelta(), finish_reason="stop")
+        yield ChatCompletionChunk(id="chatcmpl-bench", choices=[choice], created=0, model="m")
+
+
+def drain(sock: socket.socket) -> None:
+    while sock.recv(1 << 16):
+        pass
+
+
+async def stream(
+    tokens: int, rate: float, coalesce: Optional[CoalesceOptions]
+) -> Tuple[int, int, float, float]:
+    """Writes, bytes, CPU seconds and wall seconds of one streamed completion."""
+    writer, reader = socket.socketpair()
+    thread = threading.Thread(target=drain, args=(reader,), daemon=True)
+    thread.start()
+    params: Dict[str, Any] = {"model": "m", "messages": [], "stream": True}
+    writes = sent = 0
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    response = await handle_streaming_response(
+        FakeProvider(tokens, rate), params, "bench", "127.0.0.1", "q", "m", 0.0, "Fake",
+        coalesce=coalesce,
+    )  # fmt: skip
+    async for frame in response.body_iterator:
+        writer.send(frame)
+        writes += 1
+        sent += len(frame)
+    cpu, wall = time.process_time() - cpu_start, time.perf_counter() - wall_start
+    writer.close()
+    thread.join()
+    reader.close()
+    return writes, sent, cpu, wall
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=5000)
+    parser.add_argument("--rate", type=float, default=2000, help="chunks per second, 0 = burst")
+    args = parser.parse_args()
+
+    per_1k = 1000 / args.tokens
+    print(f"{'coalescing':>14} {'writes/1k':>10} {'KB/1k':>8} {'CPU ms/1k':>10} {'wall s':>7}")
+    for name, coalesce in (
+        ("off", None),
+        ("10 ms", CoalesceOptions(0.010, 1024)),
+        ("30 ms", CoalesceOptions(0.030, 1024)),
+    ):
+        writes, sent, cpu, wall = asyncio.run(stream(args.tokens, args.rate, coalesce))
+        print(
+            f"{name:>14} {writes * per_1k:>10.0f} {sent * per_1k / 1024:>8.1f}"
+            f" {cpu * per_1k * 1000:>10.1f} {wall:>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
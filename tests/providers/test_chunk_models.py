@@ -0,0 +1,88 @@
+"""Tests for the slotted streaming chunk objects in ``llm4free.llm.utils``."""
+
+import json
+
+import pytest
+
+from llm4free.llm.utils import (
+    ChatCompletion,
+    ChatCompletionChunk,
+    ChatCompletionMessage,
+    Choice,
+    ChoiceDelta,
+    ToolCall,
+    _ChatCompletionChunkSchema,
+    set_chunk_validation,
+)
+
+
+def _chunk(content="Hi", **delta):
+    return ChatCompletionChunk(
+        id="chatcmpl-1",
+        model="m",
+        created=1,
+        choices=[Choice(index=0, delta=ChoiceDelta(content=content, **delta))],
+    )
+
+
+def test_chunk_dump_matches_pydantic_schema():
+    chunk = _chunk(role="assistant")
+    reference = _ChatCompletionChunkSchema.model_validate(chunk.model_dump())
+    assert chunk.model_dump() == reference.model_dump()
+    assert chunk.model_dump(exclude_none=True) == reference.model_dump(exclude_none=True)
+    assert not hasattr(chunk, "__dict__")
+
+
+def test_dict_like_access_and_sse_bytes():
+    chunk = _chunk()
+    assert chunk["choices"][0]["delta"].get("content") == "Hi"
+    assert dict(chunk.items())["model"] == "m"
+    chunk.usage = {"total_tokens": 3}
+
+    raw = chunk.to_sse_bytes()
+    assert raw.startswith(b"data: ") and raw.endswith(b"\n\n")
+    assert json.loads(raw[6:]) == chunk.model_dump(exclude_none=True)
+
+
+def test_chat_completion_holds_and_serializes_choices():
+    completion = ChatCompletion(
+        model="m",
+        choices=[
+            Choice(index=0, message=ChatCompletionMessage(role="assistant", content="ok")),
+            {"index": 1, "message": {"role": "assistant", "content": "dict"}},
+        ],
+    )
+    assert isinstance(completion.choices[1], Choice)
+    dumped = completion.model_dump(exclude_none=True)
+    assert dumped["choices"][0] == {"index": 0, "message": {"role": "assistant", "content": "ok"}}
+
+
+def test_validation_is_opt_in():
+    ChoiceDelta(content=1)  # not validated by default
+    set_chunk_validation(True)
+    try:
+        with pytest.raises(ValueError):
+            ChoiceDelta(content=1)
+    finally:
+        set_chunk_validation(False)
+
+
+def test_streamed_tool_calls_support_attribute_access():
+    first = {"index": 0, "id": "call_1", "type": "function", "function": {"name": "f"}}
+    later = {"index": 0, "function": {"arguments": '{"a": 1}'}}
+    delta = ChoiceDelta(tool_calls=[first])
+    call = delta.tool_calls[0]
+    assert isinstance(call, ToolCall)
+    assert (call.index, call.id, call.function.name) == (0, "call_1", "f")
+    assert call["function"]["name"] == "f"
+
+    chunk = _chunk(content=None, tool_calls=[later])
+    call = chunk.choices[0].delta.tool_calls[0]
+    assert call.id is None and call.function.arguments == '{"a": 1}'
+    assert json.loads(chunk.to_sse_bytes()[6:])["choices"][0]["delta"]["tool_calls"] == [later]
+
+    set_chunk_validation(True)
+    try:
+        ChoiceDelta(tool_calls=[later])
+    finally:
+        set_chunk_validation(False)
@@ -0,0 +1,178 @@
+"""Offline tests for the shared async OpenAI-compatible core."""
+
+import asyncio
+import json
+
+from llm4free.llm.openai_compat import OpenAICompatibleAsyncProvider
+from llm4free.llm.utils import ChatCompletion, ChatCompletionMessage, Choice, CompletionUsage
+
+
+class FakeAsyncResp:
+    def __init__(self, status_code=200, lines=None, json_data=None):
+        self.status_code = status_code
+        self._lines = lines or []
+        self._json_data = json_data
+        self.closed = False
+        self.text = json.dumps(json_data) if json_data is not None else ""
+
+    async def aiter_lines(self):
+        for line in self._lines:
+            yield line.encode("utf-8")
+
+    async def atext(self):
+        return "\n".join(self._lines)
+
+    async def aclose(self):
+        self.closed = True
+
+    def json(self):
+        return self._json_data
+
+
+class FakeAsyncSession:
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    async def post(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return self.response
+
+
+class FakeSyncProvider:
+    supports_tools = False
+    required_auth = True
+
+    def __init__(self):
+        self.base_url = "https://example.com/v1/chat/completions"
+        self.headers = {"Authorization": "Bearer test"}
+        self.timeout = 30
+
+
+def _provider(response):
+    provider = OpenAICompatibleAsyncProvider(FakeSyncProvider())
+    session = FakeAsyncSession(response)
+    provider._sessions[asyncio.get_running_loop()] = session
+    return provider, session
+
+
+def _sse(payload):
+    return f"data: {json.dumps(payload)}"
+
+
+def test_stream_parses_sse_and_closes_response():
+    lines = [
+        _sse({"choices": [{"index": 0, "delta": {"role": "assistant", "content": "Hel"}}]}),
+        "",
+        _sse({"choices": [{"index": 0, "delta": {"content": "lo"}, "finish_reason": "stop"}]}),
+        "data: [DONE]",
+    ]
+    response = FakeAsyncResp(lines=lines)
+
+    async def run():
+        provider, session = _provider(response)
+        stream = await provider.chat.completions.create(
+            model="m", messages=[{"role": "user", "content": "hi"}], stream=True
+        )
+        chunks = [chunk async for chunk in stream]
+        return chunks, session
+
+    chunks, session = asyncio.run(run())
+    assert "".join(c.choices[0].delta.content or "" for c in chunks) == "Hello"
+    assert chunks[-1].choices[0].finish_reason == "stop"
+    assert session.calls[0][1]["json"]["stream"] is True
+    assert response.closed
+
+
+def test_non_stream_builds_chat_completion():
+    response = FakeAsyncResp(
+        json_data={
+            "model": "m",
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": "Hi"}}],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        }
+    )
+
+    async def run():
+        provider, _ = _provider(response)
+        return await provider.chat.completions.create(
+            model="m", messages=[{"role": "user", "content": "hi"}], max_tokens=5
+        )
+
+    completion = asyncio.run(run())
+    assert completion.choices[0].message.content == "Hi"
+    assert completion.usage.total_tokens == 2
+
+
+class ClosingSession:
+    def __init__(self, *args, **kwargs):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def test_session_per_loop_closes_sessions_of_closed_loops(monkeypatch):
+    monkeypatch.setattr("llm4free.llm.openai_compat.AsyncSession", ClosingSession)
+    provider = OpenAICompatibleAsyncProvider(FakeSyncProvider())
+
+    async def session():
+        return provider.session
+
+    first = asyncio.run(session())
+
+    async def second_loop():
+        current = provider.session
+        assert provider.session is current
+        await provider.aclose()
+        return current
+
+    second = asyncio.run(second_loop())
+    assert first is not second
+    assert first.closed and second.closed
+    assert provider._sessions == {}
+
+
+def test_non_native_tools_forward_options_and_honour_stream():
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        message = ChatCompletionMessage(role="assistant", content="Hi")
+        return ChatCompletion(
+            model="m",
+            choices=[Choice(index=0, message=message, finish_reason="stop")],
+            usage=CompletionUsage(prompt_tokens=1, completion_tokens=1, total_tokens=2),
+        )
+
+    sync_provider = FakeSyncProvider()
+    sync_provider.chat = type("Chat", (), {})()
+    sync_provider.chat.completions = type("Completions", (), {})()
+    sync_provider.chat.completions.create = create
+    provider = OpenAICompatibleAsyncProvider(sync_provider)
+    tools = [{"type": "function", "function": {"name": "f"}}]
+
+    async def run():
+        options = dict(
+            model="m",
+            messages=[{"role": "user", "content": "hi"}],
+            tools=tools,
+            tool_choice="auto",
+            timeout=5,
+            proxies={"https": "http://proxy"},
+        )
+        completion = await provider.chat.completions.create(**options)
+        stream = await provider.chat.completions.create(stream=True, **options)
+        return completion, [chunk async for chunk in stream]
+
+    completion, chunks = asyncio.run(run())
+    assert completion.choices[0].message.content == "Hi"
+    assert len(chunks) == 1
+    assert chunks[0].choices[0].delta.content == "Hi"
+    assert chunks[0].choices[0].finish_reason == "stop"
+    assert chunks[0].usage["total_tokens"] == 2
+    for kwargs in calls:
+        assert kwargs["stream"] is False
+        assert kwargs["tools"] == tools
+        assert (kwargs["tool_choice"], kwargs["timeout"]) == ("auto", 5)
+        assert kwargs["proxies"] == {"https": "http://proxy"}
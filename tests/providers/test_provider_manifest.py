@@ -0,0 +1,87 @@
+"""Tests for the generated provider manifest in ``llm4free.provider_manifest``."""
+
+import subprocess
+import sys
+
+import pytest
+
+from llm4free.provider_manifest import (
+    MANIFEST_PATH,
+    PROVIDER_KINDS,
+    ProviderRegistry,
+    _static_models,
+    generate_provider_manifest,
+    provider_entries,
+    render_provider_manifest,
+)
+
+
+def test_manifest_is_up_to_date():
+    rendered = render_provider_manifest(generate_provider_manifest())
+    assert MANIFEST_PATH.read_text(encoding="utf-8") == rendered
+
+
+@pytest.mark.parametrize("kind", sorted(PROVIDER_KINDS))
+def test_entries_load_their_classes(kind):
+    entries = provider_entries(kind)
+    assert entries
+    for name, entry in entries.items():
+        cls = entry.load()
+        assert cls.__name__ == name
+        assert cls.__module__ == entry.module
+        assert bool(getattr(cls, "required_auth", False)) is entry.required_auth
+
+
+def test_static_models_never_instantiates_providers():
+    class PropertyModels:
+        def __init__(self):
+            raise AssertionError("provider instantiated")
+
+        @property
+        def AVAILABLE_MODELS(self):
+            return ["fetched"]
+
+    class StaticModels:
+        AVAILABLE_MODELS = ["a", "b"]
+
+    assert _static_models(PropertyModels, ("AVAILABLE_MODELS",)) == []
+    assert _static_models(StaticModels, ("AVAILABLE_MODELS",)) == ["a", "b"]
+
+
+def test_unknown_kind_raises():
+    with pytest.raises(ValueError):
+        provider_entries("video")
+
+
+def test_registry_imports_on_lookup_only():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys\n"
+            "from llm4free.client import load_openai_providers\n"
+            "providers, auth = load_openai_providers()\n"
+            "assert 'Groq' in providers and 'Groq' in auth\n"
+            "assert 'llm4free.llm.Auth.groq' not in sys.modules\n"
+            "assert providers.provider_name('Groq') == 'Groq'\n"
+            "assert providers['Groq'].__module__ == 'llm4free.llm.Auth.groq'\n"
+            "print(sum(m.startswith('llm4free.llm.Auth.') for m in sys.modules))\n",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "1"
+
+
+def test_registry_accepts_classes():
+    class Fake:
+        pass
+
+    registry = ProviderRegistry({"Fake": Fake})
+    registry["Fake/model"] = provider_entries("chat")["Groq"]
+    assert registry["Fake"] is Fake
+    assert registry.provider_names() == ["Fake", "Groq"]
+    assert list(registry) == ["Fake", "Fake/model"]
+    del registry["Fake"]
+    assert "Fake" not in registry and len(registry) == 1
@@ -9,15 +9,13 @@ from tests.providers.utils import FakeResp
 
 
 class TestBraveBase(unittest.TestCase):
-    def test_brave_base_uses_curl_cffi_session(self) -> None:
+    def test_brave_base_uses_shared_session(self) -> None:
         session_mock = MagicMock()
-        session_mock.headers = MagicMock()
-
         fingerprint = {"User-Agent": "test-agent", "Accept-Language": "en-US"}
 
         with patch(
-            "llm4free.search.engines.brave.base.Session", return_value=session_mock
-        ) as mock_session:
+            "llm4free.search.engines.brave.base.shared_session", return_value=session_mock
+        ) as mock_shared_session:
             with patch("llm4free.search.engines.brave.base.LitAgent") as mock_litagent:
                 mock_litagent.return_value.generate_fingerprint.return_value = fingerprint
 
@@ -28,13 +26,13 @@ class TestBraveBase(unittest.TestCase):
                     impersonate="chrome131",
                 )
 
-        mock_session.assert_called_once_with(
-            proxies={"https": "http://proxy.local:8080"},
-            verify=False,
+        mock_shared_session.assert_called_once_with(
+            "chrome131",
+            {"https": "http://proxy.local:8080"},
+            False,
+            headers=fingerprint,
             timeout=15,
-            impersonate="chrome131",
         )
-        session_mock.headers.update.assert_called_once_with(fingerprint)
         self.assertIs(brave.session, session_mock)
 
 
@@ -0,0 +1,102 @@
+"""Offline tests for the search result cache."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from llm4free.exceptions import RatelimitE
+from llm4free.search.base import BaseSearch, BaseSearchEngine
+from llm4free.search.cache import SearchCache, search_key, set_search_cache
+from llm4free.search.results import TextResult
+
+
+class FakeSearch(BaseSearch):
+    calls = 0
+
+    def text(self, keywords, region="wt-wt", safesearch="moderate", max_results=None):
+        type(self).calls += 1
+        return [TextResult(title=f"{keywords} {type(self).calls}", href="https://a.org")]
+
+    images = videos = news = answers = maps = translate = suggestions = text
+
+
+class FakeEngine(BaseSearchEngine[TextResult]):
+    name = "fake"
+    category = "text"
+    calls = 0
+
+    def build_payload(self, query, region, safesearch, timelimit, page, **kwargs):
+        return {}
+
+    def search(self, query, region="us-en", safesearch="moderate", timelimit=None, page=1, **kw):
+        type(self).calls += 1
+        return [] if query == "empty" else [TextResult(title=query, href="https://a.org")]
+
+
+@pytest.fixture
+def cache():
+    FakeSearch.calls = FakeEngine.calls = 0
+    cache = SearchCache(ttls={"text": 0.05}, stale_while_revalidate=5)
+    set_search_cache(cache)
+    yield cache
+    set_search_cache(None)
+    cache.close()
+
+
+class TestSearchCache:
+    def test_keys_and_ttls(self):
+        key = search_key("e", "text", {"keywords": "a  b", "region": "us", "timeout": 3})
+        assert key == search_key("e", "text", {"region": "us", "keywords": " a b", "page": None})
+        assert key != search_key("e", "news", {"keywords": "a b", "region": "us"})
+        assert key != search_key("e", "text", {"keywords": "a b", "region": "de"})
+        assert SearchCache().ttl_for("news") < SearchCache().ttl_for("suggestions")
+
+    def test_search_interfaces_are_cached(self, cache):
+        search = FakeSearch()
+        first = search.text("q", max_results=3)
+        assert search.text(keywords="q", max_results=3) == first
+        assert search.text("q", max_results=3) is not first
+        search.text("q", max_results=4)
+        assert FakeSearch.calls == 2
+
+        engine = FakeEngine()
+        assert engine.search("q")[0].title == "q"
+        engine.search(query="q")
+        engine.search("empty")
+        engine.search("empty")
+        assert FakeEngine.calls == 3
+        assert cache.stats()["hits"] == 3
+
+    def test_stale_entries_are_served_while_refreshing(self, cache):
+        search = FakeSearch()
+        assert search.text("q")[0].title == "q 1"
+        time.sleep(0.06)
+        assert search.text("q")[0].title == "q 1"
+        deadline = time.monotonic() + 2
+        while cache.stats()["refreshes"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert search.text("q")[0].title == "q 2"
+
+        def rate_limited():
+            raise RatelimitE("429")
+
+        key = search_key("FakeSearch", "text", {"keywords": "q"})
+        cache.set(key, "text", [TextResult(title="old")])
+        time.sleep(0.06)
+        assert cache.fetch("FakeSearch", "text", {"keywords": "q"}, rate_limited)[0].title == "old"
+        deadline = time.monotonic() + 2
+        while cache.stats()["refresh_errors"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert cache.get(key)[0][0].title == "old"
+
+    def test_sqlite_tier_is_shared(self, tmp_path):
+        path = tmp_path / "search.db"
+        writer, reader = SearchCache(path=path), SearchCache(path=path)
+        writer.set("k", "text", [TextResult(title="t", href="h")])
+        results, fresh = reader.get("k")
+        assert fresh and results == [TextResult(title="t", href="h")]
+        assert reader.stats()["disk_entries"] == 1
+        writer.close()
+        reader.close()
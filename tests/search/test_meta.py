@@ -0,0 +1,82 @@
+"""Offline tests for the multi-engine metasearch."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from llm4free.exceptions import LLM4FreeE
+from llm4free.search import MetaSearch, TextResult
+from llm4free.search.engines import ENGINES
+from llm4free.search.engines.meta import fuse_results, normalize_result_url
+
+
+def _engine(urls, delay=0.0, error=None):
+    class Engine:
+        def run(self, keywords, **kwargs):
+            time.sleep(delay)
+            if error:
+                raise error
+            return [TextResult(title=url, href=url) for url in urls]
+
+    return Engine
+
+
+FAST = _engine(["https://www.example.com/a/", "https://b.org", "https://c.org"])
+OTHER = _engine(["http://example.com/a", "https://d.org"], delay=0.02)
+SLOW = _engine(["https://slow.org"], delay=1.0)
+BROKEN = _engine([], error=RuntimeError("blocked"))
+
+
+@pytest.fixture(autouse=True)
+def fake_engines():
+    engines = {"fast": FAST, "other": OTHER, "slow": SLOW, "broken": BROKEN}
+    with patch.dict(ENGINES["text"], engines):
+        yield
+
+
+class TestMetaSearch:
+    def test_urls_are_normalized_for_dedup(self):
+        assert normalize_result_url("https://www.Example.com/a/?y=2&x=1#top") == (
+            normalize_result_url("http://example.com/a?x=1&y=2")
+        )
+        assert normalize_result_url("https://example.com/a") != "example.com/b"
+
+    def test_reciprocal_rank_fusion(self):
+        merged = fuse_results(
+            [
+                [TextResult(href="a"), TextResult(href="b")],
+                [{"href": "https://b"}, TextResult(href="c")],
+            ]
+        )
+        assert [r["href"] for r in merged] == ["https://b", "a", "c"]
+
+    def test_slow_engines_miss_the_deadline(self):
+        meta = MetaSearch(engines=["fast", "other", "slow", "broken"], deadline=0.3, quorum=3)
+        started = time.monotonic()
+        results = meta.run("q", max_results=3)
+        assert time.monotonic() - started < 0.9
+        assert [r.href for r in results] == [
+            "https://www.example.com/a/",
+            "https://b.org",
+            "https://d.org",
+        ]
+        assert meta.last_status == {
+            "fast": "ok",
+            "other": "ok",
+            "slow": "timeout",
+            "broken": "error",
+        }
+
+    def test_quorum_returns_early_and_errors_surface(self):
+        meta = MetaSearch(engines=["fast", "slow"], deadline=5, quorum=1)
+        started = time.monotonic()
+        assert len(meta.run(keywords="q")) == 3
+        assert time.monotonic() - started < 0.9
+        with pytest.raises(LLM4FreeE, match="blocked"):
+            MetaSearch(engines=["broken"]).run("q")
+        with pytest.raises(ValueError):
+            MetaSearch(engines=["nope"])
+        assert "meta" not in MetaSearch().engines
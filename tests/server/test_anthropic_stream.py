@@ -0,0 +1,140 @@
+"""Tests for the Anthropic streaming translator."""
+
+import asyncio
+import json
+import time
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from llm4free.server.request_processing import AnthropicStreamTranslator
+from llm4free.server.routes import _handle_anthropic_streaming_response
+
+
+def parse_events(data: bytes):
+    events = []
+    for block in data.decode("utf-8").split("\n\n"):
+        if not block:
+            continue
+        name, payload = block.split("\n")
+        event = json.loads(payload[len("data: ") :])
+        assert name == f"event: {event['type']}"
+        events.append(event)
+    return events
+
+
+def text_chunk(text, finish_reason=None):
+    return {"id": "c1", "choices": [{"delta": {"content": text}, "finish_reason": finish_reason}]}
+
+
+class TestAnthropicStreamTranslator(unittest.TestCase):
+    def test_text_block_is_opened_once(self) -> None:
+        translator = AnthropicStreamTranslator("claude-x")
+        data = b"".join(translator.feed(text_chunk(t)) for t in ("Hel", "lo", ' "w"'))
+        data += translator.feed({"choices": [{"delta": {}, "finish_reason": "stop"}]})
+        data += translator.feed(
+            {"choices": [], "usage": {"prompt_tokens": 7, "completion_tokens": 3}}
+        )
+        events = parse_events(data + translator.finish())
+
+        self.assertEqual(
+            [e["type"] for e in events],
+            [
+                "message_start",
+                "content_block_start",
+                "content_block_delta",
+                "content_block_delta",
+                "content_block_delta",
+                "content_block_stop",
+                "message_delta",
+                "message_stop",
+            ],
+        )
+        self.assertEqual(events[0]["message"]["id"], "c1")
+        self.assertEqual(events[0]["message"]["model"], "claude-x")
+        self.assertEqual(
+            "".join(e["delta"]["text"] for e in events if e["type"] == "content_block_delta"),
+            'Hello "w"',
+        )
+        self.assertEqual(events[-2]["delta"]["stop_reason"], "end_turn")
+        self.assertEqual(events[-2]["usage"], {"output_tokens": 3, "input_tokens": 7})
+        self.assertEqual(translator.text, 'Hello "w"')
+
+    def test_tool_call_fragments_are_accumulated_by_index(self) -> None:
+        translator = AnthropicStreamTranslator("claude-x")
+        fragments = [
+            {"index": 0, "id": "call_a", "type": "function", "function": {"name": "get"}},
+            {"index": 1, "id": "call_b", "type": "function", "function": {"name": "put"}},
+            {"index": 0, "function": {"arguments": '{"city": '}},
+            {"index": 1, "function": {"arguments": "{}"}},
+            {"index": 0, "function": {"arguments": '"Paris"}'}},
+        ]
+        data = translator.feed(text_chunk("Checking."))
+        for fragment in fragments:
+            data += translator.feed({"choices": [{"delta": {"tool_calls": [fragment]}}]})
+        data += translator.feed({"choices": [{"delta": {}, "finish_reason": "tool_calls"}]})
+        events = parse_events(data + translator.finish())
+
+        starts = [e for e in events if e["type"] == "content_block_start"]
+        self.assertEqual([e["index"] for e in starts], [0, 1, 2])
+        self.assertEqual(starts[1]["content_block"]["id"], "call_a")
+        self.assertEqual(starts[2]["content_block"]["name"], "put")
+        json_deltas = [
+            e["delta"]["partial_json"]
+            for e in events
+            if e["type"] == "content_block_delta" and e["delta"]["type"] == "input_json_delta"
+        ]
+        self.assertEqual([json.loads(d) for d in json_deltas], [{"city": "Paris"}, {}])
+        self.assertEqual(
+            [e["index"] for e in events if e["type"] == "content_block_stop"], [0, 1, 2]
+        )
+        self.assertEqual(events[-2]["delta"]["stop_reason"], "tool_use")
+
+    def test_complete_response_and_errors(self) -> None:
+        translator = AnthropicStreamTranslator("claude-x")
+        response = {
+            "id": "c2",
+            "choices": [{"message": {"content": "Done"}, "finish_reason": "length"}],
+            "usage": {"prompt_tokens": 2, "completion_tokens": 1},
+        }
+        events = parse_events(translator.feed(response) + translator.finish())
+        self.assertEqual(events[2]["delta"]["text"], "Done")
+        self.assertEqual(events[-2]["delta"]["stop_reason"], "max_tokens")
+
+        translator = AnthropicStreamTranslator("claude-x")
+        events = parse_events(translator.error("boom") + translator.finish())
+        self.assertEqual([e["type"] for e in events], ["error", "message_stop"])
+        self.assertEqual(events[0]["error"]["message"], "boom")
+
+    def test_output_tokens_are_estimated_without_usage(self) -> None:
+        translator = AnthropicStreamTranslator("claude-x")
+        translator.feed(text_chunk("Hello"))
+        translator.feed(text_chunk(" world!"))
+        events = parse_events(translator.finish())
+        self.assertEqual(events[-2]["usage"], {"output_tokens": 3})
+
+    def test_failed_stream_is_logged(self) -> None:
+        class Failing:
+            def __init__(self):
+                self.chat = self
+                self.completions = self
+
+            def create(self, **kwargs):
+                raise RuntimeError("upstream down")
+
+        async def main():
+            response = await _handle_anthropic_streaming_response(
+                Failing(), {"model": "m", "messages": []}, "r1", "ip", "q", "m",
+                time.time(), "P", None, "claude-x",
+            )  # fmt: skip
+            return b"".join([frame async for frame in response.body_iterator])
+
+        with patch("llm4free.server.routes.log_request", new_callable=AsyncMock) as log:
+            events = parse_events(asyncio.run(main()))
+        self.assertEqual([e["type"] for e in events], ["error", "message_stop"])
+        log.assert_awaited_once()
+        self.assertEqual(log.await_args.kwargs["status_code"], 500)
+        self.assertEqual(log.await_args.kwargs["error_message"], "upstream down")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""Tests for the provider thread-pool bridge."""
+
+import asyncio
+import threading
+import unittest
+
+from llm4free.server.executor import ProviderExecutor
+
+
+class TestProviderExecutor(unittest.TestCase):
+    def setUp(self) -> None:
+        self.executor = ProviderExecutor(max_workers=4, concurrency_limit=2, queue_size=2)
+
+    def tearDown(self) -> None:
+        self.executor.shutdown(wait=True)
+
+    def test_run_executes_off_the_event_loop_thread(self) -> None:
+        async def main():
+            loop_thread = threading.get_ident()
+            worker_thread = await self.executor.run(threading.get_ident, provider_name="P")
+            return loop_thread, worker_thread
+
+        loop_thread, worker_thread = asyncio.run(main())
+        self.assertNotEqual(loop_thread, worker_thread)
+
+    def test_iterate_preserves_order(self) -> None:
+        async def main():
+            return [item async for item in self.executor.iterate(iter(range(20)), "P")]
+
+        self.assertEqual(asyncio.run(main()), list(range(20)))
+
+    def test_iterate_propagates_errors(self) -> None:
+        def gen():
+            yield 1
+            raise ValueError("boom")
+
+        async def main():
+            items = []
+            with self.assertRaises(ValueError):
+                async for item in self.executor.iterate(gen(), "P"):
+                    items.append(item)
+            return items
+
+        self.assertEqual(asyncio.run(main()), [1])
+
+    def test_early_close_stops_the_generator(self) -> None:
+        closed = threading.Event()
+
+        def gen():
+            try:
+                i = 0
+                while True:
+                    yield i
+                    i += 1
+            finally:
+                closed.set()
+
+        async def main():
+            stream = self.executor.iterate(gen(), "P")
+            async for item in stream:
+                if item == 3:
+                    break
+            await stream.aclose()
+
+        asyncio.run(main())
+        self.assertTrue(closed.wait(timeout=2))
+
+
+if __name__ == "__main__":
+    unittest.main()
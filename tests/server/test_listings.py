@@ -0,0 +1,70 @@
+"""Tests for the precomputed model and provider listings."""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from llm4free.provider_manifest import ProviderRegistry
+from llm4free.server.config import AppConfig
+from llm4free.server.listings import get_listing
+from llm4free.server.server import create_app
+
+
+class Echo:
+    pass
+
+
+class TestListings(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # create_app() fills the real registries; the tests swap in their own afterwards.
+        cls.app = create_app()
+
+    def setUp(self) -> None:
+        registry = ProviderRegistry({"Echo": Echo, "Echo/b-model": Echo, "Echo/a-model": Echo})
+        patcher = patch.object(AppConfig, "provider_map", registry)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.registry = registry
+
+    def get(self, *requests):
+        async def main():
+            transport = httpx.ASGITransport(app=self.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return [await client.get(path, headers=headers) for path, headers in requests]
+
+        return asyncio.run(main())
+
+    def test_models_are_served_with_an_etag(self) -> None:
+        (response,) = self.get(("/v1/models", {}))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [model["id"] for model in response.json()["data"]], ["Echo/a-model", "Echo/b-model"]
+        )
+        etag = response.headers["ETag"]
+
+        cached, other = self.get(
+            ("/v1/models", {"If-None-Match": f'"stale", {etag}'}),
+            ("/v1/providers", {"If-None-Match": etag}),
+        )
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.content, b"")
+        self.assertEqual(other.status_code, 200)
+        self.assertEqual(other.json()["providers"]["Echo"]["models"], ["a-model", "b-model"])
+
+    def test_listings_are_rebuilt_only_when_the_registry_changes(self) -> None:
+        listing = get_listing("chat", "models")
+        self.assertIs(get_listing("chat", "models"), listing)
+        self.registry["Echo/c-model"] = Echo
+        changed = get_listing("chat", "models")
+        self.assertNotEqual(changed.etag, listing.etag)
+        self.assertIn(b"Echo/c-model", changed.body)
+        (response,) = self.get(("/v1/messages", {"If-None-Match": listing.etag}))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["data"][0]["display_name"], "a-model")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""Tests for the /metrics registry and endpoint."""
+
+import asyncio
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import httpx
+
+from llm4free.server import metrics
+from llm4free.server.metrics import CompletionTimer, MetricsRegistry, Sample
+from llm4free.server.server import create_app
+
+
+def value(metric, **labels):
+    key = metric._key(labels)
+    return dict(metric.values()).get(key)
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def test_render(self) -> None:
+        registry = MetricsRegistry()
+        requests = registry.counter("app_requests_total", "Requests.", ("route",))
+        latency = registry.histogram("app_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+        requests.inc(route='/a"b')
+        requests.inc(2, route='/a"b')
+        for seconds in (0.05, 0.5, 5.0):
+            latency.observe(seconds, route="/a")
+        registry.add_collector(
+            lambda: [Sample("app_cache_size", "gauge", "Entries.", {"cache": "x"}, 3)]
+        )
+
+        lines = registry.render().splitlines()
+        self.assertIn("# TYPE app_requests_total counter", lines)
+        self.assertIn('app_requests_total{route="/a\\"b"} 3', lines)
+        self.assertIn('app_seconds_bucket{route="/a",le="0.1"} 1', lines)
+        self.assertIn('app_seconds_bucket{route="/a",le="1"} 2', lines)
+        self.assertIn('app_seconds_bucket{route="/a",le="+Inf"} 3', lines)
+        self.assertIn('app_seconds_sum{route="/a"} 5.55', lines)
+        self.assertIn('app_seconds_count{route="/a"} 3', lines)
+        self.assertIn('app_cache_size{cache="x"} 3', lines)
+
+    def test_snapshots_of_workers_are_summed(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            registry = MetricsRegistry(directory=tmp, interval=1.0)
+            requests = registry.counter("app_requests_total", "Requests.")
+            streams = registry.gauge("app_streams", "Streams.")
+            requests.inc(2)
+            streams.inc()
+
+            def other_worker(pid, age):
+                snapshot = registry.snapshot()
+                snapshot.update(pid=pid, time=time.time() - age)
+                Path(tmp, f"llm4free-{pid}.json").write_text(json.dumps(snapshot))
+
+            other_worker(1, 0)  # live
+            other_worker(2, 60)  # exited: its counters stay, its gauges do not
+            registry.write_snapshot()
+            lines = registry.render().splitlines()
+
+        self.assertIn("app_requests_total 6", lines)
+        self.assertIn("app_streams 2", lines)
+
+    def test_cache_hit_ratio(self) -> None:
+        registry = MetricsRegistry()
+        registry.add_collector(
+            lambda: [
+                Sample("llm4free_cache_hits_total", "counter", "Hits.", {"cache": "c"}, 3),
+                Sample("llm4free_cache_misses_total", "counter", "Misses.", {"cache": "c"}, 1),
+            ]
+        )
+        self.assertIn('llm4free_cache_hit_ratio{cache="c"} 0.75', registry.render().splitlines())
+
+
+class TestCompletionMetrics(unittest.TestCase):
+    def test_completion_timer(self) -> None:
+        labels = {"provider": "TimerProvider", "model": "m"}
+        timer = CompletionTimer("TimerProvider", "m", True, time.time() - 0.2)
+        self.assertEqual(value(metrics.streams_in_flight, provider="TimerProvider"), 1)
+        timer.first_token()
+        timer.first_token()
+        timer.finish(text_chars=400)
+
+        self.assertEqual(value(metrics.streams_in_flight, provider="TimerProvider"), 0)
+        self.assertEqual(value(metrics.completions, stream="true", status="ok", **labels), 1)
+        self.assertEqual(value(metrics.time_to_first_token, **labels)[:-1].count(1.0), 1)
+        self.assertEqual(value(metrics.output_tokens, **labels), 100)
+
+        CompletionTimer("TimerProvider", "m", False, time.time()).finish(failed=True)
+        self.assertEqual(value(metrics.completions, stream="false", status="error", **labels), 1)
+
+    def test_metrics_endpoint(self) -> None:
+        app = create_app()
+
+        async def main():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                await client.get("/v1/models")
+                return await client.get("/metrics")
+
+        response = asyncio.run(main())
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/plain"))
+        self.assertRegex(
+            response.text,
+            r'llm4free_http_requests_total\{route="/v1/models",method="GET",status="200"\} \d+',
+        )
+        self.assertIn("llm4free_provider_executor_queue_depth", response.text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+"""Tests for the background request log."""
+
+import asyncio
+import io
+import json
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from llm4free.server.config import AppConfig
+from llm4free.server.request_log import (
+    JsonlSink,
+    LogSink,
+    RequestLog,
+    SQLiteSink,
+    StdoutSink,
+)
+from llm4free.server.request_processing import log_request
+
+
+class ListSink(LogSink):
+    def __init__(self):
+        self.batches = []
+        self.closed = False
+
+    def write(self, records):
+        self.batches.append(list(records))
+
+    def close(self):
+        self.closed = True
+
+
+class FailingSink(LogSink):
+    def write(self, records):
+        raise OSError("disk full")
+
+
+class TestRequestLog(unittest.TestCase):
+    def test_records_are_batched_joined_and_truncated(self) -> None:
+        sink = ListSink()
+        request_log = RequestLog([sink, FailingSink()], batch_size=2, max_chars=5)
+
+        async def main():
+            request_log.record(request_id="a", question="hello world", answer=["ab", "cd", "ef"])
+            self.assertEqual(sink.batches, [])  # nothing is written on the request path
+            request_log.record(request_id="b", answer="x")
+            self.assertTrue(request_log._wakeup.is_set())  # a full batch wakes the writer
+            request_log.record(request_id="c", answer=None)
+            await request_log.close()
+
+        asyncio.run(main())
+        self.assertEqual([len(batch) for batch in sink.batches], [2, 1])
+        records = [record for batch in sink.batches for record in batch]
+        self.assertEqual([r["request_id"] for r in records], ["a", "b", "c"])
+        self.assertEqual(records[0]["answer"], "abcde")
+        self.assertEqual(records[0]["answer_chars"], 6)
+        self.assertEqual(records[0]["question"], "hello")
+        self.assertTrue(sink.closed)
+        stats = request_log.stats()
+        self.assertEqual((stats["written"], stats["queued"], stats["sink_errors"]), (3, 0, 2))
+
+    def test_close_waits_for_the_batch_being_written(self) -> None:
+        sink = ListSink()
+        request_log = RequestLog([sink], batch_size=2)
+        gate = threading.Event()
+
+        async def main():
+            # Keep the writer thread busy, so the writer's batch is queued, not started.
+            request_log._executor.submit(gate.wait)
+            request_log.record(request_id="a")
+            request_log.record(request_id="b")
+            while request_log.stats()["queued"]:
+                await asyncio.sleep(0)
+            closing = asyncio.ensure_future(request_log.close())
+            await asyncio.sleep(0)
+            gate.set()
+            await closing
+
+        asyncio.run(main())
+        self.assertEqual([[r["request_id"] for r in batch] for batch in sink.batches], [["a", "b"]])
+
+    def test_bounded_buffer_and_sampling(self) -> None:
+        sink = ListSink()
+        request_log = RequestLog([sink], buffer_size=2)
+        for i in range(5):
+            request_log.record(request_id=str(i))
+        self.assertEqual(request_log.stats()["dropped"], 3)
+        asyncio.run(request_log.close())
+        self.assertEqual([r["request_id"] for r in sink.batches[0]], ["3", "4"])
+
+        request_log = RequestLog([ListSink()], sample_rate=0.0)
+        self.assertFalse(request_log.record(request_id="ok", status_code=200))
+        self.assertTrue(request_log.record(request_id="err", status_code=500))
+        self.assertEqual(request_log.stats()["sampled_out"], 1)
+        asyncio.run(request_log.close())
+
+    def test_sinks(self) -> None:
+        records = [{"request_id": str(i), "answer": "x" * 40, "status_code": 200} for i in range(3)]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "log" / "requests.jsonl"
+            sink = JsonlSink(path, max_bytes=60, backups=2)
+            for record in records:
+                sink.write([record])
+            sink.close()
+            self.assertFalse(path.exists())
+            self.assertEqual(json.loads(Path(f"{path}.1").read_text())["request_id"], "2")
+            self.assertTrue(Path(f"{path}.2").exists())
+            self.assertFalse(Path(f"{path}.3").exists())
+
+            db = Path(tmp) / "requests.db"
+            sink = SQLiteSink(db)
+            sink.write(records)
+            sink.close()
+            with sqlite3.connect(db) as conn:
+                rows = conn.execute("SELECT request_id, status_code FROM request_log").fetchall()
+            conn.close()
+            self.assertEqual(rows, [("0", 200), ("1", 200), ("2", 200)])
+
+        stream = io.StringIO()
+        StdoutSink(stream).write(records[:2])
+        self.assertEqual(len(stream.getvalue().splitlines()), 2)
+
+    def test_log_request_queues_the_streamed_parts(self) -> None:
+        sink = ListSink()
+        request_log = RequestLog([sink])
+
+        async def main():
+            with patch.object(AppConfig, "request_logging_enabled", True):
+                with patch("llm4free.server.request_log._request_log", request_log):
+                    await log_request("r1", "1.2.3.4", "m", "q", ["a", "b"], 12, provider="P")
+            await request_log.close()
+
+        asyncio.run(main())
+        record = sink.batches[0][0]
+        self.assertEqual(record["answer"], "ab")
+        self.assertEqual(record["provider"], "P")
+        self.assertEqual(record["response_time_ms"], 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""Tests for the ``/search`` route's pooled engine instances."""
+
+import unittest
+from unittest.mock import patch
+
+from llm4free.search.engines import ENGINES
+from llm4free.search.results import TextResult, serialize_results
+from llm4free.server import providers
+from llm4free.server.routes import _run_web_search
+
+SEARCH_DEFAULTS = {
+    "max_results": 5,
+    "region": "wt-wt",
+    "safesearch": "moderate",
+    "place": None,
+    "street": None,
+    "city": None,
+    "county": None,
+    "state": None,
+    "country": None,
+    "postalcode": None,
+    "latitude": None,
+    "longitude": None,
+    "radius": 0,
+    "from_": None,
+    "to": "en",
+    "language": "en",
+}
+
+
+class FakeEngine:
+    instances = 0
+    fail = False
+
+    def __init__(self) -> None:
+        type(self).instances += 1
+
+    def run(self, keywords, **kwargs):
+        if self.fail:
+            raise RuntimeError("blocked")
+        return [TextResult(title=keywords, href="https://example.com", body="b")]
+
+
+class TestSearchRoute(unittest.TestCase):
+    def setUp(self) -> None:
+        FakeEngine.instances = 0
+        FakeEngine.fail = False
+        providers.close_provider_pools()
+        self.addCleanup(providers.close_provider_pools)
+        patcher = patch.dict(ENGINES["text"], {"fake": FakeEngine})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def search(self, **params):
+        return _run_web_search(**{**SEARCH_DEFAULTS, **params})
+
+    def test_engine_instances_are_reused_and_failed_ones_replaced(self) -> None:
+        for query in ("a", "b"):
+            result = self.search(q=query, engine="fake", type="text")
+            self.assertEqual(result["results"][0]["title"], query)
+        self.assertEqual(FakeEngine.instances, 1)
+
+        FakeEngine.fail = True
+        self.assertIn("blocked", self.search(q="c", engine="fake", type="text")["error"])
+        FakeEngine.fail = False
+        self.search(q="d", engine="fake", type="text")
+        self.assertEqual(FakeEngine.instances, 2)
+
+    def test_unknown_engine_and_serialization(self) -> None:
+        self.assertIn("Unknown engine", self.search(q="a", engine="nope", type="text")["error"])
+        self.assertEqual(
+            serialize_results([TextResult(title="t"), {"a": 1}, "s"]),
+            [{"title": "t", "href": "", "body": ""}, {"a": 1}, "s"],
+        )
+        self.assertEqual(serialize_results({"location": "x"}), {"location": "x"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,213 @@
+"""Tests for request coalescing in the API server."""
+
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from llm4free.llm.utils import ChatCompletionChunk, Choice, ChoiceDelta
+from llm4free.provider_manifest import ProviderRegistry
+from llm4free.response_cache import ResponseCache
+from llm4free.server import request_processing
+from llm4free.server.config import AppConfig
+from llm4free.server.request_processing import coalescing_key, handle_streaming_response
+from llm4free.server.server import create_app
+from llm4free.server.single_flight import SingleFlight
+from llm4free.server.stream_coalescing import CoalesceOptions
+
+
+class SlowProvider:
+    def __init__(self):
+        self.chat = self
+        self.completions = self
+
+    def create(self, **kwargs):
+        for _ in range(50):
+            time.sleep(0.01)
+            delta = ChoiceDelta(content="x")
+            yield ChatCompletionChunk(
+                id="c", choices=[Choice(index=0, delta=delta)], created=0, model="m"
+            )
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_identical_calls_share_one_upstream_call(self) -> None:
+        flight = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.02)
+            return {"results": [1, 2]}
+
+        async def main():
+            results = await asyncio.gather(*(flight.do("k", fetch) for _ in range(5)))
+            await flight.do("k", fetch)
+            return results
+
+        results = asyncio.run(main())
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(results, [{"results": [1, 2]}] * 5)
+        self.assertIsNot(results[0], results[1])
+        self.assertEqual(flight.stats()["coalesced"], 4)
+        self.assertEqual(flight.stats()["in_flight"], 0)
+
+    def test_errors_reach_every_caller_and_disconnects_do_not_cancel(self) -> None:
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("upstream down")
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        async def main():
+            results = await asyncio.gather(
+                flight.do("k", fail), flight.do("k", fail), return_exceptions=True
+            )
+            leader = asyncio.ensure_future(flight.do("s", slow))
+            await asyncio.sleep(0.01)
+            follower = asyncio.ensure_future(flight.do("s", slow))
+            leader.cancel()
+            return results, await follower
+
+        results, follower = asyncio.run(main())
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertEqual(follower, "done")
+
+    def test_stream_is_multicast_and_replayed_to_late_joiners(self) -> None:
+        flight = SingleFlight()
+        opened = []
+
+        async def open_stream():
+            opened.append(1)
+
+            async def chunks():
+                for item in ("a", "b", "c"):
+                    await asyncio.sleep(0.01)
+                    yield item
+
+            return chunks()
+
+        async def consume(delay):
+            await asyncio.sleep(delay)
+            return [item async for item in await flight.stream("k", open_stream)]
+
+        async def main():
+            return await asyncio.gather(consume(0), consume(0), consume(0.025))
+
+        self.assertEqual(asyncio.run(main()), [["a", "b", "c"]] * 3)
+        self.assertEqual(len(opened), 1)
+
+    def test_stream_errors_and_abandoned_streams(self) -> None:
+        flight = SingleFlight()
+        closed = []
+
+        async def refuse():
+            raise ValueError("no provider")
+
+        async def open_stream():
+            async def chunks():
+                try:
+                    while True:
+                        await asyncio.sleep(0.01)
+                        yield "x"
+                finally:
+                    closed.append(1)
+
+            return chunks()
+
+        async def main():
+            errors = await asyncio.gather(
+                flight.stream("e", refuse), flight.stream("e", refuse), return_exceptions=True
+            )
+            stream = await flight.stream("k", open_stream)
+            self.assertEqual(await stream.__anext__(), "x")
+            await stream.aclose()
+            await asyncio.sleep(0.02)
+            return errors
+
+        errors = asyncio.run(main())
+        self.assertTrue(all(isinstance(e, ValueError) for e in errors))
+        self.assertEqual(closed, [1])
+        self.assertEqual(flight.stats()["streams_in_flight"], 0)
+
+    def test_abandoned_completion_stream_is_not_finished_or_cached(self) -> None:
+        flight = SingleFlight()
+        params = {"model": "m", "messages": [{"role": "user", "content": "hi"}], "stream": True}
+
+        async def main():
+            key, _ = await request_processing.lookup_cached_completion(params, "P", None)
+            broadcast = []
+
+            async def open_stream():
+                response = await handle_streaming_response(
+                    SlowProvider(), params, "r", "ip", "q", "m", time.time(), "P", cache_key=key
+                )
+                return response.body_iterator
+
+            stream = await flight.stream("k", open_stream)
+            await stream.__anext__()
+            broadcast.append(flight._streams["k"])
+            await stream.aclose()
+            await asyncio.sleep(0.05)
+            _, cached = await request_processing.lookup_cached_completion(params, "P", None)
+            return broadcast[0], cached
+
+        with patch.object(request_processing, "_response_cache", ResponseCache()):
+            broadcast, cached = asyncio.run(main())
+        self.assertIsInstance(broadcast.error, asyncio.CancelledError)
+        self.assertNotIn(b"data: [DONE]\n\n", broadcast.items)
+        self.assertIsNone(cached)
+
+    def test_only_deterministic_chat_requests_are_coalesced(self) -> None:
+        params = {"model": "m", "messages": [{"role": "user", "content": "hi"}], "temperature": 0}
+        key = coalescing_key(params, "P", None)
+        self.assertIsNotNone(key)
+        self.assertEqual(coalescing_key(dict(params, stream=True), "P", "no-cache"), key)
+        self.assertIsNone(coalescing_key(params, "P", "no-store"))
+        self.assertIsNone(coalescing_key(dict(params, temperature=0.5), "P", None))
+        with patch.object(AppConfig, "coalesce_requests", False):
+            self.assertIsNone(coalescing_key(params, "P", None))
+        batched = coalescing_key(params, "P", None, CoalesceOptions(0.02, 64))
+        self.assertNotIn(batched, (key, coalescing_key(params, "P", None, CoalesceOptions(1, 64))))
+
+    def test_streams_with_different_coalescing_do_not_share_a_call(self) -> None:
+        calls = []
+
+        class CountingProvider(SlowProvider):
+            def create(self, **kwargs):
+                calls.append(1)
+                return super().create(**kwargs)
+
+        app = create_app()
+        registry = ProviderRegistry({"Counting": CountingProvider})
+        messages = [{"role": "user", "content": "hi"}]
+        body = {"model": "Counting/m", "messages": messages, "temperature": 0, "stream": True}
+        batched = dict(body, stream_options={"coalesce_ms": 5000, "coalesce_chars": 1000})
+        unbatched = dict(body, stream_options={"coalesce_ms": 0})
+
+        async def main():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await asyncio.gather(
+                    *(client.post("/v1/chat/completions", json=b) for b in (batched, unbatched))
+                )
+
+        with patch.object(AppConfig, "provider_map", registry):
+            batched_response, unbatched_response = asyncio.run(main())
+        self.assertEqual(len(calls), 2)
+
+        def events(response):
+            return [line for line in response.text.splitlines() if line.startswith("data: {")]
+
+        self.assertLess(len(events(batched_response)), 5)
+        self.assertGreaterEqual(len(events(unbatched_response)), 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
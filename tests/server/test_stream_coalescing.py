@@ -0,0 +1,120 @@
+"""Tests for coalescing of streamed chat completion chunks."""
+
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+
+import httpx
+from pydantic import ValidationError
+
+from llm4free.llm.utils import ChatCompletionChunk, Choice, ChoiceDelta
+from llm4free.server.config import AppConfig
+from llm4free.server.request_models import ChatCompletionRequest, StreamOptions
+from llm4free.server.server import create_app
+from llm4free.server.stream_coalescing import CoalesceOptions, coalesce_chunks, coalesce_options
+
+
+def chunk(content=None, finish_reason=None, tool_calls=None):
+    delta = {}
+    if content is not None:
+        delta["content"] = content
+    if tool_calls is not None:
+        delta["tool_calls"] = tool_calls
+    return {"choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]}
+
+
+async def upstream(items, delay=0.0, closed=None):
+    try:
+        for item in items:
+            if delay:
+                await asyncio.sleep(delay)
+            yield item
+    finally:
+        if closed is not None:
+            closed.append(1)
+
+
+def contents(chunks):
+    return [c["choices"][0]["delta"].get("content") for c in chunks]
+
+
+async def collect(chunks, window=1.0, max_chars=1024):
+    return [c async for c in coalesce_chunks(chunks, window, max_chars)]
+
+
+class TestStreamCoalescing(unittest.TestCase):
+    def test_content_deltas_are_merged_and_flushed_on_finish(self) -> None:
+        items = [chunk(c) for c in "Hello"] + [chunk(finish_reason="stop")]
+        result = asyncio.run(collect(upstream(items)))
+        self.assertEqual(contents(result), ["Hello", None])
+        self.assertEqual(result[1]["choices"][0]["finish_reason"], "stop")
+
+    def test_tool_calls_and_size_limit_flush(self) -> None:
+        tool_call = [{"index": 0, "id": "call_1", "function": {"name": "f", "arguments": ""}}]
+        items = [chunk(c) for c in "abcde"] + [chunk(tool_calls=tool_call), chunk("x")]
+        result = asyncio.run(collect(upstream(items), max_chars=2))
+        self.assertEqual(contents(result), ["ab", "cd", "e", None, "x"])
+        self.assertEqual(result[3]["choices"][0]["delta"]["tool_calls"], tool_call)
+
+    def test_window_bounds_the_delay(self) -> None:
+        async def main():
+            received = []
+            start = time.monotonic()
+            async for item in coalesce_chunks(upstream([chunk("a"), chunk("b")], 0.1), 0.02, 99):
+                received.append((item["choices"][0]["delta"]["content"], time.monotonic() - start))
+            return received
+
+        received = asyncio.run(main())
+        self.assertEqual([content for content, _ in received], ["a", "b"])
+        # "a" is flushed when its window closes, not when "b" arrives
+        self.assertLess(received[0][1], 0.19)
+
+    def test_chunk_objects_and_early_close(self) -> None:
+        def obj(content):
+            choice = Choice(index=0, delta=ChoiceDelta(content=content), finish_reason=None)
+            return ChatCompletionChunk(id="c", choices=[choice], created=0, model="m")
+
+        result = asyncio.run(collect(upstream([obj("a"), obj("b"), obj("c")])))
+        self.assertEqual([c.choices[0].delta.content for c in result], ["abc"])
+
+        closed = []
+
+        async def main():
+            stream = coalesce_chunks(upstream([chunk("a")] * 10, 0.01, closed), 0.005, 99)
+            first = await stream.__anext__()
+            await stream.aclose()
+            return first
+
+        self.assertEqual(asyncio.run(main())["choices"][0]["delta"]["content"][0], "a")
+        self.assertEqual(closed, [1])
+
+    def test_options(self) -> None:
+        with patch.object(AppConfig, "stream_coalesce_ms", 0):
+            self.assertIsNone(coalesce_options())
+            self.assertEqual(
+                coalesce_options(StreamOptions(coalesce_ms=20, coalesce_chars=64)),
+                CoalesceOptions(0.02, 64),
+            )
+        with patch.object(AppConfig, "stream_coalesce_ms", 10):
+            self.assertEqual(coalesce_options(StreamOptions(include_usage=True)).window, 0.01)
+            self.assertIsNone(coalesce_options(StreamOptions(coalesce_ms=0)))
+
+    def test_invalid_options_are_rejected(self) -> None:
+        messages = [{"role": "user", "content": "hi"}]
+        for options in ({"coalesce_ms": "soon"}, {"coalesce_ms": -1}, {"coalesce_chars": -5}):
+            with self.assertRaises(ValidationError):
+                ChatCompletionRequest(model="m", messages=messages, stream_options=options)
+
+        async def main():
+            transport = httpx.ASGITransport(app=create_app())
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                body = {"model": "m", "messages": messages, "stream": True}
+                body["stream_options"] = {"coalesce_ms": "soon"}
+                return await client.post("/v1/chat/completions", json=body)
+
+        self.assertEqual(asyncio.run(main()).status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
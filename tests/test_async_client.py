@@ -0,0 +1,142 @@
+"""Tests for ``llm4free.async_client.AsyncClient``."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from llm4free.async_client import AsyncClient
+from llm4free.router import ProviderRouter
+
+
+def _completion(text):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+
+
+class _FakeProvider:
+    fail = False
+    aio = None
+
+    def __init__(self, **kwargs):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        self.models = SimpleNamespace(list=lambda: ["m"])
+
+    def _create(self, **kwargs):
+        if self.fail:
+            raise RuntimeError(f"{type(self).__name__} down")
+        if kwargs.get("stream"):
+            return (SimpleNamespace(text=t) for t in ("a", "b", "c"))
+        return _completion(type(self).__name__)
+
+
+class Good(_FakeProvider):
+    pass
+
+
+class Bad(_FakeProvider):
+    fail = True
+
+
+class Native(_FakeProvider):
+    """Provider with a native async interface; its sync path must not be used."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.aio = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=self._acreate))
+        )
+
+    def _create(self, **kwargs):
+        raise AssertionError("sync path used for a native async provider")
+
+    async def _acreate(self, **kwargs):
+        async def stream():
+            for text in ("x", "y"):
+                yield SimpleNamespace(text=text)
+
+        return stream() if kwargs.get("stream") else _completion("Native")
+
+
+class Echo(_FakeProvider):
+    """Answers with the prompt after a prompt-controlled delay, tracking concurrency."""
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def _create(self, **kwargs):
+        prompt = kwargs["messages"][-1]["content"]
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        try:
+            time.sleep(float(prompt.split(":")[1]))
+            if prompt.startswith("boom"):
+                raise RuntimeError("boom")
+            return _completion(prompt)
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+
+def _client(*providers, **kwargs):
+    client = AsyncClient(router=ProviderRouter(), **kwargs)
+    completions = client._sync.chat.completions
+    completions._get_available_providers = lambda: [(p.__name__, p) for p in providers]
+    return client
+
+
+def test_create_fails_over_to_next_provider():
+    async def main():
+        async with _client(Bad, Good) as client:
+            response = await client.chat.completions.create(model="m", messages=[], provider=Bad)
+            return response, client.chat.completions.last_provider
+
+    response, last_provider = asyncio.run(main())
+    assert response.choices[0].message.content == "Good"
+    assert last_provider == "Good"
+
+
+def test_stream_from_sync_and_native_providers():
+    async def collect(provider):
+        async with _client(provider) as client:
+            stream = await client.chat.completions.create(
+                model="m", messages=[], provider=provider, stream=True
+            )
+            texts = [chunk.text async for chunk in stream]
+            return texts, client.router.stats()["providers"][provider.__name__]
+
+    texts, stats = asyncio.run(collect(Good))
+    assert texts == ["a", "b", "c"]
+    assert stats["throughput"] > 0
+    assert asyncio.run(collect(Native))[0] == ["x", "y"]
+
+
+def test_gather_completions_keeps_order_and_returns_failures():
+    async def main():
+        async with _client(Echo) as client:
+            requests = [
+                {"model": "m", "messages": [{"role": "user", "content": prompt}]}
+                for prompt in ("a:0.05", "boom:0", "c:0")
+            ]
+            return await client.gather_completions(requests, concurrency=2)
+
+    results = asyncio.run(main())
+    assert results[0].choices[0].message.content == "a:0.05"
+    assert isinstance(results[1], RuntimeError)
+    assert results[2].choices[0].message.content == "c:0"
+
+
+def test_map_prompts_streams_as_completed_with_bounded_concurrency():
+    Echo.peak = 0
+
+    async def main():
+        async with _client(Echo, max_workers=8) as client:
+            prompts = (f"p{i}:{0.02 * (6 - i)}" for i in range(6))
+            return [index async for index, _ in client.map_prompts(prompts, concurrency=3)]
+
+    order = asyncio.run(main())
+    assert sorted(order) == list(range(6))
+    assert order != list(range(6)), "results arrive as they complete"
+    assert Echo.peak == 3
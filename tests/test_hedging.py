@@ -0,0 +1,114 @@
+"""Tests for hedged chat completions (``create(..., hedge=N, hedge_delay=...)``)."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from llm4free.client import Client
+from llm4free.router import ProviderRouter
+
+
+class _FakeProvider:
+    delay = 0.0
+    fail = False
+
+    def __init__(self, **kwargs):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        self.models = SimpleNamespace(list=lambda: ["m"])
+
+    def _create(self, **kwargs):
+        cls = type(self)
+        cls.calls += 1
+        if kwargs.get("stream"):
+            return self._stream()
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(f"{cls.__name__} down")
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=cls.__name__))]
+        )
+
+    def _stream(self):
+        cls = type(self)
+        try:
+            time.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError(f"{cls.__name__} down")
+            for text in ("a", "b"):
+                yield SimpleNamespace(text=f"{cls.__name__}:{text}")
+        finally:
+            cls.closed.set()
+
+
+def _provider(name, delay=0.0, fail=False):
+    return type(
+        name,
+        (_FakeProvider,),
+        {"delay": delay, "fail": fail, "calls": 0, "closed": threading.Event()},
+    )
+
+
+def _client(*providers):
+    client = Client(router=ProviderRouter())
+    client.chat.completions._get_available_providers = lambda: [(p.__name__, p) for p in providers]
+    return client
+
+
+def test_hedged_stream_returns_first_token_and_closes_loser():
+    slow, fast = _provider("Slow", delay=0.5), _provider("Fast")
+    client = _client(slow, fast)
+
+    start = time.perf_counter()
+    chunks = client.chat.completions.create(
+        model="m", messages=[], stream=True, provider=slow, hedge=2, hedge_delay=0.05
+    )
+    first = next(chunks)
+    assert time.perf_counter() - start < 0.4
+    assert first.text == "Fast:a"
+    assert [c.text for c in chunks] == ["Fast:b"]
+    assert client.chat.completions.last_provider == "Fast"
+    assert slow.calls == 1
+    assert slow.closed.wait(2), "the losing stream is closed once its attempt returns"
+
+
+def test_hedged_completion():
+    slow, fast = _provider("Slow", delay=0.5), _provider("Fast")
+    client = _client(slow, fast)
+
+    response = client.chat.completions.create(
+        model="m", messages=[], provider=slow, hedge=2, hedge_delay=0.05
+    )
+    assert response.choices[0].message.content == "Fast"
+    assert client.chat.completions.last_provider == "Fast"
+
+
+def test_no_hedge_when_primary_answers_in_time():
+    first, second = _provider("First"), _provider("Second")
+    client = _client(first, second)
+
+    response = client.chat.completions.create(
+        model="m", messages=[], provider=first, hedge=2, hedge_delay=1.0
+    )
+    assert response.choices[0].message.content == "First"
+    assert second.calls == 0
+
+
+def test_failure_starts_next_provider_without_waiting():
+    bad, good = _provider("Bad", fail=True), _provider("Good")
+    client = _client(bad, good)
+
+    start = time.perf_counter()
+    response = client.chat.completions.create(
+        model="m", messages=[], provider=bad, hedge=2, hedge_delay=10
+    )
+    assert time.perf_counter() - start < 1
+    assert response.choices[0].message.content == "Good"
+    assert client.router.stats()["providers"]["Bad"]["failures"] == 1
+
+
+def test_all_hedged_providers_fail():
+    client = _client(_provider("A", fail=True), _provider("B", fail=True))
+    with pytest.raises(RuntimeError, match="All chat providers failed"):
+        client.chat.completions.create(model="m", messages=[], hedge=2, hedge_delay=0.01)
@@ -0,0 +1,73 @@
+"""Tests for ``llm4free.http_session``."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from llm4free.http_session import SessionManager
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps(
+            {
+                "port": self.client_address[1],
+                "agent": self.headers.get("User-Agent"),
+                "extra": self.headers.get("X-Extra"),
+                "cookie": self.headers.get("Cookie"),
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_views_share_connections_but_keep_their_own_defaults(url):
+    manager = SessionManager()
+    first = manager.session(headers={"User-Agent": "one"}, cookies={"a": "1"})
+    second = manager.session(headers={"User-Agent": "two"}, timeout=5)
+
+    a = first.get(url, headers={"X-Extra": "yes"}).json()
+    b = second.get(url).json()
+
+    assert a["port"] == b["port"], "the second request reuses the connection"
+    assert (a["agent"], a["extra"], a["cookie"]) == ("one", "yes", "a=1")
+    assert (b["agent"], b["extra"], b["cookie"]) == ("two", None, None)
+    assert len(manager) == 1
+    manager.close()
+
+
+def test_sessions_are_keyed_by_impersonation_proxy_and_verify():
+    manager = SessionManager()
+    base = manager.get()
+    assert manager.get(None, None, True) is base
+    assert manager.get(proxy="http://proxy:1") is manager.get(
+        proxy={"https": "http://proxy:1", "http": "http://proxy:1"}
+    )
+    assert manager.get(verify=False) is not base
+    assert manager.get("chrome") is not base
+    assert len(manager) == 4
+
+    manager.close()
+    assert len(manager) == 0 and base._closed
+    assert manager.get() is not base
+    manager.close()
@@ -0,0 +1,45 @@
+"""Tests for the pluggable JSON backend in ``llm4free.utils``."""
+
+import pytest
+
+from llm4free.utils import (
+    JSON_BACKENDS,
+    JSON_DECODE_ERRORS,
+    get_json_backend,
+    json_dumpb,
+    json_loadb,
+    set_json_backend,
+)
+
+PAYLOAD = {"id": "chatcmpl-1", "choices": [{"delta": {"content": "héllo ✓"}}], "n": [1, 2.5]}
+
+
+@pytest.fixture
+def restore_backend():
+    previous = get_json_backend()
+    yield
+    set_json_backend(previous)
+
+
+@pytest.mark.parametrize("name", JSON_BACKENDS)
+def test_backends_round_trip_bytes_and_str(name, restore_backend):
+    try:
+        set_json_backend(name)
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+    encoded = json_dumpb(PAYLOAD)
+    assert isinstance(encoded, bytes)
+    assert "héllo ✓".encode("utf-8") in encoded
+    assert json_loadb(encoded) == PAYLOAD
+    assert json_loadb(encoded.decode("utf-8")) == PAYLOAD
+    with pytest.raises(JSON_DECODE_ERRORS):
+        json_loadb(b'{"truncated": ')
+
+
+def test_dumpb_falls_back_for_unsupported_values():
+    assert json_loadb(json_dumpb({"big": 2**70})) == {"big": 2**70}
+
+
+def test_unknown_backend_is_rejected(restore_backend):
+    with pytest.raises(ValueError):
+        set_json_backend("simdjson")
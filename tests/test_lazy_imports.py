@@ -0,0 +1,70 @@
+"""Tests for the lazy package exports in ``llm4free.lazy``."""
+
+import subprocess
+import sys
+
+import pytest
+
+from llm4free import _exports
+from llm4free.lazy_manifest import MANIFEST_PATH, generate_manifest, render_manifest
+
+
+def _run(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def test_manifest_is_up_to_date():
+    assert MANIFEST_PATH.read_text(encoding="utf-8") == render_manifest(generate_manifest())
+
+
+def test_manifest_entries_resolve_to_defining_modules():
+    for package, names in _exports.EXPORTS.items():
+        assert names, package
+        assert all(module.startswith("llm4free.") for module in names.values())
+
+
+def test_import_llm4free_loads_no_providers():
+    loaded = _run(
+        "import sys, llm4free; print(sorted(m for m in sys.modules if m.startswith('llm4free')))"
+    )
+    assert "llm4free.llm" not in loaded
+    assert "llm4free.client" not in loaded
+    assert "llm4free.search" not in loaded
+
+
+def test_provider_import_loads_only_its_module():
+    loaded = _run(
+        "import sys; from llm4free import Groq; "
+        "print(Groq.__module__, *(m for m in sys.modules if m.startswith('llm4free.llm.Auth.')))"
+    ).split()
+    assert loaded == ["llm4free.llm.Auth.groq", "llm4free.llm.Auth.groq"]
+
+
+def test_lazy_names_are_cached_and_listed():
+    import llm4free
+    import llm4free.llm as llm
+
+    assert "Groq" in dir(llm)
+    assert "Groq" in llm4free.__all__
+    assert llm4free.Groq is llm.Groq
+    assert "Groq" in vars(llm4free)
+
+
+@pytest.mark.parametrize("name", ["AISEARCH", "server", "search", "llm", "TTI", "client"])
+def test_subpackages_resolve_without_an_explicit_import(name):
+    loaded = _run(f"import llm4free; print(llm4free.{name}.__name__)")
+    assert loaded == f"llm4free.{name}"
+
+
+def test_nested_subpackage_resolves():
+    assert _run("import llm4free; print(llm4free.llm.Auth.__name__)") == "llm4free.llm.Auth"
+
+
+def test_unknown_attribute_raises():
+    import llm4free
+
+    with pytest.raises(AttributeError):
+        llm4free.DefinitelyNotAProvider
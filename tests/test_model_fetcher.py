@@ -0,0 +1,95 @@
+"""Tests for the shared model cache and background fetcher in ``llm4free.model_fetcher``."""
+
+import json
+import threading
+import time
+
+import pytest
+
+from llm4free.model_fetcher import BackgroundModelFetcher, ModelFetcherCache, _CacheStore
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    monkeypatch.delenv("LLM4FREE_NO_MODEL_CACHE", raising=False)
+    path = tmp_path / "model_cache.json"
+    yield path
+    _CacheStore._stores.pop(path, None)
+
+
+def test_set_is_visible_immediately_and_flushed_atomically(cache_path):
+    cache = ModelFetcherCache(cache_path=cache_path)
+    cache.set("Groq", ["llama-3"])
+    assert cache.get("Groq") == ["llama-3"]
+    assert ModelFetcherCache(cache_path=cache_path).get("Groq") == ["llama-3"]
+
+    cache.flush()
+    data = json.loads(cache_path.read_text())
+    assert data["Groq"]["models"] == ["llama-3"]
+    assert not list(cache_path.parent.glob("*.tmp"))
+
+
+def test_file_is_read_once(cache_path, monkeypatch):
+    cache_path.write_text(json.dumps({"A": {"models": ["a"], "timestamp": time.time(), "ttl": 60}}))
+    reads = []
+    original = _CacheStore._read_disk
+
+    def counting_read(self):
+        reads.append(1)
+        return original(self)
+
+    monkeypatch.setattr(_CacheStore, "_read_disk", counting_read)
+    cache = ModelFetcherCache(cache_path=cache_path)
+    for _ in range(100):
+        assert cache.get("A") == ["a"]
+        assert cache.get("missing") is None
+    assert len(reads) == 1
+
+
+def test_per_entry_ttl(cache_path):
+    cache = ModelFetcherCache(cache_ttl=3600, cache_path=cache_path)
+    cache.set("Short", ["s"], ttl=0)
+    cache.set("Long", ["l"])
+    time.sleep(0.01)
+    assert cache.get("Short") is None
+    assert cache.get("Long") == ["l"]
+
+
+def test_flush_merges_entries_from_other_processes(cache_path):
+    ours = ModelFetcherCache(cache_path=cache_path)
+    ours.set("Ours", ["o"])
+    # Another worker process writes its own entry to the same file.
+    cache_path.write_text(
+        json.dumps({"Theirs": {"models": ["t"], "timestamp": time.time(), "ttl": 60}})
+    )
+    ours.flush()
+    data = json.loads(cache_path.read_text())
+    assert set(data) == {"Ours", "Theirs"}
+    assert ours.get("Theirs") == ["t"]
+
+
+def test_concurrent_fetches_coalesce(cache_path):
+    calls = []
+    release = threading.Event()
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return ["m1", "m2"]
+
+    cache = ModelFetcherCache(cache_path=cache_path)
+    fetchers = [BackgroundModelFetcher(cache=cache) for _ in range(8)]
+    results = [f.fetch_async("Coalesce", fetch, ["fallback"]) for f in fetchers]
+    assert results == [["fallback"]] * 8
+
+    release.set()
+    fetchers[0].wait_for_provider("Coalesce")
+    assert len(calls) == 1
+    assert fetchers[-1].fetch_async("Coalesce", fetch, ["fallback"]) == ["m1", "m2"]
+
+
+def test_disabled_cache(cache_path, monkeypatch):
+    monkeypatch.setenv("LLM4FREE_NO_MODEL_CACHE", "1")
+    cache = ModelFetcherCache(cache_path=cache_path)
+    cache.set("Groq", ["x"])
+    assert cache.get("Groq") is None
@@ -0,0 +1,112 @@
+"""Tests for ``llm4free.model_index`` and its use by ``Client`` model resolution."""
+
+import difflib
+
+import pytest
+
+from llm4free.client import _fuzzy_resolve_provider_and_model
+from llm4free.model_index import ModelIndex, ModelIndexCache
+
+
+class Alpha:
+    pass
+
+
+class Beta:
+    pass
+
+
+class Gamma:
+    pass
+
+
+PROVIDERS = [
+    ("Alpha", Alpha, ["gpt-4o", "gpt-4o-mini", "llama-3.1-8b-instant", "Qwen/Qwen2.5-72B"]),
+    ("Beta", Beta, ["gpt-4o", "claude-3-haiku", "mixtral-8x7b", "deepseek-r1"]),
+    ("Gamma", Gamma, ["gemini-1.5-flash", "llama-3.3-70b-versatile", "o3"]),
+]
+
+
+def _legacy_resolve(model, providers):
+    """The linear scan ``_fuzzy_resolve_provider_and_model`` used before the index."""
+    model_to_provider = {}
+    for _, cls, models in providers:
+        for name in models:
+            model_to_provider.setdefault(name, cls)
+    lowered = model.lower()
+    for name in model_to_provider:
+        if name.lower() == lowered:
+            return model_to_provider[name], name
+    for name in model_to_provider:
+        if lowered in name.lower() or name.lower() in lowered:
+            return model_to_provider[name], name
+    matches = difflib.get_close_matches(model, model_to_provider.keys(), n=1, cutoff=0.5)
+    return (model_to_provider[matches[0]], matches[0]) if matches else None
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "gpt-4o",
+        "GPT-4O-MINI",
+        "4o-mini",
+        "openai/gpt-4o-2024-08-06",
+        "llama-3.1",
+        "qwen2.5-72b",
+        "claude-3-haiku-20240307",
+        "deepsek-r1",
+        "gemini-15-flash",
+        "mixtral-8x22b",
+        "o3",
+        "zzzzzz",
+    ],
+)
+def test_resolution_matches_legacy_scan(query):
+    index = ModelIndex(PROVIDERS)
+    assert _fuzzy_resolve_provider_and_model(query, index) == _legacy_resolve(query, PROVIDERS)
+
+
+def test_exact_lookup_and_provider_models():
+    index = ModelIndex(PROVIDERS)
+    assert len(index) == 10
+    assert index.provider_for("gpt-4o") is Alpha
+    assert index.provider_for("GPT-4O") is None
+    assert index.models_of("Gamma") == {"gemini-1.5-flash", "llama-3.3-70b-versatile", "o3"}
+    assert index.resolve("Mixtral-8x7B").match_type == "exact"
+
+
+def test_closest_per_provider_matches_difflib():
+    index = ModelIndex(PROVIDERS)
+    closest = index.closest("llama-3.2-70b")
+    for name, _, models in PROVIDERS:
+        expected = difflib.get_close_matches("llama-3.2-70b", models, n=1, cutoff=0.5)
+        assert closest.get(name) == (expected[0] if expected else None)
+
+
+def test_lookups_are_memoized():
+    index = ModelIndex(PROVIDERS)
+    assert index.resolve("deepsek-r1") is index.resolve("deepsek-r1")
+    assert index.resolve.cache_info().hits == 1
+
+
+def test_cache_rebuilds_when_providers_change_or_invalidated():
+    calls = []
+
+    def get_models(cls):
+        calls.append(cls)
+        return next(models for _, c, models in PROVIDERS if c is cls)
+
+    cache = ModelIndexCache()
+    available = [("Alpha", Alpha), ("Beta", Beta)]
+    first = cache.get(available, get_models)
+    assert cache.get(list(available), get_models) is first
+    assert calls == [Alpha, Beta]
+
+    second = cache.get([("Alpha", Alpha)], get_models)
+    assert second is not first
+    cache.invalidate()
+    assert cache.get([("Alpha", Alpha)], get_models) is not second
+
+    expired = ModelIndexCache(ttl=0)
+    index = expired.get(available, get_models)
+    assert expired.get(available, get_models) is not index
@@ -0,0 +1,201 @@
+"""Tests for ``llm4free.provider_pool`` and its use by ``Client`` and the API server."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from llm4free.client import Client
+from llm4free.provider_pool import ProviderPool, ProviderPoolTimeout
+from llm4free.router import ProviderRouter
+from llm4free.server import providers
+from llm4free.server.providers import checkout_provider, release_when_done
+
+
+class _Session:
+    def __init__(self):
+        self._closed = False
+
+    def close(self):
+        self._closed = True
+
+
+class Instance:
+    def __init__(self):
+        self.session = _Session()
+
+
+def test_instances_are_created_lazily_and_reused():
+    pool = ProviderPool(max_size=2)
+    first = pool.acquire("P", Instance)
+    second = pool.acquire("P", Instance)
+    assert first is not second
+    pool.release("P", first)
+    assert pool.acquire("P", Instance) is first
+    assert pool.metrics()["P"]["created"] == 2
+    assert pool.metrics()["P"]["in_use"] == 2
+
+
+def test_acquire_waits_for_a_free_instance_and_times_out():
+    pool = ProviderPool(max_size=1)
+    held = pool.acquire("P", Instance)
+    with pytest.raises(ProviderPoolTimeout):
+        pool.acquire("P", Instance, timeout=0.02)
+
+    threading.Timer(0.05, pool.release, args=("P", held)).start()
+    assert pool.acquire("P", Instance, timeout=5) is held
+    metrics = pool.metrics()["P"]
+    assert metrics["waits"] == 2
+    assert metrics["wait_time_max"] >= 0.04
+    assert metrics["checkouts"] == 2
+
+
+def test_failures_evict_and_close_while_abandoned_instances_stay_open():
+    pool = ProviderPool(max_size=2)
+    with pytest.raises(RuntimeError):
+        with pool.borrow("P", Instance) as failed:
+            raise RuntimeError("upstream error")
+    assert failed.session._closed
+
+    lease = pool.lease("P", Instance)
+    lease.abandon()
+    assert not lease.instance.session._closed
+    assert pool.acquire("P", Instance) not in (failed, lease.instance)
+    assert pool.metrics()["P"]["evicted"] == 2
+
+
+def test_idle_and_unhealthy_instances_are_replaced_on_checkout():
+    pool = ProviderPool(max_size=2, idle_ttl=0.01)
+    stale = pool.acquire("P", Instance)
+    pool.release("P", stale)
+    time.sleep(0.02)
+    fresh = pool.acquire("P", Instance)
+    assert fresh is not stale and stale.session._closed
+
+    fresh.session._closed = True
+    pool.release("P", fresh)
+    assert pool.acquire("P", Instance) is not fresh
+
+
+def test_utilization_tracks_time_in_use():
+    pool = ProviderPool(max_size=2)
+    with pool.borrow("P", Instance):
+        time.sleep(0.05)
+    time.sleep(0.05)
+    assert 0.1 < pool.metrics()["P"]["utilization"] < 0.4
+
+
+class Pooled:
+    """Chat provider that fails the request if its instance is used concurrently."""
+
+    def __init__(self, **kwargs):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        self.models = SimpleNamespace(list=lambda: ["m"])
+        self.busy = threading.Lock()
+
+    def _create(self, **kwargs):
+        if not self.busy.acquire(blocking=False):
+            raise RuntimeError("instance shared between requests")
+        try:
+            time.sleep(0.02)
+            if kwargs.get("stream"):
+                return (SimpleNamespace(text=text) for text in ("a", "b"))
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))])
+        finally:
+            self.busy.release()
+
+
+def test_client_borrows_one_instance_per_concurrent_request():
+    client = Client(router=ProviderRouter(), provider_pool=ProviderPool(max_size=3))
+    client.chat.completions._get_available_providers = lambda: [("Pooled", Pooled)]
+
+    results = []
+
+    def call():
+        response = client.chat.completions.create(model="m", messages=[], provider=Pooled)
+        results.append(response.choices[0].message.content)
+
+    threads = [threading.Thread(target=call) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["ok"] * 6
+    metrics = client.provider_pool.metrics()["Pooled"]
+    assert 1 < metrics["created"] <= 3
+    assert metrics["in_use"] == 0 and metrics["evicted"] == 0
+
+    stream = client.chat.completions.create(model="m", messages=[], provider=Pooled, stream=True)
+    assert client.provider_pool.metrics()["Pooled"]["in_use"] == 1
+    assert [chunk.text for chunk in stream] == ["a", "b"]
+    assert client.provider_pool.metrics()["Pooled"]["in_use"] == 0
+
+
+def test_server_streams_hold_their_lease_until_they_end():
+    pool = ProviderPool(max_size=1)
+
+    def generate():
+        yield 1
+        raise RuntimeError("upstream dropped")
+
+    lease = pool.lease("P", Instance)
+    assert release_when_done({"choices": []}, lease) == {"choices": []}
+    assert pool.metrics()["P"]["in_use"] == 0
+
+    lease = pool.lease("P", Instance)
+    stream = release_when_done(generate(), lease)
+    assert next(stream) == 1
+    assert pool.metrics()["P"]["in_use"] == 1
+    with pytest.raises(RuntimeError):
+        next(stream)
+    metrics = pool.metrics()["P"]
+    assert (metrics["in_use"], metrics["evicted"]) == (0, 1)
+
+    async def agenerate():
+        yield 1
+        yield 2
+
+    async def consume():
+        stream = release_when_done(agenerate(), pool.lease("P", Instance))
+        first = await stream.__anext__()
+        in_use = pool.metrics()["P"]["in_use"]
+        await stream.aclose()
+        return first, in_use
+
+    assert asyncio.run(consume()) == (1, 1)
+    assert pool.metrics()["P"]["in_use"] == 0
+    assert pool.metrics()["P"]["idle"] == 1
+
+
+def test_server_builds_new_instances_off_the_event_loop():
+    threads = []
+
+    class Slow(Instance):
+        def __init__(self):
+            threads.append(threading.current_thread())
+            time.sleep(0.05)
+            super().__init__()
+
+    pool = ProviderPool(max_size=2)
+
+    async def main():
+        lease = await checkout_provider(Slow)
+        lease.release()
+        reused = await checkout_provider(Slow)
+        cancelled = asyncio.ensure_future(checkout_provider(Slow))
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        await asyncio.sleep(0.1)
+        return threading.current_thread(), lease, reused
+
+    with patch.object(providers, "get_provider_pool", return_value=pool):
+        loop_thread, lease, reused = asyncio.run(main())
+    assert len(threads) == 2 and loop_thread not in threads
+    assert reused.instance is lease.instance
+    # The instance built for the cancelled checkout is kept for the next one.
+    metrics = pool.metrics()["Slow"]
+    assert (metrics["in_use"], metrics["idle"], metrics["created"]) == (1, 1, 2)
@@ -0,0 +1,254 @@
+"""Tests for ``llm4free.response_cache`` and its use by the clients and the API server."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from llm4free.async_client import AsyncClient
+from llm4free.client import Client
+from llm4free.llm.utils import ChatCompletionChunk, Choice, ChoiceDelta
+from llm4free.response_cache import (
+    CACHE_BYPASS,
+    CACHE_REFRESH,
+    ResponseCache,
+    cache_key,
+    cache_mode_from_header,
+    replay_chunks,
+)
+from llm4free.router import ProviderRouter
+from llm4free.server import request_processing
+
+
+def _completion(content, finish_reason="stop"):
+    return {
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "created": 1,
+        "model": "m",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": finish_reason,
+            }
+        ],
+    }
+
+
+def _request(content="Hi", **params):
+    return {
+        "model": "m",
+        "messages": [{"role": "user", "content": content}],
+        "temperature": 0,
+        **params,
+    }
+
+
+def test_equivalent_requests_share_a_key():
+    base = cache_key(_request())
+    assert cache_key(_request("  Hi\r\n", top_p=1.0, stream=True, timeout=30)) == base
+    assert cache_key(_request([{"type": "text", "text": "Hi"}], temperature=0.0)) == base
+    assert cache_key(_request("Hello")) != base
+    assert cache_key(_request(max_tokens=10)) != base
+    assert cache_key(_request(), namespace="Provider") != base
+
+
+def test_lookup_modes_and_counters():
+    cache = ResponseCache()
+    key, cached = cache.lookup(_request())
+    assert cached is None
+    assert cache.set(key, _completion("cached"))
+    assert not cache.set(key, _completion("   ")), "empty answers are not cached"
+
+    _, cached = cache.lookup(_request())
+    assert cached["choices"][0]["message"]["content"] == "cached"
+    assert cached["id"] != "chatcmpl-1"
+    assert cache.lookup(_request(), mode=CACHE_REFRESH) == (key, None)
+    assert cache.lookup(_request(), mode=CACHE_BYPASS) == (None, None)
+    assert cache.lookup(_request(temperature=0.7)) == (None, None)
+    with pytest.raises(ValueError):
+        cache.lookup(_request(), mode="sometimes")
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["refreshes"]) == (1, 1, 1)
+    assert (stats["bypasses"], stats["uncacheable"], stats["stores"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+
+
+def test_memory_tier_is_lru_with_ttl():
+    cache = ResponseCache(max_entries=2, ttl=0.05)
+    for key in "abc":
+        cache.set(key, _completion(key))
+    cache.get("b")
+    assert cache.get("a") is None
+    assert cache.stats()["evictions"] == 1
+    time.sleep(0.06)
+    assert cache.get("b") is None and cache.get("c") is None
+
+
+def test_sqlite_tier_survives_restarts_and_evicts_by_size(tmp_path):
+    path = tmp_path / "cache" / "responses.db"
+    cache = ResponseCache(path=path, max_disk_bytes=600)
+    cache.set("a", _completion("a"))
+    cache.close()
+
+    cache = ResponseCache(path=path, max_disk_bytes=600)
+    assert cache.get("a")["choices"][0]["message"]["content"] == "a"
+    assert cache.stats()["disk_hits"] == 1
+    for key in "bcdef":
+        cache.set(key, _completion(key * 20))
+    stats = cache.stats()
+    assert stats["disk_bytes"] <= 600 and stats["evictions"] > 0
+    cache.close()
+
+
+def test_streams_are_replayed_and_stored_only_when_complete():
+    chunks = list(replay_chunks(_completion("hello"), request_id="req-1"))
+    assert [c.choices[0].delta.content for c in chunks] == ["hello", None]
+    assert chunks[-1].choices[0].finish_reason == "stop"
+    assert {c.id for c in chunks} == {"req-1"}
+
+    def stream():
+        for text in ("hel", "lo"):
+            yield ChatCompletionChunk(
+                model="m", choices=[Choice(index=0, delta=ChoiceDelta(content=text))]
+            )
+
+    cache = ResponseCache()
+    partial = cache.wrap_stream("k", stream())
+    next(partial)
+    partial.close()
+    assert cache.get("k") is None
+
+    assert [c.choices[0].delta.content for c in cache.wrap_stream("k", stream())] == ["hel", "lo"]
+    assert cache.get("k")["choices"][0]["message"]["content"] == "hello"
+
+
+def test_header_maps_to_cache_mode():
+    assert cache_mode_from_header(None) == "use"
+    assert cache_mode_from_header("no-cache") == CACHE_REFRESH
+    assert cache_mode_from_header("max-age=0, no-store") == CACHE_BYPASS
+
+
+class Counting:
+    calls = 0
+
+    def __init__(self, **kwargs):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        self.models = SimpleNamespace(list=lambda: ["m"])
+
+    def _create(self, **kwargs):
+        type(self).calls += 1
+        if kwargs.get("stream"):
+            return (
+                ChatCompletionChunk(
+                    model="m", choices=[Choice(index=0, delta=ChoiceDelta(content=text))]
+                )
+                for text in ("a", "b")
+            )
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="answer"))],
+            model_dump=lambda exclude_none: _completion("answer"),
+        )
+
+
+def test_clients_answer_repeated_requests_from_the_cache():
+    Counting.calls = 0
+    cache = ResponseCache()
+    client = Client(router=ProviderRouter(), response_cache=cache)
+    client.chat.completions._get_available_providers = lambda: [("Counting", Counting)]
+    request = dict(model="m", messages=[{"role": "user", "content": "q"}], temperature=0)
+
+    for _ in range(2):
+        response = client.chat.completions.create(provider=Counting, **request)
+        assert response.choices[0].message.content == "answer"
+    streamed = client.chat.completions.create(provider=Counting, stream=True, **request)
+    assert [c.choices[0].delta.content for c in streamed] == ["answer", None]
+    assert Counting.calls == 1
+
+    client.chat.completions.create(provider=Counting, cache_mode=CACHE_REFRESH, **request)
+    assert Counting.calls == 2
+
+    async def main():
+        async with AsyncClient(router=ProviderRouter(), response_cache=cache) as aclient:
+            aclient._sync.chat.completions._get_available_providers = lambda: [
+                ("Counting", Counting)
+            ]
+            request["messages"] = [{"role": "user", "content": "streamed"}]
+            texts = []
+            for _ in range(2):
+                stream = await aclient.chat.completions.create(
+                    provider=Counting, stream=True, **request
+                )
+                texts.append("".join([c.choices[0].delta.content or "" async for c in stream]))
+            return texts
+
+    assert asyncio.run(main()) == ["ab", "ab"]
+    assert Counting.calls == 3
+
+
+def test_server_replays_cached_completions(monkeypatch):
+    monkeypatch.setattr(request_processing, "_response_cache", ResponseCache())
+    params = _request()
+
+    async def main():
+        key, cached = await request_processing.lookup_cached_completion(params, "P", None)
+        assert cached is None
+        await request_processing.store_cached_completion(key, _completion("hi\x00"))
+        _, cached = await request_processing.lookup_cached_completion(params, "P", None)
+        response = request_processing.cached_completion_response(cached, "req-1", stream=True)
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        return response, body
+
+    response, body = asyncio.run(main())
+    assert response.headers["X-Cache"] == "HIT"
+    assert b'"id":"req-1"' in body and body.endswith(b"data: [DONE]\n\n")
+
+
+class StreamingProvider:
+    def __init__(self, tool_calls=None):
+        self.tool_calls = tool_calls
+        self.chat = self
+        self.completions = self
+
+    def create(self, **kwargs):
+        for text in ("a", "b"):
+            delta = ChoiceDelta(content=text, tool_calls=self.tool_calls)
+            yield ChatCompletionChunk(
+                id="c", choices=[Choice(index=0, delta=delta)], created=0, model="m"
+            )
+
+
+def test_server_caches_only_streams_that_complete(monkeypatch):
+    monkeypatch.setattr(request_processing, "_response_cache", ResponseCache())
+
+    async def stream(content, provider, frames=None):
+        params = _request(content, stream=True)
+        key, _ = await request_processing.lookup_cached_completion(params, "P", None)
+        response = await request_processing.handle_streaming_response(
+            provider, params, "r", "ip", "q", "m", time.time(), "P", cache_key=key
+        )
+        body = []
+        async for frame in response.body_iterator:
+            body.append(frame)
+            if frames is not None and len(body) == frames:
+                await response.body_iterator.aclose()  # the client disconnects
+                break
+        _, cached = await request_processing.lookup_cached_completion(params, "P", None)
+        return body, cached
+
+    async def main():
+        body, cached = await stream("complete", StreamingProvider())
+        assert body[-1] == b"data: [DONE]\n\n"
+        assert cached["choices"][0]["message"]["content"] == "ab"
+
+        body, cached = await stream("cancelled", StreamingProvider(), frames=1)
+        assert cached is None and b"data: [DONE]\n\n" not in body
+
+        tool_call = [{"index": 0, "id": "t", "type": "function", "function": {"name": "f"}}]
+        body, cached = await stream("tools", StreamingProvider(tool_call))
+        assert body[-1] == b"data: [DONE]\n\n" and cached is None
+
+    asyncio.run(main())
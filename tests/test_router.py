@@ -0,0 +1,148 @@
+"""Tests for health-scored provider routing in ``llm4free.router`` and ``Client``."""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from llm4free.client import Client, _build_fallback_queue
+from llm4free.model_index import ModelIndex
+from llm4free.router import CLOSED, HALF_OPEN, OPEN, ProviderRouter
+
+
+def _router(**kwargs):
+    kwargs.setdefault("failure_threshold", 2)
+    kwargs.setdefault("cooldown", 0.05)
+    return ProviderRouter(**kwargs)
+
+
+def test_ewma_stats_and_scores():
+    router = _router()
+    router.record_success("Fast", "m", ttft=0.2)
+    router.record_success("Fast", "m", ttft=0.4)
+    router.record_success("Slow", "m", ttft=3.0)
+    stats = router.stats()
+    assert stats["providers"]["Fast"]["ttft"] == pytest.approx(0.26)
+    assert stats["providers"]["Fast"]["calls"] == 2
+    assert "Fast/m" in stats["models"]
+    assert router.score("Fast") < router.score("Slow")
+    assert router.order(["Slow", "Fast"]) == ["Fast", "Slow"]
+    assert router.choose(["Slow", "Fast"]) == "Fast"
+
+
+def test_errors_inflate_score():
+    router = _router(failure_threshold=10)
+    router.record_success("Flaky", ttft=0.1)
+    router.record_failure("Flaky", error="boom")
+    router.record_success("Steady", ttft=0.2)
+    assert router.score("Flaky") > router.score("Steady")
+    assert router.stats()["providers"]["Flaky"]["last_error"] == "boom"
+
+
+def test_circuit_breaker_opens_and_half_open_probe():
+    router = _router()
+    router.record_failure("Dead")
+    assert router.is_available("Dead")
+    router.record_failure("Dead")
+    assert router.stats()["providers"]["Dead"]["state"] == OPEN
+    assert not router.acquire("Dead")
+    assert router.order(["Dead", "Other"], skip_unavailable=True) == ["Other"]
+
+    time.sleep(0.06)
+    assert router.stats()["providers"]["Dead"]["state"] == HALF_OPEN
+    assert router.acquire("Dead")
+    assert not router.acquire("Dead"), "only one probe while half-open"
+
+    router.record_failure("Dead")
+    stats = router.stats()["providers"]["Dead"]
+    assert stats["state"] == OPEN
+    assert stats["cooldown"] == pytest.approx(0.1)
+
+    time.sleep(0.11)
+    assert router.acquire("Dead")
+    router.record_success("Dead", ttft=1.0)
+    assert router.stats()["providers"]["Dead"]["state"] == CLOSED
+
+
+def test_state_persists(tmp_path):
+    path = tmp_path / "router.json"
+    router = _router(state_path=path)
+    router.record_success("Groq", "llama", ttft=0.5)
+    router.record_failure("Groq", "llama", "x")
+    router.save()
+    restored = _router(state_path=path)
+    assert restored.stats() == router.stats()
+
+
+class _FakeProvider:
+    outcome = "ok"
+    calls = 0
+
+    def __init__(self, **kwargs):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        self.models = SimpleNamespace(list=lambda: ["m"])
+
+    def _create(self, **kwargs):
+        type(self).calls += 1
+        if self.outcome == "fail":
+            raise RuntimeError("down")
+        if kwargs.get("stream"):
+            return (SimpleNamespace(text=t) for t in ("a", "b", "c"))
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))])
+
+
+class Good(_FakeProvider):
+    pass
+
+
+class Bad(_FakeProvider):
+    outcome = "fail"
+
+
+def _client(router):
+    client = Client(router=router)
+    client.chat.completions._get_available_providers = lambda: [("Good", Good), ("Bad", Bad)]
+    return client
+
+
+def test_client_records_outcomes_and_skips_open_circuits():
+    router = _router(failure_threshold=1, cooldown=60)
+    client = _client(router)
+    Bad.calls = Good.calls = 0
+
+    response = client.chat.completions.create(model="m", messages=[], provider=Bad)
+    assert response.choices[0].message.content == "ok"
+    assert client.chat.completions.last_provider == "Good"
+    assert router.stats()["providers"]["Bad"]["state"] == OPEN
+    assert Bad.calls == 1
+
+    # Bad's circuit is open: the router resolves to Good and never calls Bad.
+    client.chat.completions.create(model="m", messages=[])
+    assert Bad.calls == 1
+
+
+def test_stream_records_ttft_and_throughput():
+    router = _router()
+    client = _client(router)
+    chunks = list(
+        client.chat.completions.create(model="m", messages=[], stream=True, provider=Good)
+    )
+    assert [c.text for c in chunks] == ["a", "b", "c"]
+    stats = router.stats()["providers"]["Good"]
+    assert stats["ttft"] is not None
+    assert stats["throughput"] > 0
+
+
+def test_fallback_queue_orders_tiers_by_score():
+    router = _router()
+    router.record_success("A", "m", ttft=5.0)
+    router.record_success("B", "m", ttft=0.1)
+    queue = _build_fallback_queue(
+        ModelIndex.build([("A", Bad), ("B", Good)], lambda cls: ["m"]),
+        None,
+        "m",
+        "m",
+        empty_model_fallback="auto",
+        router=router,
+    )
+    assert [name for name, _, _ in queue] == ["B", "A"]
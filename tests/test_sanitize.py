@@ -0,0 +1,140 @@
+"""Tests for stream framing and compiled pipelines in ``llm4free.sanitize``."""
+
+import asyncio
+import json
+
+import pytest
+
+from llm4free.sanitize import compile_sanitizer, sanitize_stream
+
+EVENTS = [{"id": i, "text": f"token {i}   é"} for i in range(50)]
+SSE = (
+    "".join(f"data: {json.dumps(e, ensure_ascii=False)}\r\n\r\n" for e in EVENTS) + "data: [DONE]\n"
+)
+
+
+def _fragments(data: bytes, size: int):
+    return iter([data[i : i + size] for i in range(0, len(data), size)])
+
+
+def test_json_split_across_fragments_is_parsed_whole():
+    payload = SSE.encode("utf-8")
+    for size in (1, 7, 17, len(payload)):
+        out = list(
+            sanitize_stream(_fragments(payload, size), skip_markers=["[DONE]"], fragments=True)
+        )
+        assert out == EVENTS, size
+
+
+def test_async_stream_matches_sync():
+    async def gen():
+        for frag in _fragments(SSE.encode("utf-8"), 13):
+            yield frag
+
+    async def collect():
+        stream = sanitize_stream(gen(), skip_markers=["[DONE]"], fragments=True)
+        return [item async for item in stream]
+
+    assert asyncio.run(collect()) == EVENTS
+
+
+def test_unterminated_json_chunks_are_separate_records():
+    chunks = [b'{"text":"He"}', b'{"text":"llo"}', b'{"text":', b'" world"}']
+    out = list(
+        sanitize_stream(
+            iter(chunks), intro_value="", content_extractor=lambda c: c["text"], fragments=True
+        )
+    )
+    assert out == ["He", "llo", " world"]
+
+
+def test_custom_multichar_delimiter_split_across_fragments():
+    text = "a<|>b<|>c"
+    out = list(
+        sanitize_stream(
+            iter(text), intro_value=None, to_json=False, line_delimiter="<|>", fragments=True
+        )
+    )
+    assert out == ["a", "b", "c"]
+
+
+def test_each_line_chunk_is_one_record():
+    # iter_lines() yields lines without terminators; they must not be joined.
+    assert list(sanitize_stream(iter(["hello", "world"]), to_json=False)) == ["hello", "world"]
+    lines = ['0:"a"', '0:"b"']
+    out = sanitize_stream(
+        iter(lines), intro_value=None, to_json=False, extract_regexes=[r'0:"(.*?)"']
+    )
+    assert list(out) == ["a", "b"]
+    byte_lines = [b'data: {"a": 1}', b"", b"data: partial", b'data: {"b": 2}']
+    assert list(sanitize_stream(iter(byte_lines))) == [{"a": 1}, "partial", {"b": 2}]
+
+    async def gen():
+        for line in lines:
+            yield line
+
+    async def collect():
+        stream = sanitize_stream(gen(), intro_value=None, to_json=False)
+        return [item async for item in stream]
+
+    assert asyncio.run(collect()) == lines
+
+
+def test_multiline_sse_data_events():
+    stream = ['data: {"a":\n', "data: 1}\n", "\n", ": keep-alive\n\n", 'data: {"b": 2}\n\n']
+    out = list(sanitize_stream(iter(stream), sse_events=True))
+    assert out == [{"a": 1}, {"b": 2}]
+
+
+def test_markers_split_across_fragments():
+    text = "noise <START>one\ntwo<END> tail"
+    out = list(
+        sanitize_stream(
+            iter(text),
+            intro_value=None,
+            to_json=False,
+            start_marker="<START>",
+            end_marker="<END>",
+            fragments=True,
+        )
+    )
+    assert out == ["one", "two"]
+
+
+def _text(chunk):
+    return chunk.get("text") if isinstance(chunk, dict) else None
+
+
+def test_compiled_pipeline_is_cached_and_matches_sanitize_stream():
+    options = dict(skip_markers=["[DONE]"], content_extractor=_text, fragments=True)
+    pipeline = compile_sanitizer(**options)
+    assert compile_sanitizer(**options) is pipeline
+
+    payload = SSE.encode("utf-8")
+    expected = list(sanitize_stream(_fragments(payload, 11), **options))
+    assert expected == [e["text"] for e in EVENTS]
+    assert list(pipeline(_fragments(payload, 11))) == expected
+    # A compiled pipeline is reusable across streams.
+    assert list(pipeline(_fragments(payload, 64))) == expected
+
+
+def test_compiled_pipeline_regex_and_async():
+    pipeline = compile_sanitizer(
+        intro_value=None, to_json=False, skip_regexes=[r"^#"], extract_regexes=[r"v=(\d+)"]
+    )
+    lines = ["# comment\n", "v=1\n", "v=22\n"]
+    assert list(pipeline(iter(lines))) == ["1", "22"]
+
+    async def gen():
+        for line in lines:
+            yield line
+
+    async def collect():
+        return [item async for item in pipeline(gen())]
+
+    assert asyncio.run(collect()) == ["1", "22"]
+
+
+def test_compile_sanitizer_rejects_unknown_options():
+    with pytest.raises(TypeError):
+        compile_sanitizer(line_delimeter="\n")